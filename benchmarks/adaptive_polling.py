@@ -0,0 +1,86 @@
+"""
+Benchmark: the fixed `create_and_poll` schedule vs `PollingOptions(adaptive=...)`.
+
+Polls 1,000 simulated runs each of two processors on a virtual clock: an
+invoice extractor whose processing times follow a log-normal distribution
+around 45 s, and parse runs around 8 s. Every run is polled by
+`poll_until_done` as `create_and_poll` would: with the default
+PollingOptions, then with one AdaptivePolling shared by all runs at two
+`polls_per_run` settings (its first five runs are polled on the fixed
+schedule while it learns). Reports polls per run, polls that found the run
+still processing, and the mean time between a run finishing and a poll
+seeing it.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/adaptive_polling.py
+"""
+
+import math
+import platform
+import random
+import typing
+from unittest import mock
+
+from extend_ai import AdaptivePolling, PollingOptions
+from extend_ai.wrapper.polling import poll_until_done
+
+RUNS = 1000
+
+
+def report(name: str, polls: float, wasted: float, lag: float) -> None:
+    print(f"{name:<52} {polls:6.1f} polls/run {wasted:6.1f} wasted/run {lag:6.2f} s lag")
+
+
+class VirtualClock:
+    """Stands in for the `time` module in `extend_ai.wrapper.polling`: sleeping advances `now`."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def simulate(key: str, durations: typing.List[float], options: PollingOptions) -> typing.Tuple[float, float, float]:
+    """Polls one run per duration (in seconds); returns mean polls, wasted polls and detection lag."""
+    clock = VirtualClock()
+    polls = 0
+    lag = 0.0
+    with mock.patch("extend_ai.wrapper.polling.time", clock):
+        for duration in durations:
+            finish_at = clock.now + duration
+
+            def retrieve() -> bool:
+                nonlocal polls
+                polls += 1
+                return clock.now >= finish_at
+
+            poll_until_done(retrieve, lambda done: done, options, key=key)
+            lag += clock.now - finish_at
+    return polls / len(durations), (polls - len(durations)) / len(durations), lag / len(durations)
+
+
+def main() -> None:
+    rng = random.Random(0)
+    workloads = {
+        "extract_run:ex_invoices": [rng.lognormvariate(math.log(45), 0.25) for _ in range(RUNS)],
+        "parse_run": [rng.lognormvariate(math.log(8), 0.3) for _ in range(RUNS)],
+    }
+    print(f"Python {platform.python_version()}, {RUNS} runs per processor\n")
+    for key, durations in workloads.items():
+        report(f"{key} (fixed schedule)", *simulate(key, durations, PollingOptions()))
+        for polls_per_run in (10, 20):
+            adaptive = AdaptivePolling(polls_per_run=polls_per_run)
+            name = f"{key} (adaptive, polls_per_run={polls_per_run})"
+            report(name, *simulate(key, durations, PollingOptions(adaptive=adaptive)))
+        stats = adaptive.snapshot()[key]
+        assert stats.p50_ms is not None and stats.p90_ms is not None
+        print(f"{'  learned p50 / p90':<52} {stats.p50_ms / 1000:6.1f} s {stats.p90_ms / 1000:13.1f} s\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Micro-benchmark: `convert_and_respect_annotation_metadata` with and without
+its per-type caches.
+
+Every request body built from TypedDicts is converted on the way out, and
+`parse_obj_as` converts every response it validates. The conversion used to
+re-read each model's or TypedDict's type hints and alias map for every
+object it visited: a 1,000-item `create_batch` body walked the same
+`ExtractRunsCreateBatchRequestInputsItemParams` 1,000 times. Type hints and
+alias maps are now cached per type, and types with no aliases anywhere in
+their subtree are returned without being walked at all. The "uncached" rows
+bypass both.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/annotation_metadata.py
+"""
+
+import platform
+import timeit
+import typing
+
+from payloads import extract_run_payload, parse_run_payload
+
+from extend_ai.core import serialization
+from extend_ai.core.pydantic_utilities import parse_obj_as
+from extend_ai.core.serialization import convert_and_respect_annotation_metadata
+from extend_ai.extract_runs.requests import ExtractRunsCreateBatchRequestInputsItemParams
+from extend_ai.requests import EditConfigParams
+from extend_ai.types import ExtractRun, ParseRun
+
+_CACHED = ("_get_mapping_fields", "_get_resolvable_type_hints", "_get_type_hints")
+
+
+class _Uncached:
+    def __enter__(self) -> None:
+        self._saved = {name: getattr(serialization, name) for name in (*_CACHED, "_has_aliases")}
+        for name in _CACHED:
+            setattr(serialization, name, self._saved[name].__wrapped__)
+        serialization._has_aliases = lambda type_: True  # type: ignore[assignment]
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        for name, function in self._saved.items():
+            setattr(serialization, name, function)
+
+
+def batch_inputs(items: int) -> typing.List[typing.Dict[str, typing.Any]]:
+    return [
+        {"file": {"url": f"https://example.com/invoices/{index}.pdf", "name": f"{index}.pdf"}, "metadata": {"i": index}}
+        for index in range(items)
+    ]
+
+
+def edit_config(fields: int) -> typing.Dict[str, typing.Any]:
+    properties = {
+        f"field_{index}": {
+            "type": ["string", "null"],
+            "extend_edit_field_type": "text",
+            "extend_edit_bbox": {"left": 0.1, "top": 0.2, "right": 0.3, "bottom": 0.4},
+            "extend_edit_page_index": 0,
+        }
+        for index in range(fields)
+    }
+    return {"schema": {"type": "object", "properties": properties}}
+
+
+def report(name: str, number: int, seconds: float) -> None:
+    print(f"{name:<52} {seconds / number * 1e3:9.3f} ms/call")
+
+
+def main() -> None:
+    print(f"Python {platform.python_version()}\n")
+    writes = [
+        (
+            "create_batch inputs, 1000 items",
+            typing.Sequence[ExtractRunsCreateBatchRequestInputsItemParams],
+            batch_inputs(1000),
+            20,
+        ),
+        ("EditConfig, 200 aliased fields", EditConfigParams, edit_config(200), 20),
+    ]
+    for name, annotation, payload, number in writes:
+
+        def write() -> None:
+            convert_and_respect_annotation_metadata(object_=payload, annotation=annotation, direction="write")
+
+        with _Uncached():
+            report(f"{name} (uncached)", number, timeit.timeit(write, number=number))
+        write()
+        report(f"{name} (cached)", number, timeit.timeit(write, number=number))
+
+    print()
+    reads = [
+        ("parse_obj_as(ParseRun), 50 pages", ParseRun, parse_run_payload(pages=50), 3),
+        ("parse_obj_as(ExtractRun), 250 line items", ExtractRun, extract_run_payload(line_items=250), 3),
+    ]
+    for name, type_, payload, number in reads:
+        with _Uncached():
+            report(f"{name} (uncached)", number, timeit.timeit(lambda: parse_obj_as(type_, payload), number=number))
+        parse_obj_as(type_, payload)
+        report(f"{name} (cached)", number, timeit.timeit(lambda: parse_obj_as(type_, payload), number=number))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Micro-benchmark: `ParseRunOutput.index` lookups vs walking the chunks.
+
+Times building the index over a 1,000-page ParseRunOutput once, then finding
+the blocks of one type on one page, a block by id, and the blocks on a page,
+against walking every chunk's blocks for the same answers.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/block_index.py
+"""
+
+import gc
+import platform
+import time
+import timeit
+import typing
+
+from payloads import parse_run_payload
+
+from extend_ai import BlockIndex
+from extend_ai.core.unchecked_base_model import construct_type
+from extend_ai.types import ParseRunOutput
+
+PAGES = 1000
+
+
+def report(name: str, seconds: float, number: int = 1) -> None:
+    print(f"{name:<52} {seconds / number * 1e3:9.4f} ms/call")
+
+
+def main() -> None:
+    output = typing.cast(
+        ParseRunOutput, construct_type(type_=ParseRunOutput, object_=parse_run_payload(pages=PAGES)["output"])
+    )
+    blocks = sum(len(chunk.blocks) for chunk in output.chunks)
+    print(f"Python {platform.python_version()}, {PAGES} pages, {blocks} blocks\n")
+
+    gc.collect()  # otherwise a collection left over from constructing the output lands in the timing
+    started = time.perf_counter()
+    index = BlockIndex.of(output)  # what the first `output.index` does
+    report("build the index", time.perf_counter() - started)
+    assert output.index is index
+
+    def walk() -> typing.Iterator[typing.Any]:
+        return (block for chunk in output.chunks for block in chunk.blocks)
+
+    cases: typing.List[typing.Tuple[str, typing.Callable[[], object], typing.Callable[[], object]]] = [
+        (
+            "text blocks on page 700",
+            lambda: index.of_type("text", page=700),
+            lambda: [b for b in walk() if b.type == "text" and b.metadata.page and b.metadata.page.number == 700],
+        ),
+        (
+            "block by id",
+            lambda: index.get("block_700_15"),
+            lambda: next(b for b in walk() if b.id == "block_700_15"),
+        ),
+        (
+            "blocks on page 700",
+            lambda: index.on_page(700),
+            lambda: [b for b in walk() if b.metadata.page and b.metadata.page.number == 700],
+        ),
+    ]
+    for name, indexed, walked in cases:
+        report(f"{name} (index)", timeit.timeit(indexed, number=100), 100)
+        report(f"{name} (walk chunks)", timeit.timeit(walked, number=5), 5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Micro-benchmark: `construct_type` with and without cached construction plans.
+
+Every `raw_client.py` builds its response model with `construct_type`, which
+used to re-inspect the annotation (get_origin/get_args, Annotated-union
+detection, forward references, model and enum checks) for every value it
+touched, and re-read each model's type hints for every instance. It now
+compiles each annotation into a plan once and reuses it. The "uncached"
+rows reproduce the old behaviour by rebuilding the plan for every value.
+
+Union members are still validated with `parse_obj_as`, exactly as before, so
+responses whose bulk sits under `Optional[Model]` fields (ParseRun output,
+ExtractRun output) are bounded by validation rather than construction.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/construct_type.py
+"""
+
+import platform
+import timeit
+import typing
+
+from payloads import extract_run_payload, parse_run_payload
+
+from extend_ai.core import unchecked_base_model
+from extend_ai.core.unchecked_base_model import construct_type
+from extend_ai.types import Block, Chunk, ExtractOutputMetadata, ExtractRun, ParseRun
+
+
+class _Uncached:
+    def __enter__(self) -> None:
+        self._plans = unchecked_base_model._get_construct_plan, unchecked_base_model._get_model_plan
+        unchecked_base_model._get_construct_plan = unchecked_base_model._build_construct_plan  # type: ignore[assignment]
+        unchecked_base_model._get_model_plan = lambda model: unchecked_base_model._ModelPlan(  # type: ignore[assignment]
+            model, unchecked_base_model._get_model_fields(model)
+        )
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        unchecked_base_model._get_construct_plan, unchecked_base_model._get_model_plan = self._plans  # type: ignore[assignment]
+
+
+def report(name: str, number: int, seconds: float) -> None:
+    print(f"{name:<48} {seconds / number * 1e3:9.3f} ms/call")
+
+
+def main() -> None:
+    print(f"Python {platform.python_version()}\n")
+    parse_run = parse_run_payload(pages=200)
+    extract_run = extract_run_payload(line_items=1000)
+    chunks = parse_run["output"]["chunks"]
+    cases = [
+        ("ParseRun, 1 page", ParseRun, parse_run_payload(pages=1), 50),
+        ("ParseRun, 200 pages", ParseRun, parse_run, 1),
+        ("ExtractRun, 10 line items", ExtractRun, extract_run_payload(line_items=10), 50),
+        ("ExtractRun, 1000 line items", ExtractRun, extract_run, 1),
+        ("List[Chunk], 200 pages", typing.List[Chunk], chunks, 1),
+        ("List[Block], 6000 blocks", typing.List[Block], [block for chunk in chunks for block in chunk["blocks"]], 1),
+        ("ExtractOutputMetadata, 4000 fields", ExtractOutputMetadata, extract_run["output"]["metadata"], 3),
+    ]
+    for name, type_, payload, number in cases:
+        with _Uncached():
+            seconds = timeit.timeit(lambda: construct_type(type_=type_, object_=payload), number=number)
+        report(f"{name} (uncached)", number, seconds)
+        construct_type(type_=type_, object_=payload)
+        seconds = timeit.timeit(lambda: construct_type(type_=type_, object_=payload), number=number)
+        report(f"{name} (cached)", number, seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Micro-benchmark: JSON codecs for response decoding and request encoding.
+
+Without a codec, responses are decoded by `httpx.Response.json()` and JSON
+bodies encoded by httpx, both with the standard library. `Extend(json_codec=...)`
+swaps in orjson or msgspec when installed. Codecs that are not installed are
+skipped.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/json_codec.py
+"""
+
+import importlib.util
+import json
+import platform
+import timeit
+import typing
+
+import httpx
+from jsonable_encoder import batch_body
+from payloads import parse_run_payload
+
+from extend_ai import Extend, JsonCodec
+
+CODECS = [name for name in ("json", "orjson", "msgspec") if name == "json" or importlib.util.find_spec(name)]
+
+
+def report(name: str, number: int, seconds: float) -> None:
+    print(f"{name:<52} {seconds / number * 1e3:9.3f} ms/call")
+
+
+def main() -> None:
+    print(f"Python {platform.python_version()}, codecs: {', '.join(CODECS)}\n")
+    parse_run = parse_run_payload(pages=200)
+    document = json.dumps(parse_run).encode("utf-8")
+    body = batch_body(1000)
+    print(f"ParseRun, 200 pages: {len(document) / 1e6:.1f} MB\n")
+
+    for name in CODECS:
+        codec = JsonCodec.named(typing.cast(typing.Any, name))
+        report(f"decode ParseRun, 200 pages ({name})", 5, timeit.timeit(lambda: codec.loads(document), number=5))
+    for name in CODECS:
+        codec = JsonCodec.named(typing.cast(typing.Any, name))
+        report(
+            f"encode create_batch body, 1000 items ({name})", 50, timeit.timeit(lambda: codec.dumps(body), number=50)
+        )
+
+    print()
+    for json_codec in (None, *CODECS[1:]):
+        client = Extend(
+            token="sk_test",
+            base_url="https://api.example.com",
+            httpx_client=httpx.Client(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, content=document))
+            ),
+            json_codec=typing.cast(typing.Any, json_codec),
+        )
+        report(
+            f"parse_runs.retrieve, 200 pages ({json_codec or 'httpx default'})",
+            3,
+            timeit.timeit(lambda: client.parse_runs.retrieve("pr_123"), number=3),
+        )
+
+
+if __name__ == "__main__":
+    main()
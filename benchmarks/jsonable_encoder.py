@@ -0,0 +1,108 @@
+"""
+Micro-benchmark: `jsonable_encoder` on request bodies, legacy vs current.
+
+`HttpClient.request` runs every JSON body and query dict through
+`jsonable_encoder`, which used to rebuild every dict and list through a chain
+of isinstance checks even when the payload was already plain JSON data. It
+now dispatches on the exact type and returns JSON-native subtrees as is,
+copying only the containers where something actually changes (datetimes,
+enums, omitted values, ...).
+
+The legacy encoder below is the previous implementation, reduced to the
+branches these payloads reach.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/jsonable_encoder.py
+"""
+
+import datetime as dt
+import platform
+import timeit
+import typing
+from enum import Enum
+
+import httpx
+
+from extend_ai.core.datetime_utils import serialize_datetime
+from extend_ai.core.http_client import HttpClient
+from extend_ai.core.jsonable_encoder import jsonable_encoder
+
+NUMBER = 50
+
+
+def legacy_jsonable_encoder(obj: typing.Any) -> typing.Any:
+    if obj is Ellipsis:
+        return None
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (str, int, float, type(None))):
+        return obj
+    if isinstance(obj, dt.datetime):
+        return serialize_datetime(obj)
+    if isinstance(obj, dict):
+        encoded_dict = {}
+        allowed_keys = set(obj.keys())
+        for key, value in obj.items():
+            if key in allowed_keys:
+                if value is Ellipsis:
+                    continue
+                encoded_dict[legacy_jsonable_encoder(key)] = legacy_jsonable_encoder(value)
+        return encoded_dict
+    if isinstance(obj, (list, set, frozenset, tuple)):
+        return [legacy_jsonable_encoder(item) for item in obj if item is not Ellipsis]
+    return jsonable_encoder(obj)
+
+
+def batch_body(items: int) -> typing.Dict[str, typing.Any]:
+    return {
+        "extractor": {"id": "ex_123"},
+        "inputs": [
+            {
+                "file": {"url": f"https://example.com/invoices/{index}.pdf", "name": f"{index}.pdf"},
+                "metadata": {"customer": "acme", "index": index, "tags": ["q1", "priority"], "amount": 12.5},
+            }
+            for index in range(items)
+        ],
+        "priority": 50,
+    }
+
+
+def batch_body_with_datetimes(items: int) -> typing.Dict[str, typing.Any]:
+    body = batch_body(items)
+    for item in body["inputs"]:
+        item["metadata"]["received_at"] = dt.datetime(2025, 4, 28, 17, 1, 39, tzinfo=dt.timezone.utc)
+    return body
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<52} {seconds / NUMBER * 1e3:9.3f} ms/call")
+
+
+def main() -> None:
+    print(f"Python {platform.python_version()}, {NUMBER} calls each\n")
+    cases = [
+        ("create_batch body, 1000 items", batch_body(1000)),
+        ("create_batch body, 1000 items with datetimes", batch_body_with_datetimes(1000)),
+    ]
+    for name, body in cases:
+        assert legacy_jsonable_encoder(body) == jsonable_encoder(body)
+        report(f"{name} (legacy)", timeit.timeit(lambda: legacy_jsonable_encoder(body), number=NUMBER))
+        report(f"{name} (current)", timeit.timeit(lambda: jsonable_encoder(body), number=NUMBER))
+
+    print()
+    client = HttpClient(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))),
+        base_timeout=lambda: 60,
+        base_headers=lambda: {"Authorization": "Bearer sk_test"},
+        base_url=lambda: "https://api.example.com",
+    )
+    body = batch_body(1000)
+    report(
+        "HttpClient.request, create_batch body, 1000 items",
+        timeit.timeit(lambda: client.request("extract_runs/batch", method="POST", json=body), number=NUMBER),
+    )
+
+
+if __name__ == "__main__":
+    main()
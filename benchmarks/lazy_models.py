@@ -0,0 +1,69 @@
+"""
+Micro-benchmark: eager vs lazy model construction (`response_format="lazy"`).
+
+A lazily constructed run builds its scalar fields up front and nested objects
+and lists (output chunks and blocks, step runs, edits) on first access.
+Measures time and peak memory (tracemalloc) for constructing ParseRun,
+ExtractRun and WorkflowRun from decoded JSON, reading only `status`, `usage`
+and `metadata`, and for reading the heavy subtree as well.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/lazy_models.py
+"""
+
+import platform
+import timeit
+import tracemalloc
+import typing
+
+from payloads import extract_run_payload, parse_run_payload, workflow_run_payload
+
+from extend_ai.core.unchecked_base_model import construct_lazily, construct_type
+from extend_ai.types import ExtractRun, ParseRun, WorkflowRun
+
+Construct = typing.Callable[..., typing.Any]
+
+CASES: typing.List[
+    typing.Tuple[str, typing.Any, typing.Dict[str, typing.Any], typing.Callable[[typing.Any], object]]
+] = [
+    ("ParseRun, 200 pages", ParseRun, parse_run_payload(pages=200), lambda run: run.output.chunks),
+    ("ExtractRun, 1000 line items", ExtractRun, extract_run_payload(line_items=1000), lambda run: run.output),
+    ("WorkflowRun, 4 steps", WorkflowRun, workflow_run_payload(steps=4), lambda run: run.step_runs),
+]
+
+
+def report(name: str, number: int, seconds: float, peak: int) -> None:
+    print(f"{name:<52} {seconds / number * 1e3:9.3f} ms/call {peak / 1e6:8.1f} MB peak")
+
+
+def measure(
+    construct: Construct, type_: typing.Any, payload: typing.Any, read: typing.Callable[[typing.Any], object]
+) -> typing.Tuple[float, int]:
+    def run() -> None:
+        model = construct(type_=type_, object_=payload)
+        model.status, model.usage, model.metadata
+        read(model)
+
+    seconds = timeit.timeit(run, number=5)
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    print(f"Python {platform.python_version()}\n")
+    for name, type_, payload, heavy in CASES:
+        for construct, label in ((construct_type, "eager"), (construct_lazily, "lazy")):
+            seconds, peak = measure(construct, type_, payload, lambda model: None)
+            report(f"{name}, status only ({label})", 5, seconds, peak)
+        for construct, label in ((construct_type, "eager"), (construct_lazily, "lazy")):
+            seconds, peak = measure(construct, type_, payload, heavy)
+            report(f"{name}, heavy field too ({label})", 5, seconds, peak)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Micro-benchmark: OCR words and blocks as models vs as columns.
+
+Measures the memory each representation retains (tracemalloc, after the
+decoded JSON is allocated) and the time to filter it: words below a
+confidence threshold and words on one page, by scanning the models vs with
+`OcrColumns.low_confidence` / `on_page`. Columns use NumPy if it is
+installed, `array('d')` otherwise; both are reported when NumPy is present.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/ocr_columns.py
+"""
+
+import gc
+import importlib.util
+import platform
+import timeit
+import tracemalloc
+import typing
+
+from payloads import parse_run_payload
+
+from extend_ai import BlockColumns, OcrColumns
+from extend_ai.core.unchecked_base_model import construct_type
+from extend_ai.types import Block, ParseRunOutputOcr
+
+PAGES = 1000
+WORDS_PER_PAGE = 300
+
+
+def report(name: str, value: str) -> None:
+    print(f"{name:<52} {value}")
+
+
+def retained(build: typing.Callable[[], object]) -> typing.Tuple[object, int]:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def per_call(statement: typing.Callable[[], object], number: int = 5) -> str:
+    return f"{timeit.timeit(statement, number=number) / number * 1e3:9.2f} ms/call"
+
+
+def main() -> None:
+    print(f"Python {platform.python_version()}, {PAGES} pages, {PAGES * WORDS_PER_PAGE} OCR words\n")
+    output = parse_run_payload(pages=PAGES, ocr_words_per_page=WORDS_PER_PAGE)["output"]
+    ocr_json = output["ocr"]
+    blocks_json = [block for chunk in output["chunks"] for block in chunk["blocks"]]
+
+    ocr, size = retained(lambda: construct_type(type_=ParseRunOutputOcr, object_=ocr_json))
+    report("OCR words as models", f"{size / 1e6:9.1f} MB")
+    words = typing.cast(ParseRunOutputOcr, ocr).words or []
+    report("  confidence < 0.6 (scan models)", per_call(lambda: [w for w in words if w.confidence < 0.6]))
+    report("  page 500 (scan models)", per_call(lambda: [w for w in words if w.page_number == 500]))
+
+    blocks, size = retained(lambda: [construct_type(type_=Block, object_=block) for block in blocks_json])
+    report("Blocks as models", f"{size / 1e6:9.1f} MB")
+    print()
+
+    backends = [False] + ([True] if importlib.util.find_spec("numpy") else [])
+    for numpy in backends:
+        label = "numpy" if numpy else "array"
+        OcrColumns.from_words((), numpy=numpy)  # imports NumPy outside the measurement
+        columns, size = retained(lambda: OcrColumns.from_ocr(ocr, numpy=numpy))
+        report(f"OCR words as columns ({label})", f"{size / 1e6:9.1f} MB")
+        ocr_columns = typing.cast(OcrColumns, columns)
+        report("  built from models", per_call(lambda: OcrColumns.from_ocr(ocr, numpy=numpy), number=1))
+        report("  built from JSON", per_call(lambda: OcrColumns.from_ocr(ocr_json, numpy=numpy), number=1))
+        report("  confidence < 0.6 (low_confidence)", per_call(lambda: ocr_columns.low_confidence(0.6)))
+        report("  page 500 (on_page)", per_call(lambda: ocr_columns.on_page(500)))
+
+        _, size = retained(lambda: BlockColumns.from_blocks(typing.cast(typing.List[Block], blocks), numpy=numpy))
+        report(f"Blocks as columns ({label})", f"{size / 1e6:9.1f} MB")
+        print()
+
+
+if __name__ == "__main__":
+    main()
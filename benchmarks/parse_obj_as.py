@@ -0,0 +1,73 @@
+"""
+Micro-benchmark: `parse_obj_as` with and without the TypeAdapter cache.
+
+`parse_obj_as` sits under SSE event parsing and validated decoding. It used to
+build a new TypeAdapter on every call, which generates a core schema for
+anything but a plain model class (lists, unions, Annotated types), and every
+model in the payload rescanned its fields for aliases while being validated.
+The "uncached" rows reproduce that by bypassing both caches.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/parse_obj_as.py
+"""
+
+import platform
+import timeit
+import typing
+
+import pydantic
+from payloads import parse_run_payload, workflow_run_payload
+
+from extend_ai.core import pydantic_utilities
+from extend_ai.core.pydantic_utilities import parse_obj_as
+from extend_ai.types import ParseRun, WorkflowRun
+
+
+def _uncached(type_: typing.Any, payload: typing.Any) -> None:
+    pydantic_utilities._cached_type_adapter.cache_clear()
+    parse_obj_as(type_, payload)
+
+
+class _UncachedAliases:
+    def __enter__(self) -> None:
+        self._cached = pydantic_utilities._field_aliases
+        pydantic_utilities._field_aliases = self._cached.__wrapped__  # type: ignore[assignment]
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        pydantic_utilities._field_aliases = self._cached  # type: ignore[assignment]
+
+
+def report(name: str, number: int, seconds: float) -> None:
+    print(f"{name:<48} {seconds / number * 1e3:9.3f} ms/call")
+
+
+def main() -> None:
+    print(f"Python {platform.python_version()}\n")
+    cases = [
+        ("ParseRun, 1 page", ParseRun, parse_run_payload(pages=1), 200),
+        ("ParseRun, 200 pages", ParseRun, parse_run_payload(pages=200), 5),
+        ("WorkflowRun, 1 step x 1 page", WorkflowRun, workflow_run_payload(steps=1, pages=1), 200),
+        ("WorkflowRun, 4 steps x 50 pages", WorkflowRun, workflow_run_payload(steps=4, pages=50), 5),
+    ]
+    for name, type_, payload, number in cases:
+        with _UncachedAliases():
+            seconds = timeit.timeit(lambda: _uncached(type_, payload), number=number)
+        report(f"{name} (uncached)", number, seconds)
+        parse_obj_as(type_, payload)
+        report(f"{name} (cached)", number, timeit.timeit(lambda: parse_obj_as(type_, payload), number=number))
+
+    print()
+    for type_name, type_ in (
+        ("List[ParseRun]", typing.List[ParseRun]),
+        ("Optional[WorkflowRun]", typing.Optional[WorkflowRun]),
+    ):
+        number = 50
+        seconds = timeit.timeit(lambda: pydantic.TypeAdapter(type_), number=number)
+        report(f"TypeAdapter({type_name}) (uncached)", number, seconds)
+        seconds = timeit.timeit(lambda: pydantic_utilities._get_type_adapter(type_), number=number)
+        report(f"TypeAdapter({type_name}) (cached)", number, seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Synthetic API responses for the benchmarks, shaped like real large responses.
+
+`parse_run_payload(pages=200)` is a ParseRun for a 200-page document with one
+chunk per page and ~30 blocks per chunk (a few MB of JSON), plus
+`ocr_words_per_page` OCR words per page if asked;
+`workflow_run_payload(steps=4)` wraps such ParseRuns in a WorkflowRun's
+PARSE step runs; `extract_run_payload(line_items=1000)` is a processed
+ExtractRun for an invoice with 1000 line items, each field carrying
+confidence, citations and a reasoning insight.
+"""
+
+import typing
+
+TIMESTAMP = "2025-04-28T17:01:39.285Z"
+
+
+def _file_summary(file_id: str) -> typing.Dict[str, typing.Any]:
+    return {
+        "object": "file",
+        "id": file_id,
+        "name": "statement.pdf",
+        "type": "PDF",
+        "metadata": {"pageCount": 200},
+        "createdAt": TIMESTAMP,
+        "updatedAt": TIMESTAMP,
+    }
+
+
+def _block(page: int, index: int) -> typing.Dict[str, typing.Any]:
+    top = index * 0.03
+    return {
+        "object": "block",
+        "id": f"block_{page}_{index}",
+        "type": "text",
+        "content": f"Line {index} of page {page}: lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+        "details": {"type": "text_details"},
+        "metadata": {"page": {"number": page, "width": 612.0, "height": 792.0}, "avgOcrConfidence": 0.98},
+        "polygon": [
+            {"x": 0.1, "y": top},
+            {"x": 0.9, "y": top},
+            {"x": 0.9, "y": top + 0.02},
+            {"x": 0.1, "y": top + 0.02},
+        ],
+        "boundingBox": {"left": 0.1, "top": top, "right": 0.9, "bottom": top + 0.02},
+    }
+
+
+def _word(page: int, index: int) -> typing.Dict[str, typing.Any]:
+    left, top = index % 12 * 0.08, index // 12 * 0.03
+    return {
+        "content": f"word{index}",
+        "boundingBox": {"left": left, "top": top, "right": left + 0.06, "bottom": top + 0.02},
+        "confidence": 0.5 + index % 50 / 100,
+        "pageNumber": page,
+    }
+
+
+def parse_run_payload(
+    pages: int = 200, blocks_per_page: int = 30, ocr_words_per_page: int = 0
+) -> typing.Dict[str, typing.Any]:
+    chunks = []
+    for page in range(1, pages + 1):
+        blocks = [_block(page, index) for index in range(blocks_per_page)]
+        chunks.append(
+            {
+                "object": "chunk",
+                "type": "page",
+                "content": "\n".join(block["content"] for block in blocks),
+                "metadata": {"pageRange": {"start": page, "end": page}, "avgOcrConfidence": 0.98},
+                "blocks": blocks,
+            }
+        )
+    output: typing.Dict[str, typing.Any] = {"chunks": chunks}
+    if ocr_words_per_page:
+        output["ocr"] = {
+            "words": [_word(page, index) for page in range(1, pages + 1) for index in range(ocr_words_per_page)]
+        }
+    return {
+        "object": "parse_run",
+        "id": "pr_xK9mLPqRtN3vS8wF5hB2cQ",
+        "file": _file_summary("file_xK9mLPqRtN3vS8wF5hB2cQ"),
+        "status": "PROCESSED",
+        "output": output,
+        "config": {"target": "markdown"},
+    }
+
+
+def workflow_run_payload(steps: int = 4, pages: int = 50) -> typing.Dict[str, typing.Any]:
+    return {
+        "object": "workflow_run",
+        "id": "workflow_run_xKm9pNv3qWsY_jL2tR5Dh",
+        "workflow": {
+            "object": "workflow",
+            "id": "workflow_123",
+            "name": "Statements",
+            "createdAt": TIMESTAMP,
+            "updatedAt": TIMESTAMP,
+        },
+        "workflowVersion": {
+            "object": "workflow_version",
+            "id": "workflow_version_123",
+            "version": "1",
+            "createdAt": TIMESTAMP,
+        },
+        "dashboardUrl": "https://dashboard.extend.ai/workflows/workflow_run_xKm9pNv3qWsY_jL2tR5Dh",
+        "status": "PROCESSED",
+        "metadata": {},
+        "files": [_file_summary("file_1")],
+        "reviewed": False,
+        "stepRuns": [
+            {
+                "object": "workflow_step_run",
+                "id": f"step_run_{index}",
+                "workflowRunId": "workflow_run_xKm9pNv3qWsY_jL2tR5Dh",
+                "status": "PROCESSED",
+                "files": [_file_summary("file_1")],
+                "stepType": "PARSE",
+                "step": {"id": "step_parse", "name": "Parse", "type": "PARSE"},
+                "result": {"parseRun": parse_run_payload(pages=pages)},
+            }
+            for index in range(steps)
+        ],
+    }
+
+
+def _field_metadata(page: int, text: str) -> typing.Dict[str, typing.Any]:
+    return {
+        "ocrConfidence": 0.97,
+        "logprobsConfidence": 0.99,
+        "citations": [
+            {
+                "page": {"number": page, "width": 612.0, "height": 792.0},
+                "referenceText": text,
+                "polygon": [{"x": 0.1, "y": 0.2}, {"x": 0.4, "y": 0.2}, {"x": 0.4, "y": 0.22}, {"x": 0.1, "y": 0.22}],
+            }
+        ],
+        "insights": [{"type": "reasoning", "content": f"Read '{text}' from the line items table."}],
+    }
+
+
+def extract_run_payload(line_items: int = 1000) -> typing.Dict[str, typing.Any]:
+    items = [
+        {
+            "description": f"Item {index}",
+            "quantity": index % 7 + 1,
+            "unit_price": 12.5,
+            "amount": 12.5 * (index % 7 + 1),
+        }
+        for index in range(line_items)
+    ]
+    metadata = {}
+    for index, item in enumerate(items):
+        page = index // 40 + 1
+        for key in ("description", "quantity", "unit_price", "amount"):
+            metadata[f"line_items[{index}].{key}"] = _field_metadata(page, str(item[key]))
+    return {
+        "object": "extract_run",
+        "id": "exr_Xj8mK2pL9nR4vT7qY5wZ",
+        "status": "PROCESSED",
+        "output": {"value": {"invoice_number": "INV-001", "line_items": items}, "metadata": metadata},
+        "reviewed": False,
+        "edited": False,
+        "config": {
+            "schema": {
+                "type": "object",
+                "properties": {"invoice_number": {"type": "string"}, "line_items": {"type": "array"}},
+            },
+        },
+        "file": _file_summary("file_xK9mLPqRtN3vS8wF5hB2cQ"),
+        "dashboardUrl": "https://dashboard.extend.ai/runs/exr_Xj8mK2pL9nR4vT7qY5wZ",
+        "usage": {"credits": 12.0},
+        "createdAt": TIMESTAMP,
+        "updatedAt": TIMESTAMP,
+    }
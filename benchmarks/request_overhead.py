@@ -0,0 +1,75 @@
+"""
+Micro-benchmark: per-request client overhead, excluding the network.
+
+Compares building request headers the way the client used to (import platform
+and query it on every call, then jsonable_encoder the merged dict) with the
+cached static headers, and times a full `HttpClient.request` round trip
+against an in-memory transport.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/request_overhead.py
+"""
+
+import platform
+import timeit
+import typing
+
+import httpx
+
+from extend_ai.core.client_wrapper import SyncClientWrapper
+from extend_ai.core.http_client import _merge_headers
+from extend_ai.core.jsonable_encoder import jsonable_encoder
+from extend_ai.core.remove_none_from_dict import remove_none_from_dict
+
+NUMBER = 20_000
+
+
+def legacy_get_headers(token: str, extend_api_version: str) -> typing.Dict[str, str]:
+    import platform
+
+    headers: typing.Dict[str, str] = {
+        "User-Agent": "extend_ai/1.17.0",
+        "X-Fern-Language": "Python",
+        "X-Fern-Runtime": f"python/{platform.python_version()}",
+        "X-Fern-Platform": f"{platform.system().lower()}/{platform.release()}",
+        "X-Fern-SDK-Name": "extend_ai",
+        "X-Fern-SDK-Version": "1.17.0",
+    }
+    headers["Authorization"] = f"Bearer {token}"
+    headers["x-extend-api-version"] = extend_api_version
+    return headers
+
+
+def legacy_request_headers(token: str) -> typing.Dict[str, typing.Any]:
+    return jsonable_encoder(remove_none_from_dict({**legacy_get_headers(token, "2026-02-09"), **{}, **{}}))
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {seconds / NUMBER * 1e6:8.2f} µs/call")
+
+
+def main() -> None:
+    print(f"Python {platform.python_version()}, {NUMBER} calls each\n")
+
+    wrapper = SyncClientWrapper(
+        token="sk_test",
+        base_url="https://api.example.com",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))),
+    )
+
+    report("headers (legacy)", timeit.timeit(lambda: legacy_request_headers("sk_test"), number=NUMBER))
+    report(
+        "headers (cached)",
+        timeit.timeit(lambda: _merge_headers(wrapper.get_headers(), None, None), number=NUMBER),
+    )
+
+    client = wrapper.httpx_client
+    report(
+        "HttpClient.request, mock transport",
+        timeit.timeit(lambda: client.request("files", method="GET"), number=NUMBER // 10) * 10,
+    )
+
+
+if __name__ == "__main__":
+    main()
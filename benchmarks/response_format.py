@@ -0,0 +1,52 @@
+"""
+Micro-benchmark: `response_format` "model" vs "lazy" vs "raw" vs "bytes".
+
+"model" (the default) decodes the response and builds the SDK model with
+`construct_type`; "lazy" builds it with nested objects and lists left for
+first access (none are accessed here); "raw" only decodes it and "bytes"
+returns the body as received. Timed through `parse_runs.retrieve` against an in-memory transport.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/response_format.py
+"""
+
+import json
+import platform
+import timeit
+import typing
+
+import httpx
+from payloads import parse_run_payload
+
+from extend_ai import Extend
+from extend_ai.core.request_options import RequestOptions
+
+
+def report(name: str, number: int, seconds: float) -> None:
+    print(f"{name:<52} {seconds / number * 1e3:9.3f} ms/call")
+
+
+def main() -> None:
+    print(f"Python {platform.python_version()}\n")
+    for pages in (1, 200):
+        document = json.dumps(parse_run_payload(pages=pages)).encode("utf-8")
+        client = Extend(
+            token="sk_test",
+            base_url="https://api.example.com",
+            httpx_client=httpx.Client(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, content=document))
+            ),
+        )
+        number = 50 if pages == 1 else 3
+        for response_format in ("model", "lazy", "raw", "bytes"):
+            options = typing.cast(RequestOptions, {"response_format": response_format})
+            report(
+                f"parse_runs.retrieve, {pages} pages ({response_format})",
+                number,
+                timeit.timeit(lambda: client.parse_runs.retrieve("pr_123", request_options=options), number=number),
+            )
+
+
+if __name__ == "__main__":
+    main()
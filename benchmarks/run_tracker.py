@@ -0,0 +1,170 @@
+"""
+Benchmark: one `create_and_poll` loop per run vs a shared RunTracker.
+
+Simulates 5,000 extract runs created at once whose processing times follow a
+log-normal distribution around 45 s, on a virtual clock. Per-run polling
+follows the default PollingOptions schedule, with every poll a full
+`retrieve`; its request count and bytes are counted from that schedule and
+its CPU time is extrapolated from timing a sample of real `retrieve` calls
+against an in-memory transport. The tracker runs for real against an
+in-memory API that lists runs newest-update first, sweeping every 2 virtual
+seconds. Reports requests, bytes received, CPU time and how long after
+finishing a run was noticed.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/run_tracker.py
+"""
+
+import datetime as dt
+import json
+import math
+import platform
+import random
+import time
+import typing
+
+import httpx
+from payloads import extract_run_payload
+
+from extend_ai import Extend, RunTracker
+from extend_ai.core.unchecked_base_model import construct_type
+from extend_ai.types import ExtractRun
+from extend_ai.wrapper.polling import HybridDelayOptions, PollingOptions, calculate_hybrid_delay
+
+RUNS = 5000
+SWEEP_INTERVAL = 2.0
+EPOCH = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def report(name: str, requests: int, received: int, cpu: float, lag: float) -> None:
+    print(f"{name:<52} {requests:9,} requests {received / 1e6:9.1f} MB {cpu:7.2f} s CPU {lag:6.2f} s lag")
+
+
+class Api:
+    """Serves `/extract_runs` (newest update first) and `/extract_runs/{id}` at virtual time `now`."""
+
+    def __init__(self, finish_at: typing.Dict[str, float]) -> None:
+        self.finish_at = finish_at
+        self.now = 0.0
+        self.requests = 0
+        self.received = 0
+        self.server_cpu = 0.0  # subtracted from the client's CPU time
+        self._ordered: typing.Tuple[float, typing.List[str]] = (-1.0, [])
+        processed = extract_run_payload(line_items=10)
+        self.full = {key: value for key, value in processed.items() if key not in ("id", "status", "updatedAt")}
+        self.processing = {key: value for key, value in self.full.items() if key not in ("output", "usage")}
+
+    def status(self, run_id: str) -> typing.Tuple[str, float]:
+        finish_at = self.finish_at[run_id]
+        return ("PROCESSED", finish_at) if finish_at <= self.now else ("PROCESSING", 0.0)
+
+    def summary(self, run_id: str) -> typing.Dict[str, typing.Any]:
+        status, updated = self.status(run_id)
+        updated_at = (EPOCH + dt.timedelta(seconds=updated)).isoformat().replace("+00:00", "Z")
+        return {"object": "extract_run", "id": run_id, "status": status, "updatedAt": updated_at}
+
+    def run(self, run_id: str) -> typing.Dict[str, typing.Any]:
+        summary = self.summary(run_id)
+        return {**(self.full if summary["status"] == "PROCESSED" else self.processing), **summary}
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        started = time.process_time()
+        if request.url.path == "/extract_runs":
+            params = request.url.params
+            if self._ordered[0] != self.now:
+                ordered = sorted(self.finish_at, key=lambda run_id: self.status(run_id)[1], reverse=True)
+                self._ordered = (self.now, ordered)
+            ordered = self._ordered[1]
+            start = int(params.get("nextPageToken", 0))
+            size = int(params["maxPageSize"])
+            body: typing.Dict[str, typing.Any] = {
+                "data": [self.summary(run_id) for run_id in ordered[start : start + size]]
+            }
+            if start + size < len(ordered):
+                body["nextPageToken"] = str(start + size)
+        else:
+            run_id = request.url.path.rsplit("/", 1)[1]
+            body = self.run(run_id)
+        content = json.dumps(body).encode()
+        self.requests += 1
+        self.received += len(content)
+        self.server_cpu += time.process_time() - started
+        return httpx.Response(200, content=content)
+
+
+def polls_until(finish_at: float) -> typing.Tuple[int, float]:
+    """The polls the default create_and_poll schedule makes to see a run finished at *finish_at*, and when."""
+    options = PollingOptions()
+    hybrid = HybridDelayOptions(
+        fast_poll_duration_ms=options.fast_poll_duration_ms,
+        fast_poll_interval_ms=options.fast_poll_interval_ms,
+        initial_delay_ms=options.initial_delay_ms,
+        max_delay_ms=options.max_delay_ms,
+        backoff_multiplier=options.backoff_multiplier,
+        jitter_fraction=options.jitter_fraction,
+    )
+    elapsed, polls = 0.0, 1
+    while elapsed < finish_at:
+        elapsed += calculate_hybrid_delay(elapsed * 1000, hybrid) / 1000
+        polls += 1
+    return polls, elapsed
+
+
+def main() -> None:
+    rng = random.Random(0)
+    finish_at = {f"exr_{n}": min(max(rng.lognormvariate(math.log(45), 0.5), 5.0), 600.0) for n in range(RUNS)}
+    print(f"Python {platform.python_version()}, {RUNS} runs, median {sorted(finish_at.values())[RUNS // 2]:.0f} s\n")
+
+    # One create_and_poll loop per run: every poll is a full retrieve.
+    api = Api(finish_at)
+    client = Extend(
+        token="sk_test",
+        base_url="https://api.example.com",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(api.handle)),
+    )
+    sizes, cpu_per_retrieve = [], []
+    for api.now in (0.0, 1e9):  # a poll of a PROCESSING run, then of the PROCESSED run
+        sizes.append(len(json.dumps(api.run("exr_0"))))
+        api.server_cpu = 0.0
+        started = time.process_time()
+        for run_id in list(finish_at)[:200]:
+            client.extract_runs.retrieve(run_id)
+        cpu_per_retrieve.append((time.process_time() - started - api.server_cpu) / 200)
+    requests = received = 0
+    cpu = lag = 0.0
+    for finish in finish_at.values():
+        polls, noticed_at = polls_until(finish)
+        requests += polls
+        received += (polls - 1) * sizes[0] + sizes[1]
+        cpu += (polls - 1) * cpu_per_retrieve[0] + cpu_per_retrieve[1]
+        lag += (noticed_at - finish) / RUNS
+    report("create_and_poll per run (estimated)", requests, received, cpu, lag)
+
+    # One RunTracker: a list sweep every 2 s, one retrieve per finished run.
+    api = Api(finish_at)
+    client = Extend(
+        token="sk_test",
+        base_url="https://api.example.com",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(api.handle)),
+    )
+    tracker = RunTracker(client.extract_runs, interval_ms=None)  # swept below, on the virtual clock
+    # Registered as returned by create: PROCESSING as of their creation.
+    runs = [construct_type(type_=ExtractRun, object_=api.summary(run_id)) for run_id in finish_at]
+    futures = {run.id: tracker.track(run) for run in runs}
+    noticed: typing.Dict[str, float] = {}
+    started = time.process_time()
+    while tracker.pending:
+        api.now += SWEEP_INTERVAL
+        tracker.poll()
+        for run_id, future in futures.items():
+            if run_id not in noticed and future.done():
+                noticed[run_id] = api.now
+    cpu = time.process_time() - started - api.server_cpu
+    lag = sum(noticed[run_id] - finish_at[run_id] for run_id in finish_at) / RUNS
+    report("RunTracker, 2 s sweeps", api.requests, api.received, cpu, lag)
+    tracker.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Micro-benchmark: SpatialIndex vs a linear scan of the parse output.
+
+Builds the index over every block (and, separately, every OCR word) of a
+1,000-page ParseRunOutput, then times rectangle, point and nearest-neighbour
+queries on random pages against scanning `chunks[].blocks[]` / `ocr.words`
+for the same answers.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/spatial_index.py
+"""
+
+import math
+import platform
+import random
+import time
+import typing
+
+from payloads import parse_run_payload
+
+from extend_ai import SpatialIndex
+from extend_ai.core.unchecked_base_model import construct_type
+from extend_ai.types import ParseRunOutput
+
+PAGES = 1000
+QUERIES = 200
+
+
+def report(name: str, seconds: float, number: int = 1) -> None:
+    print(f"{name:<52} {seconds / number * 1e3:9.3f} ms/call")
+
+
+def timed(function: typing.Callable[[], object]) -> typing.Tuple[object, float]:
+    started = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - started
+
+
+def intersects(box: typing.Any, rectangle: typing.Tuple[float, float, float, float]) -> bool:
+    return (
+        box.left <= rectangle[2]
+        and box.right >= rectangle[0]
+        and box.top <= rectangle[3]
+        and box.bottom >= rectangle[1]
+    )
+
+
+def distance(box: typing.Any, x: float, y: float) -> float:
+    return math.hypot(max(box.left - x, 0.0, x - box.right), max(box.top - y, 0.0, y - box.bottom))
+
+
+def main() -> None:
+    print(f"Python {platform.python_version()}, {PAGES} pages, {QUERIES} queries\n")
+    payload = parse_run_payload(pages=PAGES, ocr_words_per_page=300)["output"]
+    output = typing.cast(ParseRunOutput, construct_type(type_=ParseRunOutput, object_=payload))
+    blocks = [block for chunk in output.chunks for block in chunk.blocks]
+    words = output.ocr.words if output.ocr and output.ocr.words else []
+    rng = random.Random(0)
+    queries = []
+    for _ in range(QUERIES):
+        left, top = rng.random(), rng.random()
+        queries.append((rng.randint(1, PAGES), (left, top, left + 0.1, top + 0.05), rng.random(), rng.random()))
+
+    for label, items, page_of in (
+        (f"{len(blocks)} blocks", blocks, lambda block: block.metadata.page.number),
+        (f"{len(words)} OCR words", words, lambda word: word.page_number),
+    ):
+        build = SpatialIndex.of_blocks if items is blocks else SpatialIndex.of_words
+        index, seconds = timed(lambda: build(items))
+        spatial = typing.cast(SpatialIndex[typing.Any], index)
+        report(f"{label}: build index", seconds)
+
+        _, seconds = timed(lambda: [spatial.query(page, box) for page, box, _, _ in queries])
+        report("  query(page, bbox) (index)", seconds, QUERIES)
+        _, seconds = timed(
+            lambda: [
+                [item for item in items if page_of(item) == page and intersects(item.bounding_box, box)]
+                for page, box, _, _ in queries
+            ]
+        )
+        report("  query(page, bbox) (linear scan)", seconds, QUERIES)
+
+        _, seconds = timed(lambda: [spatial.containing(page, x, y) for page, _, x, y in queries])
+        report("  containing(page, x, y) (index)", seconds, QUERIES)
+
+        _, seconds = timed(lambda: [spatial.nearest(page, x, y) for page, _, x, y in queries])
+        report("  nearest(page, x, y) (index)", seconds, QUERIES)
+        _, seconds = timed(
+            lambda: [
+                min(
+                    (item for item in items if page_of(item) == page),
+                    key=lambda item: distance(item.bounding_box, x, y),
+                )
+                for page, _, x, y in queries
+            ]
+        )
+        report("  nearest(page, x, y) (linear scan)", seconds, QUERIES)
+        print()
+
+
+if __name__ == "__main__":
+    main()
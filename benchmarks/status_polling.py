@@ -0,0 +1,113 @@
+"""
+Benchmark: `create_and_poll` with and without `PollingOptions(status_only=True)`.
+
+Runs `create_and_poll` for an extract run and a parse run that each stay
+PROCESSING for 30 polls, against an in-memory API with no delay between
+polls. By default every poll builds the full run model; with `status_only`
+the polls only decode the JSON (parse runs are polled with
+`response_type="url"`) and the run is built once, at completion. Reports
+requests, bytes received and client CPU time per completed run; the
+in-memory API's own time is excluded.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/status_polling.py
+"""
+
+import gc
+import json
+import platform
+import time
+import typing
+
+import httpx
+from payloads import extract_run_payload, parse_run_payload
+
+from extend_ai import Extend, PollingOptions
+
+POLLS = 30
+REPEAT = 5
+# An extractor schema of realistic size: it comes back in `config` on every poll.
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        f"field_{index}": {"type": ["string", "null"], "description": f"The value of field {index} on the invoice."}
+        for index in range(60)
+    },
+}
+
+
+def report(name: str, requests: float, received: float, cpu: float) -> None:
+    print(f"{name:<52} {requests:5.0f} requests {received / 1e3:9.1f} KB {cpu * 1e3:8.2f} ms CPU")
+
+
+class Api:
+    """Answers `POST /{kind}` and `GET /{kind}/{id}` with a run that finishes on poll number POLLS + 1."""
+
+    def __init__(self, kind: str, finished: typing.Dict[str, typing.Any]) -> None:
+        self.kind = kind
+        self.finished = finished
+        self.processing = {**finished, "status": "PROCESSING", "output": None}
+        self.without_output = {key: value for key, value in finished.items() if key != "output"}
+        self.without_output["outputUrl"] = "https://storage.example.com/outputs/run.json"
+        self.polls = self.requests = self.received = 0
+        self.cpu = 0.0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        started = time.process_time()
+        if request.method == "POST":
+            body = self.processing
+        else:
+            self.polls += 1
+            if self.polls <= POLLS:
+                body = self.processing
+            elif request.url.params.get("responseType") == "url":
+                body = self.without_output
+            else:
+                body = self.finished
+        content = json.dumps(body).encode()
+        self.requests += 1
+        self.received += len(content)
+        self.cpu += time.process_time() - started
+        return httpx.Response(200, content=content)
+
+
+def main() -> None:
+    extract_run = extract_run_payload(line_items=200)
+    extract_run["config"] = {**extract_run["config"], "schema": SCHEMA}
+    cases: typing.List[typing.Tuple[str, typing.Dict[str, typing.Any]]] = [
+        ("extract_runs", extract_run),
+        ("parse_runs", parse_run_payload(pages=20)),
+    ]
+    print(f"Python {platform.python_version()}, {POLLS} polls while PROCESSING, mean of {REPEAT} runs\n")
+    for kind, finished in cases:
+        for status_only in (False, True):
+            requests = received = 0
+            cpu = 0.0
+            for _ in range(REPEAT):
+                api = Api(kind, finished)
+                client = Extend(
+                    token="sk_test",
+                    base_url="https://api.example.com",
+                    httpx_client=httpx.Client(transport=httpx.MockTransport(api.handle)),
+                )
+                options = PollingOptions(fast_poll_interval_ms=0, jitter_fraction=0, status_only=status_only)
+                gc.collect()
+                started = time.process_time()
+                if kind == "extract_runs":
+                    run: typing.Any = client.extract_runs.create_and_poll(
+                        file={"id": "file_123"}, extractor={"id": "ex_123"}, polling_options=options
+                    )
+                else:
+                    run = client.parse_runs.create_and_poll(file={"id": "file_123"}, polling_options=options)
+                cpu += time.process_time() - started - api.cpu
+                assert run.status == "PROCESSED" and run.output is not None
+                requests += api.requests
+                received += api.received
+            mode = "status_only" if status_only else "default"
+            report(f"{kind}.create_and_poll ({mode})", requests / REPEAT, received / REPEAT, cpu / REPEAT)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -439,18 +439,42 @@ if typing.TYPE_CHECKING:
         ClassifyRunsListResponseParams,
     )
     from .wrapper import (
+        AdaptivePolling,
+        AdaptivePollingStats,
         AsyncExtend,
+        AsyncRunTracker,
+        BlockColumns,
+        BlockIndex,
+        ConnectionTiming,
         Extend,
         ExtendCurrency,
         ExtendDate,
         ExtendSignature,
         ExtractOutputValidationError,
+        JsonCodec,
+        MetricsRegistry,
+        OcrColumns,
+        ParseRunOutputUnavailableError,
         PollingOptions,
         PollingTimeoutError,
+        RateLimiter,
+        RequestEvent,
+        RequestHooks,
+        RetryAttempt,
+        RetryBudget,
+        RetryPolicy,
+        RetryStats,
+        RunResult,
+        RunTracker,
         SchemaConversionError,
+        SpatialIndex,
+        TokenProvider,
         TypedExtractOutput,
         TypedExtractRun,
+        WarmupReport,
         Webhooks,
+        create_async_httpx_client,
+        create_httpx_client,
         parse_extract_run,
         pydantic_to_extend_schema,
     )
@@ -1126,6 +1150,30 @@ _dynamic_imports: typing.Dict[str, str] = {
     "TypedExtractRun": ".wrapper",
     "parse_extract_run": ".wrapper",
     "pydantic_to_extend_schema": ".wrapper",
+    "MetricsRegistry": ".wrapper",
+    "RequestEvent": ".wrapper",
+    "RequestHooks": ".wrapper",
+    "JsonCodec": ".wrapper",
+    "ParseRunOutputUnavailableError": ".wrapper",
+    "OcrColumns": ".wrapper",
+    "BlockColumns": ".wrapper",
+    "SpatialIndex": ".wrapper",
+    "BlockIndex": ".wrapper",
+    "RunTracker": ".wrapper",
+    "AsyncRunTracker": ".wrapper",
+    "RunResult": ".wrapper",
+    "AdaptivePolling": ".wrapper",
+    "AdaptivePollingStats": ".wrapper",
+    "ConnectionTiming": ".wrapper",
+    "WarmupReport": ".wrapper",
+    "create_httpx_client": ".wrapper",
+    "create_async_httpx_client": ".wrapper",
+    "TokenProvider": ".wrapper",
+    "RateLimiter": ".wrapper",
+    "RetryBudget": ".wrapper",
+    "RetryAttempt": ".wrapper",
+    "RetryPolicy": ".wrapper",
+    "RetryStats": ".wrapper",
     "ExtendEnvironment": ".environment",
     "ExternalDataValidationResult": ".types",
     "ExternalDataValidationResultParams": ".requests",
@@ -2022,6 +2070,30 @@ __all__ = [
     "TypedExtractRun",
     "parse_extract_run",
     "pydantic_to_extend_schema",
+    "MetricsRegistry",
+    "RequestEvent",
+    "RequestHooks",
+    "JsonCodec",
+    "ParseRunOutputUnavailableError",
+    "OcrColumns",
+    "BlockColumns",
+    "SpatialIndex",
+    "BlockIndex",
+    "RunTracker",
+    "AsyncRunTracker",
+    "RunResult",
+    "AdaptivePolling",
+    "AdaptivePollingStats",
+    "ConnectionTiming",
+    "WarmupReport",
+    "create_httpx_client",
+    "create_async_httpx_client",
+    "TokenProvider",
+    "RateLimiter",
+    "RetryBudget",
+    "RetryAttempt",
+    "RetryPolicy",
+    "RetryStats",
     "ExternalDataValidationResult",
     "ExternalDataValidationResultParams",
     "ExternalDataValidationResultResponse",
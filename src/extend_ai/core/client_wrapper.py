@@ -1,9 +1,21 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import functools
+import platform
 import typing
 
 import httpx
 from .http_client import AsyncHttpClient, HttpClient
+from .token_provider import TokenProvider
+
+
+@functools.lru_cache(maxsize=None)
+def _platform_headers() -> typing.Tuple[typing.Tuple[str, str], ...]:
+    """Runtime and platform headers; these cannot change within a process, so compute them once."""
+    return (
+        ("X-Fern-Runtime", f"python/{platform.python_version()}"),
+        ("X-Fern-Platform", f"{platform.system().lower()}/{platform.release()}"),
+    )
 
 
 class BaseClientWrapper:
@@ -21,23 +33,32 @@ class BaseClientWrapper:
         self._base_url = base_url
         self._timeout = timeout
         self._extend_api_version = extend_api_version
+        self._static_headers: typing.Optional[typing.Dict[str, str]] = None
+
+    def get_static_headers(self) -> typing.Dict[str, str]:
+        """
+        Every header except Authorization. Built on first use and reused for the
+        lifetime of the client; callers must copy before modifying.
+        """
+        if self._static_headers is None:
+            headers: typing.Dict[str, str] = {
+                "User-Agent": "extend_ai/1.17.0",
+                "X-Fern-Language": "Python",
+                **dict(_platform_headers()),
+                "X-Fern-SDK-Name": "extend_ai",
+                "X-Fern-SDK-Version": "1.17.0",
+                **(self.get_custom_headers() or {}),
+            }
+            headers.pop("Authorization", None)
+            headers["x-extend-api-version"] = (
+                self._extend_api_version if self._extend_api_version is not None else "2026-02-09"
+            )
+            self._static_headers = headers
+        return self._static_headers
 
     def get_headers(self) -> typing.Dict[str, str]:
-        import platform
-
-        headers: typing.Dict[str, str] = {
-            "User-Agent": "extend_ai/1.17.0",
-            "X-Fern-Language": "Python",
-            "X-Fern-Runtime": f"python/{platform.python_version()}",
-            "X-Fern-Platform": f"{platform.system().lower()}/{platform.release()}",
-            "X-Fern-SDK-Name": "extend_ai",
-            "X-Fern-SDK-Version": "1.17.0",
-            **(self.get_custom_headers() or {}),
-        }
+        headers = dict(self.get_static_headers())
         headers["Authorization"] = f"Bearer {self._get_token()}"
-        headers["x-extend-api-version"] = (
-            self._extend_api_version if self._extend_api_version is not None else "2026-02-09"
-        )
         return headers
 
     def _get_token(self) -> str:
@@ -46,6 +67,16 @@ class BaseClientWrapper:
         else:
             return self._token()
 
+    def invalidate_token(self, authorization: str) -> bool:
+        """
+        Called by the HTTP client when a request is rejected with 401. Returns True
+        if the token can be refreshed, in which case the request is sent again.
+        """
+        if not isinstance(self._token, TokenProvider):
+            return False
+        self._token.invalidate(authorization[len("Bearer ") :])
+        return True
+
     def get_custom_headers(self) -> typing.Optional[typing.Dict[str, str]]:
         return self._headers
 
@@ -75,6 +106,7 @@ class SyncClientWrapper(BaseClientWrapper):
             base_headers=self.get_headers,
             base_timeout=self.get_timeout,
             base_url=self.get_base_url,
+            on_unauthorized=self.invalidate_token,
         )
 
 
@@ -100,11 +132,16 @@ class AsyncClientWrapper(BaseClientWrapper):
             base_timeout=self.get_timeout,
             base_url=self.get_base_url,
             async_base_headers=self.async_get_headers,
+            on_unauthorized=self.invalidate_token,
         )
 
     async def async_get_headers(self) -> typing.Dict[str, str]:
-        headers = self.get_headers()
         if self._async_token is not None:
             token = await self._async_token()
-            headers["Authorization"] = f"Bearer {token}"
+        elif isinstance(self._token, TokenProvider):
+            token = await self._token.async_get_token()
+        else:
+            return self.get_headers()
+        headers = dict(self.get_static_headers())
+        headers["Authorization"] = f"Bearer {token}"
         return headers
@@ -1,26 +1,38 @@
 # This file was auto-generated by Fern from our API Definition.
 
 import asyncio
+import dataclasses
 import email.utils
 import re
 import time
 import typing
-from contextlib import asynccontextmanager, contextmanager
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
 from random import random
 
 import httpx
 from .file import File, convert_file_dict_to_httpx_tuples
 from .force_multipart import FORCE_MULTIPART
+from .instrumentation import RequestHooks, RequestTrace
+from .json_codec import JsonCodec, use_json_codec
 from .jsonable_encoder import jsonable_encoder
 from .query_encoder import encode_query
+from .rate_limit import WORKSPACE_HEADER, RateLimiter
 from .remove_none_from_dict import remove_none_from_dict as remove_none_from_dict
 from .request_options import RequestOptions
+from .response_format import ResponseFormat, check_response_format, use_response_format
+from .retries import (
+    DEFAULT_RETRY_POLICY,
+    INITIAL_RETRY_DELAY_SECONDS,  # noqa: F401
+    JITTER_FACTOR,
+    MAX_RETRY_DELAY_SECONDS,  # noqa: F401
+    RetryAttempt,
+    RetryBudget,
+    RetryPolicy,
+    RetryStats,
+    transport_error_kind,
+)
 from httpx._types import RequestFiles
 
-INITIAL_RETRY_DELAY_SECONDS = 1.0
-MAX_RETRY_DELAY_SECONDS = 60.0
-JITTER_FACTOR = 0.2  # 20% random jitter
-
 
 def _parse_retry_after(response_headers: httpx.Headers) -> typing.Optional[float]:
     """
@@ -63,15 +75,15 @@ def _parse_retry_after(response_headers: httpx.Headers) -> typing.Optional[float
     return seconds
 
 
-def _add_positive_jitter(delay: float) -> float:
-    """Add positive jitter (0-20%) to prevent thundering herd."""
-    jitter_multiplier = 1 + random() * JITTER_FACTOR
+def _add_positive_jitter(delay: float, jitter: float = JITTER_FACTOR) -> float:
+    """Add positive jitter (0-20% by default) to prevent thundering herd."""
+    jitter_multiplier = 1 + random() * jitter
     return delay * jitter_multiplier
 
 
-def _add_symmetric_jitter(delay: float) -> float:
-    """Add symmetric jitter (±10%) for exponential backoff."""
-    jitter_multiplier = 1 + (random() - 0.5) * JITTER_FACTOR
+def _add_symmetric_jitter(delay: float, jitter: float = JITTER_FACTOR) -> float:
+    """Add symmetric jitter (±10% by default) for exponential backoff."""
+    jitter_multiplier = 1 + (random() - 0.5) * jitter
     return delay * jitter_multiplier
 
 
@@ -95,7 +107,7 @@ def _parse_x_ratelimit_reset(response_headers: httpx.Headers) -> typing.Optional
     return None
 
 
-def _retry_timeout(response: httpx.Response, retries: int) -> float:
+def _retry_timeout(response: httpx.Response, retries: int, policy: RetryPolicy = DEFAULT_RETRY_POLICY) -> float:
     """
     Determine the amount of time to wait before retrying a request.
     This function begins by trying to parse a retry-after header from the response, and then proceeds to use exponential backoff
@@ -105,21 +117,161 @@ def _retry_timeout(response: httpx.Response, retries: int) -> float:
     # 1. Check Retry-After header first
     retry_after = _parse_retry_after(response.headers)
     if retry_after is not None and retry_after > 0:
-        return min(retry_after, MAX_RETRY_DELAY_SECONDS)
+        return min(retry_after, policy.max_delay)
 
     # 2. Check X-RateLimit-Reset header (with positive jitter)
     ratelimit_reset = _parse_x_ratelimit_reset(response.headers)
     if ratelimit_reset is not None:
-        return _add_positive_jitter(min(ratelimit_reset, MAX_RETRY_DELAY_SECONDS))
+        return _add_positive_jitter(min(ratelimit_reset, policy.max_delay), policy.jitter)
 
     # 3. Fall back to exponential backoff (with symmetric jitter)
-    backoff = min(INITIAL_RETRY_DELAY_SECONDS * pow(2.0, retries), MAX_RETRY_DELAY_SECONDS)
-    return _add_symmetric_jitter(backoff)
+    return _backoff_timeout(retries, policy)
+
+
+def _backoff_timeout(retries: int, policy: RetryPolicy = DEFAULT_RETRY_POLICY) -> float:
+    """
+    Exponential backoff with symmetric jitter. Used directly for transport errors,
+    which have no response headers to take a delay from.
+    """
+    # Cap the exponent so large max_retries cannot overflow the float.
+    backoff = min(policy.initial_delay * pow(2.0, min(retries, 64)), policy.max_delay)
+    return _add_symmetric_jitter(backoff, policy.jitter)
+
+
+def _resolve_retry_policy(default: RetryPolicy, request_options: typing.Optional[RequestOptions]) -> RetryPolicy:
+    """Per-request policy if given, else the client's; `max_retries` in request_options wins over both."""
+    if request_options is None:
+        return default
+    policy = request_options.get("retry_policy") or default
+    max_retries = request_options.get("max_retries")
+    if max_retries is not None and max_retries != policy.max_retries:
+        policy = dataclasses.replace(policy, max_retries=max_retries)
+    return policy
+
+
+class _RetryLoop:
+    """
+    Retry bookkeeping for one logical request, shared by the sync and async
+    `request` and `stream` methods.
+
+    After each attempt the caller reports the outcome with `on_response` or
+    `on_error`; both return the number of seconds to wait before the next
+    attempt, or None when the attempt is final. Successful responses refill
+    the retry budget, if any, and each retry withdraws from it.
+
+    `before_attempt` returns how long to wait before sending, to stay under the
+    rate limit the limiter has learned from earlier responses.
+
+    A 401 is resent once, immediately and without counting as a retry, if
+    `on_unauthorized` reports that the rejected token has been invalidated.
+    """
+
+    def __init__(
+        self,
+        *,
+        policy: RetryPolicy,
+        stats: RetryStats,
+        method: str,
+        url: str,
+        retries: int = 0,
+        budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        on_unauthorized: typing.Optional[typing.Callable[[str], bool]] = None,
+        on_retry: typing.Optional[typing.Callable[[RetryAttempt], None]] = None,
+    ):
+        self.policy = policy
+        self.stats = stats
+        self.budget = budget
+        self.rate_limiter = rate_limiter
+        self.on_unauthorized = on_unauthorized
+        self.on_retry = on_retry
+        self._workspace_id: typing.Optional[str] = None
+        self._authorization: typing.Optional[str] = None
+        self.method = method
+        self.url = url
+        self.retries = retries
+        self._started = time.monotonic()
+
+    def before_attempt(self, request_headers: typing.Dict[str, typing.Any]) -> float:
+        self._authorization = request_headers.get("Authorization")
+        if self.rate_limiter is None:
+            return 0.0
+        self._workspace_id = request_headers.get(WORKSPACE_HEADER)
+        return self.rate_limiter.reserve(self._workspace_id)
+
+    def on_response(self, response: httpx.Response) -> typing.Optional[float]:
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(response, self._workspace_id)
+        if response.status_code == 401 and self._refresh_authorization():
+            self._finish(status_code=401, error=None, delay=0.0, counts_as_retry=False)
+            return 0.0
+        delay: typing.Optional[float] = None
+        if self.policy.should_retry_status(self.method, response.status_code):
+            delay = self._next_delay(_retry_timeout(response=response, retries=self.retries, policy=self.policy))
+            if delay is not None:
+                self.stats.record_status_retry(response.status_code)
+        elif self.budget is not None:
+            self.budget.deposit()
+        self._finish(status_code=response.status_code, error=None, delay=delay)
+        return delay
+
+    def on_error(self, exc: httpx.TransportError) -> typing.Optional[float]:
+        kind = transport_error_kind(exc)
+        delay: typing.Optional[float] = None
+        if self.policy.should_retry_error(self.method, exc):
+            delay = self._next_delay(_backoff_timeout(retries=self.retries, policy=self.policy))
+        if delay is not None:
+            self.stats.record_transport_retry(kind)
+        else:
+            self.stats.record_transport_error_raised(kind)
+        self._finish(status_code=None, error=exc, delay=delay)
+        return delay
+
+    def _next_delay(self, delay: float) -> typing.Optional[float]:
+        if self.retries >= self.policy.max_retries:
+            return None
+        if self.policy.max_elapsed is not None and self._elapsed() + delay > self.policy.max_elapsed:
+            return None
+        if self.budget is not None and not self.budget.try_withdraw():
+            return None
+        return delay
+
+    def _refresh_authorization(self) -> bool:
+        if self.on_unauthorized is None or self._authorization is None:
+            return False
+        # Only once per request: a second 401 is returned to the caller.
+        on_unauthorized, self.on_unauthorized = self.on_unauthorized, None
+        return on_unauthorized(self._authorization)
 
+    def _elapsed(self) -> float:
+        return time.monotonic() - self._started
 
-def _should_retry(response: httpx.Response) -> bool:
-    retryable_400s = [429, 408, 409]
-    return response.status_code >= 500 or response.status_code in retryable_400s
+    def _finish(
+        self,
+        *,
+        status_code: typing.Optional[int],
+        error: typing.Optional[BaseException],
+        delay: typing.Optional[float],
+        counts_as_retry: bool = True,
+    ) -> None:
+        on_retry = self.on_retry if delay is not None else None
+        if self.policy.on_attempt is not None or on_retry is not None:
+            attempt = RetryAttempt(
+                method=self.method,
+                url=self.url,
+                attempt=self.retries + 1,
+                elapsed=self._elapsed(),
+                status_code=status_code,
+                error=error,
+                will_retry=delay is not None,
+                delay=delay or 0.0,
+            )
+            if self.policy.on_attempt is not None:
+                self.policy.on_attempt(attempt)
+            if on_retry is not None:
+                on_retry(attempt)
+        if delay is not None and counts_as_retry:
+            self.retries += 1
 
 
 def _build_url(base_url: str, path: typing.Optional[str]) -> str:
@@ -146,6 +298,52 @@ def _build_url(base_url: str, path: typing.Optional[str]) -> str:
     return f"{base_url.rstrip('/')}/{path.lstrip('/')}"
 
 
+def _merge_headers(*sources: typing.Optional[typing.Mapping[str, typing.Any]]) -> typing.Dict[str, typing.Any]:
+    """
+    Merge header dicts, later ones winning, and drop None values.
+
+    The client's own headers are all strings, and generated endpoints pass
+    optional headers such as `{"x-extend-workspace-id": None}`, so once None is
+    dropped the common case skips jsonable_encoder entirely; it only runs when a
+    caller passes a non-string value.
+    """
+    merged: typing.Dict[str, typing.Any] = {}
+    for source in sources:
+        if source:
+            for key, value in source.items():
+                if value is None:
+                    merged.pop(key, None)
+                else:
+                    merged[key] = value
+    if all(type(value) is str for value in merged.values()):
+        return merged
+    return jsonable_encoder(merged)
+
+
+def _encode_json_body(
+    json_codec: typing.Optional[JsonCodec],
+    json_body: typing.Optional[typing.Any],
+    data_body: typing.Optional[typing.Any],
+    content: typing.Optional[typing.Any],
+    request_files: typing.Optional[RequestFiles],
+) -> typing.Optional[bytes]:
+    """
+    With a JSON codec, encode a plain JSON body once, up front, to send as content; httpx would
+    otherwise encode it with the standard library on every attempt. None if there is nothing to encode.
+    """
+    if json_codec is None or json_body is None:
+        return None
+    if data_body is not None or content is not None or request_files is not None:
+        return None
+    return json_codec.dumps(json_body)
+
+
+def _set_json_content_type(headers: typing.Dict[str, typing.Any]) -> None:
+    # httpx only sets the content type itself for `json=` bodies.
+    if not any(name.lower() == "content-type" for name in headers):
+        headers["content-type"] = "application/json"
+
+
 def _maybe_filter_none_from_multipart_data(
     data: typing.Optional[typing.Any],
     request_files: typing.Optional[RequestFiles],
@@ -238,11 +436,27 @@ class HttpClient:
         base_timeout: typing.Callable[[], typing.Optional[float]],
         base_headers: typing.Callable[[], typing.Dict[str, str]],
         base_url: typing.Optional[typing.Callable[[], str]] = None,
+        retry_stats: typing.Optional[RetryStats] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        on_unauthorized: typing.Optional[typing.Callable[[str], bool]] = None,
+        hooks: typing.Optional[RequestHooks] = None,
+        json_codec: typing.Optional[JsonCodec] = None,
+        response_format: typing.Optional[ResponseFormat] = None,
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
         self.base_headers = base_headers
         self.httpx_client = httpx_client
+        self.retry_stats = retry_stats if retry_stats is not None else RetryStats()
+        self.retry_policy = retry_policy if retry_policy is not None else DEFAULT_RETRY_POLICY
+        self.retry_budget = retry_budget
+        self.rate_limiter = rate_limiter
+        self.on_unauthorized = on_unauthorized
+        self.hooks = hooks
+        self.json_codec = json_codec
+        self.response_format = response_format
 
     def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
         base_url = maybe_base_url
@@ -253,6 +467,27 @@ class HttpClient:
             raise ValueError("A base_url is required to make this request, please provide one and try again.")
         return base_url
 
+    def _send(self, trace: typing.Optional[RequestTrace], *, attempt: int, **kwargs: typing.Any) -> httpx.Response:
+        if trace is None:
+            return self.httpx_client.request(**kwargs)
+        # Build the request separately so the hooks can see its encoded size before it is sent.
+        build_started = time.monotonic()
+        request = self.httpx_client.build_request(**kwargs)
+        trace.request_start(request, attempt=attempt, build_started=build_started)
+        return self.httpx_client.send(request)
+
+    def _open_stream(
+        self, stack: ExitStack, trace: typing.Optional[RequestTrace], *, attempt: int, **kwargs: typing.Any
+    ) -> httpx.Response:
+        if trace is None:
+            return stack.enter_context(self.httpx_client.stream(**kwargs))
+        build_started = time.monotonic()
+        request = self.httpx_client.build_request(**kwargs)
+        trace.request_start(request, attempt=attempt, build_started=build_started)
+        response = self.httpx_client.send(request, stream=True)
+        stack.callback(response.close)
+        return response
+
     def request(
         self,
         path: typing.Optional[str] = None,
@@ -275,12 +510,19 @@ class HttpClient:
         omit: typing.Optional[typing.Any] = None,
         force_multipart: typing.Optional[bool] = None,
     ) -> httpx.Response:
+        started = time.monotonic()
         base_url = self.get_base_url(base_url)
         timeout = (
             request_options.get("timeout_in_seconds")
             if request_options is not None and request_options.get("timeout_in_seconds") is not None
             else self.base_timeout()
         )
+        response_format = (
+            request_options.get("response_format")
+            if request_options is not None and request_options.get("response_format") is not None
+            else self.response_format
+        )
+        check_response_format(response_format)
 
         json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
 
@@ -315,45 +557,68 @@ class HttpClient:
             )
         )
 
-        response = self.httpx_client.request(
+        encoded_json = _encode_json_body(self.json_codec, json_body, data_body, content, request_files)
+        if encoded_json is not None:
+            json_body, content = None, encoded_json
+
+        url = _build_url(base_url, path)
+        retry_loop = _RetryLoop(
+            policy=_resolve_retry_policy(self.retry_policy, request_options),
+            stats=self.retry_stats,
             method=method,
-            url=_build_url(base_url, path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=_encoded_params if _encoded_params else None,
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=request_files,
-            timeout=timeout,
+            url=url,
+            retries=retries,
+            budget=self.retry_budget,
+            rate_limiter=self.rate_limiter,
+            on_unauthorized=self.on_unauthorized,
+            on_retry=self.hooks.on_retry if self.hooks is not None else None,
         )
-
-        max_retries: int = request_options.get("max_retries", 2) if request_options is not None else 2
-        if _should_retry(response=response):
-            if retries < max_retries:
-                time.sleep(_retry_timeout(response=response, retries=retries))
-                return self.request(
-                    path=path,
+        trace = (
+            RequestTrace(self.hooks, method=method, path=path, url=url, started=started)
+            if self.hooks is not None
+            else None
+        )
+        while True:
+            request_headers = _merge_headers(
+                self.base_headers(),
+                headers,
+                request_options.get("additional_headers") if request_options is not None else None,
+            )
+            if encoded_json is not None:
+                _set_json_content_type(request_headers)
+            pacing = retry_loop.before_attempt(request_headers)
+            if pacing > 0:
+                time.sleep(pacing)
+            try:
+                response = self._send(
+                    trace,
+                    attempt=retry_loop.retries + 1,
                     method=method,
-                    base_url=base_url,
-                    params=params,
-                    json=json,
+                    url=url,
+                    headers=request_headers,
+                    params=_encoded_params if _encoded_params else None,
+                    json=json_body,
+                    data=data_body,
                     content=content,
-                    files=files,
-                    headers=headers,
-                    request_options=request_options,
-                    retries=retries + 1,
-                    omit=omit,
+                    files=request_files,
+                    timeout=timeout,
                 )
-
-        return response
+            except httpx.TransportError as exc:
+                if trace is not None:
+                    trace.error(exc)
+                delay = retry_loop.on_error(exc)
+                if delay is None:
+                    raise
+            else:
+                if self.json_codec is not None:
+                    use_json_codec(response, self.json_codec)
+                use_response_format(response, response_format)
+                if trace is not None:
+                    trace.response(response)
+                delay = retry_loop.on_response(response)
+                if delay is None:
+                    return response
+            time.sleep(delay)
 
     @contextmanager
     def stream(
@@ -377,7 +642,9 @@ class HttpClient:
         retries: int = 0,
         omit: typing.Optional[typing.Any] = None,
         force_multipart: typing.Optional[bool] = None,
+        authenticated: bool = True,
     ) -> typing.Iterator[httpx.Response]:
+        started = time.monotonic()
         base_url = self.get_base_url(base_url)
         timeout = (
             request_options.get("timeout_in_seconds")
@@ -418,25 +685,77 @@ class HttpClient:
             )
         )
 
-        with self.httpx_client.stream(
+        encoded_json = _encode_json_body(self.json_codec, json_body, data_body, content, request_files)
+        if encoded_json is not None:
+            json_body, content = None, encoded_json
+
+        url = _build_url(base_url, path)
+        retry_loop = _RetryLoop(
+            policy=_resolve_retry_policy(self.retry_policy, request_options),
+            stats=self.retry_stats,
             method=method,
-            url=_build_url(base_url, path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=_encoded_params if _encoded_params else None,
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=request_files,
-            timeout=timeout,
-        ) as stream:
+            url=url,
+            retries=retries,
+            budget=self.retry_budget,
+            rate_limiter=self.rate_limiter if authenticated else None,
+            on_unauthorized=self.on_unauthorized if authenticated else None,
+            on_retry=self.hooks.on_retry if self.hooks is not None else None,
+        )
+        trace = (
+            RequestTrace(self.hooks, method=method, path=path, url=url, started=started)
+            if self.hooks is not None
+            else None
+        )
+        # Retries only cover opening the stream: a response that is retried is
+        # closed before the next attempt, and errors raised while the caller
+        # iterates the body are not retried.
+        # With authenticated=False (e.g. a presigned download URL) the client's
+        # headers are not sent and the API's rate limit does not apply.
+        while True:
+            request_headers = _merge_headers(
+                self.base_headers() if authenticated else None,
+                headers,
+                request_options.get("additional_headers") if request_options is not None else None,
+            )
+            if encoded_json is not None:
+                _set_json_content_type(request_headers)
+            pacing = retry_loop.before_attempt(request_headers)
+            if pacing > 0:
+                time.sleep(pacing)
+            with ExitStack() as attempt_stack:
+                try:
+                    stream = self._open_stream(
+                        attempt_stack,
+                        trace,
+                        attempt=retry_loop.retries + 1,
+                        method=method,
+                        url=url,
+                        headers=request_headers,
+                        params=_encoded_params if _encoded_params else None,
+                        json=json_body,
+                        data=data_body,
+                        content=content,
+                        files=request_files,
+                        timeout=timeout,
+                    )
+                except httpx.TransportError as exc:
+                    if trace is not None:
+                        trace.error(exc)
+                    delay = retry_loop.on_error(exc)
+                    if delay is None:
+                        raise
+                else:
+                    if self.json_codec is not None:
+                        use_json_codec(stream, self.json_codec)
+                    if trace is not None:
+                        trace.response(stream)
+                    delay = retry_loop.on_response(stream)
+                    if delay is None:
+                        stream_stack = attempt_stack.pop_all()
+                        break
+            time.sleep(delay)
+
+        with stream_stack:
             yield stream
 
 
@@ -449,12 +768,28 @@ class AsyncHttpClient:
         base_headers: typing.Callable[[], typing.Dict[str, str]],
         base_url: typing.Optional[typing.Callable[[], str]] = None,
         async_base_headers: typing.Optional[typing.Callable[[], typing.Awaitable[typing.Dict[str, str]]]] = None,
+        retry_stats: typing.Optional[RetryStats] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        on_unauthorized: typing.Optional[typing.Callable[[str], bool]] = None,
+        hooks: typing.Optional[RequestHooks] = None,
+        json_codec: typing.Optional[JsonCodec] = None,
+        response_format: typing.Optional[ResponseFormat] = None,
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
         self.base_headers = base_headers
         self.async_base_headers = async_base_headers
         self.httpx_client = httpx_client
+        self.retry_stats = retry_stats if retry_stats is not None else RetryStats()
+        self.retry_policy = retry_policy if retry_policy is not None else DEFAULT_RETRY_POLICY
+        self.retry_budget = retry_budget
+        self.rate_limiter = rate_limiter
+        self.on_unauthorized = on_unauthorized
+        self.hooks = hooks
+        self.json_codec = json_codec
+        self.response_format = response_format
 
     async def _get_headers(self) -> typing.Dict[str, str]:
         if self.async_base_headers is not None:
@@ -470,6 +805,29 @@ class AsyncHttpClient:
             raise ValueError("A base_url is required to make this request, please provide one and try again.")
         return base_url
 
+    async def _send(
+        self, trace: typing.Optional[RequestTrace], *, attempt: int, **kwargs: typing.Any
+    ) -> httpx.Response:
+        if trace is None:
+            return await self.httpx_client.request(**kwargs)
+        # Build the request separately so the hooks can see its encoded size before it is sent.
+        build_started = time.monotonic()
+        request = self.httpx_client.build_request(**kwargs)
+        trace.request_start(request, attempt=attempt, build_started=build_started)
+        return await self.httpx_client.send(request)
+
+    async def _open_stream(
+        self, stack: AsyncExitStack, trace: typing.Optional[RequestTrace], *, attempt: int, **kwargs: typing.Any
+    ) -> httpx.Response:
+        if trace is None:
+            return await stack.enter_async_context(self.httpx_client.stream(**kwargs))
+        build_started = time.monotonic()
+        request = self.httpx_client.build_request(**kwargs)
+        trace.request_start(request, attempt=attempt, build_started=build_started)
+        response = await self.httpx_client.send(request, stream=True)
+        stack.push_async_callback(response.aclose)
+        return response
+
     async def request(
         self,
         path: typing.Optional[str] = None,
@@ -492,12 +850,19 @@ class AsyncHttpClient:
         omit: typing.Optional[typing.Any] = None,
         force_multipart: typing.Optional[bool] = None,
     ) -> httpx.Response:
+        started = time.monotonic()
         base_url = self.get_base_url(base_url)
         timeout = (
             request_options.get("timeout_in_seconds")
             if request_options is not None and request_options.get("timeout_in_seconds") is not None
             else self.base_timeout()
         )
+        response_format = (
+            request_options.get("response_format")
+            if request_options is not None and request_options.get("response_format") is not None
+            else self.response_format
+        )
+        check_response_format(response_format)
 
         request_files: typing.Optional[RequestFiles] = (
             convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
@@ -512,9 +877,6 @@ class AsyncHttpClient:
 
         data_body = _maybe_filter_none_from_multipart_data(data_body, request_files, force_multipart)
 
-        # Get headers (supports async token providers)
-        _headers = await self._get_headers()
-
         # Compute encoded params separately to avoid passing empty list to httpx
         # (httpx strips existing query params from URL when params=[] is passed)
         _encoded_params = encode_query(
@@ -535,45 +897,70 @@ class AsyncHttpClient:
             )
         )
 
-        # Add the input to each of these and do None-safety checks
-        response = await self.httpx_client.request(
+        encoded_json = _encode_json_body(self.json_codec, json_body, data_body, content, request_files)
+        if encoded_json is not None:
+            json_body, content = None, encoded_json
+
+        url = _build_url(base_url, path)
+        retry_loop = _RetryLoop(
+            policy=_resolve_retry_policy(self.retry_policy, request_options),
+            stats=self.retry_stats,
             method=method,
-            url=_build_url(base_url, path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **_headers,
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=_encoded_params if _encoded_params else None,
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=request_files,
-            timeout=timeout,
+            url=url,
+            retries=retries,
+            budget=self.retry_budget,
+            rate_limiter=self.rate_limiter,
+            on_unauthorized=self.on_unauthorized,
+            on_retry=self.hooks.on_retry if self.hooks is not None else None,
         )
-
-        max_retries: int = request_options.get("max_retries", 2) if request_options is not None else 2
-        if _should_retry(response=response):
-            if retries < max_retries:
-                await asyncio.sleep(_retry_timeout(response=response, retries=retries))
-                return await self.request(
-                    path=path,
+        trace = (
+            RequestTrace(self.hooks, method=method, path=path, url=url, started=started)
+            if self.hooks is not None
+            else None
+        )
+        while True:
+            # Get headers (supports async token providers)
+            _headers = await self._get_headers()
+            request_headers = _merge_headers(
+                _headers,
+                headers,
+                request_options.get("additional_headers") if request_options is not None else None,
+            )
+            if encoded_json is not None:
+                _set_json_content_type(request_headers)
+            pacing = retry_loop.before_attempt(request_headers)
+            if pacing > 0:
+                await asyncio.sleep(pacing)
+            try:
+                response = await self._send(
+                    trace,
+                    attempt=retry_loop.retries + 1,
                     method=method,
-                    base_url=base_url,
-                    params=params,
-                    json=json,
+                    url=url,
+                    headers=request_headers,
+                    params=_encoded_params if _encoded_params else None,
+                    json=json_body,
+                    data=data_body,
                     content=content,
-                    files=files,
-                    headers=headers,
-                    request_options=request_options,
-                    retries=retries + 1,
-                    omit=omit,
+                    files=request_files,
+                    timeout=timeout,
                 )
-        return response
+            except httpx.TransportError as exc:
+                if trace is not None:
+                    trace.error(exc)
+                delay = retry_loop.on_error(exc)
+                if delay is None:
+                    raise
+            else:
+                if self.json_codec is not None:
+                    use_json_codec(response, self.json_codec)
+                use_response_format(response, response_format)
+                if trace is not None:
+                    trace.response(response)
+                delay = retry_loop.on_response(response)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
 
     @asynccontextmanager
     async def stream(
@@ -597,7 +984,9 @@ class AsyncHttpClient:
         retries: int = 0,
         omit: typing.Optional[typing.Any] = None,
         force_multipart: typing.Optional[bool] = None,
+        authenticated: bool = True,
     ) -> typing.AsyncIterator[httpx.Response]:
+        started = time.monotonic()
         base_url = self.get_base_url(base_url)
         timeout = (
             request_options.get("timeout_in_seconds")
@@ -618,9 +1007,6 @@ class AsyncHttpClient:
 
         data_body = _maybe_filter_none_from_multipart_data(data_body, request_files, force_multipart)
 
-        # Get headers (supports async token providers)
-        _headers = await self._get_headers()
-
         # Compute encoded params separately to avoid passing empty list to httpx
         # (httpx strips existing query params from URL when params=[] is passed)
         _encoded_params = encode_query(
@@ -641,23 +1027,74 @@ class AsyncHttpClient:
             )
         )
 
-        async with self.httpx_client.stream(
+        encoded_json = _encode_json_body(self.json_codec, json_body, data_body, content, request_files)
+        if encoded_json is not None:
+            json_body, content = None, encoded_json
+
+        url = _build_url(base_url, path)
+        retry_loop = _RetryLoop(
+            policy=_resolve_retry_policy(self.retry_policy, request_options),
+            stats=self.retry_stats,
             method=method,
-            url=_build_url(base_url, path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **_headers,
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=_encoded_params if _encoded_params else None,
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=request_files,
-            timeout=timeout,
-        ) as stream:
+            url=url,
+            retries=retries,
+            budget=self.retry_budget,
+            rate_limiter=self.rate_limiter if authenticated else None,
+            on_unauthorized=self.on_unauthorized if authenticated else None,
+            on_retry=self.hooks.on_retry if self.hooks is not None else None,
+        )
+        trace = (
+            RequestTrace(self.hooks, method=method, path=path, url=url, started=started)
+            if self.hooks is not None
+            else None
+        )
+        # Retries only cover opening the stream; see HttpClient.stream.
+        while True:
+            # Get headers (supports async token providers)
+            _headers = await self._get_headers() if authenticated else None
+            request_headers = _merge_headers(
+                _headers,
+                headers,
+                request_options.get("additional_headers") if request_options is not None else None,
+            )
+            if encoded_json is not None:
+                _set_json_content_type(request_headers)
+            pacing = retry_loop.before_attempt(request_headers)
+            if pacing > 0:
+                await asyncio.sleep(pacing)
+            async with AsyncExitStack() as attempt_stack:
+                try:
+                    stream = await self._open_stream(
+                        attempt_stack,
+                        trace,
+                        attempt=retry_loop.retries + 1,
+                        method=method,
+                        url=url,
+                        headers=request_headers,
+                        params=_encoded_params if _encoded_params else None,
+                        json=json_body,
+                        data=data_body,
+                        content=content,
+                        files=request_files,
+                        timeout=timeout,
+                    )
+                except httpx.TransportError as exc:
+                    if trace is not None:
+                        trace.error(exc)
+                    delay = retry_loop.on_error(exc)
+                    if delay is None:
+                        raise
+                else:
+                    if self.json_codec is not None:
+                        use_json_codec(stream, self.json_codec)
+                    if trace is not None:
+                        trace.response(stream)
+                    delay = retry_loop.on_response(stream)
+                    if delay is None:
+                        stream_stack = attempt_stack.pop_all()
+                        break
+            # mypy cannot narrow `delay` across `async with`; it is never None here.
+            await asyncio.sleep(typing.cast(float, delay))
+
+        async with stream_stack:
             yield stream
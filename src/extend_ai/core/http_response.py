@@ -3,6 +3,7 @@
 from typing import Dict, Generic, TypeVar
 
 import httpx
+from .instrumentation import notify_model_constructed
 
 # Generic to represent the underlying type of the data wrapped by the HTTP response.
 T = TypeVar("T")
@@ -29,6 +30,7 @@ class HttpResponse(Generic[T], BaseHttpResponse):
     def __init__(self, response: httpx.Response, data: T):
         super().__init__(response)
         self._data = data
+        notify_model_constructed(response, data)
 
     @property
     def data(self) -> T:
@@ -46,6 +48,7 @@ class AsyncHttpResponse(Generic[T], BaseHttpResponse):
     def __init__(self, response: httpx.Response, data: T):
         super().__init__(response)
         self._data = data
+        notify_model_constructed(response, data)
 
     @property
     def data(self) -> T:
@@ -0,0 +1,249 @@
+"""
+Per-request lifecycle hooks for HttpClient and AsyncHttpClient.
+
+Each request goes through four phases, all timed with `time.monotonic()`:
+
+- encode: preparing the body and query string and building the httpx request,
+- network: sending the request and receiving the response (the whole body,
+  except for streaming requests, where only the headers),
+- decode: `response.json()`,
+- construct: building the SDK model from the decoded JSON (`construct_type`).
+
+Events are labelled with the logical operation: the method and the path with
+its ids replaced by `{id}`, e.g. `"GET parse_runs/{id}"`.
+
+Set `RequestHooks` on a client (`Extend(hooks=...)`) to receive a `RequestEvent`
+as each phase completes, e.g. to tell whether large ParseRun responses are
+bound by the network or by model construction.
+"""
+
+import re
+import time
+import typing
+from dataclasses import dataclass, replace
+
+import httpx
+from .response_format import CodecResponse
+from .retries import RetryAttempt
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """
+    What is known about one attempt of a request when a hook fires. Phases that
+    have not happened yet are None.
+
+    Attributes:
+        operation: Logical operation, e.g. `"POST extract_runs"` or `"GET parse_runs/{id}"`.
+        method: HTTP method.
+        path: Endpoint path relative to the base URL, e.g. `"parse_runs/pr_123"`.
+        url: Full request URL, without the query string.
+        attempt: 1-based attempt number.
+        request_bytes: Size of the request body, if known (None for streamed uploads).
+        encode: Seconds spent encoding the request.
+        status_code: Response status.
+        response_bytes: Size of the response body, if known.
+        network: Seconds from sending the request to receiving the response, or to the error.
+        decode: Seconds spent in `response.json()`.
+        construct: Seconds spent building the SDK model from the decoded JSON.
+        model: Class name of the constructed model, e.g. `"ParseRun"`.
+        error: Type of the transport error the attempt raised instead of getting a response,
+            e.g. `"ReadTimeout"` or `"ConnectError"`.
+    """
+
+    operation: str
+    method: str
+    path: str
+    url: str
+    attempt: int
+    request_bytes: typing.Optional[int]
+    encode: float
+    status_code: typing.Optional[int] = None
+    response_bytes: typing.Optional[int] = None
+    network: typing.Optional[float] = None
+    decode: typing.Optional[float] = None
+    construct: typing.Optional[float] = None
+    model: typing.Optional[str] = None
+    error: typing.Optional[str] = None
+
+
+RequestHook = typing.Callable[[RequestEvent], None]
+
+
+@dataclass(frozen=True)
+class RequestHooks:
+    """
+    Callbacks fired as a request moves through its phases. All are optional and
+    called synchronously, on the thread or event loop making the request, so
+    they should be cheap. Exceptions raised by a hook propagate to the caller.
+
+    Attributes:
+        on_request_start: Before each attempt is sent; `encode` is set.
+        on_response: When each attempt gets a response; adds status, size and `network`.
+        on_retry: When an attempt is going to be retried, with the same
+            RetryAttempt that `RetryPolicy.on_attempt` receives.
+        on_decode_complete: After `response.json()`; adds `decode`.
+        on_model_constructed: After the SDK model is built; adds `construct` and `model`.
+        on_error: When an attempt raises a transport error (a timeout, a refused or dropped
+            connection) instead of getting a response; adds `error` and `network`. Fires
+            before `on_retry` if the attempt is retried.
+
+    Example:
+        from extend_ai import Extend, RequestHooks
+
+        def log_phases(event):
+            print(event.path, event.response_bytes, event.network, event.decode, event.construct)
+
+        client = Extend(hooks=RequestHooks(on_model_constructed=log_phases))
+    """
+
+    on_request_start: typing.Optional[RequestHook] = None
+    on_response: typing.Optional[RequestHook] = None
+    on_retry: typing.Optional[typing.Callable[[RetryAttempt], None]] = None
+    on_decode_complete: typing.Optional[RequestHook] = None
+    on_model_constructed: typing.Optional[RequestHook] = None
+    on_error: typing.Optional[RequestHook] = None
+
+
+_WORD = re.compile(r"[a-z]+")
+
+
+def operation_name(method: str, path: typing.Optional[str]) -> str:
+    """
+    Name a request's operation after its method and path template: `GET parse_runs/pr_123`
+    becomes `"GET parse_runs/{id}"`. API paths alternate collections and ids, so a segment
+    following a collection is taken as an id unless it is a plain lowercase word, as in
+    `extract_runs/batch` or `classifiers/{id}/versions/latest`.
+    """
+    segments = (path or "").strip("/").split("/")
+    for index in range(1, len(segments), 2):
+        if not _WORD.fullmatch(segments[index]):
+            segments[index] = "{id}"
+    return f"{method} {'/'.join(segments)}".rstrip()
+
+
+def _content_length(headers: httpx.Headers) -> typing.Optional[int]:
+    value = headers.get("content-length")
+    return int(value) if value is not None and value.isdigit() else None
+
+
+def _request_bytes(request: httpx.Request) -> typing.Optional[int]:
+    try:
+        return len(request.content)
+    except httpx.RequestNotRead:
+        return _content_length(request.headers)
+
+
+def _response_bytes(response: httpx.Response) -> typing.Optional[int]:
+    try:
+        return len(response.content)
+    except httpx.ResponseNotRead:
+        return _content_length(response.headers)
+
+
+class RequestTrace:
+    """Times one logical request across its attempts and fires the client's hooks."""
+
+    def __init__(
+        self, hooks: RequestHooks, *, method: str, path: typing.Optional[str], url: str, started: float
+    ) -> None:
+        self.hooks = hooks
+        self.operation = operation_name(method, path)
+        self._method = method
+        self._path = path or ""
+        self._url = url
+        # Time spent encoding the body and query string before the first attempt.
+        self._prepare = time.monotonic() - started
+        self._sent_at = 0.0
+        self._decoded_at: typing.Optional[float] = None
+        self._event: typing.Optional[RequestEvent] = None
+
+    def request_start(self, request: httpx.Request, *, attempt: int, build_started: float) -> None:
+        self._sent_at = time.monotonic()
+        self._decoded_at = None
+        self._event = RequestEvent(
+            operation=self.operation,
+            method=self._method,
+            path=self._path,
+            url=self._url,
+            attempt=attempt,
+            request_bytes=_request_bytes(request),
+            encode=self._prepare + (self._sent_at - build_started),
+        )
+        if self.hooks.on_request_start is not None:
+            self.hooks.on_request_start(self._event)
+
+    def response(self, response: httpx.Response) -> None:
+        if self._event is None:
+            return
+        self._event = replace(
+            self._event,
+            status_code=response.status_code,
+            response_bytes=_response_bytes(response),
+            network=time.monotonic() - self._sent_at,
+        )
+        if self.hooks.on_response is not None:
+            self.hooks.on_response(self._event)
+        if self.hooks.on_decode_complete is not None or self.hooks.on_model_constructed is not None:
+            # Generated endpoint code calls response.json() and then builds the model; the
+            # subclass times json() and HttpResponse reports when the model is ready.
+            response.__class__ = _TracedResponse
+            typing.cast(_TracedResponse, response)._extend_trace = self
+
+    def error(self, exc: httpx.TransportError) -> None:
+        if self._event is None:
+            return
+        self._event = replace(self._event, error=type(exc).__name__, network=time.monotonic() - self._sent_at)
+        if self.hooks.on_error is not None:
+            self.hooks.on_error(self._event)
+
+    def decoded(self, started: float) -> None:
+        if self._event is None:
+            return
+        self._decoded_at = time.monotonic()
+        self._event = replace(self._event, decode=self._decoded_at - started)
+        if self.hooks.on_decode_complete is not None:
+            self.hooks.on_decode_complete(self._event)
+
+    def model_constructed(self, data: typing.Any) -> None:
+        if self._event is None or self._decoded_at is None:
+            return
+        self._event = replace(self._event, construct=time.monotonic() - self._decoded_at, model=type(data).__name__)
+        if self.hooks.on_model_constructed is not None:
+            self.hooks.on_model_constructed(self._event)
+
+
+class _TracedResponse(CodecResponse):
+    _extend_trace: RequestTrace
+
+    def json(self, **kwargs: typing.Any) -> typing.Any:
+        started = time.monotonic()
+        result = super().json(**kwargs)
+        self._extend_trace.decoded(started)
+        return result
+
+
+def notify_model_constructed(response: httpx.Response, data: typing.Any) -> None:
+    """Called by HttpResponse once the generated code has built `data` from `response`."""
+    if isinstance(response, _TracedResponse):
+        response._extend_trace.model_constructed(data)
+
+
+def _chain(callbacks: typing.List[typing.Callable[[typing.Any], None]]) -> typing.Callable[[typing.Any], None]:
+    def call_all(event: typing.Any) -> None:
+        for callback in callbacks:
+            callback(event)
+
+    return call_all
+
+
+def merge_hooks(*hooks: typing.Optional[RequestHooks]) -> typing.Optional[RequestHooks]:
+    """Combine several RequestHooks into one that calls each of them in order."""
+    present = [hook for hook in hooks if hook is not None]
+    if len(present) <= 1:
+        return present[0] if present else None
+    merged: typing.Dict[str, typing.Any] = {}
+    for name in RequestHooks.__dataclass_fields__:
+        callbacks = [getattr(hook, name) for hook in present if getattr(hook, name) is not None]
+        merged[name] = callbacks[0] if len(callbacks) == 1 else _chain(callbacks) if callbacks else None
+    return RequestHooks(**merged)
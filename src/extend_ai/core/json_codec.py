@@ -0,0 +1,158 @@
+"""
+Pluggable JSON codec for request bodies and response decoding.
+
+By default the client leaves JSON to httpx, which uses the standard library.
+Large responses (parse outputs with OCR words run to tens of megabytes) decode
+several times faster with orjson or msgspec, so a client can opt in with
+`Extend(json_codec="auto")`: HttpClient and AsyncHttpClient then encode JSON
+bodies with the codec, and `response.json()` in the generated endpoint code
+decodes with it.
+
+Codecs accept and produce the same JSON as the standard library: input that
+orjson or msgspec reject (NaN literals, integers beyond 64 bits, non-UTF-8
+encodings) is decoded with the standard library instead, and invalid input
+raises `json.JSONDecodeError` as before. When encoding, orjson and msgspec
+write NaN and infinities as `null`, where the standard library raises.
+"""
+
+import importlib
+import importlib.util
+import json
+import typing
+
+import httpx
+from .response_format import CodecResponse
+
+JsonCodecName = typing.Literal["auto", "orjson", "msgspec", "json"]
+
+# Preference order for "auto".
+_AUTO = ("orjson", "msgspec")
+
+
+def _stdlib_loads(data: typing.Union[str, bytes]) -> typing.Any:
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj: typing.Any) -> bytes:
+    # Same settings httpx uses for `json=` bodies.
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+class JsonCodec:
+    """
+    A pair of JSON functions used for request bodies and responses.
+
+    Get one by name with `JsonCodec.named()`, or build one from your own
+    functions. `loads` takes str or bytes and must raise `json.JSONDecodeError`
+    (or a subclass) on invalid input, which the generated code relies on to
+    fall back to the raw response text. `dumps` returns UTF-8 bytes.
+
+    Attributes:
+        name: "orjson", "msgspec", "json", or the name given.
+
+    Example:
+        from extend_ai import Extend, JsonCodec
+
+        client = Extend(json_codec="auto")  # orjson or msgspec if installed
+        print(client.json_codec.name)
+
+        client = Extend(json_codec=JsonCodec.named("orjson"))  # ImportError if orjson is missing
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        loads: typing.Callable[[typing.Union[str, bytes]], typing.Any],
+        dumps: typing.Callable[[typing.Any], bytes],
+    ) -> None:
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+    @classmethod
+    def named(cls, name: JsonCodecName) -> "JsonCodec":
+        """
+        The codec called *name*. "auto" is orjson if installed, then msgspec,
+        then the standard library; naming an uninstalled codec raises ImportError.
+        """
+        if name == "auto":
+            for candidate in _AUTO:
+                if importlib.util.find_spec(candidate) is not None:
+                    return cls.named(typing.cast(JsonCodecName, candidate))
+            return STDLIB_CODEC
+        if name == "json":
+            return STDLIB_CODEC
+        if name == "orjson":
+            return _orjson_codec()
+        if name == "msgspec":
+            return _msgspec_codec()
+        raise ValueError(f"Unknown JSON codec {name!r}; expected one of 'auto', 'orjson', 'msgspec', 'json'")
+
+
+STDLIB_CODEC = JsonCodec("json", loads=_stdlib_loads, dumps=_stdlib_dumps)
+
+
+def _import(name: str) -> typing.Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError as exc:
+        raise ImportError(
+            f"json_codec={name!r} requires the {name} package. Install it with: pip install {name}"
+        ) from exc
+
+
+def _orjson_codec() -> JsonCodec:
+    orjson = _import("orjson")
+    options = orjson.OPT_NON_STR_KEYS
+
+    def loads(data: typing.Union[str, bytes]) -> typing.Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return _stdlib_loads(data)
+
+    def dumps(obj: typing.Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=options)
+        except TypeError:
+            return _stdlib_dumps(obj)
+
+    return JsonCodec("orjson", loads=loads, dumps=dumps)
+
+
+def _msgspec_codec() -> JsonCodec:
+    msgspec = _import("msgspec")
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def loads(data: typing.Union[str, bytes]) -> typing.Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError:
+            return _stdlib_loads(data)
+
+    def dumps(obj: typing.Any) -> bytes:
+        try:
+            return encoder.encode(obj)
+        except (TypeError, msgspec.EncodeError):
+            return _stdlib_dumps(obj)
+
+    return JsonCodec("msgspec", loads=loads, dumps=dumps)
+
+
+def resolve_json_codec(codec: typing.Union[JsonCodecName, JsonCodec, None]) -> typing.Optional[JsonCodec]:
+    """None (leave JSON to httpx), a JsonCodec, or the codec with that name."""
+    if codec is None or isinstance(codec, JsonCodec):
+        return codec
+    return JsonCodec.named(codec)
+
+
+def use_json_codec(response: httpx.Response, codec: JsonCodec) -> None:
+    """Make `response.json()` decode with *codec*. Keeps subclasses set by RequestTrace."""
+    if not isinstance(response, CodecResponse):
+        response.__class__ = CodecResponse
+    typing.cast(CodecResponse, response)._extend_json_codec = codec
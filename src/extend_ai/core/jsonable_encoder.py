@@ -11,6 +11,7 @@ https://github.com/tiangolo/fastapi/blob/master/fastapi/encoders.py
 import base64
 import dataclasses
 import datetime as dt
+import itertools
 from enum import Enum
 from pathlib import PurePath
 from types import GeneratorType
@@ -29,11 +30,21 @@ DictIntStrAny = Dict[Union[int, str], Any]
 
 
 def jsonable_encoder(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]] = None) -> Any:
+    """
+    JSON-native values (str/int/float/bool/None, and dicts and lists made only of them) are returned
+    as is rather than rebuilt; anything else is encoded into new containers as before.
+    """
     custom_encoder = custom_encoder or {}
     # Generated SDKs use Ellipsis (`...`) as the sentinel value for "OMIT".
     # OMIT values should be excluded from serialized payloads.
     if obj is Ellipsis:
         return None
+    if not custom_encoder:
+        # Exact-type dispatch for the common types; subclasses (str enums, dict subclasses, ...) take the
+        # isinstance chain below.
+        encode = _ENCODERS_BY_TYPE.get(type(obj))
+        if encode is not None:
+            return encode(obj, custom_encoder)
     if custom_encoder:
         if type(obj) in custom_encoder:
             return custom_encoder[type(obj)](obj)
@@ -70,23 +81,14 @@ def jsonable_encoder(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any]
     if isinstance(obj, dt.date):
         return str(obj)
     if isinstance(obj, dict):
-        encoded_dict = {}
-        allowed_keys = set(obj.keys())
-        for key, value in obj.items():
-            if key in allowed_keys:
-                if value is Ellipsis:
-                    continue
-                encoded_key = jsonable_encoder(key, custom_encoder=custom_encoder)
-                encoded_value = jsonable_encoder(value, custom_encoder=custom_encoder)
-                encoded_dict[encoded_key] = encoded_value
-        return encoded_dict
-    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple)):
-        encoded_list = []
-        for item in obj:
-            if item is Ellipsis:
-                continue
-            encoded_list.append(jsonable_encoder(item, custom_encoder=custom_encoder))
-        return encoded_list
+        encoded_dict = _encode_dict(obj, custom_encoder)
+        # Subclasses (OrderedDict, defaultdict, ...) are always encoded as plain dicts.
+        return encoded_dict if encoded_dict is not obj else dict(obj)
+    if isinstance(obj, list):
+        encoded_list = _encode_list(obj, custom_encoder)
+        return encoded_list if encoded_list is not obj else list(obj)
+    if isinstance(obj, (set, frozenset, GeneratorType, tuple)):
+        return _encode_iterable(obj, custom_encoder)
 
     def fallback_serializer(o: Any) -> Any:
         attempt_encode = encode_by_type(o)
@@ -106,3 +108,84 @@ def jsonable_encoder(obj: Any, custom_encoder: Optional[Dict[Any, Callable[[Any]
         return jsonable_encoder(data, custom_encoder=custom_encoder)
 
     return to_jsonable_with_fallback(obj, fallback_serializer)
+
+
+# Types that jsonable_encoder returns unchanged (without a custom encoder), both as values and as dict keys.
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+def _encode_item(item: Any, custom_encoder: Dict[Any, Callable[[Any], Any]]) -> Any:
+    if custom_encoder:
+        return jsonable_encoder(item, custom_encoder=custom_encoder)
+    type_ = type(item)
+    if type_ in _JSON_SCALARS:
+        return item
+    encode = _ENCODERS_BY_TYPE.get(type_)
+    return encode(item, custom_encoder) if encode is not None else jsonable_encoder(item)
+
+
+def _encode_dict(obj: Dict[Any, Any], custom_encoder: Dict[Any, Callable[[Any], Any]]) -> Dict[Any, Any]:
+    """
+    Encodes *obj* in a single pass, returning *obj* itself if no key or value changed and nothing was
+    omitted. The copy is only started at the first key that differs.
+    """
+    scalars = _JSON_SCALARS if not custom_encoder else frozenset()
+    encoded_dict: Optional[Dict[Any, Any]] = None
+    for key, value in obj.items():
+        if value is Ellipsis:
+            if encoded_dict is None:
+                encoded_dict = _copy_until(obj, key)
+            continue
+        encoded_key = key if type(key) in scalars else _encode_item(key, custom_encoder)
+        encoded_value = value if type(value) in scalars else _encode_item(value, custom_encoder)
+        if encoded_dict is None:
+            if encoded_key is key and encoded_value is value:
+                continue
+            encoded_dict = _copy_until(obj, key)
+        encoded_dict[encoded_key] = encoded_value
+    return obj if encoded_dict is None else encoded_dict
+
+
+def _copy_until(obj: Dict[Any, Any], stop: Any) -> Dict[Any, Any]:
+    # The entries before *stop*, all of which encoded to themselves.
+    return dict(itertools.takewhile(lambda item: item[0] is not stop, obj.items()))
+
+
+def _encode_list(obj: List[Any], custom_encoder: Dict[Any, Callable[[Any], Any]]) -> List[Any]:
+    """Like _encode_dict: returns *obj* itself if no item changed and none was omitted."""
+    scalars = _JSON_SCALARS if not custom_encoder else frozenset()
+    encoded_list: Optional[List[Any]] = None
+    for index, item in enumerate(obj):
+        if item is Ellipsis:
+            if encoded_list is None:
+                encoded_list = obj[:index]
+            continue
+        encoded_item = item if type(item) in scalars else _encode_item(item, custom_encoder)
+        if encoded_list is None:
+            if encoded_item is item:
+                continue
+            encoded_list = obj[:index]
+        encoded_list.append(encoded_item)
+    return obj if encoded_list is None else encoded_list
+
+
+def _encode_iterable(obj: Any, custom_encoder: Dict[Any, Callable[[Any], Any]]) -> List[Any]:
+    return [_encode_item(item, custom_encoder) for item in obj if item is not Ellipsis]
+
+
+def _return_as_is(obj: Any, custom_encoder: Dict[Any, Callable[[Any], Any]]) -> Any:
+    return obj
+
+
+_ENCODERS_BY_TYPE: Dict[type, Callable[[Any, Dict[Any, Callable[[Any], Any]]], Any]] = {
+    **{type_: _return_as_is for type_ in _JSON_SCALARS},
+    dict: _encode_dict,
+    list: _encode_list,
+    tuple: _encode_iterable,
+    set: _encode_iterable,
+    frozenset: _encode_iterable,
+    GeneratorType: _encode_iterable,
+    bytes: lambda obj, custom_encoder: base64.b64encode(obj).decode("utf-8"),
+    dt.datetime: lambda obj, custom_encoder: serialize_datetime(obj),
+    dt.date: lambda obj, custom_encoder: str(obj),
+}
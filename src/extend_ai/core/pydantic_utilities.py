@@ -2,6 +2,7 @@
 
 # nopycln: file
 import datetime as dt
+import functools
 import inspect
 import json
 import logging
@@ -236,6 +237,73 @@ def parse_sse_obj(sse: "ServerSentEvent", type_: Type[T]) -> T:
         return parse_obj_as(type_, sse_event)
 
 
+# Bound on the number of TypeAdapters and field-alias maps kept by parse_obj_as. The SDK has a few hundred models
+# and unions, so in practice every type that is parsed stays cached.
+PARSE_CACHE_SIZE = 512
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _field_aliases(model: Type[Any]) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]]:
+    """
+    Alias metadata for a model, computed once per class: the (name, alias) pairs of fields whose alias
+    differs from their name, and the (key, alias) pairs of keys that are both an alias and a field name.
+    """
+    if IS_PYDANTIC_V2:
+        fields = {name: getattr(info, "alias", None) for name, info in getattr(model, "model_fields", {}).items()}
+    else:
+        fields = {name: getattr(field, "alias", None) for name, field in getattr(model, "__fields__", {}).items()}
+    name_to_alias = {name: alias or name for name, alias in fields.items()}
+    renames = tuple((name, alias) for name, alias in name_to_alias.items() if alias != name)
+    ambiguous = tuple((alias, name_to_alias[alias]) for _, alias in renames if alias in name_to_alias)
+    return renames, ambiguous
+
+
+def _coerce_field_names(model: Any, data: Mapping[str, Any]) -> Dict[str, Any]:
+    renames, ambiguous = _field_aliases(model)
+    # Detect ambiguous keys: a key that is an alias for one field and a name for another.
+    for key, alias in ambiguous:
+        if key in data and alias not in data:
+            raise ValueError(
+                f"Ambiguous input key '{key}': it is both a field name and an alias. "
+                "Provide the explicit alias key to disambiguate."
+            )
+    if not any(name in data for name, _ in renames):
+        # Responses use the wire (alias) keys, so there is usually nothing to rewrite.
+        return data if isinstance(data, dict) else dict(data)
+    rewritten: Dict[str, Any] = dict(data)
+    for name, alias in renames:
+        if name in data and alias not in rewritten:
+            rewritten[alias] = rewritten.pop(name)
+    return rewritten
+
+
+def type_cache_key(type_: Any) -> Any:
+    """
+    Hashable key for caching per-annotation work. Unions compare equal regardless of member order
+    (Union[str, int] == Union[int, str]), but member order decides which one wins, so the key spells
+    out every argument in order. Raises TypeError for unhashable annotations.
+    """
+    args = typing_extensions.get_args(type_)
+    if not args:
+        return type_
+    return (type_, tuple(type_cache_key(arg) for arg in args))
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _cached_type_adapter(type_: Type[Any], cache_key: Any) -> Any:
+    return pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
+
+
+def _get_type_adapter(type_: Any) -> Any:
+    # Building a TypeAdapter generates the type's core schema, which costs far more than validating a typical
+    # payload. lru_cache is thread-safe; concurrent misses for the same type may each build an adapter.
+    try:
+        return _cached_type_adapter(type_, type_cache_key(type_))
+    except TypeError:
+        # Unhashable annotations (e.g. Annotated with unhashable metadata) are not cached.
+        return pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
+
+
 def parse_obj_as(type_: Type[T], object_: Any) -> T:
     # convert_and_respect_annotation_metadata is required for TypedDict aliasing.
     #
@@ -244,32 +312,13 @@ def parse_obj_as(type_: Type[T], object_: Any) -> T:
     #   unchanged so Pydantic can validate them.
     # - If the model encodes aliasing only via FieldMetadata annotations, then we MUST pre-dealias because Pydantic
     #   will not recognize those aliases during validation.
-    if inspect.isclass(type_) and issubclass(type_, pydantic.BaseModel):
-        has_pydantic_aliases = False
-        if IS_PYDANTIC_V2:
-            for field_name, field_info in getattr(type_, "model_fields", {}).items():  # type: ignore[attr-defined]
-                alias = getattr(field_info, "alias", None)
-                if alias is not None and alias != field_name:
-                    has_pydantic_aliases = True
-                    break
-        else:
-            for field in getattr(type_, "__fields__", {}).values():
-                alias = getattr(field, "alias", None)
-                name = getattr(field, "name", None)
-                if alias is not None and name is not None and alias != name:
-                    has_pydantic_aliases = True
-                    break
-
-        dealiased_object = (
-            object_
-            if has_pydantic_aliases
-            else convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
-        )
+    if inspect.isclass(type_) and issubclass(type_, pydantic.BaseModel) and _field_aliases(type_)[0]:
+        dealiased_object = object_
     else:
         dealiased_object = convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
     if IS_PYDANTIC_V2:
-        adapter = pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
-        return adapter.validate_python(dealiased_object)
+        adapter = _get_type_adapter(type_)
+        return cast(T, adapter.validate_python(dealiased_object))
     return pydantic.parse_obj_as(type_, dealiased_object)
 
 
@@ -297,33 +346,7 @@ class UniversalBaseModel(pydantic.BaseModel):
             """
             if not isinstance(data, Mapping):
                 return data
-
-            fields = getattr(cls, "model_fields", {})  # type: ignore[attr-defined]
-            name_to_alias: Dict[str, str] = {}
-            alias_to_name: Dict[str, str] = {}
-
-            for name, field_info in fields.items():
-                alias = getattr(field_info, "alias", None) or name
-                name_to_alias[name] = alias
-                if alias != name:
-                    alias_to_name[alias] = name
-
-            # Detect ambiguous keys: a key that is an alias for one field and a name for another.
-            ambiguous_keys = set(alias_to_name.keys()).intersection(set(name_to_alias.keys()))
-            for key in ambiguous_keys:
-                if key in data and name_to_alias[key] not in data:
-                    raise ValueError(
-                        f"Ambiguous input key '{key}': it is both a field name and an alias. "
-                        "Provide the explicit alias key to disambiguate."
-                    )
-
-            original_keys = set(data.keys())
-            rewritten: Dict[str, Any] = dict(data)
-            for name, alias in name_to_alias.items():
-                if alias != name and name in original_keys and alias not in rewritten:
-                    rewritten[alias] = rewritten.pop(name)
-
-            return rewritten
+            return _coerce_field_names(cls, data)
 
         @pydantic.model_serializer(mode="plain", when_used="json")  # type: ignore[attr-defined]
         def serialize_model(self) -> Any:  # type: ignore[name-defined]
@@ -344,32 +367,7 @@ class UniversalBaseModel(pydantic.BaseModel):
             """
             if not isinstance(values, Mapping):
                 return values
-
-            fields = getattr(cls, "__fields__", {})
-            name_to_alias: Dict[str, str] = {}
-            alias_to_name: Dict[str, str] = {}
-
-            for name, field in fields.items():
-                alias = getattr(field, "alias", None) or name
-                name_to_alias[name] = alias
-                if alias != name:
-                    alias_to_name[alias] = name
-
-            ambiguous_keys = set(alias_to_name.keys()).intersection(set(name_to_alias.keys()))
-            for key in ambiguous_keys:
-                if key in values and name_to_alias[key] not in values:
-                    raise ValueError(
-                        f"Ambiguous input key '{key}': it is both a field name and an alias. "
-                        "Provide the explicit alias key to disambiguate."
-                    )
-
-            original_keys = set(values.keys())
-            rewritten: Dict[str, Any] = dict(values)
-            for name, alias in name_to_alias.items():
-                if alias != name and name in original_keys and alias not in rewritten:
-                    rewritten[alias] = rewritten.pop(name)
-
-            return rewritten
+            return _coerce_field_names(cls, values)
 
     @classmethod
     def model_construct(cls: Type["Model"], _fields_set: Optional[Set[str]] = None, **values: Any) -> "Model":
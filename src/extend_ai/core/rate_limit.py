@@ -0,0 +1,180 @@
+"""
+Client-side pacing driven by the API's X-RateLimit headers.
+
+HttpClient and AsyncHttpClient consult an optional RateLimiter before every
+attempt and feed it every response. The limiter learns the remaining quota
+and the reset time per workspace and spreads the remaining quota evenly over
+the rest of the window, so bulk jobs run at the sustainable rate instead of
+bursting into 429s and backing off.
+"""
+
+import threading
+import time
+import typing
+from dataclasses import dataclass
+
+import httpx
+
+WORKSPACE_HEADER = "x-extend-workspace-id"
+
+
+@dataclass(frozen=True)
+class RateLimitState:
+    """
+    What a RateLimiter currently knows about one workspace's quota.
+
+    Attributes:
+        limit: Requests allowed per window, if the API reported it.
+        remaining: Requests left in the current window, after local reservations.
+        reset_in: Seconds until the window resets.
+    """
+
+    limit: typing.Optional[int]
+    remaining: int
+    reset_in: float
+
+
+class _Bucket:
+    __slots__ = ("limit", "remaining", "reset", "reset_at", "next_send_at", "peak", "window")
+
+    def __init__(self) -> None:
+        self.limit: typing.Optional[int] = None
+        self.remaining: typing.Optional[int] = None
+        # The window's X-RateLimit-Reset value as reported, to recognise later responses in the same window.
+        self.reset: typing.Optional[int] = None
+        self.reset_at = 0.0
+        self.next_send_at = 0.0
+        # Highest remaining count and longest time to reset seen: lower bounds for the limit and the window length.
+        self.peak = 0
+        self.window = 0.0
+
+    def reset_interval(self) -> float:
+        """Spacing for requests held past an exhausted window's reset: one window's worth of quota, evenly spread."""
+        capacity = self.limit or self.peak
+        if capacity <= 0:
+            # Nothing is known about the quota: let one request through per window until a response reports it.
+            return self.window
+        return self.window / capacity
+
+
+def _header_int(headers: httpx.Headers, name: str) -> typing.Optional[int]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that paces requests to stay under the API rate limit.
+
+    Quota is tracked per `x-extend-workspace-id` header, so org-scoped keys that
+    target several workspaces get one bucket per workspace. Requests without
+    the header share a default bucket. Until a response has reported the
+    quota, requests are sent immediately.
+
+    One limiter can be shared by several clients (sync and async) that use the
+    same API key.
+
+    Args:
+        max_delay: Upper bound for a single pacing wait, in seconds. It does not apply once the
+            quota is exhausted: requests then wait until the window resets, however long that is,
+            since sending them earlier would only be rejected with a 429. Requests held that way
+            are let through one limit-per-window interval apart after the reset.
+
+    Example:
+        from extend_ai import Extend, RateLimiter
+
+        client = Extend(token="...", rate_limiter=RateLimiter())
+        for url in urls:
+            client.extract_runs.create(file={"url": url}, extractor={"id": "ex_123"})
+    """
+
+    def __init__(self, *, max_delay: float = 60.0) -> None:
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._buckets: typing.Dict[typing.Optional[str], _Bucket] = {}
+
+    def reserve(self, workspace_id: typing.Optional[str] = None) -> float:
+        """
+        Claim a slot for one request and return how many seconds to wait before sending it.
+        The caller is responsible for waiting (HttpClient sleeps, AsyncHttpClient awaits).
+        """
+        with self._lock:
+            bucket = self._buckets.get(workspace_id)
+            if bucket is None:
+                return 0.0
+            now = time.monotonic()
+            if bucket.remaining is None or now >= bucket.reset_at:
+                # The window has rolled over; the next response reports the new quota.
+                bucket.remaining = None
+                if bucket.next_send_at <= now:
+                    return 0.0
+                # Requests held for the exhausted window are still being let through; queue behind them.
+                start = bucket.next_send_at
+                bucket.next_send_at = start + bucket.reset_interval()
+                return start - now
+            start = max(now, bucket.next_send_at)
+            if bucket.remaining <= 0:
+                # Quota exhausted: hold the request until the window resets, uncapped, and space the held
+                # requests out from there so they do not all hit the new window at once.
+                start = max(start, bucket.reset_at)
+                bucket.next_send_at = start + bucket.reset_interval()
+                return start - now
+            # Spread what is left of the quota evenly over what is left of the window.
+            interval = max(bucket.reset_at - start, 0.0) / bucket.remaining
+            bucket.next_send_at = start + interval
+            bucket.remaining -= 1
+            return min(start - now, self.max_delay)
+
+    def observe(self, response: httpx.Response, workspace_id: typing.Optional[str] = None) -> None:
+        """
+        Update the workspace's quota from a response's X-RateLimit (and Retry-After) headers.
+
+        Within a window the count only goes down: a response to a request sent
+        before later reservations reports more quota than is left after them.
+        """
+        headers = response.headers
+        remaining = _header_int(headers, "x-ratelimit-remaining")
+        reset = _header_int(headers, "x-ratelimit-reset")
+        limit = _header_int(headers, "x-ratelimit-limit")
+        retry_after = _header_int(headers, "retry-after")
+        if response.status_code == 429 and remaining is None:
+            remaining = 0
+        if remaining is None:
+            return
+
+        now = time.monotonic()
+        if reset is not None:
+            reset_at = now + max(reset - time.time(), 0.0)
+        elif retry_after is not None:
+            reset_at = now + retry_after
+        else:
+            return
+
+        with self._lock:
+            bucket = self._buckets.setdefault(workspace_id, _Bucket())
+            if limit is not None:
+                bucket.limit = limit
+            bucket.peak = max(bucket.peak, remaining)
+            bucket.window = max(bucket.window, reset_at - now)
+            if reset is not None and reset == bucket.reset and bucket.remaining is not None:
+                remaining = min(bucket.remaining, remaining)
+            bucket.remaining = remaining
+            bucket.reset = reset
+            bucket.reset_at = reset_at
+
+    def state(self, workspace_id: typing.Optional[str] = None) -> typing.Optional[RateLimitState]:
+        """Current view of a workspace's quota, or None if no response has reported it yet."""
+        with self._lock:
+            bucket = self._buckets.get(workspace_id)
+            if bucket is None or bucket.remaining is None:
+                return None
+            return RateLimitState(
+                limit=bucket.limit,
+                remaining=bucket.remaining,
+                reset_in=max(bucket.reset_at - time.monotonic(), 0.0),
+            )
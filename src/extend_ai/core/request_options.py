@@ -7,6 +7,9 @@ try:
 except ImportError:
     from typing_extensions import NotRequired
 
+from .response_format import ResponseFormat
+from .retries import RetryPolicy
+
 
 class RequestOptions(typing.TypedDict, total=False):
     """
@@ -18,18 +21,24 @@ class RequestOptions(typing.TypedDict, total=False):
 
         - max_retries: int. The max number of retries to attempt if the API call fails.
 
+        - retry_policy: RetryPolicy. Retry rules for this request, overriding the client's policy. `max_retries`, if also set, takes precedence over the policy's.
+
         - additional_headers: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's header dict
 
         - additional_query_parameters: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's query parameters dict
 
         - additional_body_parameters: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's body parameters dict
 
+        - response_format: ResponseFormat. "raw" returns the decoded JSON of a successful response instead of a model, "bytes" the undecoded body, and "lazy" a LazyModel whose nested objects and lists are constructed on first access; errors are raised as usual. Overrides the client's `response_format`.
+
         - chunk_size: int. The size, in bytes, to process each chunk of data being streamed back within the response. This equates to leveraging `chunk_size` within `requests` or `httpx`, and is only leveraged for file downloads.
     """
 
     timeout_in_seconds: NotRequired[int]
     max_retries: NotRequired[int]
+    retry_policy: NotRequired[RetryPolicy]
     additional_headers: NotRequired[typing.Dict[str, typing.Any]]
     additional_query_parameters: NotRequired[typing.Dict[str, typing.Any]]
     additional_body_parameters: NotRequired[typing.Dict[str, typing.Any]]
+    response_format: NotRequired[ResponseFormat]
     chunk_size: NotRequired[int]
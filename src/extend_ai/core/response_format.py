@@ -0,0 +1,84 @@
+"""
+Skip model construction for successful responses.
+
+Generated endpoint methods build the response model with
+`construct_type(type_=..., object_=response.json())`. For large outputs
+(ParseRun chunks and blocks, OCR words) that is most of the cost of a call,
+and pipelines that forward the JSON to storage don't need the model. With
+`response_format="raw"` a successful response's `json()` returns its decoded
+JSON wrapped in a RawBody, which `construct_type` unwraps instead of
+constructing; `"bytes"` skips decoding too and returns the body as received.
+`"lazy"` sits in between: a LazyModel proxy is built with the model's scalar
+fields, and nested objects and lists are only constructed when first
+accessed (see `construct_lazily` in unchecked_base_model.py).
+
+Only 2xx responses are marked, so error responses still raise the typed
+errors with parsed bodies.
+"""
+
+import typing
+
+import httpx
+
+if typing.TYPE_CHECKING:
+    from .json_codec import JsonCodec
+
+ResponseFormat = typing.Literal["model", "raw", "bytes", "lazy"]
+
+_RESPONSE_FORMATS = ("model", "raw", "bytes", "lazy")
+
+
+class RawBody:
+    """A response body to hand to the caller as is, rather than construct a model from."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: typing.Any) -> None:
+        self.value = value
+
+
+class LazyBody:
+    """A decoded response body to construct a model from lazily."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: typing.Any) -> None:
+        self.value = value
+
+
+class CodecResponse(httpx.Response):
+    """
+    An httpx.Response whose `json()` decodes with the client's JSON codec, if it has one, and
+    returns a RawBody or LazyBody when another response format was requested.
+    """
+
+    _extend_json_codec: typing.Optional["JsonCodec"] = None
+    _extend_response_format: typing.Optional[str] = None
+
+    def json(self, **kwargs: typing.Any) -> typing.Any:
+        if self._extend_response_format == "bytes":
+            return RawBody(self.content)
+        codec = self._extend_json_codec
+        data = super().json(**kwargs) if codec is None or kwargs else codec.loads(self.content)
+        if self._extend_response_format == "raw":
+            return RawBody(data)
+        if self._extend_response_format == "lazy":
+            return LazyBody(data)
+        return data
+
+
+def check_response_format(response_format: typing.Optional[str]) -> None:
+    if response_format is not None and response_format not in _RESPONSE_FORMATS:
+        raise ValueError(
+            f"Unknown response_format {response_format!r}; expected one of 'model', 'raw', 'bytes', 'lazy'"
+        )
+
+
+def use_response_format(response: httpx.Response, response_format: typing.Optional[str]) -> None:
+    """Make a successful response's `json()` return a RawBody or LazyBody; "model" and None do nothing."""
+    marked = response_format in ("raw", "bytes", "lazy") and response.is_success
+    if not isinstance(response, CodecResponse):
+        if not marked:
+            return
+        response.__class__ = CodecResponse
+    typing.cast(CodecResponse, response)._extend_response_format = response_format if marked else None
@@ -0,0 +1,300 @@
+"""
+Retry classification and accounting shared by HttpClient and AsyncHttpClient.
+
+Transport errors (httpx.TransportError) are split into two groups:
+
+- errors raised before the request reached the server (connect failures and
+  pool timeouts), which are safe to retry for every method, and
+- errors raised after the request may have been sent (read/write failures,
+  read/write timeouts, dropped connections), which are only retried for
+  idempotent methods.
+
+A RetryPolicy decides which attempts are retried and how long to wait between
+them. It can be set per client (`Extend(retry_policy=...)`) or per request
+(`request_options={"retry_policy": ...}`).
+"""
+
+import threading
+import typing
+from dataclasses import dataclass, field
+
+import httpx
+
+INITIAL_RETRY_DELAY_SECONDS = 1.0
+MAX_RETRY_DELAY_SECONDS = 60.0
+JITTER_FACTOR = 0.2  # 20% random jitter
+
+IDEMPOTENT_METHODS: typing.FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+RETRYABLE_4XX_STATUSES: typing.FrozenSet[int] = frozenset({408, 409, 429})
+
+# (exception type, counter label, retryable for non-idempotent methods)
+# Ordered most-specific first: ConnectTimeout and PoolTimeout are TimeoutExceptions,
+# and RemoteProtocolError is a ProtocolError.
+_TRANSPORT_ERROR_KINDS: typing.Tuple[typing.Tuple[typing.Type[httpx.TransportError], str, bool], ...] = (
+    (httpx.ConnectTimeout, "connect_timeout", True),
+    (httpx.PoolTimeout, "pool_timeout", True),
+    (httpx.ConnectError, "connect_error", True),
+    (httpx.ReadTimeout, "read_timeout", False),
+    (httpx.WriteTimeout, "write_timeout", False),
+    (httpx.RemoteProtocolError, "remote_protocol_error", False),
+    (httpx.ReadError, "read_error", False),
+    (httpx.WriteError, "write_error", False),
+)
+
+
+def transport_error_kind(exc: BaseException) -> str:
+    """Return the counter label for a transport error, e.g. `"connect_timeout"`."""
+    for error_type, kind, _ in _TRANSPORT_ERROR_KINDS:
+        if isinstance(exc, error_type):
+            return kind
+    return type(exc).__name__
+
+
+def is_retryable_transport_error(exc: BaseException, method: str) -> bool:
+    """
+    Whether a transport error raised while sending `method` may be retried.
+
+    Errors that are not listed above (proxy errors, unsupported protocols, local
+    protocol errors, ...) indicate a misconfiguration and are never retried.
+    """
+    for error_type, _, retry_any_method in _TRANSPORT_ERROR_KINDS:
+        if isinstance(exc, error_type):
+            return retry_any_method or method.upper() in IDEMPOTENT_METHODS
+    return False
+
+
+@dataclass(frozen=True)
+class RetryAttempt:
+    """
+    Outcome of a single attempt, passed to `RetryPolicy.on_attempt`.
+
+    Attributes:
+        method: HTTP method of the request.
+        url: Full request URL.
+        attempt: 1-based number of the attempt that just finished.
+        elapsed: Seconds since the first attempt started.
+        status_code: Response status, or None if the attempt raised a transport error.
+        error: The transport error raised by the attempt, if any.
+        will_retry: Whether another attempt will be made.
+        delay: Seconds that will be waited before the next attempt (0 if not retrying).
+    """
+
+    method: str
+    url: str
+    attempt: int
+    elapsed: float
+    status_code: typing.Optional[int]
+    error: typing.Optional[BaseException]
+    will_retry: bool
+    delay: float
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Configuration for retrying failed requests.
+
+    The defaults reproduce the SDK's built-in behaviour: two retries of 408, 409,
+    429 and 5xx responses and of transport errors, with exponential backoff
+    starting at one second, honouring `Retry-After` and `X-RateLimit-Reset`.
+
+    Attributes:
+        max_retries: Maximum number of retries after the first attempt.
+            `request_options["max_retries"]` overrides this for a single request.
+        initial_delay: Backoff before the first retry, in seconds. Doubles on each retry.
+        max_delay: Upper bound for any single delay, including server-provided ones.
+        jitter: Random jitter applied to backoff delays, as a fraction of the delay.
+        retry_statuses: Status codes that are retried. None means 408, 409, 429 and 5xx.
+        retry_methods: HTTP methods that are retried at all. None means every method;
+            errors after the request may have been sent are still only retried for
+            idempotent methods.
+        max_elapsed: Give up once the next attempt would start more than this many
+            seconds after the first one. None means no limit.
+        on_attempt: Called after every attempt with a RetryAttempt.
+
+    Example:
+        from extend_ai import Extend, RetryPolicy
+
+        # Patient retries for every request made by this client
+        client = Extend(token="...", retry_policy=RetryPolicy(max_retries=5, max_elapsed=120))
+
+        # Fail fast for a latency-sensitive call
+        client.parse_runs.retrieve(
+            "pr_123",
+            request_options={"retry_policy": RetryPolicy(max_retries=1, initial_delay=0.1, max_delay=0.5)},
+        )
+    """
+
+    max_retries: int = 2
+    initial_delay: float = INITIAL_RETRY_DELAY_SECONDS
+    max_delay: float = MAX_RETRY_DELAY_SECONDS
+    jitter: float = JITTER_FACTOR
+    retry_statuses: typing.Optional[typing.FrozenSet[int]] = None
+    retry_methods: typing.Optional[typing.FrozenSet[str]] = None
+    max_elapsed: typing.Optional[float] = None
+    on_attempt: typing.Optional[typing.Callable[[RetryAttempt], None]] = None
+
+    def __post_init__(self) -> None:
+        # Accept any iterable for the rule sets, and normalise method case.
+        if self.retry_statuses is not None:
+            object.__setattr__(self, "retry_statuses", frozenset(self.retry_statuses))
+        if self.retry_methods is not None:
+            object.__setattr__(self, "retry_methods", frozenset(m.upper() for m in self.retry_methods))
+
+    def allows_method(self, method: str) -> bool:
+        return self.retry_methods is None or method.upper() in self.retry_methods
+
+    def should_retry_status(self, method: str, status_code: int) -> bool:
+        if not self.allows_method(method):
+            return False
+        if self.retry_statuses is not None:
+            return status_code in self.retry_statuses
+        return status_code >= 500 or status_code in RETRYABLE_4XX_STATUSES
+
+    def should_retry_error(self, method: str, exc: BaseException) -> bool:
+        return self.allows_method(method) and is_retryable_transport_error(exc, method)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+@dataclass(frozen=True)
+class RetryBudgetSnapshot:
+    """
+    Point-in-time copy of a RetryBudget's state.
+
+    Attributes:
+        tokens: Retries currently available.
+        granted: Retries the budget has allowed.
+        denied: Retries the budget has refused; those requests returned or raised their last failure.
+        deposits: Successful requests that refilled the budget.
+    """
+
+    tokens: float
+    granted: int
+    denied: int
+    deposits: int
+
+
+class RetryBudget:
+    """
+    Thread-safe token bucket that caps retries at a fraction of successful traffic.
+
+    Every successful request deposits `ratio` tokens (up to `max_tokens`) and
+    every retry withdraws one. When the bucket is empty, retries are denied and
+    the failure is returned to the caller, so a saturated API sees roughly
+    `1 + ratio` times its normal load instead of `1 + max_retries` times.
+
+    The bucket starts full, so a client can retry right away before it has
+    seen any successes. Share one budget across clients (sync and async) to
+    cap retries for the whole process.
+
+    Args:
+        ratio: Tokens deposited per successful request. 0.1 allows retries for
+            about 10% of successful traffic.
+        max_tokens: Capacity of the bucket, i.e. the largest burst of retries.
+
+    Example:
+        from extend_ai import AsyncExtend, Extend, RetryBudget
+
+        budget = RetryBudget(ratio=0.1, max_tokens=20)
+        client = Extend(token="...", retry_budget=budget)
+        async_client = AsyncExtend(token="...", retry_budget=budget)
+        ...
+        print(budget.snapshot())  # RetryBudgetSnapshot(tokens=3.4, granted=40, denied=112, deposits=234)
+    """
+
+    def __init__(self, *, ratio: float = 0.1, max_tokens: float = 10.0) -> None:
+        if ratio < 0:
+            raise ValueError("ratio must be non-negative")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._lock = threading.Lock()
+        self._tokens = max_tokens
+        self._granted = 0
+        self._denied = 0
+        self._deposits = 0
+
+    def deposit(self) -> None:
+        """Record a successful request."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+            self._deposits += 1
+
+    def try_withdraw(self) -> bool:
+        """Take one token for a retry. Returns False, and counts a denial, if none is available."""
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self._granted += 1
+                return True
+            self._denied += 1
+            return False
+
+    def snapshot(self) -> RetryBudgetSnapshot:
+        with self._lock:
+            return RetryBudgetSnapshot(
+                tokens=self._tokens, granted=self._granted, denied=self._denied, deposits=self._deposits
+            )
+
+
+@dataclass(frozen=True)
+class RetryStatsSnapshot:
+    """
+    Point-in-time copy of a client's retry counters.
+
+    Attributes:
+        transport_retries: Transport errors that were absorbed by a retry, keyed by kind.
+        transport_errors_raised: Transport errors that were raised to the caller
+            (not retryable, or retries exhausted), keyed by kind.
+        status_retries: Responses that were retried, keyed by status code.
+    """
+
+    transport_retries: typing.Dict[str, int] = field(default_factory=dict)
+    transport_errors_raised: typing.Dict[str, int] = field(default_factory=dict)
+    status_retries: typing.Dict[int, int] = field(default_factory=dict)
+
+
+class RetryStats:
+    """
+    Thread-safe retry counters for a client.
+
+    Example:
+        client = Extend(token="...")
+        ...
+        print(client.retry_stats.snapshot().transport_retries)  # {"read_timeout": 3}
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._transport_retries: typing.Dict[str, int] = {}
+        self._transport_errors_raised: typing.Dict[str, int] = {}
+        self._status_retries: typing.Dict[int, int] = {}
+
+    def record_transport_retry(self, kind: str) -> None:
+        with self._lock:
+            self._transport_retries[kind] = self._transport_retries.get(kind, 0) + 1
+
+    def record_transport_error_raised(self, kind: str) -> None:
+        with self._lock:
+            self._transport_errors_raised[kind] = self._transport_errors_raised.get(kind, 0) + 1
+
+    def record_status_retry(self, status_code: int) -> None:
+        with self._lock:
+            self._status_retries[status_code] = self._status_retries.get(status_code, 0) + 1
+
+    def snapshot(self) -> RetryStatsSnapshot:
+        with self._lock:
+            return RetryStatsSnapshot(
+                transport_retries=dict(self._transport_retries),
+                transport_errors_raised=dict(self._transport_errors_raised),
+                status_retries=dict(self._status_retries),
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._transport_retries.clear()
+            self._transport_errors_raised.clear()
+            self._status_retries.clear()
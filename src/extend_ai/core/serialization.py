@@ -1,7 +1,9 @@
 # This file was auto-generated by Fern from our API Definition.
 
 import collections
+import functools
 import inspect
+import sys
 import typing
 
 import pydantic
@@ -57,24 +59,24 @@ def convert_and_respect_annotation_metadata(
         return None
     if inner_type is None:
         inner_type = annotation
+    if not _has_aliases(inner_type):
+        # Nothing under this type is aliased, so conversion would only copy the containers.
+        return object_
 
     clean_type = _remove_annotations(inner_type)
+    origin = typing_extensions.get_origin(clean_type)
     # Pydantic models
     if (
         inspect.isclass(clean_type)
         and issubclass(clean_type, pydantic.BaseModel)
-        and isinstance(object_, typing.Mapping)
+        and isinstance(object_, collections.abc.Mapping)
     ):
         return _convert_mapping(object_, clean_type, direction)
     # TypedDicts
-    if typing_extensions.is_typeddict(clean_type) and isinstance(object_, typing.Mapping):
+    if typing_extensions.is_typeddict(clean_type) and isinstance(object_, collections.abc.Mapping):
         return _convert_mapping(object_, clean_type, direction)
 
-    if (
-        typing_extensions.get_origin(clean_type) == typing.Dict
-        or typing_extensions.get_origin(clean_type) == dict
-        or clean_type == typing.Dict
-    ) and isinstance(object_, typing.Dict):
+    if (origin == typing.Dict or origin == dict or clean_type == typing.Dict) and isinstance(object_, dict):
         key_type = typing_extensions.get_args(clean_type)[0]
         value_type = typing_extensions.get_args(clean_type)[1]
 
@@ -90,11 +92,7 @@ def convert_and_respect_annotation_metadata(
 
     # If you're iterating on a string, do not bother to coerce it to a sequence.
     if not isinstance(object_, str):
-        if (
-            typing_extensions.get_origin(clean_type) == typing.Set
-            or typing_extensions.get_origin(clean_type) == set
-            or clean_type == typing.Set
-        ) and isinstance(object_, typing.Set):
+        if (origin == typing.Set or origin == set or clean_type == typing.Set) and isinstance(object_, set):
             inner_type = typing_extensions.get_args(clean_type)[0]
             return {
                 convert_and_respect_annotation_metadata(
@@ -105,20 +103,9 @@ def convert_and_respect_annotation_metadata(
                 )
                 for item in object_
             }
-        elif (
-            (
-                typing_extensions.get_origin(clean_type) == typing.List
-                or typing_extensions.get_origin(clean_type) == list
-                or clean_type == typing.List
-            )
-            and isinstance(object_, typing.List)
-        ) or (
-            (
-                typing_extensions.get_origin(clean_type) == typing.Sequence
-                or typing_extensions.get_origin(clean_type) == collections.abc.Sequence
-                or clean_type == typing.Sequence
-            )
-            and isinstance(object_, typing.Sequence)
+        elif ((origin == typing.List or origin == list or clean_type == typing.List) and isinstance(object_, list)) or (
+            (origin == typing.Sequence or origin == collections.abc.Sequence or clean_type == typing.Sequence)
+            and isinstance(object_, collections.abc.Sequence)
         ):
             inner_type = typing_extensions.get_args(clean_type)[0]
             return [
@@ -131,7 +118,7 @@ def convert_and_respect_annotation_metadata(
                 for item in object_
             ]
 
-    if typing_extensions.get_origin(clean_type) == typing.Union:
+    if origin == typing.Union:
         # We should be able to ~relatively~ safely try to convert keys against all
         # member types in the union, the edge case here is if one member aliases a field
         # of the same name to a different name from another member
@@ -145,10 +132,6 @@ def convert_and_respect_annotation_metadata(
             )
         return object_
 
-    annotated_type = _get_annotation(annotation)
-    if annotated_type is None:
-        return object_
-
     # If the object is not a TypedDict, a Union, or other container (list, set, sequence, etc.)
     # Then we can safely call it on the recursive conversion.
     return object_
@@ -160,50 +143,141 @@ def _convert_mapping(
     direction: typing.Literal["read", "write"],
 ) -> typing.Mapping[str, object]:
     converted_object: typing.Dict[str, object] = {}
+    fields = _get_mapping_fields(expected_type, direction)
+    for key, value in object_.items():
+        field = fields.get(key)
+        # Keys without a type annotation pass through as is.
+        if field is None:
+            converted_object[key] = value
+            continue
+        type_, converted_key, has_aliases = field
+        converted_object[converted_key] = (
+            convert_and_respect_annotation_metadata(object_=value, annotation=type_, direction=direction)
+            if has_aliases
+            else value
+        )
+    return converted_object
+
+
+# Bound on the number of types whose annotations, field maps and alias-freedom are remembered; the SDK's
+# request and response types fit comfortably.
+_TYPE_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _get_mapping_fields(
+    expected_type: typing.Any,
+    direction: typing.Literal["read", "write"],
+) -> typing.Dict[str, typing.Tuple[typing.Any, str, bool]]:
+    """
+    For each key _convert_mapping may see on *expected_type*: the field's annotation, the key to write
+    the converted value under, and whether anything under the annotation is aliased. Computed once per
+    model or TypedDict and direction.
+    """
+    annotations = _get_resolvable_type_hints(expected_type)
+    fields: typing.Dict[str, typing.Tuple[typing.Any, str, bool]] = {}
+    for key, type_ in annotations.items():
+        converted_key = key if direction == "read" else _get_alias_from_type(type_=type_) or key
+        fields[key] = (type_, converted_key, _has_aliases(type_))
+    if direction == "read":
+        # Note you can't get the annotation by the field name if you're in read mode, so you must check the
+        # aliases map. Aliases take precedence over a field of the same name.
+        for alias, field_name in _get_alias_to_field_name(annotations).items():
+            type_ = annotations[field_name]
+            fields[alias] = (type_, field_name, _has_aliases(type_))
+    return fields
+
+
+@functools.lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _get_type_hints(type_: typing.Any) -> typing.Dict[str, typing.Any]:
+    return typing_extensions.get_type_hints(type_, include_extras=True)
+
+
+# Types whose hints were resolved with names stubbed as Any: the namespace the names are looked up in,
+# and the names. Until one of those names is defined, the stubbed hints (and what is built on them) stay
+# cached; once one is, _drop_stale_stubs clears the caches so the real annotation is used.
+_STUBBED_HINTS: typing.Dict[typing.Any, typing.Tuple[typing.Mapping[str, typing.Any], typing.FrozenSet[str]]] = {}
+
+
+@functools.lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _get_resolvable_type_hints(type_: typing.Any) -> typing.Dict[str, typing.Any]:
     try:
-        annotations = typing_extensions.get_type_hints(expected_type, include_extras=True)
+        return _get_type_hints(type_)
     except NameError:
         # When get_type_hints fails (e.g., circular TypedDict references with
         # `from __future__ import annotations` on Python 3.10+), retry with
         # unresolvable names stubbed as Any so we can still extract FieldMetadata
         # aliases for all resolvable fields.
         localns: typing.Dict[str, typing.Any] = {}
-        annotations = getattr(expected_type, "__annotations__", {})
+        annotations = getattr(type_, "__annotations__", {})
         for _ in range(20):
             try:
-                annotations = typing_extensions.get_type_hints(
-                    expected_type, localns=localns, include_extras=True
-                )
+                annotations = typing_extensions.get_type_hints(type_, localns=localns, include_extras=True)
                 break
             except NameError as inner_e:
-                missing = getattr(inner_e, 'name', None) or (str(inner_e).split("'")[1] if "'" in str(inner_e) else None)
+                missing = getattr(inner_e, "name", None) or (
+                    str(inner_e).split("'")[1] if "'" in str(inner_e) else None
+                )
                 if missing and missing not in localns:
                     localns[missing] = typing.Any
                 else:
                     break
-    aliases_to_field_names = _get_alias_to_field_name(annotations)
-    for key, value in object_.items():
-        if direction == "read" and key in aliases_to_field_names:
-            dealiased_key = aliases_to_field_names.get(key)
-            if dealiased_key is not None:
-                type_ = annotations.get(dealiased_key)
-        else:
-            type_ = annotations.get(key)
-        # Note you can't get the annotation by the field name if you're in read mode, so you must check the aliases map
-        #
-        # So this is effectively saying if we're in write mode, and we don't have a type, or if we're in read mode and we don't have an alias
-        # then we can just pass the value through as is
-        if type_ is None:
-            converted_object[key] = value
-        elif direction == "read" and key not in aliases_to_field_names:
-            converted_object[key] = convert_and_respect_annotation_metadata(
-                object_=value, annotation=type_, direction=direction
-            )
-        else:
-            converted_object[_alias_key(key, type_, direction, aliases_to_field_names)] = (
-                convert_and_respect_annotation_metadata(object_=value, annotation=type_, direction=direction)
-            )
-    return converted_object
+        module = sys.modules.get(getattr(type_, "__module__", ""))
+        _STUBBED_HINTS[type_] = (getattr(module, "__dict__", {}), frozenset(localns))
+        return annotations
+
+
+def _drop_stale_stubs() -> None:
+    """Clears the caches built on stubbed type hints once any of the stubbed names has been defined."""
+    for namespace, names in list(_STUBBED_HINTS.values()):
+        if any(name in namespace for name in names):
+            _STUBBED_HINTS.clear()
+            _get_resolvable_type_hints.cache_clear()
+            _get_mapping_fields.cache_clear()
+            _cached_has_aliases.cache_clear()
+            return
+
+
+@functools.lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _cached_has_aliases(type_: typing.Any) -> bool:
+    return _subtree_has_aliases(type_, set())
+
+
+def _has_aliases(type_: typing.Any) -> bool:
+    """
+    Whether a FieldMetadata alias appears anywhere under *type_*: in its own metadata, its type
+    arguments, or (recursively) the fields of any model or TypedDict it reaches. When it doesn't,
+    convert_and_respect_annotation_metadata has nothing to rename and returns the object as is.
+    """
+    if _STUBBED_HINTS:
+        _drop_stale_stubs()
+    try:
+        return _cached_has_aliases(type_)
+    except TypeError:
+        # Unhashable annotations (e.g. Annotated with unhashable metadata) are converted as before.
+        return True
+
+
+def _subtree_has_aliases(type_: typing.Any, seen: typing.Set[int]) -> bool:
+    # Types already being visited (recursive models and TypedDicts) are answered by the first visit.
+    if id(type_) in seen:
+        return False
+    seen.add(id(type_))
+
+    origin = typing_extensions.get_origin(type_)
+    if origin is not None:
+        args = typing_extensions.get_args(type_)
+        if origin == typing_extensions.Annotated:
+            if any(isinstance(metadata, FieldMetadata) and metadata.alias is not None for metadata in args[1:]):
+                return True
+            return _subtree_has_aliases(args[0], seen)
+        # Bare generics (typing.List, typing.Dict, ...) are left to the converter.
+        return not args or any(_subtree_has_aliases(arg, seen) for arg in args)
+
+    if inspect.isclass(type_) and (issubclass(type_, pydantic.BaseModel) or typing_extensions.is_typeddict(type_)):
+        hints = _get_resolvable_type_hints(type_)  # type: ignore[arg-type]
+        return any(_subtree_has_aliases(hint, seen) for hint in hints.values())
+    return False
 
 
 def _get_annotation(type_: typing.Any) -> typing.Optional[typing.Any]:
@@ -236,13 +310,22 @@ def _remove_annotations(type_: typing.Any) -> typing.Any:
 
 
 def get_alias_to_field_mapping(type_: typing.Any) -> typing.Dict[str, str]:
-    annotations = typing_extensions.get_type_hints(type_, include_extras=True)
-    return _get_alias_to_field_name(annotations)
+    return dict(_get_alias_to_field_mapping(type_))
 
 
 def get_field_to_alias_mapping(type_: typing.Any) -> typing.Dict[str, str]:
-    annotations = typing_extensions.get_type_hints(type_, include_extras=True)
-    return _get_field_to_alias_name(annotations)
+    return dict(_get_field_to_alias_mapping(type_))
+
+
+# The mappings are cached per type; the public functions above return copies.
+@functools.lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _get_alias_to_field_mapping(type_: typing.Any) -> typing.Dict[str, str]:
+    return _get_alias_to_field_name(_get_type_hints(type_))
+
+
+@functools.lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _get_field_to_alias_mapping(type_: typing.Any) -> typing.Dict[str, str]:
+    return _get_field_to_alias_name(_get_type_hints(type_))
 
 
 def _get_alias_to_field_name(
@@ -278,14 +361,3 @@ def _get_alias_from_type(type_: typing.Any) -> typing.Optional[str]:
             if isinstance(annotation, FieldMetadata) and annotation.alias is not None:
                 return annotation.alias
     return None
-
-
-def _alias_key(
-    key: str,
-    type_: typing.Any,
-    direction: typing.Literal["read", "write"],
-    aliases_to_field_names: typing.Dict[str, str],
-) -> str:
-    if direction == "read":
-        return aliases_to_field_names.get(key, key)
-    return _get_alias_from_type(type_=type_) or key
@@ -0,0 +1,142 @@
+"""
+Cached API tokens with expiry, proactive refresh and single-flight fetching.
+
+A TokenProvider wraps a slow token source (a secrets manager, an auth
+service) so it is called once per token lifetime instead of once per request.
+Pass it as the client's `token`:
+
+    client = Extend(token=TokenProvider(fetch_api_key, ttl=900))
+
+When the API answers 401, HttpClient invalidates the rejected token and
+resends the request once with a freshly fetched one.
+"""
+
+import asyncio
+import threading
+import time
+import typing
+
+TokenResult = typing.Union[str, typing.Tuple[str, float]]
+
+
+class TokenProvider:
+    """
+    Thread- and task-safe token cache.
+
+    Concurrent callers that need a new token share a single fetch: threads wait
+    on a lock, asyncio tasks await the same future. Once a token is within
+    `refresh_margin` seconds of expiring, the next caller refreshes it while
+    everyone else keeps using the current token.
+
+    Args:
+        fetch: Returns a token, or a `(token, expires_in_seconds)` tuple to
+            override `ttl` for that token. Used by sync clients, and by async
+            clients (in a worker thread) when `async_fetch` is not given.
+        async_fetch: Async variant of `fetch`, preferred by async clients.
+        ttl: Lifetime of a token, in seconds, when the source does not say.
+        refresh_margin: Refresh tokens this many seconds before they expire.
+
+    Example:
+        from extend_ai import Extend, TokenProvider
+
+        def fetch_api_key() -> str:
+            return secrets_client.get_secret_value(SecretId="extend-api-key")["SecretString"]
+
+        client = Extend(token=TokenProvider(fetch_api_key, ttl=900))
+    """
+
+    def __init__(
+        self,
+        fetch: typing.Optional[typing.Callable[[], TokenResult]] = None,
+        *,
+        async_fetch: typing.Optional[typing.Callable[[], typing.Awaitable[TokenResult]]] = None,
+        ttl: float = 3600.0,
+        refresh_margin: float = 60.0,
+    ) -> None:
+        if fetch is None and async_fetch is None:
+            raise ValueError("TokenProvider requires fetch, async_fetch, or both")
+        self.fetch = fetch
+        self.async_fetch = async_fetch
+        self.ttl = ttl
+        self.refresh_margin = refresh_margin
+        self._lock = threading.Lock()
+        self._token: typing.Optional[str] = None
+        self._refresh_at = 0.0
+        self._expires_at = 0.0
+        self._async_refresh: typing.Optional["asyncio.Future[str]"] = None
+
+    def __call__(self) -> str:
+        # Lets a TokenProvider be passed anywhere a `token` callable is accepted.
+        return self.get_token()
+
+    def get_token(self) -> str:
+        """Return a valid token, fetching one if needed. Blocks while another thread fetches."""
+        token, now = self._token, time.monotonic()
+        if token is not None and now < self._refresh_at:
+            return token
+        if token is not None and now < self._expires_at:
+            # Still valid: refresh unless another thread already is.
+            if not self._lock.acquire(blocking=False):
+                return token
+            try:
+                return self._refresh_locked(stale=token)
+            finally:
+                self._lock.release()
+        with self._lock:
+            return self._refresh_locked(stale=token)
+
+    async def async_get_token(self) -> str:
+        """Return a valid token, fetching one if needed. Concurrent tasks share one fetch."""
+        token, now = self._token, time.monotonic()
+        if token is not None and now < self._refresh_at:
+            return token
+        refresh = self._async_refresh
+        if refresh is None or refresh.done() or refresh.get_loop() is not asyncio.get_running_loop():
+            refresh = self._async_refresh = asyncio.ensure_future(self._async_refresh_token(stale=token))
+            # A failed background refresh is retried by the next caller; don't log it as unretrieved.
+            refresh.add_done_callback(lambda future: future.cancelled() or future.exception())
+        if token is not None and now < self._expires_at:
+            # Still valid: let the refresh finish in the background.
+            return token
+        return await asyncio.shield(refresh)
+
+    def invalidate(self, token: str) -> None:
+        """
+        Mark `token` as rejected so the next caller fetches a new one. A no-op if the
+        cache has already moved on, so concurrent 401s trigger a single refresh.
+        """
+        with self._lock:
+            if self._token == token:
+                self._refresh_at = self._expires_at = 0.0
+
+    def _refresh_locked(self, stale: typing.Optional[str]) -> str:
+        # Another thread may have refreshed while we waited for the lock.
+        if self._token is not None and self._token != stale and time.monotonic() < self._expires_at:
+            return self._token
+        if self.fetch is None:
+            raise RuntimeError("This TokenProvider only has async_fetch; use it with AsyncExtend")
+        return self._store(self.fetch())
+
+    async def _async_refresh_token(self, stale: typing.Optional[str]) -> str:
+        if self.async_fetch is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._refresh_blocking, stale)
+        result = await self.async_fetch()
+        with self._lock:
+            return self._store(result)
+
+    def _refresh_blocking(self, stale: typing.Optional[str]) -> str:
+        with self._lock:
+            return self._refresh_locked(stale=stale)
+
+    def _store(self, result: TokenResult) -> str:
+        if isinstance(result, tuple):
+            token, expires_in = result
+        else:
+            token, expires_in = result, self.ttl
+        now = time.monotonic()
+        self._token = token
+        self._expires_at = now + expires_in
+        # Short-lived tokens are refreshed halfway through rather than constantly.
+        self._refresh_at = now + max(expires_in - self.refresh_margin, expires_in / 2)
+        return token
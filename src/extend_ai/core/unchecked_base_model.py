@@ -1,7 +1,9 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import copy
 import datetime as dt
 import enum
+import functools
 import inspect
 import sys
 import typing
@@ -11,6 +13,7 @@ import pydantic
 import typing_extensions
 from .pydantic_utilities import (
     IS_PYDANTIC_V2,
+    PARSE_CACHE_SIZE,
     ModelField,
     UniversalBaseModel,
     get_args,
@@ -20,7 +23,9 @@ from .pydantic_utilities import (
     parse_date,
     parse_datetime,
     parse_obj_as,
+    type_cache_key,
 )
+from .response_format import LazyBody, RawBody
 from .serialization import get_field_to_alias_mapping
 from pydantic_core import PydanticUndefined
 
@@ -82,72 +87,281 @@ class UncheckedBaseModel(UniversalBaseModel):
         _fields_set: typing.Optional[typing.Set[str]] = None,
         **values: typing.Any,
     ) -> "Model":
-        m = cls.__new__(cls)
-        fields_values = {}
+        return _construct_model(cls, _get_model_plan(cls), _fields_set, values, None)
 
-        if _fields_set is None:
-            _fields_set = set(values.keys())
 
-        fields = _get_model_fields(cls)
-        populate_by_name = _get_is_populate_by_name(cls)
-        field_aliases = get_field_to_alias_mapping(cls)
+# A construction plan converts one non-None value to the plan's type, exactly as construct_type would.
+# Plans are built once per (type, host) and reused, so the typing introspection below runs once per
+# annotation rather than once per value.
+ConstructPlan = typing.Callable[[typing.Any], typing.Any]
 
+
+def _identity(object_: typing.Any) -> typing.Any:
+    return object_
+
+
+# Defaults of these types are returned as-is by FieldInfo.get_default (it deep-copies anything else),
+# so they can be looked up once per field instead of on every construct.
+_IMMUTABLE_DEFAULT_TYPES = (type(None), bool, int, float, str, bytes)
+
+
+def _get_default_and_is_set(field: "PydanticField") -> typing.Tuple[typing.Any, bool]:
+    default = _get_field_default(field)
+    return default, default != None and default != PydanticUndefined
+
+
+class _ModelPlan:
+    """Per-model metadata used by UncheckedBaseModel.construct."""
+
+    def __init__(self, model: typing.Type[typing.Any], fields: typing.Mapping[str, "PydanticField"]) -> None:
+        self.model_fields = fields
+        self.populate_by_name = _get_is_populate_by_name(model)
+        field_aliases = get_field_to_alias_mapping(model)
+
+        # (name, alias, plan or None for as-is values, model type to construct lazily or None, field)
+        self.fields: typing.List[
+            typing.Tuple[
+                str,
+                typing.Optional[str],
+                typing.Optional[ConstructPlan],
+                typing.Optional[typing.Type[typing.Any]],
+                typing.Any,
+            ]
+        ] = []
+        self.defaults: typing.Dict[str, typing.Tuple[typing.Any, bool]] = {}
         for name, field in fields.items():
-            # Key here is only used to pull data from the values dict
-            # you should always use the NAME of the field to for field_values, etc.
-            # because that's how the object is constructed from a pydantic perspective
-            key = field.alias
-            if (key is None or field.alias == name) and name in field_aliases:
-                key = field_aliases[name]
-
-            if key is None or (key not in values and populate_by_name):  # Added this to allow population by field name
-                key = name
-
-            if key in values:
-                if IS_PYDANTIC_V2:
-                    type_ = field.annotation  # type: ignore # Pydantic v2
-                else:
-                    type_ = typing.cast(typing.Type, field.outer_type_)  # type: ignore # Pydantic < v1.10.15
+            alias = field.alias
+            if (alias is None or field.alias == name) and name in field_aliases:
+                alias = field_aliases[name]
+
+            if IS_PYDANTIC_V2:
+                type_ = field.annotation  # type: ignore # Pydantic v2
+            else:
+                type_ = typing.cast(typing.Type, field.outer_type_)  # type: ignore # Pydantic < v1.10.15
+
+            field_plan = _get_construct_plan(type_, model) if type_ is not None else None
+            self.fields.append(
+                (name, alias, None if field_plan is _identity else field_plan, _get_lazy_model(type_), field)
+            )
+
+            default, default_is_set = _get_default_and_is_set(field)
+            if type(default) in _IMMUTABLE_DEFAULT_TYPES:
+                self.defaults[name] = (default, default_is_set)
+
+        self.known_keys = frozenset(
+            [field.alias for field in fields.values()] + list(field_aliases.values()) + list(fields)
+        )
+
+
+_model_plans: typing.Dict[typing.Type[typing.Any], _ModelPlan] = {}
+
+
+def _get_model_plan(model: typing.Type[typing.Any]) -> _ModelPlan:
+    fields = _get_model_fields(model)
+    plan = _model_plans.get(model)
+    # A model_rebuild replaces the fields mapping, which invalidates the plan.
+    if plan is None or plan.model_fields is not fields:
+        plan = _model_plans[model] = _ModelPlan(model, fields)
+    return plan
+
+
+_DEFERRED_VALUE_TYPES = (dict, list)
 
-                fields_values[name] = (
-                    construct_type(object_=values[key], type_=type_, host=cls)
-                    if type_ is not None
-                    else values[key]
-                )
+
+def _construct_model(
+    cls: typing.Type["Model"],
+    plan: _ModelPlan,
+    _fields_set: typing.Optional[typing.Set[str]],
+    values: typing.Mapping[str, typing.Any],
+    deferred: typing.Optional[typing.Dict[str, typing.Tuple[ConstructPlan, typing.Any, typing.Any]]],
+) -> "Model":
+    """
+    UncheckedBaseModel.construct. With a *deferred* dict, object and list values are not
+    constructed but added to it as (plan, lazy model type or None, value), keyed by field name.
+    """
+    m = cls.__new__(cls)
+    fields_values = {}
+
+    if _fields_set is None:
+        _fields_set = set(values.keys())
+
+    populate_by_name = plan.populate_by_name
+
+    for name, alias, field_plan, lazy_model, field in plan.fields:
+        # Key here is only used to pull data from the values dict
+        # you should always use the NAME of the field to for field_values, etc.
+        # because that's how the object is constructed from a pydantic perspective
+        key = alias
+        if key is None or (key not in values and populate_by_name):  # Added this to allow population by field name
+            key = name
+
+        if key in values:
+            value = values[key]
+            if field_plan is None or value is None:
+                fields_values[name] = value
+            elif deferred is not None and type(value) in _DEFERRED_VALUE_TYPES:
+                deferred[name] = (field_plan, lazy_model, value)
+            else:
+                fields_values[name] = field_plan(value)
+            _fields_set.add(name)
+        else:
+            default, default_is_set = plan.defaults.get(name) or _get_default_and_is_set(field)
+            fields_values[name] = default
+
+            # If the default values are non-null act like they've been set
+            # This effectively allows exclude_unset to work like exclude_none where
+            # the latter passes through intentionally set none values.
+            if default_is_set:
                 _fields_set.add(name)
+
+    # Add extras back in
+    extras = {}
+    for key, value in values.items():
+        # If the key is not a field by name, nor an alias to a field, then it's extra
+        if key not in plan.known_keys:
+            if IS_PYDANTIC_V2:
+                extras[key] = value
             else:
-                default = _get_field_default(field)
-                fields_values[name] = default
-
-                # If the default values are non-null act like they've been set
-                # This effectively allows exclude_unset to work like exclude_none where
-                # the latter passes through intentionally set none values.
-                if default != None and default != PydanticUndefined:
-                    _fields_set.add(name)
-
-        # Add extras back in
-        extras = {}
-        pydantic_alias_fields = [field.alias for field in fields.values()]
-        internal_alias_fields = list(field_aliases.values())
-        for key, value in values.items():
-            # If the key is not a field by name, nor an alias to a field, then it's extra
-            if (key not in pydantic_alias_fields and key not in internal_alias_fields) and key not in fields:
-                if IS_PYDANTIC_V2:
-                    extras[key] = value
-                else:
-                    _fields_set.add(key)
-                    fields_values[key] = value
+                _fields_set.add(key)
+                fields_values[key] = value
 
-        object.__setattr__(m, "__dict__", fields_values)
+    object.__setattr__(m, "__dict__", fields_values)
 
-        if IS_PYDANTIC_V2:
-            object.__setattr__(m, "__pydantic_private__", None)
-            object.__setattr__(m, "__pydantic_extra__", extras)
-            object.__setattr__(m, "__pydantic_fields_set__", _fields_set)
+    if IS_PYDANTIC_V2:
+        object.__setattr__(m, "__pydantic_private__", None)
+        object.__setattr__(m, "__pydantic_extra__", extras)
+        object.__setattr__(m, "__pydantic_fields_set__", _fields_set)
+    else:
+        object.__setattr__(m, "__fields_set__", _fields_set)
+        m._init_private_attributes()  # type: ignore # Pydantic v1
+    return m
+
+
+# Lazy construction (response_format="lazy"). A lazily constructed model is a LazyModel, a proxy
+# that is not an instance of the model: pydantic-core reads a model's __dict__ directly, so no
+# model instance with fields still missing may ever reach it. The proxy keeps a model instance
+# to itself with the scalar fields constructed, and constructs each object and list field on
+# first access. Anything else (methods, properties, dumps, equality, repr, copies, pickling) is
+# answered by the complete model, which materialize() builds once and returns.
+class LazyModel:
+    """
+    A model whose object and list fields are constructed on first access; see `construct_lazily`.
+
+    Fields read like the model's. Everything else, and `materialize(lazy)`, uses the complete
+    model. A LazyModel is not an instance of its model, so pass `materialize(lazy)` wherever a
+    model instance is expected, e.g. as a field of another model.
+    """
+
+    __slots__ = ("_model", "_deferred")
+
+    def __init__(
+        self,
+        model: typing.Any,
+        deferred: typing.Dict[str, typing.Tuple[ConstructPlan, typing.Any, typing.Any]],
+    ) -> None:
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_deferred", deferred)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        values = self._model.__dict__
+        if name in values:
+            return values[name]
+        deferred = self._deferred
+        entry = deferred.pop(name, None) if deferred else None
+        if entry is None:
+            return getattr(materialize(self), name)
+
+        plan, lazy_model, value = entry
+        if lazy_model is not None and type(value) is dict:
+            constructed = _construct_lazy_model(lazy_model, value)
         else:
-            object.__setattr__(m, "__fields_set__", _fields_set)
-            m._init_private_attributes()  # type: ignore # Pydantic v1
-        return m
+            constructed = plan(value)
+        values[name] = constructed
+        return constructed
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        if self._deferred:
+            self._deferred.pop(name, None)
+        setattr(self._model, name, value)
+
+    def __eq__(self, other: object) -> bool:
+        return materialize(self) == materialize(other)
+
+    def __hash__(self) -> int:
+        return hash(materialize(self))
+
+    def __repr__(self) -> str:
+        return repr(materialize(self))
+
+    def __str__(self) -> str:
+        return str(materialize(self))
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return iter(materialize(self))
+
+    def __dir__(self) -> typing.Iterable[str]:
+        return dir(self._model)
+
+    def __copy__(self) -> typing.Any:
+        return copy.copy(materialize(self))
+
+    def __deepcopy__(self, memo: typing.Dict[int, typing.Any]) -> typing.Any:
+        return copy.deepcopy(materialize(self), memo)
+
+    def __reduce__(self) -> typing.Any:
+        # Pickles as the complete model, which unpickles as itself.
+        return _identity, (materialize(self),)
+
+
+def _get_lazy_model(type_: typing.Any) -> typing.Optional[typing.Type[typing.Any]]:
+    """
+    *type_* if it is an UncheckedBaseModel subclass, otherwise None. Not optional models: construct_type
+    validates those with parse_obj_as, so only building them in full gives the same result.
+    """
+    if inspect.isclass(type_) and issubclass(type_, UncheckedBaseModel):
+        return type_
+    return None
+
+
+def _construct_lazy_model(model: typing.Type["Model"], values: typing.Dict[str, typing.Any]) -> typing.Any:
+    deferred: typing.Dict[str, typing.Tuple[ConstructPlan, typing.Any, typing.Any]] = {}
+    m = _construct_model(model, _get_model_plan(model), None, values, deferred)
+    return LazyModel(m, deferred) if deferred else m
+
+
+def construct_lazily(*, type_: typing.Type[typing.Any], object_: typing.Any) -> typing.Any:
+    """
+    construct_type, except that a model is returned as a LazyModel whose object and list fields
+    are only constructed when first accessed, recursively for fields typed as a model. Types
+    other than models, models without such fields, and Pydantic v1 are constructed as
+    construct_type does.
+    """
+    model = _get_lazy_model(type_)
+    if model is None or not IS_PYDANTIC_V2 or type(object_) is not dict:
+        return construct_type(type_=type_, object_=object_)
+    return _construct_lazy_model(model, object_)
+
+
+def materialize(object_: typing.Any) -> typing.Any:
+    """
+    The complete model of a LazyModel, constructing whatever it (and the LazyModels in it) has
+    left; the same instance on every call. Anything else is returned as is.
+    """
+    if type(object_) is not LazyModel:
+        return object_
+
+    model = object_._model
+    deferred = object_._deferred
+    if deferred is not None:
+        values = model.__dict__
+        for name, (plan, _, value) in list(deferred.items()):
+            values[name] = plan(value)
+        # Restore the field order construct gives, which repr follows.
+        object.__setattr__(
+            model, "__dict__", {name: materialize(values[name]) for name in _get_model_fields(type(model))}
+        )
+        object.__setattr__(object_, "_deferred", None)
+    return model
 
 
 def _validate_collection_items_compatible(collection: typing.Any, target_type: typing.Type[typing.Any]) -> bool:
@@ -176,48 +390,75 @@ def _validate_collection_items_compatible(collection: typing.Any, target_type: t
     return True
 
 
-def _get_literal_field_value(
-    inner_type: typing.Type[typing.Any], field_name: str, field: typing.Any, object_: typing.Any
-) -> typing.Any:
-    """Get the value of a Literal field from *object_*, checking both alias and field name."""
-    name_or_alias = get_field_to_alias_mapping(inner_type).get(field_name, field_name)
-    if isinstance(object_, dict):
-        return object_.get(name_or_alias)
-    return getattr(object_, name_or_alias, None)
-
-
-def _literal_fields_match_strict(inner_type: typing.Type[typing.Any], object_: typing.Any) -> bool:
-    """Return True iff every Literal-typed field in *inner_type* is **present** in
-    *object_* and its value equals the field's declared default.
-
-    This prevents models whose fields are all optional (e.g. ``FigureDetails``)
-    from vacuously matching inputs that don't carry the discriminant key at all
-    (e.g. ``{}`` for text blocks).  For types with no Literal fields this
-    returns True unconditionally.
-    """
-    fields = _get_model_fields(inner_type)
-    for field_name, field in fields.items():
+def _get_literal_fields(inner_type: typing.Type[typing.Any]) -> typing.Tuple[typing.Tuple[str, typing.Any], ...]:
+    """The (key, declared default) of every Literal-typed field in *inner_type*, keyed by alias where one is set."""
+    literal_fields = []
+    for field_name, field in _get_model_fields(inner_type).items():
         if IS_PYDANTIC_V2:
             field_type = field.annotation  # type: ignore # Pydantic v2
         else:
             field_type = field.outer_type_  # type: ignore # Pydantic v1
 
         if is_literal_type(field_type):  # type: ignore[arg-type]
-            field_default = _get_field_default(field)
-            object_value = _get_literal_field_value(inner_type, field_name, field, object_)
-            if field_default != object_value:
-                return False
+            name_or_alias = get_field_to_alias_mapping(inner_type).get(field_name, field_name)
+            literal_fields.append((name_or_alias, _get_field_default(field)))
+    return tuple(literal_fields)
+
+
+def _literal_fields_match(
+    literal_fields: typing.Tuple[typing.Tuple[str, typing.Any], ...], object_: typing.Any, strict: bool
+) -> bool:
+    """Return True iff every Literal field's value in *object_* equals the field's declared default.
+
+    In strict mode an absent value is a mismatch. This prevents models whose fields are all optional
+    (e.g. ``FigureDetails``) from vacuously matching inputs that don't carry the discriminant key at all
+    (e.g. ``{}`` for text blocks). The lenient mode skips only when a Literal value is present but
+    doesn't match (allows absent-discriminant inputs). For types with no Literal fields this returns
+    True unconditionally.
+    """
+    is_dict = isinstance(object_, dict)
+    for name_or_alias, field_default in literal_fields:
+        object_value = object_.get(name_or_alias) if is_dict else getattr(object_, name_or_alias, None)
+        if (strict or object_value is not None) and field_default != object_value:
+            return False
     return True
 
 
-def _convert_undiscriminated_union_type(
+class _UnionMember:
+    """Everything about one member of an undiscriminated union that does not depend on the value."""
+
+    def __init__(self, inner_type: typing.Any, host: typing.Optional[typing.Type[typing.Any]]) -> None:
+        self.type_ = inner_type
+        self.plan = _get_construct_plan(inner_type, host)
+        self.list_args = get_args(inner_type) if get_origin(inner_type) is list else None
+        self.is_model = inspect.isclass(inner_type) and issubclass(inner_type, pydantic.BaseModel)
+        self.literal_fields: typing.Optional[typing.Tuple[typing.Tuple[str, typing.Any], ...]] = None
+        if self.is_model:
+            try:
+                self.literal_fields = _get_literal_fields(inner_type)
+            except Exception:
+                # Leave it to matches(), which raises where construct_type always has.
+                pass
+
+    def matches(self, object_: typing.Any, strict: bool) -> bool:
+        literal_fields = self.literal_fields
+        if literal_fields is None:
+            literal_fields = _get_literal_fields(self.type_)
+        return _literal_fields_match(literal_fields, object_, strict)
+
+
+def _build_undiscriminated_union_plan(
     union_type: typing.Type[typing.Any],
-    object_: typing.Any,
     host: typing.Optional[typing.Type[typing.Any]] = None,
-) -> typing.Any:
+) -> ConstructPlan:
     inner_types = get_args(union_type)
     if typing.Any in inner_types:
-        return object_
+        return _identity
+
+    members = [_UnionMember(inner_type, host) for inner_type in inner_types]
+    if not any(member.is_model or member.list_args is not None for member in members) and members[0].plan is _identity:
+        # e.g. Optional[str]: the second pass below returns the first member's (unchanged) value.
+        return _identity
 
     # When any union member carries a Literal discriminant field, require the
     # discriminant key to be present AND matching before accepting a candidate.
@@ -225,227 +466,327 @@ def _convert_undiscriminated_union_type(
     # greedily matching inputs that belong to a different variant or to a
     # plain-dict fallback (e.g. EmptyBlockDetails = Dict[str, Any]).
     has_literal_discriminant = any(
-        inspect.isclass(t)
-        and issubclass(t, pydantic.BaseModel)
+        member.is_model
         and any(
             is_literal_type(
                 f.annotation if IS_PYDANTIC_V2 else f.outer_type_  # type: ignore
             )
-            for f in _get_model_fields(t).values()
+            for f in _get_model_fields(member.type_).values()
         )
-        for t in inner_types
+        for member in members
     )
 
-    for inner_type in inner_types:
-        # Handle lists of objects that need parsing
-        if get_origin(inner_type) is list and isinstance(object_, list):
-            list_inner_type = _maybe_resolve_forward_ref(get_args(inner_type)[0], host)
+    def convert(object_: typing.Any) -> typing.Any:
+        for member in members:
+            # Handle lists of objects that need parsing
+            if member.list_args is not None and isinstance(object_, list):
+                list_inner_type = _maybe_resolve_forward_ref(member.list_args[0], host)
+                try:
+                    if inspect.isclass(list_inner_type) and issubclass(list_inner_type, pydantic.BaseModel):
+                        if _validate_collection_items_compatible(object_, list_inner_type):
+                            parsed_list = [parse_obj_as(object_=item, type_=list_inner_type) for item in object_]
+                            return parsed_list
+                except Exception:
+                    pass
+
             try:
-                if inspect.isclass(list_inner_type) and issubclass(list_inner_type, pydantic.BaseModel):
-                    if _validate_collection_items_compatible(object_, list_inner_type):
-                        parsed_list = [parse_obj_as(object_=item, type_=list_inner_type) for item in object_]
-                        return parsed_list
+                if member.is_model:
+                    if has_literal_discriminant and not member.matches(object_, strict=True):
+                        continue
+                    return parse_obj_as(member.type_, object_)
             except Exception:
-                pass
+                continue
 
-        try:
-            if inspect.isclass(inner_type) and issubclass(inner_type, pydantic.BaseModel):
-                if has_literal_discriminant and not _literal_fields_match_strict(inner_type, object_):
+        # First pass: try types where all literal fields match the object's values.
+        for member in members:
+            if member.is_model:
+                if not member.matches(object_, strict=has_literal_discriminant):
                     continue
-                return parse_obj_as(inner_type, object_)
-        except Exception:
-            continue
-
-    # First pass: try types where all literal fields match the object's values.
-    for inner_type in inner_types:
-        if inspect.isclass(inner_type) and issubclass(inner_type, pydantic.BaseModel):
-            if has_literal_discriminant:
-                if not _literal_fields_match_strict(inner_type, object_):
-                    continue
-            else:
-                # Legacy lenient check: skip only when a Literal value is
-                # present but doesn't match (allows absent-discriminant inputs).
-                fields = _get_model_fields(inner_type)
-                literal_fields_match = True
-                for field_name, field in fields.items():
-                    if IS_PYDANTIC_V2:
-                        field_type = field.annotation  # type: ignore # Pydantic v2
-                    else:
-                        field_type = field.outer_type_  # type: ignore # Pydantic v1
-
-                    if is_literal_type(field_type):  # type: ignore[arg-type]
-                        field_default = _get_field_default(field)
-                        object_value = _get_literal_field_value(inner_type, field_name, field, object_)
-                        if object_value is not None and field_default != object_value:
-                            literal_fields_match = False
-                            break
-
-                if not literal_fields_match:
+
+                try:
+                    return member.plan(object_)
+                except Exception:
                     continue
 
+        # Second pass: if no literal matches, return the first successful cast.
+        # When a Literal discriminant is present, skip Pydantic models whose
+        # discriminant doesn't match so that plain-dict fallback types are reached.
+        for member in members:
             try:
-                return construct_type(object_=object_, type_=inner_type, host=host)
+                if has_literal_discriminant and member.is_model:
+                    if not member.matches(object_, strict=True):
+                        continue
+                return member.plan(object_)
             except Exception:
                 continue
+        return None
+
+    return convert
 
-    # Second pass: if no literal matches, return the first successful cast.
-    # When a Literal discriminant is present, skip Pydantic models whose
-    # discriminant doesn't match so that plain-dict fallback types are reached.
-    for inner_type in inner_types:
-        try:
-            if has_literal_discriminant and inspect.isclass(inner_type) and issubclass(inner_type, pydantic.BaseModel):
-                if not _literal_fields_match_strict(inner_type, object_):
-                    continue
-            return construct_type(object_=object_, type_=inner_type, host=host)
-        except Exception:
-            continue
 
+_NO_DEFAULT = object()
 
-def _convert_union_type(
+
+def _build_union_plan(
     type_: typing.Type[typing.Any],
-    object_: typing.Any,
     host: typing.Optional[typing.Type[typing.Any]] = None,
-) -> typing.Any:
+) -> ConstructPlan:
     base_type = get_origin(type_) or type_
     union_type = type_
+    discriminants: typing.List[str] = []
     if base_type == typing_extensions.Annotated:  # type: ignore[comparison-overlap]
         union_type = get_args(type_)[0]
-        annotated_metadata = get_args(type_)[1:]
-        for metadata in annotated_metadata:
-            if isinstance(metadata, UnionMetadata):
-                try:
-                    # Cast to the correct type, based on the discriminant
-                    for inner_type in get_args(union_type):
-                        try:
-                            objects_discriminant = getattr(object_, metadata.discriminant)
-                        except:
-                            objects_discriminant = object_[metadata.discriminant]
-                        if inner_type.__fields__[metadata.discriminant].default == objects_discriminant:
-                            return construct_type(object_=object_, type_=inner_type, host=host)
-                except Exception:
-                    # Allow to fall through to our regular union handling
-                    pass
-    return _convert_undiscriminated_union_type(union_type, object_, host)
+        discriminants = [
+            metadata.discriminant for metadata in get_args(type_)[1:] if isinstance(metadata, UnionMetadata)
+        ]
+    undiscriminated = _build_undiscriminated_union_plan(union_type, host)
+    if not discriminants:
+        return undiscriminated
+
+    # (discriminant, [(member plan, the member's default for the discriminant, or _NO_DEFAULT)])
+    variants: typing.List[typing.Tuple[str, typing.List[typing.Tuple[ConstructPlan, typing.Any]]]] = []
+    for discriminant in discriminants:
+        members: typing.List[typing.Tuple[ConstructPlan, typing.Any]] = []
+        for inner_type in get_args(union_type):
+            try:
+                default = _get_model_fields(inner_type)[discriminant].default
+            except Exception:
+                default = _NO_DEFAULT
+            members.append((_get_construct_plan(inner_type, host), default))
+        variants.append((discriminant, members))
+
+    def convert(object_: typing.Any) -> typing.Any:
+        for discriminant, members in variants:
+            try:
+                # Cast to the correct type, based on the discriminant
+                for plan, default in members:
+                    try:
+                        objects_discriminant = getattr(object_, discriminant)
+                    except:
+                        objects_discriminant = object_[discriminant]
+                    if default is _NO_DEFAULT:
+                        raise LookupError(discriminant)
+                    if default == objects_discriminant:
+                        return plan(object_)
+            except Exception:
+                # Allow to fall through to our regular union handling
+                pass
+        return undiscriminated(object_)
 
+    return convert
 
-def construct_type(
-    *,
+
+def _build_item_plan(type_: typing.Any, host: typing.Optional[typing.Type[typing.Any]]) -> ConstructPlan:
+    """Plan for the items of a dict, list or set, resolving forward references against *host*."""
+    resolved = _maybe_resolve_forward_ref(type_, host)
+    if isinstance(resolved, typing.ForwardRef) and host is not None:
+        # Not resolvable yet (e.g. the module is still importing): retry on each use.
+        return lambda object_: _get_construct_plan(_maybe_resolve_forward_ref(type_, host), host)(object_)
+    return _get_construct_plan(resolved, host)
+
+
+def _build_construct_plan(
     type_: typing.Type[typing.Any],
-    object_: typing.Any,
     host: typing.Optional[typing.Type[typing.Any]] = None,
-) -> typing.Any:
+) -> ConstructPlan:
     """
-    Here we are essentially creating the same `construct` method in spirit as the above, but for all types, not just
-    Pydantic models.
-    The idea is to essentially attempt to coerce object_ to type_ (recursively)
+    Compile construct_type's decision tree for *type_* into a plan. Every branch mirrors
+    construct_type's historical per-value checks, in the same order.
     """
-    # Short circuit when dealing with optionals, don't try to coerces None to a type
-    if object_ is None:
-        return None
-
     base_type = get_origin(type_) or type_
     is_annotated = base_type == typing_extensions.Annotated  # type: ignore[comparison-overlap]
     maybe_annotation_members = get_args(type_)
     is_annotated_union = is_annotated and is_union(get_origin(maybe_annotation_members[0]))
 
     if base_type == typing.Any:  # type: ignore[comparison-overlap]
-        return object_
+        return _identity
 
     if base_type == dict:
-        if not isinstance(object_, typing.Mapping):
-            return object_
-
-        key_type, items_type = get_args(type_)
-        key_type = _maybe_resolve_forward_ref(key_type, host)
-        items_type = _maybe_resolve_forward_ref(items_type, host)
-        d = {
-            construct_type(object_=key, type_=key_type, host=host): construct_type(
-                object_=item, type_=items_type, host=host
-            )
-            for key, item in object_.items()
-        }
-        return d
+        try:
+            key_type, items_type = get_args(type_)
+        except ValueError:
+            # A bare Dict fails on mappings, as construct_type always has.
+            def convert_bare_dict(object_: typing.Any) -> typing.Any:
+                if not isinstance(object_, typing.Mapping):
+                    return object_
+                key_type, items_type = get_args(type_)
+                return object_
+
+            return convert_bare_dict
+
+        key_plan = _build_item_plan(key_type, host)
+        items_plan = _build_item_plan(items_type, host)
+
+        def convert_dict(object_: typing.Any) -> typing.Any:
+            if not isinstance(object_, typing.Mapping):
+                return object_
+            if key_plan is _identity and items_plan is _identity:
+                return dict(object_.items())
+            return {
+                (None if key is None else key_plan(key)): (None if item is None else items_plan(item))
+                for key, item in object_.items()
+            }
+
+        return convert_dict
 
     if base_type == list:
-        if not isinstance(object_, list):
-            return object_
+        args = get_args(type_)
+        list_plan = _build_item_plan(args[0], host) if args else None
+
+        def convert_list(object_: typing.Any) -> typing.Any:
+            if not isinstance(object_, list):
+                return object_
 
-        inner_type = _maybe_resolve_forward_ref(get_args(type_)[0], host)
-        return [construct_type(object_=entry, type_=inner_type, host=host) for entry in object_]
+            # A bare List fails here, as construct_type always has.
+            plan = list_plan or _build_item_plan(args[0], host)
+            if plan is _identity:
+                return list(object_)
+            return [None if entry is None else plan(entry) for entry in object_]
+
+        return convert_list
 
     if base_type == set:
-        if not isinstance(object_, set) and not isinstance(object_, list):
-            return object_
+        args = get_args(type_)
+        set_plan = _build_item_plan(args[0], host) if args else None
+
+        def convert_set(object_: typing.Any) -> typing.Any:
+            if not isinstance(object_, set) and not isinstance(object_, list):
+                return object_
+
+            plan = set_plan or _build_item_plan(args[0], host)
+            return {None if entry is None else plan(entry) for entry in object_}
 
-        inner_type = _maybe_resolve_forward_ref(get_args(type_)[0], host)
-        return {construct_type(object_=entry, type_=inner_type, host=host) for entry in object_}
+        return convert_set
 
     if is_union(base_type) or is_annotated_union:
-        return _convert_union_type(type_, object_, host)
+        return _build_union_plan(type_, host)
 
     # Cannot do an `issubclass` with a literal type, let's also just confirm we have a class before this call
-    if (
-        object_ is not None
-        and not is_literal_type(type_)
-        and (
-            (inspect.isclass(base_type) and issubclass(base_type, pydantic.BaseModel))
-            or (
-                is_annotated
-                and inspect.isclass(maybe_annotation_members[0])
-                and issubclass(maybe_annotation_members[0], pydantic.BaseModel)
-            )
+    if not is_literal_type(type_) and (
+        (inspect.isclass(base_type) and issubclass(base_type, pydantic.BaseModel))
+        or (
+            is_annotated
+            and inspect.isclass(maybe_annotation_members[0])
+            and issubclass(maybe_annotation_members[0], pydantic.BaseModel)
         )
     ):
         if IS_PYDANTIC_V2:
-            return type_.model_construct(**object_)
+            return lambda object_: type_.model_construct(**object_)
         else:
-            return type_.construct(**object_)
+            return lambda object_: type_.construct(**object_)
 
     if base_type == dt.datetime:
-        try:
-            return parse_datetime(object_)
-        except Exception:
-            return object_
+
+        def convert_datetime(object_: typing.Any) -> typing.Any:
+            try:
+                return parse_datetime(object_)
+            except Exception:
+                return object_
+
+        return convert_datetime
 
     if base_type == dt.date:
-        try:
-            return parse_date(object_)
-        except Exception:
-            return object_
+
+        def convert_date(object_: typing.Any) -> typing.Any:
+            try:
+                return parse_date(object_)
+            except Exception:
+                return object_
+
+        return convert_date
 
     if base_type == uuid.UUID:
-        try:
-            return uuid.UUID(object_)
-        except Exception:
-            return object_
+
+        def convert_uuid(object_: typing.Any) -> typing.Any:
+            try:
+                return uuid.UUID(object_)
+            except Exception:
+                return object_
+
+        return convert_uuid
 
     if base_type == int:
-        try:
-            return int(object_)
-        except Exception:
-            return object_
+
+        def convert_int(object_: typing.Any) -> typing.Any:
+            try:
+                return int(object_)
+            except Exception:
+                return object_
+
+        return convert_int
 
     if base_type == bool:
-        try:
-            if isinstance(object_, str):
-                stringified_object = object_.lower()
-                return stringified_object == "true" or stringified_object == "1"
 
-            return bool(object_)
-        except Exception:
-            return object_
+        def convert_bool(object_: typing.Any) -> typing.Any:
+            try:
+                if isinstance(object_, str):
+                    stringified_object = object_.lower()
+                    return stringified_object == "true" or stringified_object == "1"
+
+                return bool(object_)
+            except Exception:
+                return object_
+
+        return convert_bool
 
     # Until the Fern generator is updated to handle enums correctly, we need this code.
     # It's here to handle the case where the object is an enum value, and we need to convert it to the enum type.
     # However, this code will get removed by the Fern generator.
     # If you are reviewing a PR and you see this code being removed, please flag it as a potential issue.
     if inspect.isclass(base_type) and issubclass(base_type, enum.Enum):
-        try:
-            return base_type(object_)
-        except (ValueError, KeyError):
-            return object_
+        enum_type = base_type
 
-    return object_
+        def convert_enum(object_: typing.Any) -> typing.Any:
+            try:
+                return enum_type(object_)
+            except (ValueError, KeyError):
+                return object_
+
+        return convert_enum
+
+    return _identity
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _cached_construct_plan(type_: typing.Any, host: typing.Any, cache_key: typing.Any) -> ConstructPlan:
+    return _build_construct_plan(type_, host)
+
+
+def _get_construct_plan(type_: typing.Any, host: typing.Optional[typing.Type[typing.Any]] = None) -> ConstructPlan:
+    try:
+        cache_key = type_cache_key(type_)
+        hash((cache_key, host))
+    except TypeError:
+        # Unhashable annotations (e.g. Annotated with unhashable metadata) are not cached.
+        return _build_construct_plan(type_, host)
+    return _cached_construct_plan(type_, host, cache_key)  # type: ignore[arg-type]
+
+
+def construct_type(
+    *,
+    type_: typing.Type[typing.Any],
+    object_: typing.Any,
+    host: typing.Optional[typing.Type[typing.Any]] = None,
+) -> typing.Any:
+    """
+    Here we are essentially creating the same `construct` method in spirit as the above, but for all types, not just
+    Pydantic models.
+    The idea is to essentially attempt to coerce object_ to type_ (recursively)
+
+    The type is compiled into a construction plan once and reused, so large responses don't
+    re-inspect the same annotations for every list element.
+    """
+    # Short circuit when dealing with optionals, don't try to coerces None to a type
+    if object_ is None:
+        return None
+    # Responses requested with response_format="raw" or "bytes" are returned without a model, and
+    # with "lazy" are constructed lazily.
+    if type(object_) is RawBody:
+        return object_.value
+    if type(object_) is LazyBody:
+        return construct_lazily(type_=type_, object_=object_.value)
+
+    return _get_construct_plan(type_, host)(object_)
 
 
 def _get_is_populate_by_name(model: typing.Type["Model"]) -> bool:
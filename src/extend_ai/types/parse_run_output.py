@@ -10,6 +10,9 @@ from ..core.unchecked_base_model import UncheckedBaseModel
 from .chunk import Chunk
 from .parse_run_output_ocr import ParseRunOutputOcr
 
+if typing.TYPE_CHECKING:
+    from ..wrapper.block_index import BlockIndex
+
 
 class ParseRunOutput(UncheckedBaseModel):
     """
@@ -28,6 +31,16 @@ class ParseRunOutput(UncheckedBaseModel):
     Raw OCR data from the parsing process. Only included when `returnOcr` is configured in the parse config's advanced options.
     """
 
+    @property
+    def index(self) -> BlockIndex:
+        """
+        Lookups over the blocks of every chunk (see `extend_ai.wrapper.block_index.BlockIndex`): by id, parent,
+        type and page, and iteration in reading order. Built in one pass on first access, then reused.
+        """
+        from ..wrapper.block_index import BlockIndex
+
+        return BlockIndex.of(self)
+
     if IS_PYDANTIC_V2:
         model_config: typing.ClassVar[pydantic.ConfigDict] = pydantic.ConfigDict(extra="allow", frozen=True)  # type: ignore # Pydantic v2
     else:
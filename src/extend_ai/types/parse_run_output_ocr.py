@@ -7,6 +7,9 @@ from ..core.pydantic_utilities import IS_PYDANTIC_V2
 from ..core.unchecked_base_model import UncheckedBaseModel
 from .parse_run_output_ocr_words_item import ParseRunOutputOcrWordsItem
 
+if typing.TYPE_CHECKING:
+    from ..wrapper.columns import OcrColumns
+
 
 class ParseRunOutputOcr(UncheckedBaseModel):
     """
@@ -18,6 +21,15 @@ class ParseRunOutputOcr(UncheckedBaseModel):
     An array of individual words detected by OCR.
     """
 
+    def as_columns(self, *, numpy: typing.Optional[bool] = None) -> "OcrColumns":
+        """
+        The words as columns (see `extend_ai.wrapper.columns.OcrColumns`): a handful of flat arrays instead
+        of two models per word, filterable by confidence or page without building rows.
+        """
+        from ..wrapper.columns import OcrColumns
+
+        return OcrColumns.from_ocr(self, numpy=numpy)
+
     if IS_PYDANTIC_V2:
         model_config: typing.ClassVar[pydantic.ConfigDict] = pydantic.ConfigDict(extra="allow", frozen=True)  # type: ignore # Pydantic v2
     else:
@@ -21,15 +21,42 @@ Example:
     event = client.webhooks.verify_and_parse(body, headers, secret)
 """
 
+from ..core.instrumentation import RequestEvent, RequestHooks
+from ..core.json_codec import JsonCodec
+from ..core.rate_limit import RateLimiter, RateLimitState
+from ..core.retries import (
+    RetryAttempt,
+    RetryBudget,
+    RetryBudgetSnapshot,
+    RetryPolicy,
+    RetryStats,
+    RetryStatsSnapshot,
+)
+from ..core.token_provider import TokenProvider
+from .block_index import BlockIndex
 from .client import AsyncExtend, Extend
+from .columns import BlockColumns, OcrColumns
 from .errors import (
+    ParseRunOutputUnavailableError,
     PollingTimeoutError,
     SignedUrlNotAllowedError,
     WebhookParseError,
     WebhookPayloadFetchError,
     WebhookSignatureVerificationError,
 )
-from .polling import PollingOptions, calculate_backoff_delay, poll_until_done, poll_until_done_async
+from .fan_out import RunResult
+from .http_clients import create_async_httpx_client, create_httpx_client
+from .metrics import LatencySummary, MetricsRegistry, MetricsSnapshot, OperationMetrics, render_prometheus
+from .polling import (
+    AdaptivePolling,
+    AdaptivePollingStats,
+    PollingOptions,
+    calculate_backoff_delay,
+    poll_until_done,
+    poll_until_done_async,
+    polling_key,
+)
+from .run_tracker import AsyncRunTracker, RunTracker
 from .schema import (
     ExtendCurrency,
     ExtendDate,
@@ -41,6 +68,8 @@ from .schema import (
     parse_extract_run,
     pydantic_to_extend_schema,
 )
+from .spatial import SpatialIndex
+from .warmup import ConnectionTiming, WarmupReport
 from .webhooks import RawWebhookEvent, SignedDataUrlPayload, WebhookEventWithSignedUrl, Webhooks
 
 __all__ = [
@@ -64,13 +93,53 @@ __all__ = [
     "SignedDataUrlPayload",
     # Polling
     "PollingOptions",
+    "AdaptivePolling",
+    "AdaptivePollingStats",
+    "polling_key",
     "poll_until_done",
     "poll_until_done_async",
     "calculate_backoff_delay",
+    "RunTracker",
+    "AsyncRunTracker",
+    "RunResult",
+    # Parse output columns and indexes
+    "OcrColumns",
+    "BlockColumns",
+    "SpatialIndex",
+    "BlockIndex",
+    # HTTP clients
+    "create_httpx_client",
+    "create_async_httpx_client",
+    "ConnectionTiming",
+    "WarmupReport",
+    # Instrumentation
+    "RequestEvent",
+    "RequestHooks",
+    # JSON
+    "JsonCodec",
+    # Metrics
+    "MetricsRegistry",
+    "MetricsSnapshot",
+    "OperationMetrics",
+    "LatencySummary",
+    "render_prometheus",
+    # Rate limiting
+    "RateLimiter",
+    "RateLimitState",
+    # Authentication
+    "TokenProvider",
+    # Retries
+    "RetryAttempt",
+    "RetryBudget",
+    "RetryBudgetSnapshot",
+    "RetryPolicy",
+    "RetryStats",
+    "RetryStatsSnapshot",
     # Errors
     "PollingTimeoutError",
     "WebhookSignatureVerificationError",
     "WebhookParseError",
     "WebhookPayloadFetchError",
     "SignedUrlNotAllowedError",
+    "ParseRunOutputUnavailableError",
 ]
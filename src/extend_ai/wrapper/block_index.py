@@ -0,0 +1,159 @@
+"""
+Block tree and type indexes over a ParseRunOutput.
+
+Finding the tables on page 7, or the children of a section heading, means
+walking every chunk's blocks and their children. `ParseRunOutput.index`
+builds a BlockIndex in one pass over the output the first time it is read,
+and keeps it for as long as the output is alive:
+
+    index = run.output.index
+    index.get("block_123")                    # block by id
+    index.children("block_123")               # child blocks, by parentBlockId or nesting
+    index.of_type("table", page=7)            # blocks by type and/or page
+    for block in index:                       # every block in reading order
+        ...
+
+Outputs are frozen, so the index never goes stale. It is kept in a table
+keyed by the output's identity rather than on the model, so that it never
+shows up in dumps, comparisons or pickles.
+"""
+
+import threading
+import typing
+import weakref
+
+from ..types.block import Block
+from ..types.chunk import Chunk
+from ..types.parse_run_output import ParseRunOutput
+
+_EMPTY: typing.Tuple[Block, ...] = ()
+
+_indexes: typing.Dict[int, "BlockIndex"] = {}
+_indexes_lock = threading.Lock()
+
+
+class BlockIndex:
+    """
+    Lookups over the blocks of a ParseRunOutput: by id, by parent, by type and by page, plus iteration in
+    reading order (chunk by chunk, each block followed by its children). Read it from `ParseRunOutput.index`.
+
+    Block ids are hashes of block content, so repeated content can share an id; `get` returns the first
+    block with the id in reading order, while iteration and the other lookups include every occurrence.
+    """
+
+    def __init__(self, chunks: typing.Iterable[Chunk]) -> None:
+        order: typing.List[Block] = []
+        by_id: typing.Dict[str, Block] = {}
+        chunk_of: typing.Dict[str, Chunk] = {}
+        parent_of: typing.Dict[str, str] = {}
+        children: typing.Dict[str, typing.List[Block]] = {}
+        by_type: typing.Dict[str, typing.List[Block]] = {}
+        by_page: typing.Dict[float, typing.List[Block]] = {}
+
+        # One pass: a stack of (block, id of the block it is nested in) in reading order.
+        for chunk in chunks:
+            stack: typing.List[typing.Tuple[Block, typing.Optional[str]]] = [
+                (block, None) for block in reversed(chunk.blocks)
+            ]
+            while stack:
+                block, container_id = stack.pop()
+                order.append(block)
+                by_id.setdefault(block.id, block)
+                chunk_of.setdefault(block.id, chunk)
+                parent_id = block.parent_block_id or container_id
+                if parent_id is not None:
+                    parent_of.setdefault(block.id, parent_id)
+                    children.setdefault(parent_id, []).append(block)
+                by_type.setdefault(block.type, []).append(block)
+                page = block.metadata.page
+                if page is not None:
+                    by_page.setdefault(page.number, []).append(block)
+                if block.children:
+                    stack.extend((child, block.id) for child in reversed(block.children))
+
+        self._order = tuple(order)
+        self._by_id = by_id
+        self._chunk_of = chunk_of
+        self._parent_of = parent_of
+        self._children = {parent_id: tuple(blocks) for parent_id, blocks in children.items()}
+        self._by_type = {type_: tuple(blocks) for type_, blocks in by_type.items()}
+        self._by_page = {page: tuple(blocks) for page, blocks in by_page.items()}
+
+    @classmethod
+    def of(cls, output: ParseRunOutput) -> "BlockIndex":
+        """The index of *output*, built on first use and kept until the output is garbage collected."""
+        key = id(output)
+        index = _indexes.get(key)
+        if index is None:
+            index = cls(output.chunks)
+            with _indexes_lock:
+                if key not in _indexes:
+                    _indexes[key] = index
+                    # Runs as the output is collected, before its id can be reused.
+                    weakref.finalize(output, _indexes.pop, key, None)
+                index = _indexes[key]
+        return index
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __iter__(self) -> typing.Iterator[Block]:
+        """Every block in reading order."""
+        return iter(self._order)
+
+    def __contains__(self, block_id: object) -> bool:
+        return block_id in self._by_id
+
+    def get(self, block_id: str) -> typing.Optional[Block]:
+        """The block with *block_id*, or None."""
+        return self._by_id.get(block_id)
+
+    def __getitem__(self, block_id: str) -> Block:
+        """The block with *block_id*; raises KeyError if there is none."""
+        return self._by_id[block_id]
+
+    def parent(self, block: typing.Union[Block, str]) -> typing.Optional[Block]:
+        """The parent of a block (given as a block or an id), or None for top-level blocks."""
+        parent_id = self._parent_of.get(block if isinstance(block, str) else block.id)
+        return None if parent_id is None else self._by_id.get(parent_id)
+
+    def children(self, block: typing.Union[Block, str]) -> typing.Sequence[Block]:
+        """
+        The children of a block (given as a block or an id), in reading order: the blocks whose
+        `parent_block_id` is its id, and the blocks nested in its `children`.
+        """
+        return self._children.get(block if isinstance(block, str) else block.id, _EMPTY)
+
+    def descendants(self, block: typing.Union[Block, str]) -> typing.Iterator[Block]:
+        """The children of a block, each followed by its own descendants."""
+        stack = list(reversed(self.children(block)))
+        while stack:
+            child = stack.pop()
+            yield child
+            stack.extend(reversed(self.children(child)))
+
+    def chunk(self, block: typing.Union[Block, str]) -> typing.Optional[Chunk]:
+        """The chunk a block (given as a block or an id) first appears in, or None."""
+        return self._chunk_of.get(block if isinstance(block, str) else block.id)
+
+    def of_type(self, *types: str, page: typing.Optional[float] = None) -> typing.Sequence[Block]:
+        """The blocks of any of *types*, optionally only those on *page*, in reading order."""
+        if len(types) == 1 and page is None:
+            return self._by_type.get(types[0], _EMPTY)
+        wanted = set(types)
+        blocks = self._order if page is None else self._by_page.get(page, _EMPTY)
+        return tuple(block for block in blocks if block.type in wanted)
+
+    def on_page(self, page: float) -> typing.Sequence[Block]:
+        """The blocks on *page*, in reading order."""
+        return self._by_page.get(page, _EMPTY)
+
+    @property
+    def types(self) -> typing.List[str]:
+        """The block types present, in order of first appearance."""
+        return list(self._by_type)
+
+    @property
+    def pages(self) -> typing.List[float]:
+        """The page numbers that have blocks, in ascending order."""
+        return sorted(self._by_page)
@@ -39,7 +39,12 @@ from ..client import AsyncExtend as GeneratedAsyncExtend
 from ..client import Extend as GeneratedExtend
 
 # Import all client types for proper type annotations
+from ..core.instrumentation import RequestHooks, merge_hooks
+from ..core.json_codec import JsonCodec, JsonCodecName, resolve_json_codec
+from ..core.rate_limit import RateLimiter
 from ..core.request_options import RequestOptions
+from ..core.response_format import ResponseFormat, check_response_format
+from ..core.retries import RetryBudget, RetryPolicy, RetryStats
 from ..environment import ExtendEnvironment
 from ..evaluation_set_items.client import AsyncEvaluationSetItemsClient, EvaluationSetItemsClient
 from ..evaluation_set_runs.client import AsyncEvaluationSetRunsClient, EvaluationSetRunsClient
@@ -57,6 +62,9 @@ from ..splitters.client import AsyncSplittersClient, SplittersClient
 from ..types.extract_run import ExtractRun
 from ..types.run_metadata import RunMetadata
 from ..workflows.client import AsyncWorkflowsClient, WorkflowsClient
+from .http_clients import check_pool_options_unused, create_async_httpx_client, create_httpx_client
+from .metrics import MetricsRegistry
+from .polling import MODEL_RESPONSE
 from .resources import (
     AsyncClassifyRunsClient,
     AsyncEditRunsClient,
@@ -86,6 +94,7 @@ from .schema import (
     parse_extract_run,
 )
 from .schema.typed_run import ModelT
+from .warmup import WarmupReport, warmup, warmup_async
 from .webhooks import Webhooks
 
 # this is used as the default value for optional parameters
@@ -135,6 +144,8 @@ class Extend(GeneratedExtend):
 
     token : typing.Optional[typing.Union[str, typing.Callable[[], str]]]
         Your Extend API token. Defaults to the EXTEND_API_KEY environment variable.
+        Pass a `TokenProvider` to cache a token fetched from a slow source and
+        refresh it before it expires, or after a 401.
 
     headers : typing.Optional[typing.Dict[str, str]]
         Additional headers to send with every request.
@@ -147,11 +158,60 @@ class Extend(GeneratedExtend):
         Whether the client follows redirects.
 
     httpx_client : typing.Optional[httpx.Client]
-        Custom httpx client to use for making requests.
+        Custom httpx client to use for making requests. To share one connection
+        pool between several clients, build it with `create_httpx_client()`.
+
+    max_connections : typing.Optional[int]
+        Maximum concurrent connections. Default: 200.
+
+    max_keepalive_connections : typing.Optional[int]
+        Idle connections kept open for reuse. Default: 100.
+
+    keepalive_expiry : typing.Optional[float]
+        Seconds an idle connection is kept open. Default: 30.
+
+    http2 : bool
+        Use HTTP/2. Requires `pip install 'httpx[http2]'`.
+        The connection options only apply when `httpx_client` is not given.
 
     extend_api_version : typing.Optional[str]
         API version to use.
 
+    retry_policy : typing.Optional[RetryPolicy]
+        Retry rules for every request made by this client. Override per request
+        with `request_options={"retry_policy": ...}`.
+
+    retry_budget : typing.Optional[RetryBudget]
+        Caps retries at a fraction of successful requests. Pass the same budget
+        to several clients to cap retries across all of them.
+
+    rate_limiter : typing.Optional[RateLimiter]
+        Paces requests to stay under the rate limit reported in X-RateLimit
+        response headers, per workspace.
+
+    hooks : typing.Optional[RequestHooks]
+        Callbacks with per-phase timings (encode, network, decode, model
+        construction) and byte counts for every request.
+
+    metrics : typing.Union[bool, MetricsRegistry, None]
+        Collect per-operation request counts, status codes, retries, bytes and
+        latency percentiles, read with `client.metrics.snapshot()`. Pass True
+        for a registry of this client's own, or a MetricsRegistry to share one
+        between clients.
+
+    json_codec : typing.Union[str, JsonCodec, None]
+        Encode request bodies and decode responses and webhooks with a faster
+        JSON library: "orjson", "msgspec", or "auto" for whichever is
+        installed (falling back to the standard library). Default: leave JSON
+        to httpx.
+
+    response_format : typing.Optional[ResponseFormat]
+        "raw" returns the decoded JSON of successful responses instead of
+        models, "bytes" the undecoded response body, and "lazy" LazyModels whose
+        nested objects and lists are constructed on first access; errors are
+        raised as usual. Override per request with `request_options={"response_format": ...}`.
+        `create_and_poll()` always returns models. Default: "model".
+
     Examples
     --------
     from extend_ai import Extend
@@ -179,12 +239,39 @@ class Extend(GeneratedExtend):
         follow_redirects: typing.Optional[bool] = True,
         httpx_client: typing.Optional[httpx.Client] = None,
         extend_api_version: typing.Optional[str] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        hooks: typing.Optional[RequestHooks] = None,
+        metrics: typing.Union[bool, MetricsRegistry, None] = None,
+        json_codec: typing.Union[JsonCodecName, JsonCodec, None] = None,
+        response_format: typing.Optional[ResponseFormat] = None,
+        max_connections: typing.Optional[int] = None,
+        max_keepalive_connections: typing.Optional[int] = None,
+        keepalive_expiry: typing.Optional[float] = None,
+        http2: bool = False,
     ):
         # Fall back to the environment like the generated client and the other
         # SDKs; the generated __init__ raises a descriptive ApiError if the
         # token is still missing.
         if token is None:
             token = os.getenv("EXTEND_API_KEY")
+        check_pool_options_unused(
+            httpx_client,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+        )
+        if httpx_client is None:
+            httpx_client = create_httpx_client(
+                timeout=timeout,
+                follow_redirects=follow_redirects,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                http2=http2,
+            )
         super().__init__(
             base_url=base_url,
             environment=environment,
@@ -195,9 +282,23 @@ class Extend(GeneratedExtend):
             httpx_client=httpx_client,
             extend_api_version=extend_api_version,
         )
+        if retry_policy is not None:
+            self._client_wrapper.httpx_client.retry_policy = retry_policy
+        if retry_budget is not None:
+            self._client_wrapper.httpx_client.retry_budget = retry_budget
+        if rate_limiter is not None:
+            self._client_wrapper.httpx_client.rate_limiter = rate_limiter
+        self._metrics = MetricsRegistry() if metrics is True else metrics or None
+        self._client_wrapper.httpx_client.hooks = merge_hooks(
+            hooks, self._metrics.hooks if self._metrics is not None else None
+        )
+
+        self._client_wrapper.httpx_client.json_codec = resolve_json_codec(json_codec)
+        check_response_format(response_format)
+        self._client_wrapper.httpx_client.response_format = response_format
 
         # Webhook utilities
-        self._webhooks = Webhooks()
+        self._webhooks = Webhooks(json_codec=self._client_wrapper.httpx_client.json_codec)
 
         # Client instances (lazy initialization)
         self._extract_runs_client: typing.Optional[ExtractRunsClient] = None
@@ -214,6 +315,47 @@ class Extend(GeneratedExtend):
         """Webhook utilities for signature verification and event parsing."""
         return self._webhooks
 
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Counters for the retries this client has absorbed and the transport errors it has raised."""
+        return self._client_wrapper.httpx_client.retry_stats
+
+    @property
+    def metrics(self) -> typing.Optional[MetricsRegistry]:
+        """Per-operation request metrics, or None unless the client was created with `metrics=`."""
+        return self._metrics
+
+    @property
+    def json_codec(self) -> typing.Optional[JsonCodec]:
+        """The JSON codec requests and responses use, or None when JSON is left to httpx."""
+        return self._client_wrapper.httpx_client.json_codec
+
+    def warmup(self, connections: int = 1, *, timeout: float = 10.0) -> WarmupReport:
+        """
+        Open pooled connections to the API ahead of the first real request.
+
+        Sends `connections` concurrent authenticated HEAD requests to the base
+        URL so the DNS, TCP and TLS handshakes happen now; the connections stay
+        in the pool (for `keepalive_expiry` seconds) for later requests. Errors
+        are recorded in the report, not raised.
+
+        Args:
+            connections: Number of connections to open, from 1 to 32. Keep it at or below
+                `max_keepalive_connections`, or the extra connections are closed.
+            timeout: Timeout for each warm-up request, in seconds.
+
+        Returns:
+            A WarmupReport with one entry per request. `report.opened` counts the new
+            connections; requests that reused an already pooled connection or failed
+            are not counted.
+
+        Example:
+            client = Extend(token="...")
+            report = client.warmup(connections=8)
+            print(f"opened {report.opened}, median TLS handshake {report.tls_p50}s")
+        """
+        return warmup(self._client_wrapper, connections, timeout)
+
     @typing.overload
     def extract(
         self,
@@ -284,6 +426,9 @@ class Extend(GeneratedExtend):
                 print(result.output.value.invoice_number)  # typed!
         """
         converted_extractor, converted_config, schema_model = _convert_extract_request(extractor, config)
+        if schema_model is not None:
+            # Typed output is validated from the ExtractRun model.
+            request_options = {**(request_options or {}), **MODEL_RESPONSE}
         result = super().extract(
             extractor=converted_extractor,
             config=converted_config,
@@ -455,12 +600,39 @@ class AsyncExtend(GeneratedAsyncExtend):
         follow_redirects: typing.Optional[bool] = True,
         httpx_client: typing.Optional[httpx.AsyncClient] = None,
         extend_api_version: typing.Optional[str] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        hooks: typing.Optional[RequestHooks] = None,
+        metrics: typing.Union[bool, MetricsRegistry, None] = None,
+        json_codec: typing.Union[JsonCodecName, JsonCodec, None] = None,
+        response_format: typing.Optional[ResponseFormat] = None,
+        max_connections: typing.Optional[int] = None,
+        max_keepalive_connections: typing.Optional[int] = None,
+        keepalive_expiry: typing.Optional[float] = None,
+        http2: bool = False,
     ):
         # Fall back to the environment like the generated client and the other
         # SDKs; the generated __init__ raises a descriptive ApiError if the
         # token is still missing.
         if token is None:
             token = os.getenv("EXTEND_API_KEY")
+        check_pool_options_unused(
+            httpx_client,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+        )
+        if httpx_client is None:
+            httpx_client = create_async_httpx_client(
+                timeout=timeout,
+                follow_redirects=follow_redirects,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                http2=http2,
+            )
         super().__init__(
             base_url=base_url,
             environment=environment,
@@ -471,9 +643,23 @@ class AsyncExtend(GeneratedAsyncExtend):
             httpx_client=httpx_client,
             extend_api_version=extend_api_version,
         )
+        if retry_policy is not None:
+            self._client_wrapper.httpx_client.retry_policy = retry_policy
+        if retry_budget is not None:
+            self._client_wrapper.httpx_client.retry_budget = retry_budget
+        if rate_limiter is not None:
+            self._client_wrapper.httpx_client.rate_limiter = rate_limiter
+        self._metrics = MetricsRegistry() if metrics is True else metrics or None
+        self._client_wrapper.httpx_client.hooks = merge_hooks(
+            hooks, self._metrics.hooks if self._metrics is not None else None
+        )
+
+        self._client_wrapper.httpx_client.json_codec = resolve_json_codec(json_codec)
+        check_response_format(response_format)
+        self._client_wrapper.httpx_client.response_format = response_format
 
         # Webhook utilities
-        self._webhooks = Webhooks()
+        self._webhooks = Webhooks(json_codec=self._client_wrapper.httpx_client.json_codec)
 
         # Client instances (lazy initialization)
         self._extract_runs_client: typing.Optional[AsyncExtractRunsClient] = None
@@ -490,6 +676,28 @@ class AsyncExtend(GeneratedAsyncExtend):
         """Webhook utilities for signature verification and event parsing."""
         return self._webhooks
 
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Counters for the retries this client has absorbed and the transport errors it has raised."""
+        return self._client_wrapper.httpx_client.retry_stats
+
+    @property
+    def metrics(self) -> typing.Optional[MetricsRegistry]:
+        """Per-operation request metrics, or None unless the client was created with `metrics=`."""
+        return self._metrics
+
+    @property
+    def json_codec(self) -> typing.Optional[JsonCodec]:
+        """The JSON codec requests and responses use, or None when JSON is left to httpx."""
+        return self._client_wrapper.httpx_client.json_codec
+
+    async def warmup(self, connections: int = 1, *, timeout: float = 10.0) -> WarmupReport:
+        """
+        Open pooled connections to the API ahead of the first real request.
+        See `Extend.warmup`.
+        """
+        return await warmup_async(self._client_wrapper, connections, timeout)
+
     @typing.overload
     async def extract(
         self,
@@ -544,6 +752,9 @@ class AsyncExtend(GeneratedAsyncExtend):
         into instances of the model and returned as a TypedExtractRun.
         """
         converted_extractor, converted_config, schema_model = _convert_extract_request(extractor, config)
+        if schema_model is not None:
+            # Typed output is validated from the ExtractRun model.
+            request_options = {**(request_options or {}), **MODEL_RESPONSE}
         result = await super().extract(
             extractor=converted_extractor,
             config=converted_config,
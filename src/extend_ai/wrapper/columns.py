@@ -0,0 +1,446 @@
+"""
+Columnar views of parse output geometry.
+
+`ParseRunOutputOcr.words` holds one model per word, each with a nested
+BoundingBox, so a large document's OCR output is millions of Python objects.
+OcrColumns holds the same words as a few flat columns: the word contents
+joined into one string plus an offsets array, and `array('d')` columns (NumPy
+arrays when NumPy is installed) for the coordinates, confidence and page
+number. BlockColumns does the same for blocks, with the polygons stored as
+flat point arrays.
+
+Both accept models or decoded JSON (`response_format="raw"`, or the dicts in
+a webhook payload), and filter by mask or index without building rows:
+
+    columns = run.output.ocr.as_columns()
+    shaky = columns.low_confidence(0.5)
+    page_3 = columns.on_page(3)
+    if columns.numpy:
+        wide = columns.filter(columns.right - columns.left > 0.5)
+"""
+
+import importlib
+import importlib.util
+import itertools
+import math
+import typing
+from array import array
+
+from ..core.unchecked_base_model import construct_type
+from ..types.block import Block
+from ..types.parse_run_output import ParseRunOutput
+from ..types.parse_run_output_ocr import ParseRunOutputOcr
+from ..types.parse_run_output_ocr_words_item import ParseRunOutputOcrWordsItem
+
+Column = typing.Any
+"""A float column: an `array('d')`, or a NumPy float64 array when the view was built with NumPy."""
+
+Mask = typing.Iterable[typing.Any]
+Indices = typing.Iterable[int]
+
+_NAN = math.nan
+_COORDINATES = ("left", "top", "right", "bottom")
+
+
+def _numpy(use_numpy: typing.Optional[bool]) -> typing.Any:
+    """The numpy module if it should be used: None means "if installed"; True raises ImportError without it."""
+    if use_numpy is False or (use_numpy is None and importlib.util.find_spec("numpy") is None):
+        return None
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as exc:
+        raise ImportError("numpy=True requires NumPy. Install it with `pip install numpy`.") from exc
+
+
+def _float_column(values: "array[float]", np: typing.Any) -> Column:
+    return values if np is None else np.frombuffer(values, dtype=np.float64)
+
+
+def _take_floats(column: Column, indices: typing.Sequence[int]) -> Column:
+    if isinstance(column, array):
+        return array("d", map(column.__getitem__, indices))
+    return column[indices]
+
+
+def _indices(mask: Mask, np: typing.Any) -> typing.Sequence[int]:
+    if np is not None:
+        return typing.cast(typing.Sequence[int], np.flatnonzero(np.asarray(mask, dtype=bool)))
+    mask = list(mask)
+    return list(itertools.compress(range(len(mask)), mask))
+
+
+def _as_indices(indices: Indices, np: typing.Any) -> typing.Sequence[int]:
+    if np is not None:
+        return typing.cast(typing.Sequence[int], np.asarray(indices, dtype=np.intp))
+    return indices if isinstance(indices, (list, range)) else list(indices)
+
+
+def _int_list(indices: typing.Sequence[int]) -> typing.Sequence[int]:
+    """Indices as Python ints: indexing arrays and strings with NumPy integers is several times slower."""
+    tolist = getattr(indices, "tolist", None)
+    return typing.cast(typing.Sequence[int], tolist()) if tolist is not None else indices
+
+
+class StringColumn:
+    """A column of strings stored as one joined string and the offsets of each string in it."""
+
+    __slots__ = ("text", "offsets")
+
+    def __init__(self, text: str, offsets: "array[int]") -> None:
+        self.text = text
+        self.offsets = offsets
+
+    @classmethod
+    def from_strings(cls, values: typing.Sequence[str]) -> "StringColumn":
+        offsets = array("q", [0])
+        offsets.extend(itertools.accumulate(map(len, values)))
+        return cls("".join(values), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("StringColumn index out of range")
+        return self.text[self.offsets[index] : self.offsets[index + 1]]
+
+    def __iter__(self) -> typing.Iterator[str]:
+        text, offsets = self.text, self.offsets
+        return (text[start:end] for start, end in zip(offsets, itertools.islice(offsets, 1, None)))
+
+    def take(self, indices: typing.Sequence[int]) -> "StringColumn":
+        text, offsets = self.text, self.offsets
+        return StringColumn.from_strings([text[offsets[index] : offsets[index + 1]] for index in _int_list(indices)])
+
+
+class PointsColumn:
+    """A column of point lists (polygons) stored as flat x and y columns and the offsets of each list in them."""
+
+    __slots__ = ("offsets", "x", "y")
+
+    def __init__(self, offsets: "array[int]", x: Column, y: Column) -> None:
+        self.offsets = offsets
+        self.x = x
+        self.y = y
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> typing.List[typing.Tuple[float, float]]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PointsColumn index out of range")
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return [(float(self.x[point]), float(self.y[point])) for point in range(start, end)]
+
+    def take(self, indices: typing.Sequence[int]) -> "PointsColumn":
+        offsets = array("q", [0])
+        points: typing.List[int] = []
+        for index in _int_list(indices):
+            start, end = self.offsets[index], self.offsets[index + 1]
+            points.extend(range(start, end))
+            offsets.append(offsets[-1] + end - start)
+        return PointsColumn(offsets, _take_floats(self.x, points), _take_floats(self.y, points))
+
+
+class OcrColumns:
+    """
+    OCR words as columns: `content` (a StringColumn), `left`, `top`, `right`, `bottom`, `confidence` and
+    `page_number`. Missing coordinates are NaN.
+
+    Build one with `ParseRunOutputOcr.as_columns()` or `OcrColumns.from_words(...)`.
+    """
+
+    __slots__ = ("content", "left", "top", "right", "bottom", "confidence", "page_number", "_np")
+
+    def __init__(
+        self,
+        *,
+        content: StringColumn,
+        left: Column,
+        top: Column,
+        right: Column,
+        bottom: Column,
+        confidence: Column,
+        page_number: Column,
+        np: typing.Any = None,
+    ) -> None:
+        self.content = content
+        self.left = left
+        self.top = top
+        self.right = right
+        self.bottom = bottom
+        self.confidence = confidence
+        self.page_number = page_number
+        self._np = np
+
+    @classmethod
+    def from_words(
+        cls,
+        words: typing.Iterable[typing.Union[ParseRunOutputOcrWordsItem, typing.Mapping[str, typing.Any]]],
+        *,
+        numpy: typing.Optional[bool] = None,
+    ) -> "OcrColumns":
+        """
+        Build the columns from OCR words, as models or decoded JSON.
+
+        Uses NumPy arrays if NumPy is installed, unless `numpy=False`; `numpy=True` raises ImportError without it.
+        """
+        np = _numpy(numpy)
+        contents: typing.List[str] = []
+        columns: typing.Tuple["array[float]", ...] = tuple(array("d") for _ in range(6))
+        left, top, right, bottom, confidence, page_number = columns
+        for word in words:
+            if isinstance(word, ParseRunOutputOcrWordsItem):
+                box = word.bounding_box
+                contents.append(word.content)
+                left.append(_NAN if box.left is None else box.left)
+                top.append(_NAN if box.top is None else box.top)
+                right.append(_NAN if box.right is None else box.right)
+                bottom.append(_NAN if box.bottom is None else box.bottom)
+                confidence.append(word.confidence)
+                page_number.append(word.page_number)
+            else:
+                box_json = word.get("boundingBox") or {}
+                contents.append(word["content"])
+                for column, name in zip(columns, _COORDINATES):
+                    value = box_json.get(name)
+                    column.append(_NAN if value is None else value)
+                confidence.append(word["confidence"])
+                page_number.append(word["pageNumber"])
+        return cls(
+            content=StringColumn.from_strings(contents),
+            left=_float_column(left, np),
+            top=_float_column(top, np),
+            right=_float_column(right, np),
+            bottom=_float_column(bottom, np),
+            confidence=_float_column(confidence, np),
+            page_number=_float_column(page_number, np),
+            np=np,
+        )
+
+    @classmethod
+    def from_ocr(
+        cls,
+        ocr: typing.Union[ParseRunOutputOcr, typing.Mapping[str, typing.Any], None],
+        *,
+        numpy: typing.Optional[bool] = None,
+    ) -> "OcrColumns":
+        """Build the columns from a ParseRunOutputOcr (or its JSON); no OCR output gives empty columns."""
+        if isinstance(ocr, ParseRunOutputOcr):
+            return cls.from_words(ocr.words or (), numpy=numpy)
+        return cls.from_words((ocr or {}).get("words") or (), numpy=numpy)
+
+    @property
+    def numpy(self) -> bool:
+        """Whether the float columns are NumPy arrays (so comparisons on them give masks)."""
+        return self._np is not None
+
+    def __len__(self) -> int:
+        return len(self.content)
+
+    def __getitem__(self, index: int) -> ParseRunOutputOcrWordsItem:
+        """Build the word at *index* as a model."""
+        content = self.content[index]
+        return typing.cast(
+            ParseRunOutputOcrWordsItem,
+            construct_type(
+                type_=ParseRunOutputOcrWordsItem,
+                object_={
+                    "content": content,
+                    "boundingBox": {name: _optional(getattr(self, name)[index]) for name in _COORDINATES},
+                    "confidence": float(self.confidence[index]),
+                    "pageNumber": float(self.page_number[index]),
+                },
+            ),
+        )
+
+    def take(self, indices: Indices) -> "OcrColumns":
+        """The words at *indices*, in that order."""
+        indices = _as_indices(indices, self._np)
+        return OcrColumns(
+            content=self.content.take(indices),
+            left=_take_floats(self.left, indices),
+            top=_take_floats(self.top, indices),
+            right=_take_floats(self.right, indices),
+            bottom=_take_floats(self.bottom, indices),
+            confidence=_take_floats(self.confidence, indices),
+            page_number=_take_floats(self.page_number, indices),
+            np=self._np,
+        )
+
+    def filter(self, mask: Mask) -> "OcrColumns":
+        """The words whose entry in *mask* (one truth value per word, e.g. a NumPy boolean array) is true."""
+        return self.take(_indices(mask, self._np))
+
+    def low_confidence(self, threshold: float) -> "OcrColumns":
+        """The words with a confidence below *threshold*."""
+        if self._np is not None:
+            return self.filter(self.confidence < threshold)
+        return self.filter([confidence < threshold for confidence in self.confidence])
+
+    def on_page(self, page_number: float) -> "OcrColumns":
+        """The words on page *page_number*."""
+        if self._np is not None:
+            return self.filter(self.page_number == page_number)
+        return self.filter([page == page_number for page in self.page_number])
+
+
+class BlockColumns:
+    """
+    Blocks as columns: `id` and `content` (StringColumns), `type` (a list), `page_number`, `left`, `top`,
+    `right`, `bottom` and `polygon` (a PointsColumn). Missing coordinates and page numbers are NaN.
+
+    Build one with `BlockColumns.from_output(run.output)` or `BlockColumns.from_blocks(...)`.
+    """
+
+    __slots__ = ("id", "type", "content", "page_number", "left", "top", "right", "bottom", "polygon", "_np")
+
+    def __init__(
+        self,
+        *,
+        id: StringColumn,
+        type: typing.List[str],
+        content: StringColumn,
+        page_number: Column,
+        left: Column,
+        top: Column,
+        right: Column,
+        bottom: Column,
+        polygon: PointsColumn,
+        np: typing.Any = None,
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.content = content
+        self.page_number = page_number
+        self.left = left
+        self.top = top
+        self.right = right
+        self.bottom = bottom
+        self.polygon = polygon
+        self._np = np
+
+    @classmethod
+    def from_blocks(
+        cls,
+        blocks: typing.Iterable[typing.Union[Block, typing.Mapping[str, typing.Any]]],
+        *,
+        numpy: typing.Optional[bool] = None,
+    ) -> "BlockColumns":
+        """
+        Build the columns from blocks, as models or decoded JSON. Child blocks are not included.
+
+        Uses NumPy arrays if NumPy is installed, unless `numpy=False`; `numpy=True` raises ImportError without it.
+        """
+        np = _numpy(numpy)
+        ids: typing.List[str] = []
+        types: typing.List[str] = []
+        contents: typing.List[str] = []
+        names: typing.Dict[str, str] = {}
+        columns: typing.Tuple["array[float]", ...] = tuple(array("d") for _ in range(7))
+        page_number, left, top, right, bottom, x, y = columns
+        offsets = array("q", [0])
+        for block in blocks:
+            if isinstance(block, Block):
+                page = block.metadata.page
+                box = block.bounding_box
+                ids.append(block.id)
+                types.append(names.setdefault(block.type, block.type))
+                contents.append(block.content)
+                page_number.append(_NAN if page is None else page.number)
+                left.append(_NAN if box.left is None else box.left)
+                top.append(_NAN if box.top is None else box.top)
+                right.append(_NAN if box.right is None else box.right)
+                bottom.append(_NAN if box.bottom is None else box.bottom)
+                for point in block.polygon:
+                    x.append(point.x)
+                    y.append(point.y)
+                offsets.append(offsets[-1] + len(block.polygon))
+            else:
+                page_json = (block.get("metadata") or {}).get("page") or {}
+                box_json = block.get("boundingBox") or {}
+                polygon = block.get("polygon") or ()
+                ids.append(block["id"])
+                types.append(names.setdefault(block["type"], block["type"]))
+                contents.append(block["content"])
+                page_number.append(page_json.get("number", _NAN))
+                for column, name in zip(columns[1:5], _COORDINATES):
+                    value = box_json.get(name)
+                    column.append(_NAN if value is None else value)
+                for point_json in polygon:
+                    x.append(point_json["x"])
+                    y.append(point_json["y"])
+                offsets.append(offsets[-1] + len(polygon))
+        return cls(
+            id=StringColumn.from_strings(ids),
+            type=types,
+            content=StringColumn.from_strings(contents),
+            page_number=_float_column(page_number, np),
+            left=_float_column(left, np),
+            top=_float_column(top, np),
+            right=_float_column(right, np),
+            bottom=_float_column(bottom, np),
+            polygon=PointsColumn(offsets, _float_column(x, np), _float_column(y, np)),
+            np=np,
+        )
+
+    @classmethod
+    def from_output(
+        cls,
+        output: typing.Union[ParseRunOutput, typing.Mapping[str, typing.Any]],
+        *,
+        numpy: typing.Optional[bool] = None,
+    ) -> "BlockColumns":
+        """Build the columns from the blocks of every chunk of a ParseRunOutput (or its JSON), in order."""
+        if isinstance(output, ParseRunOutput):
+            blocks: typing.Iterable[typing.Any] = (block for chunk in output.chunks for block in chunk.blocks)
+        else:
+            blocks = (block for chunk in output.get("chunks") or () for block in chunk.get("blocks") or ())
+        return cls.from_blocks(blocks, numpy=numpy)
+
+    @property
+    def numpy(self) -> bool:
+        """Whether the float columns are NumPy arrays (so comparisons on them give masks)."""
+        return self._np is not None
+
+    def __len__(self) -> int:
+        return len(self.type)
+
+    def take(self, indices: Indices) -> "BlockColumns":
+        """The blocks at *indices*, in that order."""
+        indices = _as_indices(indices, self._np)
+        return BlockColumns(
+            id=self.id.take(indices),
+            type=[self.type[index] for index in indices],
+            content=self.content.take(indices),
+            page_number=_take_floats(self.page_number, indices),
+            left=_take_floats(self.left, indices),
+            top=_take_floats(self.top, indices),
+            right=_take_floats(self.right, indices),
+            bottom=_take_floats(self.bottom, indices),
+            polygon=self.polygon.take(indices),
+            np=self._np,
+        )
+
+    def filter(self, mask: Mask) -> "BlockColumns":
+        """The blocks whose entry in *mask* (one truth value per block, e.g. a NumPy boolean array) is true."""
+        return self.take(_indices(mask, self._np))
+
+    def on_page(self, page_number: float) -> "BlockColumns":
+        """The blocks on page *page_number*."""
+        if self._np is not None:
+            return self.filter(self.page_number == page_number)
+        return self.filter([page == page_number for page in self.page_number])
+
+    def of_type(self, *types: str) -> "BlockColumns":
+        """The blocks of any of *types* (e.g. `"table"`)."""
+        wanted = set(types)
+        return self.filter([type_ in wanted for type_ in self.type])
+
+
+def _optional(value: float) -> typing.Optional[float]:
+    return None if math.isnan(value) else float(value)
@@ -2,6 +2,8 @@
 Custom error classes for the Extend SDK wrapper.
 """
 
+from typing import Optional
+
 
 class PollingTimeoutError(Exception):
     """Error thrown when polling exceeds the maximum wait time."""
@@ -39,3 +41,12 @@ class SignedUrlNotAllowedError(Exception):
             "Either pass allow_signed_url=True to verify_and_parse() to handle signed URL payloads, "
             "or configure your webhook endpoint in the Extend dashboard to not use signed URLs."
         )
+
+
+class ParseRunOutputUnavailableError(Exception):
+    """Error thrown when streaming the output of a parse run that has none (e.g. still processing or failed)."""
+
+    def __init__(self, run_id: str, status: Optional[str]):
+        super().__init__(f"Parse run {run_id} has no output to stream (status: {status})")
+        self.run_id = run_id
+        self.status = status
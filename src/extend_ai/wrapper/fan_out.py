@@ -0,0 +1,267 @@
+"""
+Bounded fan-out of `create_and_poll` over many inputs.
+
+Every run resource has `map()` and `as_completed()`, which run
+`create_and_poll` for each input with at most `concurrency` runs in flight:
+
+    inputs = ({"file": {"url": url}, "extractor": {"id": "ex_123"}} for url in urls)
+    for result in client.extract_runs.as_completed(inputs, concurrency=16):
+        if result.error is not None:
+            print(result.index, "failed:", result.error)
+        else:
+            print(result.index, result.run.status)
+
+The input iterator is only advanced when a slot frees up, so a generator of
+any length is consumed as the runs complete and memory stays bounded by
+`concurrency`. `map()` yields in input order without letting one slow run
+stall the rest: the other slots keep running, and up to `concurrency`
+finished results wait behind it. An input whose create or polling raises yields a RunResult
+with the error rather than stopping the others.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import dataclasses
+import typing
+
+from .polling import PollingOptions
+
+T = typing.TypeVar("T")
+
+DEFAULT_CONCURRENCY = 8
+
+
+@dataclasses.dataclass(frozen=True)
+class RunResult(typing.Generic[T]):
+    """
+    The outcome of one input of `map()` / `as_completed()`: the finished run, or the error that
+    `create_and_poll` raised for it. A run that finished with status FAILED is a run, not an error.
+
+    Attributes:
+        index: The position of the input in the input iterable.
+        input: The `create_and_poll` keyword arguments the run was created with.
+        run: The run in its terminal state, or None if `error` is set.
+        error: The exception raised while creating or polling the run, or None.
+    """
+
+    index: int
+    input: typing.Mapping[str, typing.Any]
+    run: typing.Optional[T] = None
+    error: typing.Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the run was created and polled to a terminal state."""
+        return self.error is None
+
+    def result(self) -> T:
+        """The run; raises the captured error instead if there is one."""
+        if self.error is not None:
+            raise self.error
+        return typing.cast(T, self.run)
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+
+def _window(concurrency: int, ordered: bool) -> int:
+    """
+    Most runs submitted but not yet yielded. In input order, a slow run at the head does not stop
+    the other slots: up to `concurrency` finished results are held back behind it.
+    """
+    return 2 * concurrency if ordered else concurrency
+
+
+def _kwargs(
+    item: typing.Mapping[str, typing.Any], polling_options: typing.Optional[PollingOptions]
+) -> typing.Dict[str, typing.Any]:
+    kwargs = dict(item)
+    if polling_options is not None:
+        kwargs.setdefault("polling_options", polling_options)
+    return kwargs
+
+
+def fan_out(
+    create_and_poll: typing.Callable[..., T],
+    inputs: typing.Iterable[typing.Mapping[str, typing.Any]],
+    *,
+    concurrency: int,
+    polling_options: typing.Optional[PollingOptions],
+    ordered: bool,
+) -> typing.Iterator[RunResult[T]]:
+    """
+    Calls `create_and_poll(**item)` for each input on a pool of `concurrency` threads, yielding
+    RunResults in input order if *ordered*, else in completion order.
+
+    Closing the iterator early stops submitting inputs; runs already in flight finish polling in the background.
+    """
+    _check_concurrency(concurrency)
+    return _fan_out(create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=ordered)
+
+
+def _fan_out(
+    create_and_poll: typing.Callable[..., T],
+    inputs: typing.Iterable[typing.Mapping[str, typing.Any]],
+    *,
+    concurrency: int,
+    polling_options: typing.Optional[PollingOptions],
+    ordered: bool,
+) -> typing.Iterator[RunResult[T]]:
+    def call(index: int, item: typing.Mapping[str, typing.Any]) -> RunResult[T]:
+        try:
+            return RunResult(index, item, run=create_and_poll(**_kwargs(item, polling_options)))
+        except Exception as exc:
+            return RunResult(index, item, error=exc)
+
+    items = enumerate(inputs)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="extend-fan-out")
+    # Runs not yet yielded, in submission order, which is input order.
+    in_flight: typing.Deque["concurrent.futures.Future[RunResult[T]]"] = collections.deque()
+    window = _window(concurrency, ordered)
+    exhausted = False
+
+    def fill() -> None:
+        nonlocal exhausted
+        running = sum(1 for future in in_flight if not future.done())
+        while not exhausted and running < concurrency and len(in_flight) < window:
+            entry = next(items, None)
+            if entry is None:
+                exhausted = True
+                return
+            in_flight.append(executor.submit(call, *entry))
+            running += 1
+
+    try:
+        fill()
+        while in_flight:
+            if not ordered:
+                finished, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                done = [future for future in in_flight if future in finished]
+                for future in done:
+                    in_flight.remove(future)
+            elif in_flight[0].done():
+                done = [in_flight.popleft()]
+            else:
+                # The head is still running: keep the other slots busy and hold their results back.
+                fill()
+                running = [future for future in in_flight if not future.done()]
+                if len(running) < concurrency and not exhausted and len(in_flight) < window:
+                    continue  # a run finished after fill() counted it; refill its slot first
+                concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                continue
+            for future in done:
+                result = future.result()
+                fill()
+                yield result
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+_EXHAUSTED: typing.Any = object()
+
+
+def _next_item(
+    inputs: typing.Union[typing.Iterable[typing.Any], typing.AsyncIterable[typing.Any]],
+) -> typing.Callable[[], typing.Awaitable[typing.Any]]:
+    """A coroutine function returning the next input, or _EXHAUSTED once there are no more."""
+    if isinstance(inputs, typing.AsyncIterable):
+        async_items = inputs.__aiter__()
+
+        async def next_async_item() -> typing.Any:
+            try:
+                return await async_items.__anext__()
+            except StopAsyncIteration:
+                return _EXHAUSTED
+
+        return next_async_item
+    items = iter(inputs)
+
+    async def next_item() -> typing.Any:
+        return next(items, _EXHAUSTED)
+
+    return next_item
+
+
+def fan_out_async(
+    create_and_poll: typing.Callable[..., typing.Awaitable[T]],
+    inputs: typing.Union[typing.Iterable[typing.Mapping[str, typing.Any]], typing.AsyncIterable[typing.Any]],
+    *,
+    concurrency: int,
+    polling_options: typing.Optional[PollingOptions],
+    ordered: bool,
+) -> typing.AsyncIterator[RunResult[T]]:
+    """
+    Awaits `create_and_poll(**item)` for each input with at most `concurrency` tasks, yielding
+    RunResults in input order if *ordered*, else in completion order. *inputs* may be an async iterable.
+
+    Closing the iterator early cancels the runs still being polled (the runs themselves keep processing).
+    """
+    _check_concurrency(concurrency)
+    return _fan_out_async(
+        create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=ordered
+    )
+
+
+async def _fan_out_async(
+    create_and_poll: typing.Callable[..., typing.Awaitable[T]],
+    inputs: typing.Union[typing.Iterable[typing.Mapping[str, typing.Any]], typing.AsyncIterable[typing.Any]],
+    *,
+    concurrency: int,
+    polling_options: typing.Optional[PollingOptions],
+    ordered: bool,
+) -> typing.AsyncIterator[RunResult[T]]:
+    async def call(index: int, item: typing.Mapping[str, typing.Any]) -> RunResult[T]:
+        try:
+            return RunResult(index, item, run=await create_and_poll(**_kwargs(item, polling_options)))
+        except Exception as exc:
+            return RunResult(index, item, error=exc)
+
+    next_item = _next_item(inputs)
+    index = 0
+    # Runs not yet yielded, in submission order, which is input order.
+    in_flight: typing.Deque["asyncio.Task[RunResult[T]]"] = collections.deque()
+    window = _window(concurrency, ordered)
+    exhausted = False
+
+    async def fill() -> None:
+        nonlocal index, exhausted
+        running = sum(1 for task in in_flight if not task.done())
+        while not exhausted and running < concurrency and len(in_flight) < window:
+            item = await next_item()
+            if item is _EXHAUSTED:
+                exhausted = True
+                return
+            in_flight.append(asyncio.ensure_future(call(index, item)))
+            index += 1
+            running += 1
+
+    try:
+        await fill()
+        while in_flight:
+            if not ordered:
+                finished, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                done = [task for task in in_flight if task in finished]
+                for task in done:
+                    in_flight.remove(task)
+            elif in_flight[0].done():
+                done = [in_flight.popleft()]
+            else:
+                # The head is still running: keep the other slots busy and hold their results back.
+                await fill()
+                running = [task for task in in_flight if not task.done()]
+                if len(running) < concurrency and not exhausted and len(in_flight) < window:
+                    continue  # a run finished while fill() awaited the next input; refill its slot first
+                await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                continue
+            for task in done:
+                result = task.result()
+                await fill()
+                yield result
+    finally:
+        for task in in_flight:
+            task.cancel()
@@ -0,0 +1,123 @@
+"""
+httpx client factories with connection-pool settings tuned for batch workloads.
+
+Extend and AsyncExtend use these when no `httpx_client` is passed. Call them
+directly to build one pooled client and share it between several Extend
+instances (for example one per workspace), so they all reuse the same
+connections.
+
+This file is protected by .fernignore and will not be overwritten during regeneration.
+
+Example:
+    from extend_ai import Extend, create_httpx_client
+
+    shared = create_httpx_client(max_connections=500, http2=True)
+    clients = {
+        workspace_id: Extend(token=token, httpx_client=shared)
+        for workspace_id, token in workspace_tokens.items()
+    }
+"""
+
+import importlib.util
+import typing
+
+import httpx
+
+DEFAULT_TIMEOUT_SECONDS = 300.0
+# httpx defaults to 100 connections, 20 kept alive for 5 seconds. Polling many
+# runs concurrently wants more idle connections kept around for longer.
+DEFAULT_MAX_CONNECTIONS = 200
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 100
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+
+def _limits(
+    max_connections: typing.Optional[int],
+    max_keepalive_connections: typing.Optional[int],
+    keepalive_expiry: typing.Optional[float],
+) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections if max_connections is not None else DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections=(
+            max_keepalive_connections if max_keepalive_connections is not None else DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        ),
+        keepalive_expiry=keepalive_expiry if keepalive_expiry is not None else DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+    )
+
+
+def _check_http2(http2: bool) -> None:
+    if http2 and importlib.util.find_spec("h2") is None:
+        raise ImportError("http2=True requires the h2 package. Install it with: pip install 'httpx[http2]'")
+
+
+def create_httpx_client(
+    *,
+    timeout: typing.Optional[float] = None,
+    follow_redirects: typing.Optional[bool] = True,
+    max_connections: typing.Optional[int] = None,
+    max_keepalive_connections: typing.Optional[int] = None,
+    keepalive_expiry: typing.Optional[float] = None,
+    http2: bool = False,
+) -> httpx.Client:
+    """
+    Build an httpx.Client with the SDK's connection-pool defaults.
+
+    Args:
+        timeout: Request timeout in seconds. Default: 300.
+        follow_redirects: Whether to follow redirects. Default: True.
+        max_connections: Maximum concurrent connections. Default: 200.
+        max_keepalive_connections: Idle connections kept open for reuse. Default: 100.
+        keepalive_expiry: Seconds an idle connection is kept open. Default: 30.
+        http2: Negotiate HTTP/2, which multiplexes requests over fewer
+            connections. Requires `pip install 'httpx[http2]'`.
+
+    Returns:
+        A new httpx.Client. The caller owns it and should close it when done.
+    """
+    _check_http2(http2)
+    return httpx.Client(
+        timeout=timeout if timeout is not None else DEFAULT_TIMEOUT_SECONDS,
+        follow_redirects=bool(follow_redirects),
+        limits=_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+        http2=http2,
+    )
+
+
+def create_async_httpx_client(
+    *,
+    timeout: typing.Optional[float] = None,
+    follow_redirects: typing.Optional[bool] = True,
+    max_connections: typing.Optional[int] = None,
+    max_keepalive_connections: typing.Optional[int] = None,
+    keepalive_expiry: typing.Optional[float] = None,
+    http2: bool = False,
+) -> httpx.AsyncClient:
+    """
+    Build an httpx.AsyncClient with the SDK's connection-pool defaults.
+
+    Takes the same arguments as `create_httpx_client`.
+    """
+    _check_http2(http2)
+    return httpx.AsyncClient(
+        timeout=timeout if timeout is not None else DEFAULT_TIMEOUT_SECONDS,
+        follow_redirects=bool(follow_redirects),
+        limits=_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+        http2=http2,
+    )
+
+
+def check_pool_options_unused(
+    httpx_client: typing.Any, *, http2: bool = False, **limits: typing.Optional[float]
+) -> None:
+    """Pool options only apply to clients the SDK builds; reject them alongside a custom httpx_client."""
+    if httpx_client is None:
+        return
+    # 0 is a meaningful limit (keepalive_expiry=0 disables keep-alive), so only None counts as unset.
+    given = sorted(name for name, value in limits.items() if value is not None)
+    if http2 is True:
+        given.append("http2")
+    if given:
+        raise ValueError(
+            f"{', '.join(given)} cannot be combined with httpx_client; "
+            "configure the httpx client yourself, e.g. with create_httpx_client()"
+        )
@@ -0,0 +1,283 @@
+"""
+In-process request metrics per logical operation.
+
+A MetricsRegistry subscribes to the client's request hooks and keeps, for each
+operation (`POST extract_runs`, `GET parse_runs/{id}`, `POST files/upload`, ...),
+request counts, a breakdown by status code and transport error, retries, bytes
+sent and received, and a latency histogram with p50/p95/p99.
+
+This file is protected by .fernignore and will not be overwritten during regeneration.
+
+Example:
+    from extend_ai import Extend
+
+    client = Extend(token="...", metrics=True)
+    client.extract_runs.create(file={"url": url}, extractor={"id": "ex_123"})
+
+    stats = client.metrics.snapshot().operations["POST extract_runs"]
+    print(stats.requests, stats.latency.p95)
+    print(client.metrics.to_prometheus())
+"""
+
+import threading
+import typing
+from dataclasses import dataclass
+
+from ..core.instrumentation import RequestEvent, RequestHooks
+
+# Latencies are bucketed in microseconds with 2**5 = 32 linear sub-buckets per
+# power of two, so a reported percentile is within ~3% of the recorded value.
+_SUB_BUCKET_BITS = 5
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < _SUB_BUCKETS:
+        return micros
+    shift = micros.bit_length() - _SUB_BUCKET_BITS - 1
+    return (shift + 1) * _SUB_BUCKETS + (micros >> shift) - _SUB_BUCKETS
+
+
+def _bucket_upper_bound(index: int) -> int:
+    if index < _SUB_BUCKETS:
+        return index
+    shift = index // _SUB_BUCKETS - 1
+    mantissa = index % _SUB_BUCKETS + _SUB_BUCKETS
+    return ((mantissa + 1) << shift) - 1
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    """
+    Latency distribution of one operation, in seconds.
+
+    Percentiles are None until a request has been recorded.
+    """
+
+    count: int
+    total: float
+    min: typing.Optional[float]
+    max: typing.Optional[float]
+    p50: typing.Optional[float]
+    p95: typing.Optional[float]
+    p99: typing.Optional[float]
+
+    @property
+    def mean(self) -> typing.Optional[float]:
+        return self.total / self.count if self.count else None
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram: constant memory per order of magnitude and
+    bounded relative error, however many values are recorded. Not thread-safe
+    on its own; MetricsRegistry records under a lock.
+    """
+
+    def __init__(self) -> None:
+        self._counts: typing.Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: typing.Optional[float] = None
+        self.max: typing.Optional[float] = None
+
+    def record(self, seconds: float) -> None:
+        seconds = max(seconds, 0.0)
+        index = _bucket_index(int(seconds * 1_000_000))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def percentiles(self, *quantiles: float) -> typing.List[typing.Optional[float]]:
+        """Values at the given quantiles (0..1), in seconds, each clamped to the recorded range."""
+        if not self.count or self.min is None or self.max is None:
+            return [None for _ in quantiles]
+        results: typing.List[typing.Optional[float]] = []
+        buckets = sorted(self._counts.items())
+        for quantile in quantiles:
+            target = max(1, int(round(quantile * self.count)))
+            seen = 0
+            for index, count in buckets:
+                seen += count
+                if seen >= target:
+                    value = _bucket_upper_bound(index) / 1_000_000
+                    results.append(min(max(value, self.min), self.max))
+                    break
+        return results
+
+    def summary(self) -> LatencySummary:
+        p50, p95, p99 = self.percentiles(0.5, 0.95, 0.99)
+        return LatencySummary(count=self.count, total=self.total, min=self.min, max=self.max, p50=p50, p95=p95, p99=p99)
+
+
+@dataclass(frozen=True)
+class OperationMetrics:
+    """
+    Metrics for one logical operation.
+
+    Attributes:
+        requests: Attempts that received a response or raised a transport error, including retried ones.
+        retries: Attempts made after the first one.
+        status_codes: Responses per HTTP status.
+        errors: Attempts that raised a transport error instead of getting a response, per
+            exception type, e.g. `{"ReadTimeout": 2}`.
+        bytes_sent: Request body bytes, where the size was known.
+        bytes_received: Response body bytes, where the size was known.
+        latency: Time from the start of each attempt to its response or error, including encoding.
+    """
+
+    requests: int
+    retries: int
+    status_codes: typing.Dict[int, int]
+    errors: typing.Dict[str, int]
+    bytes_sent: int
+    bytes_received: int
+    latency: LatencySummary
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Point-in-time copy of a MetricsRegistry, keyed by operation name."""
+
+    operations: typing.Dict[str, OperationMetrics]
+
+
+class _Operation:
+    __slots__ = ("lock", "requests", "retries", "status_codes", "errors", "bytes_sent", "bytes_received", "latency")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.status_codes: typing.Dict[int, int] = {}
+        self.errors: typing.Dict[str, int] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = LatencyHistogram()
+
+    def snapshot(self) -> OperationMetrics:
+        with self.lock:
+            return OperationMetrics(
+                requests=self.requests,
+                retries=self.retries,
+                status_codes=dict(self.status_codes),
+                errors=dict(self.errors),
+                bytes_sent=self.bytes_sent,
+                bytes_received=self.bytes_received,
+                latency=self.latency.summary(),
+            )
+
+
+class MetricsRegistry:
+    """
+    Thread-safe request metrics, keyed by logical operation.
+
+    Each operation has its own lock, held only for a few counter updates, so
+    threads and asyncio tasks calling different operations do not contend.
+    Pass the same registry to several clients to aggregate across them.
+
+    Example:
+        from extend_ai import AsyncExtend, Extend, MetricsRegistry
+
+        metrics = MetricsRegistry()
+        client = Extend(token="...", metrics=metrics)
+        async_client = AsyncExtend(token="...", metrics=metrics)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._operations: typing.Dict[str, _Operation] = {}
+        self.hooks = RequestHooks(
+            on_request_start=self._on_request_start, on_response=self._on_response, on_error=self._on_error
+        )
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            operations = dict(self._operations)
+        return MetricsSnapshot(operations={name: operation.snapshot() for name, operation in operations.items()})
+
+    def reset(self) -> None:
+        with self._lock:
+            self._operations = {}
+
+    def to_prometheus(self, prefix: str = "extend") -> str:
+        """Render the current metrics in the Prometheus text exposition format."""
+        return render_prometheus(self.snapshot(), prefix=prefix)
+
+    def _operation(self, name: str) -> _Operation:
+        operation = self._operations.get(name)
+        if operation is None:
+            with self._lock:
+                operation = self._operations.setdefault(name, _Operation())
+        return operation
+
+    def _on_request_start(self, event: RequestEvent) -> None:
+        if event.attempt > 1:
+            operation = self._operation(event.operation)
+            with operation.lock:
+                operation.retries += 1
+
+    def _on_response(self, event: RequestEvent) -> None:
+        operation = self._operation(event.operation)
+        with operation.lock:
+            operation.requests += 1
+            if event.status_code is not None:
+                operation.status_codes[event.status_code] = operation.status_codes.get(event.status_code, 0) + 1
+            operation.bytes_sent += event.request_bytes or 0
+            operation.bytes_received += event.response_bytes or 0
+            operation.latency.record(event.encode + (event.network or 0.0))
+
+    def _on_error(self, event: RequestEvent) -> None:
+        operation = self._operation(event.operation)
+        with operation.lock:
+            operation.requests += 1
+            error = event.error or "TransportError"
+            operation.errors[error] = operation.errors.get(error, 0) + 1
+            operation.bytes_sent += event.request_bytes or 0
+            operation.latency.record(event.encode + (event.network or 0.0))
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(snapshot: MetricsSnapshot, prefix: str = "extend") -> str:
+    """Render a MetricsSnapshot in the Prometheus text exposition format (version 0.0.4)."""
+    lines: typing.List[str] = []
+
+    def family(name: str, kind: str, help_text: str) -> str:
+        metric = f"{prefix}_{name}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        return metric
+
+    operations = sorted(snapshot.operations.items())
+    metric = family(
+        "requests_total", "counter", 'Attempts by operation and HTTP status, or status="error" for transport errors.'
+    )
+    for name, stats in operations:
+        for status, count in sorted(stats.status_codes.items()):
+            lines.append(f'{metric}{{operation="{_label(name)}",status="{status}"}} {count}')
+        if stats.errors:
+            lines.append(f'{metric}{{operation="{_label(name)}",status="error"}} {sum(stats.errors.values())}')
+    for field, help_text in (
+        ("retries", "Attempts made after the first one."),
+        ("bytes_sent", "Request body bytes sent."),
+        ("bytes_received", "Response body bytes received."),
+    ):
+        metric = family(f"{field}_total", "counter", help_text)
+        for name, stats in operations:
+            lines.append(f'{metric}{{operation="{_label(name)}"}} {getattr(stats, field)}')
+    metric = family(
+        "request_duration_seconds", "summary", "Time from the start of an attempt to its response or error."
+    )
+    for name, stats in operations:
+        latency, label = stats.latency, _label(name)
+        for quantile, value in (("0.5", latency.p50), ("0.95", latency.p95), ("0.99", latency.p99)):
+            if value is not None:
+                lines.append(f'{metric}{{operation="{label}",quantile="{quantile}"}} {value:.6f}')
+        lines.append(f'{metric}_sum{{operation="{label}"}} {latency.total:.6f}')
+        lines.append(f'{metric}_count{{operation="{label}"}} {latency.count}')
+    return "\n".join(lines) + "\n"
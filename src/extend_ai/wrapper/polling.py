@@ -4,7 +4,8 @@ by exponential backoff with proportional jitter.
 
 The default strategy polls at 1-second intervals for the first 30 seconds,
 then gradually increases the interval using exponential backoff (1.15x multiplier)
-up to a maximum of 30 seconds between polls.
+up to a maximum of 30 seconds between polls. `PollingOptions(adaptive=AdaptivePolling())`
+replaces it with a schedule learned from earlier runs of the same extractor, workflow, etc.
 
 Example:
     # Polls until complete (uses hybrid strategy by default)
@@ -32,13 +33,25 @@ Example:
 """
 
 import asyncio
+import collections
 import random
+import threading
 import time
 from dataclasses import dataclass
-from typing import Awaitable, Callable, Optional, TypeVar
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Type, TypeVar, cast
+
+from ..core.request_options import RequestOptions
+from ..core.unchecked_base_model import construct_type
 
 T = TypeVar("T")
 
+# The create_and_poll helpers read `id` and `status` from the runs they fetch, so their requests
+# always build models, whatever `response_format` the client defaults to.
+MODEL_RESPONSE: RequestOptions = {"response_format": "model"}
+
+# Status checks with `PollingOptions(status_only=True)` only read `status`, so they skip building a model.
+STATUS_RESPONSE: RequestOptions = {"response_format": "raw"}
+
 
 @dataclass
 class PollingOptions:
@@ -59,6 +72,12 @@ class PollingOptions:
             A value of 1.15 means each delay is 1.15x the previous delay. Default: 1.15.
         jitter_fraction: Jitter fraction for randomization. A value of 0.25 means delays
             will be randomized by +/-25%. Default: 0.25.
+        status_only: Poll the run's status without building the run, and build it once, at
+            completion. Parse runs are polled without their output (`response_type="url"`) and
+            fetched in full once they finish. Default: False.
+        adaptive: An AdaptivePolling that learns how long runs of each extractor, workflow, etc.
+            take and schedules the polls of new runs around when they are likely to finish, in place
+            of the fixed schedule above. Default: None.
     """
 
     max_wait_ms: Optional[int] = None  # None = poll indefinitely
@@ -68,6 +87,8 @@ class PollingOptions:
     max_delay_ms: int = 30_000  # 30 seconds
     backoff_multiplier: float = 1.15
     jitter_fraction: float = 0.25
+    status_only: bool = False
+    adaptive: Optional["AdaptivePolling"] = None
 
 
 class PollingTimeoutError(Exception):
@@ -175,10 +196,220 @@ def calculate_hybrid_delay(elapsed_ms: float, options: HybridDelayOptions) -> in
     )
 
 
+@dataclass(frozen=True)
+class AdaptivePollingStats:
+    """
+    What AdaptivePolling has observed for one key.
+
+    Attributes:
+        runs: Runs polled to a terminal state.
+        polls: Polls made for those runs.
+        wasted_polls: Polls that found the run still processing.
+        mean_detection_lag_ms: Mean time between a run finishing and a poll seeing it, estimated as
+            half the gap between the last two polls of each run.
+        p50_ms: Median processing time over the recent window, or None before any run finished.
+        p90_ms: 90th percentile processing time over the recent window, or None.
+    """
+
+    runs: int
+    polls: int
+    wasted_polls: int
+    mean_detection_lag_ms: Optional[float]
+    p50_ms: Optional[float]
+    p90_ms: Optional[float]
+
+
+class _KeyStats:
+    def __init__(self, window: int) -> None:
+        self.durations: Deque[float] = collections.deque(maxlen=window)
+        self.runs = 0
+        self.polls = 0
+        self.lag_total_ms = 0.0
+
+
+def _quantile(ordered: List[float], q: float) -> float:
+    """Nearest-rank quantile of an ascending list."""
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+class AdaptivePolling:
+    """
+    Learns how long runs take, per extractor, classifier, splitter or workflow, and polls each new
+    run around when it is likely to finish.
+
+    Processing times are kept in a rolling window per key (see `polling_key`). Once a key has
+    `min_samples` of them, a new run is first polled at the window's 1/`polls_per_run` quantile
+    and then at each following one, up to the slowest run in the window; a run that outlasts all
+    of them falls back to the fixed PollingOptions schedule. Until then, runs of that key are
+    polled on the fixed schedule, which is how the first timings are learned. Pass one instance in
+    `PollingOptions(adaptive=...)` for every run that should share what it learns. Thread-safe.
+
+    Example:
+        adaptive = AdaptivePolling()
+        options = PollingOptions(adaptive=adaptive)
+        run = client.extract_runs.create_and_poll(file=file, extractor={"id": "ex_123"}, polling_options=options)
+
+        stats = adaptive.snapshot()["extract_run:ex_123"]
+        print(stats.p50_ms, stats.wasted_polls, stats.mean_detection_lag_ms)
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int = 200,
+        min_samples: int = 5,
+        polls_per_run: int = 10,
+        min_interval_ms: int = 250,
+    ) -> None:
+        """
+        Args:
+            window: Processing times kept per key; older ones are forgotten. Default: 200.
+            min_samples: Processing times a key needs before its runs are polled adaptively. Default: 5.
+            polls_per_run: Polls spread over the key's range of processing times, at evenly spaced
+                quantiles. More polls see runs finish sooner, at the cost of more wasted polls. Default: 10.
+            min_interval_ms: Minimum time between two adaptive polls. Default: 250.
+        """
+        if window < 1 or min_samples < 1 or polls_per_run < 1:
+            raise ValueError("window, min_samples and polls_per_run must be at least 1")
+        self._window = window
+        self._min_samples = min_samples
+        self._polls_per_run = polls_per_run
+        self._min_interval_ms = min_interval_ms
+        self._keys: Dict[str, _KeyStats] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, key: str, processing_ms: float) -> None:
+        """Adds a processing time for `key`, e.g. to warm up from the timestamps of earlier runs."""
+        with self._lock:
+            self._stats(key).durations.append(processing_ms)
+
+    def snapshot(self) -> Dict[str, AdaptivePollingStats]:
+        """The statistics observed so far, per key."""
+        with self._lock:
+            snapshot = {}
+            for key, stats in self._keys.items():
+                ordered = sorted(stats.durations)
+                snapshot[key] = AdaptivePollingStats(
+                    runs=stats.runs,
+                    polls=stats.polls,
+                    wasted_polls=stats.polls - stats.runs,
+                    mean_detection_lag_ms=stats.lag_total_ms / stats.runs if stats.runs else None,
+                    p50_ms=_quantile(ordered, 0.5) if ordered else None,
+                    p90_ms=_quantile(ordered, 0.9) if ordered else None,
+                )
+            return snapshot
+
+    def reset(self) -> None:
+        """Forgets everything observed."""
+        with self._lock:
+            self._keys.clear()
+
+    def schedule(self, key: str, max_delay_ms: int) -> List[float]:
+        """
+        The times, in ms after creation, at which to poll a new run of `key`; empty until the key has
+        `min_samples` processing times.
+        """
+        with self._lock:
+            stats = self._keys.get(key)
+            if stats is None or len(stats.durations) < self._min_samples:
+                return []
+            ordered = sorted(stats.durations)
+        offsets = [_quantile(ordered, 1 / self._polls_per_run)]
+        for step in range(2, self._polls_per_run + 1):
+            offset = _quantile(ordered, step / self._polls_per_run)
+            # Keep to the fixed schedule's longest gap, for keys whose processing times vary widely.
+            while offset - offsets[-1] > max_delay_ms:
+                offsets.append(offsets[-1] + max_delay_ms)
+            if offset - offsets[-1] >= self._min_interval_ms:
+                offsets.append(offset)
+        return offsets
+
+    def record(self, key: str, polls: int, pending_ms: Optional[float], finished_ms: float) -> None:
+        """
+        Records a run of `key` that took `polls` polls, the last of which, `finished_ms` after creation,
+        saw it finished, while the one before, at `pending_ms`, saw it processing. With `pending_ms` None
+        (the first poll already saw it finished), `finished_ms` is kept as an upper bound of its
+        processing time rather than a midpoint that would pull the low quantiles down.
+        """
+        with self._lock:
+            stats = self._stats(key)
+            stats.durations.append(finished_ms if pending_ms is None else (pending_ms + finished_ms) / 2)
+            stats.runs += 1
+            stats.polls += polls
+            # The run was processing when it was created, so the lag is at most `finished_ms`.
+            stats.lag_total_ms += (finished_ms - (pending_ms or 0.0)) / 2
+
+    def _stats(self, key: str) -> _KeyStats:
+        stats = self._keys.get(key)
+        if stats is None:
+            stats = self._keys[key] = _KeyStats(self._window)
+        return stats
+
+
+# Fields of the run models that name the processor a run used, in the order they are looked for.
+_PROCESSOR_FIELDS = ("extractor", "classifier", "splitter", "workflow")
+
+
+def polling_key(run: Any) -> Optional[str]:
+    """
+    The key AdaptivePolling groups a run's processing times under: its object type and the id of its
+    extractor, classifier, splitter or workflow, e.g. "extract_run:ex_123", or just the object type,
+    e.g. "parse_run", for runs without one.
+    """
+    kind = getattr(run, "object", None)
+    if not isinstance(kind, str):
+        return None
+    for field in _PROCESSOR_FIELDS:
+        processor_id = getattr(getattr(run, field, None), "id", None)
+        if isinstance(processor_id, str):
+            return f"{kind}:{processor_id}"
+    return kind
+
+
+class _PollSchedule:
+    """When to poll one run: the fixed hybrid schedule, or the one AdaptivePolling learned for its key."""
+
+    def __init__(self, options: PollingOptions, key: Optional[str]) -> None:
+        self._hybrid = HybridDelayOptions(
+            fast_poll_duration_ms=options.fast_poll_duration_ms,
+            fast_poll_interval_ms=options.fast_poll_interval_ms,
+            initial_delay_ms=options.initial_delay_ms,
+            max_delay_ms=options.max_delay_ms,
+            backoff_multiplier=options.backoff_multiplier,
+            jitter_fraction=options.jitter_fraction,
+        )
+        self._adaptive = options.adaptive if key is not None else None
+        self._key = key
+        self._offsets = self._adaptive.schedule(cast(str, key), options.max_delay_ms) if self._adaptive else []
+        self._next = 0
+        self.polls = 0
+        # When a poll last saw the run processing; None until one has.
+        self.pending_ms: Optional[float] = None
+
+    def first_delay_ms(self) -> float:
+        """How long to wait before the first poll; the fixed schedule polls right away."""
+        return self._offsets[0] if self._offsets else 0
+
+    def next_delay_ms(self, elapsed_ms: float) -> float:
+        """How long to wait after a poll at `elapsed_ms` that found the run processing."""
+        self.pending_ms = elapsed_ms
+        # A poll that landed a hair before its offset has made it; waiting out the rounding would only re-poll.
+        while self._next < len(self._offsets) and self._offsets[self._next] <= elapsed_ms + 1:
+            self._next += 1
+        if self._next < len(self._offsets):
+            return self._offsets[self._next] - elapsed_ms
+        return calculate_hybrid_delay(elapsed_ms, self._hybrid)
+
+    def finished(self, elapsed_ms: float) -> None:
+        if self._adaptive is not None:
+            self._adaptive.record(cast(str, self._key), self.polls, self.pending_ms, elapsed_ms)
+
+
 def poll_until_done(
     retrieve: Callable[[], T],
     is_terminal: Callable[[T], bool],
     options: Optional[PollingOptions] = None,
+    key: Optional[str] = None,
 ) -> T:
     """
     Polls a retrieve function until a terminal condition is met (synchronous version).
@@ -195,6 +426,8 @@ def poll_until_done(
         retrieve: Function that fetches the current state
         is_terminal: Predicate that returns True when polling should stop
         options: Polling configuration options
+        key: What `options.adaptive` groups this poll's timings under, e.g. `polling_key(run)`.
+            Without one, the fixed schedule is used.
 
     Returns:
         The final result when is_terminal returns True
@@ -220,21 +453,23 @@ def poll_until_done(
         options = PollingOptions()
 
     max_wait_ms = options.max_wait_ms
-    hybrid_options = HybridDelayOptions(
-        fast_poll_duration_ms=options.fast_poll_duration_ms,
-        fast_poll_interval_ms=options.fast_poll_interval_ms,
-        initial_delay_ms=options.initial_delay_ms,
-        max_delay_ms=options.max_delay_ms,
-        backoff_multiplier=options.backoff_multiplier,
-        jitter_fraction=options.jitter_fraction,
-    )
+    schedule = _PollSchedule(options, key)
 
     start_time = time.time() * 1000  # Convert to milliseconds
 
+    # An adaptive schedule waits until the run is likely to have finished before the first poll
+    first_delay = schedule.first_delay_ms()
+    if max_wait_ms is not None:
+        first_delay = min(first_delay, max_wait_ms)
+    if first_delay > 0:
+        time.sleep(first_delay / 1000)
+
     while True:
         result = retrieve()
+        schedule.polls += 1
 
         if is_terminal(result):
+            schedule.finished((time.time() * 1000) - start_time)
             return result
 
         elapsed_ms = (time.time() * 1000) - start_time
@@ -247,7 +482,7 @@ def poll_until_done(
                 max_wait_ms,
             )
 
-        delay = calculate_hybrid_delay(elapsed_ms, hybrid_options)
+        delay = schedule.next_delay_ms(elapsed_ms)
 
         # If timeout is set, don't wait longer than remaining time
         if max_wait_ms is not None:
@@ -263,6 +498,7 @@ async def poll_until_done_async(
     retrieve: Callable[[], Awaitable[T]],
     is_terminal: Callable[[T], bool],
     options: Optional[PollingOptions] = None,
+    key: Optional[str] = None,
 ) -> T:
     """
     Polls a retrieve function until a terminal condition is met (asynchronous version).
@@ -279,6 +515,8 @@ async def poll_until_done_async(
         retrieve: Async function that fetches the current state
         is_terminal: Predicate that returns True when polling should stop
         options: Polling configuration options
+        key: What `options.adaptive` groups this poll's timings under, e.g. `polling_key(run)`.
+            Without one, the fixed schedule is used.
 
     Returns:
         The final result when is_terminal returns True
@@ -304,21 +542,23 @@ async def poll_until_done_async(
         options = PollingOptions()
 
     max_wait_ms = options.max_wait_ms
-    hybrid_options = HybridDelayOptions(
-        fast_poll_duration_ms=options.fast_poll_duration_ms,
-        fast_poll_interval_ms=options.fast_poll_interval_ms,
-        initial_delay_ms=options.initial_delay_ms,
-        max_delay_ms=options.max_delay_ms,
-        backoff_multiplier=options.backoff_multiplier,
-        jitter_fraction=options.jitter_fraction,
-    )
+    schedule = _PollSchedule(options, key)
 
     start_time = time.time() * 1000  # Convert to milliseconds
 
+    # An adaptive schedule waits until the run is likely to have finished before the first poll
+    first_delay = schedule.first_delay_ms()
+    if max_wait_ms is not None:
+        first_delay = min(first_delay, max_wait_ms)
+    if first_delay > 0:
+        await asyncio.sleep(first_delay / 1000)
+
     while True:
         result = await retrieve()
+        schedule.polls += 1
 
         if is_terminal(result):
+            schedule.finished((time.time() * 1000) - start_time)
             return result
 
         elapsed_ms = (time.time() * 1000) - start_time
@@ -331,7 +571,7 @@ async def poll_until_done_async(
                 max_wait_ms,
             )
 
-        delay = calculate_hybrid_delay(elapsed_ms, hybrid_options)
+        delay = schedule.next_delay_ms(elapsed_ms)
 
         # If timeout is set, don't wait longer than remaining time
         if max_wait_ms is not None:
@@ -341,3 +581,86 @@ async def poll_until_done_async(
             actual_delay = delay
 
         await asyncio.sleep(actual_delay / 1000)  # Convert to seconds for asyncio.sleep
+
+
+def poll_run_until_done(
+    retrieve: Callable[[RequestOptions], Any],
+    run_type: Type[T],
+    is_terminal_status: Callable[[str], bool],
+    options: Optional[PollingOptions] = None,
+    check_status: Optional[Callable[[], Any]] = None,
+    key: Optional[str] = None,
+) -> T:
+    """
+    Polls a run until its status is terminal; what every `create_and_poll` does after creating the run.
+
+    By default each poll is `retrieve(MODEL_RESPONSE)`. With `options.status_only`, each poll is
+    `check_status()`, or `retrieve(STATUS_RESPONSE)` without it, and only the `status` of its decoded
+    JSON is read. The run is then built from the last poll's JSON, or fetched once with
+    `retrieve(MODEL_RESPONSE)` when `check_status` leaves the full run out.
+
+    Args:
+        retrieve: Fetches the run with the given request options
+        run_type: The run model, e.g. ExtractRun
+        is_terminal_status: Predicate on the run's status
+        options: Polling configuration options
+        check_status: Fetches the run's JSON without its payload, if the endpoint can
+        key: What `options.adaptive` groups the run's timings under; `polling_key()` of the created run
+
+    Returns:
+        The run, once its status is terminal
+
+    Raises:
+        PollingTimeoutError: If max_wait_ms is set and exceeded
+    """
+    if options is None or not options.status_only:
+        return cast(
+            T,
+            poll_until_done(
+                retrieve=lambda: retrieve(MODEL_RESPONSE),
+                is_terminal=lambda run: is_terminal_status(run.status),
+                options=options,
+                key=key,
+            ),
+        )
+    body = poll_until_done(
+        retrieve=check_status or (lambda: retrieve(STATUS_RESPONSE)),
+        is_terminal=lambda body: is_terminal_status(body["status"]),
+        options=options,
+        key=key,
+    )
+    if check_status is not None:
+        return cast(T, retrieve(MODEL_RESPONSE))
+    return cast(T, construct_type(type_=run_type, object_=body))
+
+
+async def poll_run_until_done_async(
+    retrieve: Callable[[RequestOptions], Awaitable[Any]],
+    run_type: Type[T],
+    is_terminal_status: Callable[[str], bool],
+    options: Optional[PollingOptions] = None,
+    check_status: Optional[Callable[[], Awaitable[Any]]] = None,
+    key: Optional[str] = None,
+) -> T:
+    """
+    Polls a run until its status is terminal (asynchronous version of poll_run_until_done).
+    """
+    if options is None or not options.status_only:
+        return cast(
+            T,
+            await poll_until_done_async(
+                retrieve=lambda: retrieve(MODEL_RESPONSE),
+                is_terminal=lambda run: is_terminal_status(run.status),
+                options=options,
+                key=key,
+            ),
+        )
+    body = await poll_until_done_async(
+        retrieve=check_status or (lambda: retrieve(STATUS_RESPONSE)),
+        is_terminal=lambda body: is_terminal_status(body["status"]),
+        options=options,
+        key=key,
+    )
+    if check_status is not None:
+        return cast(T, await retrieve(MODEL_RESPONSE))
+    return cast(T, construct_type(type_=run_type, object_=body))
@@ -16,7 +16,7 @@ Example:
         print(result.output)
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Mapping, Optional, Union
 
 from ...classify_runs.client import AsyncClassifyRunsClient as GeneratedAsyncClassifyRunsClient
 from ...classify_runs.client import ClassifyRunsClient as GeneratedClassifyRunsClient
@@ -27,7 +27,8 @@ from ...requests.classify_config import ClassifyConfigParams
 from ...types.classify_run import ClassifyRun
 from ...types.run_metadata import RunMetadata
 from ...types.run_priority import RunPriority
-from ..polling import PollingOptions, poll_until_done, poll_until_done_async
+from ..fan_out import DEFAULT_CONCURRENCY, RunResult, fan_out, fan_out_async
+from ..polling import MODEL_RESPONSE, PollingOptions, poll_run_until_done, poll_run_until_done_async, polling_key
 
 # Re-export for convenience
 from ..polling import PollingTimeoutError
@@ -108,14 +109,52 @@ class ClassifyRunsClient(GeneratedClassifyRunsClient):
             kwargs["metadata"] = metadata
 
         # Create the classify run
-        create_response = self.create(**kwargs)
+        create_response = self.create(**kwargs, request_options=MODEL_RESPONSE)
         run_id = create_response.id
 
         # Poll until terminal state
-        return poll_until_done(
-            retrieve=lambda: self.retrieve(run_id),
-            is_terminal=lambda response: _is_terminal_status(response.status),
+        return poll_run_until_done(
+            retrieve=lambda request_options: self.retrieve(run_id, request_options=request_options),
+            run_type=ClassifyRun,
+            is_terminal_status=_is_terminal_status,
             options=polling_options,
+            key=polling_key(create_response),
+        )
+
+    def map(
+        self,
+        inputs: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> Iterator[RunResult[ClassifyRun]]:
+        """
+        Runs `create_and_poll(**item)` for each input, with at most `concurrency` runs in flight, and
+        yields a RunResult per input in input order. An error is captured in its input's RunResult
+        rather than raised, and the next input is only read when a slot frees up. A slow run does not
+        hold up the others: up to `concurrency` finished results are held back until it is yielded.
+
+        Args:
+            inputs: `create_and_poll` keyword arguments, one mapping per run.
+            concurrency: Maximum number of runs in flight. Default: 8.
+            polling_options: Options for polling behavior, unless an input sets its own.
+        """
+        return fan_out(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=True
+        )
+
+    def as_completed(
+        self,
+        inputs: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> Iterator[RunResult[ClassifyRun]]:
+        """
+        Like `map()`, but yields each RunResult as soon as its run finishes rather than in input order.
+        """
+        return fan_out(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=False
         )
 
 
@@ -152,12 +191,50 @@ class AsyncClassifyRunsClient(GeneratedAsyncClassifyRunsClient):
             kwargs["metadata"] = metadata
 
         # Create the classify run
-        create_response = await self.create(**kwargs)
+        create_response = await self.create(**kwargs, request_options=MODEL_RESPONSE)
         run_id = create_response.id
 
         # Poll until terminal state
-        return await poll_until_done_async(
-            retrieve=lambda: self.retrieve(run_id),
-            is_terminal=lambda response: _is_terminal_status(response.status),
+        return await poll_run_until_done_async(
+            retrieve=lambda request_options: self.retrieve(run_id, request_options=request_options),
+            run_type=ClassifyRun,
+            is_terminal_status=_is_terminal_status,
             options=polling_options,
+            key=polling_key(create_response),
+        )
+
+    def map(
+        self,
+        inputs: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> AsyncIterator[RunResult[ClassifyRun]]:
+        """
+        Runs `create_and_poll(**item)` for each input, with at most `concurrency` runs in flight, and
+        yields a RunResult per input in input order. An error is captured in its input's RunResult
+        rather than raised, and the next input is only read when a slot frees up. A slow run does not
+        hold up the others: up to `concurrency` finished results are held back until it is yielded.
+
+        Args:
+            inputs: `create_and_poll` keyword arguments, one mapping per run; an iterable or async iterable.
+            concurrency: Maximum number of runs in flight. Default: 8.
+            polling_options: Options for polling behavior, unless an input sets its own.
+        """
+        return fan_out_async(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=True
+        )
+
+    def as_completed(
+        self,
+        inputs: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> AsyncIterator[RunResult[ClassifyRun]]:
+        """
+        Like `map()`, but yields each RunResult as soon as its run finishes rather than in input order.
+        """
+        return fan_out_async(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=False
         )
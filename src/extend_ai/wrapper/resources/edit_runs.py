@@ -16,7 +16,7 @@ Example:
         print(result.output)
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Mapping, Optional, Union
 
 from ...core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
 from ...edit_runs.client import AsyncEditRunsClient as GeneratedAsyncEditRunsClient
@@ -24,7 +24,8 @@ from ...edit_runs.client import EditRunsClient as GeneratedEditRunsClient
 from ...edit_runs.requests.edit_runs_create_request_file import EditRunsCreateRequestFileParams
 from ...requests.edit_config import EditConfigParams
 from ...types.edit_run import EditRun
-from ..polling import PollingOptions, poll_until_done, poll_until_done_async
+from ..fan_out import DEFAULT_CONCURRENCY, RunResult, fan_out, fan_out_async
+from ..polling import MODEL_RESPONSE, PollingOptions, poll_run_until_done, poll_run_until_done_async, polling_key
 
 # Re-export for convenience
 from ..polling import PollingTimeoutError
@@ -92,14 +93,52 @@ class EditRunsClient(GeneratedEditRunsClient):
             kwargs["config"] = config
 
         # Create the edit run
-        create_response = self.create(**kwargs)
+        create_response = self.create(**kwargs, request_options=MODEL_RESPONSE)
         run_id = create_response.id
 
         # Poll until terminal state
-        return poll_until_done(
-            retrieve=lambda: self.retrieve(run_id),
-            is_terminal=lambda response: _is_terminal_status(response.status),
+        return poll_run_until_done(
+            retrieve=lambda request_options: self.retrieve(run_id, request_options=request_options),
+            run_type=EditRun,
+            is_terminal_status=_is_terminal_status,
             options=polling_options,
+            key=polling_key(create_response),
+        )
+
+    def map(
+        self,
+        inputs: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> Iterator[RunResult[EditRun]]:
+        """
+        Runs `create_and_poll(**item)` for each input, with at most `concurrency` runs in flight, and
+        yields a RunResult per input in input order. An error is captured in its input's RunResult
+        rather than raised, and the next input is only read when a slot frees up. A slow run does not
+        hold up the others: up to `concurrency` finished results are held back until it is yielded.
+
+        Args:
+            inputs: `create_and_poll` keyword arguments, one mapping per run.
+            concurrency: Maximum number of runs in flight. Default: 8.
+            polling_options: Options for polling behavior, unless an input sets its own.
+        """
+        return fan_out(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=True
+        )
+
+    def as_completed(
+        self,
+        inputs: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> Iterator[RunResult[EditRun]]:
+        """
+        Like `map()`, but yields each RunResult as soon as its run finishes rather than in input order.
+        """
+        return fan_out(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=False
         )
 
 
@@ -127,12 +166,50 @@ class AsyncEditRunsClient(GeneratedAsyncEditRunsClient):
             kwargs["config"] = config
 
         # Create the edit run
-        create_response = await self.create(**kwargs)
+        create_response = await self.create(**kwargs, request_options=MODEL_RESPONSE)
         run_id = create_response.id
 
         # Poll until terminal state
-        return await poll_until_done_async(
-            retrieve=lambda: self.retrieve(run_id),
-            is_terminal=lambda response: _is_terminal_status(response.status),
+        return await poll_run_until_done_async(
+            retrieve=lambda request_options: self.retrieve(run_id, request_options=request_options),
+            run_type=EditRun,
+            is_terminal_status=_is_terminal_status,
             options=polling_options,
+            key=polling_key(create_response),
+        )
+
+    def map(
+        self,
+        inputs: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> AsyncIterator[RunResult[EditRun]]:
+        """
+        Runs `create_and_poll(**item)` for each input, with at most `concurrency` runs in flight, and
+        yields a RunResult per input in input order. An error is captured in its input's RunResult
+        rather than raised, and the next input is only read when a slot frees up. A slow run does not
+        hold up the others: up to `concurrency` finished results are held back until it is yielded.
+
+        Args:
+            inputs: `create_and_poll` keyword arguments, one mapping per run; an iterable or async iterable.
+            concurrency: Maximum number of runs in flight. Default: 8.
+            polling_options: Options for polling behavior, unless an input sets its own.
+        """
+        return fan_out_async(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=True
+        )
+
+    def as_completed(
+        self,
+        inputs: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> AsyncIterator[RunResult[EditRun]]:
+        """
+        Like `map()`, but yields each RunResult as soon as its run finishes rather than in input order.
+        """
+        return fan_out_async(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=False
         )
@@ -45,7 +45,15 @@ from ...types.run_metadata import RunMetadata
 from ...types.run_priority import RunPriority
 
 # Re-export for convenience
-from ..polling import PollingOptions, PollingTimeoutError, poll_until_done, poll_until_done_async
+from ..fan_out import DEFAULT_CONCURRENCY, RunResult, fan_out, fan_out_async
+from ..polling import (
+    MODEL_RESPONSE,
+    PollingOptions,
+    PollingTimeoutError,
+    poll_run_until_done,
+    poll_run_until_done_async,
+    polling_key,
+)
 from ..schema import (
     TypedExtractConfigParams,
     TypedExtractorParams,
@@ -264,20 +272,58 @@ class ExtractRunsClient(GeneratedExtractRunsClient):
         )
 
         # Create the extract run
-        create_response = self.create(**kwargs)
+        create_response = self.create(**kwargs, request_options=MODEL_RESPONSE)
         run_id = create_response.id
 
         # Poll until terminal state
-        result = poll_until_done(
-            retrieve=lambda: self.retrieve(run_id),
-            is_terminal=lambda response: _is_terminal_status(response.status),
+        result = poll_run_until_done(
+            retrieve=lambda request_options: self.retrieve(run_id, request_options=request_options),
+            run_type=ExtractRun,
+            is_terminal_status=_is_terminal_status,
             options=polling_options,
+            key=polling_key(create_response),
         )
 
         if schema_model is not None:
             return parse_extract_run(result, typing.cast(typing.Type[ModelT], schema_model))
         return result
 
+    def map(
+        self,
+        inputs: typing.Iterable[typing.Mapping[str, typing.Any]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: typing.Optional[PollingOptions] = None,
+    ) -> typing.Iterator[RunResult[typing.Union[ExtractRun, TypedExtractRun[typing.Any]]]]:
+        """
+        Runs `create_and_poll(**item)` for each input, with at most `concurrency` runs in flight, and
+        yields a RunResult per input in input order. An error is captured in its input's RunResult
+        rather than raised, and the next input is only read when a slot frees up. A slow run does not
+        hold up the others: up to `concurrency` finished results are held back until it is yielded.
+
+        Args:
+            inputs: `create_and_poll` keyword arguments, one mapping per run.
+            concurrency: Maximum number of runs in flight. Default: 8.
+            polling_options: Options for polling behavior, unless an input sets its own.
+        """
+        return fan_out(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=True
+        )
+
+    def as_completed(
+        self,
+        inputs: typing.Iterable[typing.Mapping[str, typing.Any]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: typing.Optional[PollingOptions] = None,
+    ) -> typing.Iterator[RunResult[typing.Union[ExtractRun, TypedExtractRun[typing.Any]]]]:
+        """
+        Like `map()`, but yields each RunResult as soon as its run finishes rather than in input order.
+        """
+        return fan_out(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=False
+        )
+
 
 class AsyncExtractRunsClient(GeneratedAsyncExtractRunsClient):
     """
@@ -383,16 +429,58 @@ class AsyncExtractRunsClient(GeneratedAsyncExtractRunsClient):
         )
 
         # Create the extract run
-        create_response = await self.create(**kwargs)
+        create_response = await self.create(**kwargs, request_options=MODEL_RESPONSE)
         run_id = create_response.id
 
         # Poll until terminal state
-        result = await poll_until_done_async(
-            retrieve=lambda: self.retrieve(run_id),
-            is_terminal=lambda response: _is_terminal_status(response.status),
+        result = await poll_run_until_done_async(
+            retrieve=lambda request_options: self.retrieve(run_id, request_options=request_options),
+            run_type=ExtractRun,
+            is_terminal_status=_is_terminal_status,
             options=polling_options,
+            key=polling_key(create_response),
         )
 
         if schema_model is not None:
             return parse_extract_run(result, typing.cast(typing.Type[ModelT], schema_model))
         return result
+
+    def map(
+        self,
+        inputs: typing.Union[
+            typing.Iterable[typing.Mapping[str, typing.Any]], typing.AsyncIterable[typing.Mapping[str, typing.Any]]
+        ],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: typing.Optional[PollingOptions] = None,
+    ) -> typing.AsyncIterator[RunResult[typing.Union[ExtractRun, TypedExtractRun[typing.Any]]]]:
+        """
+        Runs `create_and_poll(**item)` for each input, with at most `concurrency` runs in flight, and
+        yields a RunResult per input in input order. An error is captured in its input's RunResult
+        rather than raised, and the next input is only read when a slot frees up. A slow run does not
+        hold up the others: up to `concurrency` finished results are held back until it is yielded.
+
+        Args:
+            inputs: `create_and_poll` keyword arguments, one mapping per run; an iterable or async iterable.
+            concurrency: Maximum number of runs in flight. Default: 8.
+            polling_options: Options for polling behavior, unless an input sets its own.
+        """
+        return fan_out_async(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=True
+        )
+
+    def as_completed(
+        self,
+        inputs: typing.Union[
+            typing.Iterable[typing.Mapping[str, typing.Any]], typing.AsyncIterable[typing.Mapping[str, typing.Any]]
+        ],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: typing.Optional[PollingOptions] = None,
+    ) -> typing.AsyncIterator[RunResult[typing.Union[ExtractRun, TypedExtractRun[typing.Any]]]]:
+        """
+        Like `map()`, but yields each RunResult as soon as its run finishes rather than in input order.
+        """
+        return fan_out_async(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=False
+        )
@@ -1,5 +1,5 @@
 """
-Extended ParseRuns client with polling utilities.
+Extended ParseRuns client with polling and streaming utilities.
 
 Example:
     from extend_ai import Extend
@@ -13,21 +13,38 @@ Example:
 
     if result.status == "PROCESSED":
         print(result.output)
+
+    # Stream a large output chunk by chunk
+    for chunk in client.parse_runs.stream_output(result.id):
+        print(chunk.content)
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Mapping, Optional, Union
 
 from ...core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ...core.jsonable_encoder import jsonable_encoder
+from ...core.request_options import RequestOptions
 from ...parse_runs.client import AsyncParseRunsClient as GeneratedAsyncParseRunsClient
 from ...parse_runs.client import ParseRunsClient as GeneratedParseRunsClient
 from ...parse_runs.requests.parse_runs_create_request_file import ParseRunsCreateRequestFileParams
+from ...parse_runs.types.parse_runs_retrieve_request_response_type import ParseRunsRetrieveRequestResponseType
 from ...requests.data_retention import DataRetentionParams
 from ...requests.parse_config import ParseConfigParams
 from ...types.parse_run import ParseRun
 from ...types.run_metadata import RunMetadata
 
 # Re-export for convenience
-from ..polling import PollingOptions, PollingTimeoutError, poll_until_done, poll_until_done_async
+from ..fan_out import DEFAULT_CONCURRENCY, RunResult, fan_out, fan_out_async
+from ..polling import (
+    MODEL_RESPONSE,
+    STATUS_RESPONSE,
+    PollingOptions,
+    PollingTimeoutError,
+    poll_run_until_done,
+    poll_run_until_done_async,
+    polling_key,
+)
+from ..streaming import ParseOutputItem, ParseOutputScanner, download_options, raise_for_error_response
 
 __all__ = ["ParseRunsClient", "AsyncParseRunsClient", "PollingTimeoutError"]
 
@@ -45,14 +62,16 @@ def _is_terminal_status(status: str) -> bool:
 
 class ParseRunsClient(GeneratedParseRunsClient):
     """
-    Extended ParseRuns client with create_and_poll method.
+    Extended ParseRuns client with create_and_poll and stream_output methods.
 
     Inherits all methods from ParseRunsClient and adds create_and_poll
-    for convenient polling until completion.
+    for convenient polling until completion, and stream_output for reading
+    large outputs chunk by chunk.
     """
 
     def __init__(self, *, client_wrapper: SyncClientWrapper):
         super().__init__(client_wrapper=client_wrapper)
+        self._client_wrapper = client_wrapper
 
     def create_and_poll(
         self,
@@ -99,24 +118,142 @@ class ParseRunsClient(GeneratedParseRunsClient):
             kwargs["data_retention"] = data_retention
 
         # Create the parse run
-        create_response = self.create(**kwargs)
+        create_response = self.create(**kwargs, request_options=MODEL_RESPONSE)
         run_id = create_response.id
 
         # Poll until terminal state
-        return poll_until_done(
-            retrieve=lambda: self.retrieve(run_id),
-            is_terminal=lambda response: _is_terminal_status(response.status),
+        return poll_run_until_done(
+            retrieve=lambda request_options: self.retrieve(run_id, request_options=request_options),
+            run_type=ParseRun,
+            is_terminal_status=_is_terminal_status,
             options=polling_options,
+            key=polling_key(create_response),
+            check_status=lambda: self.retrieve(
+                run_id, response_type=ParseRunsRetrieveRequestResponseType.URL, request_options=STATUS_RESPONSE
+            ),
         )
 
+    def map(
+        self,
+        inputs: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> Iterator[RunResult[ParseRun]]:
+        """
+        Runs `create_and_poll(**item)` for each input, with at most `concurrency` runs in flight, and
+        yields a RunResult per input in input order. An error is captured in its input's RunResult
+        rather than raised, and the next input is only read when a slot frees up. A slow run does not
+        hold up the others: up to `concurrency` finished results are held back until it is yielded.
+
+        Args:
+            inputs: `create_and_poll` keyword arguments, one mapping per run.
+            concurrency: Maximum number of runs in flight. Default: 8.
+            polling_options: Options for polling behavior, unless an input sets its own.
+        """
+        return fan_out(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=True
+        )
+
+    def as_completed(
+        self,
+        inputs: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> Iterator[RunResult[ParseRun]]:
+        """
+        Like `map()`, but yields each RunResult as soon as its run finishes rather than in input order.
+        """
+        return fan_out(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=False
+        )
+
+    def stream_output(
+        self,
+        id: str,
+        *,
+        ocr_words: bool = False,
+        response_type: Optional[ParseRunsRetrieveRequestResponseType] = None,
+        extend_workspace_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Iterator[ParseOutputItem]:
+        """
+        Retrieves a parse run's output incrementally, yielding each chunk as soon as it has been read.
+
+        Unlike `retrieve()`, the response is scanned as it arrives rather than
+        read, decoded and constructed whole, so memory stays bounded by the
+        largest chunk whatever the size of the document. Outputs delivered by
+        URL (`response_type="url"`) are downloaded from `outputUrl` and
+        streamed the same way; the download follows the client's retry policy
+        and the request's timeout, but is sent without the client's headers.
+
+        Args:
+            id: The parse run ID.
+            ocr_words: Also yield the OCR words (`output.ocr.words`).
+            response_type: How the API delivers the output: "json" (inline) or "url".
+            extend_workspace_id: The workspace ID to target.
+            request_options: Request-specific configuration. `chunk_size` sets the read size.
+
+        Yields:
+            Chunk objects in document order, and ParseRunOutputOcrWordsItem
+            objects where the words appear when ocr_words is set.
+
+        Raises:
+            ParseRunOutputUnavailableError: If the run has no output, e.g. it is still processing or failed.
+
+        Example:
+            for item in client.parse_runs.stream_output("pr_xxx", ocr_words=True):
+                if isinstance(item, Chunk):
+                    print(item.content)
+        """
+        httpx_client = self._client_wrapper.httpx_client
+        chunk_size = request_options.get("chunk_size") if request_options is not None else None
+        scanner = ParseOutputScanner(("output",), ocr_words=ocr_words)
+        with httpx_client.stream(
+            f"parse_runs/{jsonable_encoder(id)}",
+            method="GET",
+            params={"responseType": response_type},
+            headers={"x-extend-workspace-id": str(extend_workspace_id) if extend_workspace_id is not None else None},
+            request_options=request_options,
+        ) as response:
+            if not response.is_success:
+                response.read()
+                raise_for_error_response(response, typed=True)
+            for data in response.iter_bytes(chunk_size):
+                yield from scanner.feed(data)
+                if scanner.done:
+                    break
+            yield from scanner.close()
+        if scanner.found_output:
+            return
+
+        output_url = scanner.output_url(id)
+        scanner = ParseOutputScanner((), ocr_words=ocr_words)
+        with httpx_client.stream(
+            method="GET",
+            base_url=output_url,
+            request_options=download_options(request_options),
+            authenticated=False,
+        ) as response:
+            if not response.is_success:
+                response.read()
+                raise_for_error_response(response, typed=False)
+            for data in response.iter_bytes(chunk_size):
+                yield from scanner.feed(data)
+                if scanner.done:
+                    break
+            yield from scanner.close()
+
 
 class AsyncParseRunsClient(GeneratedAsyncParseRunsClient):
     """
-    Extended AsyncParseRuns client with create_and_poll method.
+    Extended AsyncParseRuns client with create_and_poll and stream_output methods.
     """
 
     def __init__(self, *, client_wrapper: AsyncClientWrapper):
         super().__init__(client_wrapper=client_wrapper)
+        self._client_wrapper = client_wrapper
 
     async def create_and_poll(
         self,
@@ -140,12 +277,107 @@ class AsyncParseRunsClient(GeneratedAsyncParseRunsClient):
             kwargs["data_retention"] = data_retention
 
         # Create the parse run
-        create_response = await self.create(**kwargs)
+        create_response = await self.create(**kwargs, request_options=MODEL_RESPONSE)
         run_id = create_response.id
 
         # Poll until terminal state
-        return await poll_until_done_async(
-            retrieve=lambda: self.retrieve(run_id),
-            is_terminal=lambda response: _is_terminal_status(response.status),
+        return await poll_run_until_done_async(
+            retrieve=lambda request_options: self.retrieve(run_id, request_options=request_options),
+            run_type=ParseRun,
+            is_terminal_status=_is_terminal_status,
             options=polling_options,
+            key=polling_key(create_response),
+            check_status=lambda: self.retrieve(
+                run_id, response_type=ParseRunsRetrieveRequestResponseType.URL, request_options=STATUS_RESPONSE
+            ),
+        )
+
+    def map(
+        self,
+        inputs: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> AsyncIterator[RunResult[ParseRun]]:
+        """
+        Runs `create_and_poll(**item)` for each input, with at most `concurrency` runs in flight, and
+        yields a RunResult per input in input order. An error is captured in its input's RunResult
+        rather than raised, and the next input is only read when a slot frees up. A slow run does not
+        hold up the others: up to `concurrency` finished results are held back until it is yielded.
+
+        Args:
+            inputs: `create_and_poll` keyword arguments, one mapping per run; an iterable or async iterable.
+            concurrency: Maximum number of runs in flight. Default: 8.
+            polling_options: Options for polling behavior, unless an input sets its own.
+        """
+        return fan_out_async(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=True
         )
+
+    def as_completed(
+        self,
+        inputs: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> AsyncIterator[RunResult[ParseRun]]:
+        """
+        Like `map()`, but yields each RunResult as soon as its run finishes rather than in input order.
+        """
+        return fan_out_async(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=False
+        )
+
+    async def stream_output(
+        self,
+        id: str,
+        *,
+        ocr_words: bool = False,
+        response_type: Optional[ParseRunsRetrieveRequestResponseType] = None,
+        extend_workspace_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncIterator[ParseOutputItem]:
+        """
+        Retrieves a parse run's output incrementally, yielding each chunk as soon as it has been read (async version).
+        """
+        httpx_client = self._client_wrapper.httpx_client
+        chunk_size = request_options.get("chunk_size") if request_options is not None else None
+        scanner = ParseOutputScanner(("output",), ocr_words=ocr_words)
+        async with httpx_client.stream(
+            f"parse_runs/{jsonable_encoder(id)}",
+            method="GET",
+            params={"responseType": response_type},
+            headers={"x-extend-workspace-id": str(extend_workspace_id) if extend_workspace_id is not None else None},
+            request_options=request_options,
+        ) as response:
+            if not response.is_success:
+                await response.aread()
+                raise_for_error_response(response, typed=True)
+            async for data in response.aiter_bytes(chunk_size):
+                for item in scanner.feed(data):
+                    yield item
+                if scanner.done:
+                    break
+            for item in scanner.close():
+                yield item
+        if scanner.found_output:
+            return
+
+        output_url = scanner.output_url(id)
+        scanner = ParseOutputScanner((), ocr_words=ocr_words)
+        async with httpx_client.stream(
+            method="GET",
+            base_url=output_url,
+            request_options=download_options(request_options),
+            authenticated=False,
+        ) as response:
+            if not response.is_success:
+                await response.aread()
+                raise_for_error_response(response, typed=False)
+            async for data in response.aiter_bytes(chunk_size):
+                for item in scanner.feed(data):
+                    yield item
+                if scanner.done:
+                    break
+            for item in scanner.close():
+                yield item
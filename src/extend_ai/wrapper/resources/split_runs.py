@@ -16,7 +16,7 @@ Example:
         print(result.output)
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Mapping, Optional, Union
 
 from ...core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
 from ...requests.split_config import SplitConfigParams
@@ -27,7 +27,8 @@ from ...split_runs.requests.split_runs_create_request_splitter import SplitRunsC
 from ...types.run_metadata import RunMetadata
 from ...types.run_priority import RunPriority
 from ...types.split_run import SplitRun
-from ..polling import PollingOptions, poll_until_done, poll_until_done_async
+from ..fan_out import DEFAULT_CONCURRENCY, RunResult, fan_out, fan_out_async
+from ..polling import MODEL_RESPONSE, PollingOptions, poll_run_until_done, poll_run_until_done_async, polling_key
 
 # Re-export for convenience
 from ..polling import PollingTimeoutError
@@ -105,14 +106,52 @@ class SplitRunsClient(GeneratedSplitRunsClient):
             kwargs["metadata"] = metadata
 
         # Create the split run
-        create_response = self.create(**kwargs)
+        create_response = self.create(**kwargs, request_options=MODEL_RESPONSE)
         run_id = create_response.id
 
         # Poll until terminal state
-        return poll_until_done(
-            retrieve=lambda: self.retrieve(run_id),
-            is_terminal=lambda response: _is_terminal_status(response.status),
+        return poll_run_until_done(
+            retrieve=lambda request_options: self.retrieve(run_id, request_options=request_options),
+            run_type=SplitRun,
+            is_terminal_status=_is_terminal_status,
             options=polling_options,
+            key=polling_key(create_response),
+        )
+
+    def map(
+        self,
+        inputs: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> Iterator[RunResult[SplitRun]]:
+        """
+        Runs `create_and_poll(**item)` for each input, with at most `concurrency` runs in flight, and
+        yields a RunResult per input in input order. An error is captured in its input's RunResult
+        rather than raised, and the next input is only read when a slot frees up. A slow run does not
+        hold up the others: up to `concurrency` finished results are held back until it is yielded.
+
+        Args:
+            inputs: `create_and_poll` keyword arguments, one mapping per run.
+            concurrency: Maximum number of runs in flight. Default: 8.
+            polling_options: Options for polling behavior, unless an input sets its own.
+        """
+        return fan_out(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=True
+        )
+
+    def as_completed(
+        self,
+        inputs: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> Iterator[RunResult[SplitRun]]:
+        """
+        Like `map()`, but yields each RunResult as soon as its run finishes rather than in input order.
+        """
+        return fan_out(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=False
         )
 
 
@@ -149,12 +188,50 @@ class AsyncSplitRunsClient(GeneratedAsyncSplitRunsClient):
             kwargs["metadata"] = metadata
 
         # Create the split run
-        create_response = await self.create(**kwargs)
+        create_response = await self.create(**kwargs, request_options=MODEL_RESPONSE)
         run_id = create_response.id
 
         # Poll until terminal state
-        return await poll_until_done_async(
-            retrieve=lambda: self.retrieve(run_id),
-            is_terminal=lambda response: _is_terminal_status(response.status),
+        return await poll_run_until_done_async(
+            retrieve=lambda request_options: self.retrieve(run_id, request_options=request_options),
+            run_type=SplitRun,
+            is_terminal_status=_is_terminal_status,
             options=polling_options,
+            key=polling_key(create_response),
+        )
+
+    def map(
+        self,
+        inputs: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> AsyncIterator[RunResult[SplitRun]]:
+        """
+        Runs `create_and_poll(**item)` for each input, with at most `concurrency` runs in flight, and
+        yields a RunResult per input in input order. An error is captured in its input's RunResult
+        rather than raised, and the next input is only read when a slot frees up. A slow run does not
+        hold up the others: up to `concurrency` finished results are held back until it is yielded.
+
+        Args:
+            inputs: `create_and_poll` keyword arguments, one mapping per run; an iterable or async iterable.
+            concurrency: Maximum number of runs in flight. Default: 8.
+            polling_options: Options for polling behavior, unless an input sets its own.
+        """
+        return fan_out_async(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=True
+        )
+
+    def as_completed(
+        self,
+        inputs: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        polling_options: Optional[PollingOptions] = None,
+    ) -> AsyncIterator[RunResult[SplitRun]]:
+        """
+        Like `map()`, but yields each RunResult as soon as its run finishes rather than in input order.
+        """
+        return fan_out_async(
+            self.create_and_poll, inputs, concurrency=concurrency, polling_options=polling_options, ordered=False
         )
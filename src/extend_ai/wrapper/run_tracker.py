@@ -0,0 +1,499 @@
+"""
+Shared completion tracking for many in-flight runs.
+
+`create_and_poll` polls each run with its own `retrieve` loop, downloading the
+full run every time. With thousands of runs in flight that is thousands of
+requests per minute. A RunTracker follows any number of runs with one `list`
+sweep per interval instead, and fetches each run in full once, when the sweep
+sees it finish:
+
+    tracker = RunTracker(client.extract_runs)
+    runs = [client.extract_runs.create(file=file, extractor={"id": "ex_123"}) for file in files]
+    for future in tracker.as_completed(runs):
+        run = future.result()   # the full ExtractRun, PROCESSED / FAILED / CANCELLED
+
+Sweeps sort the listing by `updatedAt`, newest first, and stop paging once
+they reach runs last updated before the tracked runs were last seen
+unfinished, so a sweep costs a page or two however long the run history is.
+Scoping the tracker with `batch_id` (or filters such as `extractor_id`)
+narrows the listing further; parse runs cannot be sorted, so tracking them
+requires a `batch_id`.
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import threading
+import typing
+
+import httpx
+from ..core.api_error import ApiError
+from ..core.retries import RETRYABLE_4XX_STATUSES
+from .polling import MODEL_RESPONSE
+
+# How far before a run was last seen unfinished a sweep keeps paging, to allow for lag in the listing.
+DEFAULT_LISTING_LAG_MS = 10_000
+# Consecutive failed sweeps after which the runs being followed fail with the last sweep's error.
+DEFAULT_MAX_SWEEP_FAILURES = 3
+
+
+def _is_terminal_status(status: str) -> bool:
+    """Same rule as create_and_poll: anything but PENDING, PROCESSING or CANCELLING is final."""
+    return status not in ("PROCESSING", "PENDING", "CANCELLING")
+
+
+def _run_id_and_since(run: typing.Any) -> typing.Tuple[str, typing.Optional[float]]:
+    """The id of a run given as an id or a run object, and when it was last seen unfinished if known."""
+    if isinstance(run, str):
+        return run, None
+    updated_at = getattr(run, "updated_at", None)
+    status = getattr(run, "status", None)
+    if updated_at is None or status is None or _is_terminal_status(status):
+        return run.id, None
+    return run.id, updated_at.timestamp()
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Whether a sweep that failed with *exc* may succeed if repeated: a 5xx, 408, 409 or 429, or a transport error."""
+    if isinstance(exc, ApiError) and exc.status_code is not None:
+        return exc.status_code >= 500 or exc.status_code in RETRYABLE_4XX_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+class _Sweeper:
+    """The bookkeeping shared by RunTracker and AsyncRunTracker; the subclasses make the requests."""
+
+    def __init__(
+        self,
+        runs: typing.Any,
+        *,
+        batch_id: typing.Optional[str],
+        filters: typing.Optional[typing.Mapping[str, typing.Any]],
+        interval_ms: typing.Optional[int],
+        max_page_size: int,
+        listing_lag_ms: int,
+        fetch_full: bool,
+        max_sweep_failures: int,
+    ) -> None:
+        if not hasattr(runs, "list"):
+            raise TypeError(f"{type(runs).__name__} has no list endpoint to follow runs with")
+        self._sorted = "sort_by" in inspect.signature(runs.list).parameters
+        if not self._sorted and batch_id is None:
+            raise ValueError(
+                f"{type(runs).__name__}.list cannot be sorted by update time, so tracking its runs requires a batch_id"
+            )
+        self._runs = runs
+        self._batch_id = batch_id
+        self._filters = dict(filters or {})
+        self._interval = None if interval_ms is None else interval_ms / 1000
+        self._max_page_size = max_page_size
+        self._listing_lag = listing_lag_ms / 1000
+        self._fetch_full = fetch_full
+        self._max_sweep_failures = max_sweep_failures
+        self._sweep_failures = 0
+        # Run id -> server time the run was last seen unfinished, or None if never.
+        self._since: typing.Dict[str, typing.Optional[float]] = {}
+
+    def _list_kwargs(self, next_page_token: typing.Optional[str]) -> typing.Dict[str, typing.Any]:
+        kwargs: typing.Dict[str, typing.Any] = dict(self._filters)
+        if self._batch_id is not None:
+            kwargs["batch_id"] = self._batch_id
+        if self._sorted:
+            kwargs["sort_by"] = "updatedAt"
+            kwargs["sort_dir"] = "desc"
+        kwargs["max_page_size"] = self._max_page_size
+        kwargs["next_page_token"] = next_page_token
+        kwargs["request_options"] = MODEL_RESPONSE
+        return kwargs
+
+    def _cutoff(self, pending: typing.Mapping[str, typing.Optional[float]]) -> typing.Optional[float]:
+        """Pages of runs last updated before this hold no news about *pending*; None pages to the end."""
+        if not self._sorted or any(since is None for since in pending.values()):
+            return None
+        return min(typing.cast(typing.Iterable[float], pending.values())) - self._listing_lag
+
+    def _scan(
+        self,
+        page: typing.Any,
+        pending: typing.Dict[str, typing.Optional[float]],
+        finished: typing.List[typing.Any],
+        cutoff: typing.Optional[float],
+    ) -> typing.Optional[str]:
+        """Moves the finished runs on *page* from *pending* to *finished*; returns the next page to read, if any."""
+        data = page.data or []
+        for summary in data:
+            if summary.id in pending and _is_terminal_status(summary.status):
+                del pending[summary.id]
+                finished.append(summary)
+        if not pending or not page.next_page_token:
+            return None
+        if cutoff is not None and data and data[-1].updated_at.timestamp() < cutoff:
+            return None
+        return page.next_page_token
+
+    def _sweep_failed(self, exc: BaseException) -> bool:
+        """Counts a failed sweep; returns whether the runs it was following should fail with *exc*."""
+        self._sweep_failures += 1
+        if self._sweep_failures < self._max_sweep_failures and _is_retryable(exc):
+            return False
+        self._sweep_failures = 0
+        return True
+
+    @staticmethod
+    def _seen_at(page: typing.Any) -> typing.Optional[float]:
+        """The newest update time on the first page of a sweep: every run not finished by then is unfinished."""
+        data = page.data or []
+        return max((summary.updated_at.timestamp() for summary in data), default=None)
+
+
+class RunTracker(_Sweeper):
+    """
+    Follows runs of one resource (`client.extract_runs`, `client.workflow_runs`, `client.parse_runs`, ...)
+    to completion with one shared `list` sweep every `interval_ms`, on a background thread that runs while
+    there are runs to follow.
+
+    `track()` returns a `concurrent.futures.Future` that resolves to the full run once it is PROCESSED,
+    FAILED or CANCELLED (or to its list summary with `fetch_full=False`), and fails with the API error if
+    the fetch fails. A failed sweep leaves the runs pending for the next one; they fail with its error
+    after `max_sweep_failures` failed sweeps in a row, or at once if it is not worth retrying (a 4xx
+    other than 408, 409 or 429). Runs passed as the objects `create` returns are known to be unfinished
+    as of their `updated_at`; runs passed by id make the next sweep read the whole listing once.
+
+    Args:
+        runs: The run resource to track, e.g. `client.extract_runs`.
+        batch_id: Only list the runs of this batch. Required for parse runs.
+        filters: Other `list` filters, e.g. `{"extractor_id": "ex_123"}`.
+        interval_ms: Time between background sweeps, or None to sweep only when `poll()` is called. Default: 2000.
+        max_page_size: Page size of the listing. Default: 100.
+        listing_lag_ms: How long a finished run may take to show up in the listing. Default: 10000.
+        fetch_full: Fetch the full run on completion rather than resolving to the list summary. Default: True.
+        max_sweep_failures: Consecutive failed sweeps after which the runs being followed fail. Default: 3.
+    """
+
+    def __init__(
+        self,
+        runs: typing.Any,
+        *,
+        batch_id: typing.Optional[str] = None,
+        filters: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+        interval_ms: typing.Optional[int] = 2_000,
+        max_page_size: int = 100,
+        listing_lag_ms: int = DEFAULT_LISTING_LAG_MS,
+        fetch_full: bool = True,
+        max_sweep_failures: int = DEFAULT_MAX_SWEEP_FAILURES,
+    ) -> None:
+        super().__init__(
+            runs,
+            batch_id=batch_id,
+            filters=filters,
+            interval_ms=interval_ms,
+            max_page_size=max_page_size,
+            listing_lag_ms=listing_lag_ms,
+            fetch_full=fetch_full,
+            max_sweep_failures=max_sweep_failures,
+        )
+        self._futures: typing.Dict[str, "concurrent.futures.Future[typing.Any]"] = {}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._worker: typing.Optional[threading.Thread] = None
+
+    def track(self, run: typing.Any) -> "concurrent.futures.Future[typing.Any]":
+        """Starts following a run, given as an id or a run object; tracking a run twice returns the same future."""
+        run_id, since = _run_id_and_since(run)
+        with self._lock:
+            if self._closed.is_set():
+                raise RuntimeError("RunTracker is closed")
+            future = self._futures.get(run_id)
+            if future is None:
+                future = concurrent.futures.Future()
+                self._futures[run_id] = future
+                self._since[run_id] = since
+            if self._worker is None and self._interval is not None:
+                self._worker = threading.Thread(
+                    target=self._work, args=(self._interval,), name="extend-run-tracker", daemon=True
+                )
+                self._worker.start()
+        return future
+
+    def as_completed(
+        self, runs: typing.Iterable[typing.Any], timeout: typing.Optional[float] = None
+    ) -> typing.Iterator["concurrent.futures.Future[typing.Any]"]:
+        """
+        Tracks *runs* and yields their futures as they complete, like `concurrent.futures.as_completed`;
+        raises `TimeoutError` if they have not all completed within *timeout* seconds.
+        """
+        return concurrent.futures.as_completed([self.track(run) for run in runs], timeout=timeout)
+
+    @property
+    def pending(self) -> int:
+        """The number of runs being followed."""
+        with self._lock:
+            return sum(not future.done() for future in self._futures.values())
+
+    def poll(self) -> int:
+        """
+        Runs one sweep now and returns the number of runs it resolved; raises the error of a failed sweep,
+        whether or not it failed the runs.
+        """
+        with self._lock:
+            pending = {run_id: self._since[run_id] for run_id, future in self._futures.items() if not future.done()}
+        if not pending:
+            return 0
+        cutoff = self._cutoff(pending)
+        finished: typing.List[typing.Any] = []
+        seen_at: typing.Optional[float] = None
+        next_page_token: typing.Optional[str] = None
+        try:
+            while True:
+                page = self._runs.list(**self._list_kwargs(next_page_token))
+                if next_page_token is None:
+                    seen_at = self._seen_at(page)
+                next_page_token = self._scan(page, pending, finished, cutoff)
+                if next_page_token is None:
+                    break
+        except Exception as exc:
+            with self._lock:
+                give_up = self._sweep_failed(exc)
+            if give_up:
+                self._fail([*pending, *(summary.id for summary in finished)], exc)
+            raise
+        with self._lock:
+            self._sweep_failures = 0
+            for run_id in pending:
+                if run_id in self._since and seen_at is not None:
+                    self._since[run_id] = seen_at
+        for summary in finished:
+            self._resolve(summary)
+        return len(finished)
+
+    def close(self) -> None:
+        """Stops sweeping and cancels the futures of runs that have not completed."""
+        with self._lock:
+            self._closed.set()
+            worker = self._worker
+            futures = list(self._futures.values())
+            self._futures.clear()
+            self._since.clear()
+        for future in futures:
+            future.cancel()
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
+
+    def __enter__(self) -> "RunTracker":
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
+
+    def _resolve(self, summary: typing.Any) -> None:
+        with self._lock:
+            future = self._futures.pop(summary.id, None)
+            self._since.pop(summary.id, None)
+        if future is None or future.done():
+            return
+        try:
+            run = self._runs.retrieve(summary.id, request_options=MODEL_RESPONSE) if self._fetch_full else summary
+        except Exception as exc:
+            _settle(future, exception=exc)
+        else:
+            _settle(future, result=run)
+
+    def _fail(self, run_ids: typing.List[str], exc: BaseException) -> None:
+        with self._lock:
+            futures = [self._futures.pop(run_id, None) for run_id in run_ids]
+            for run_id in run_ids:
+                self._since.pop(run_id, None)
+        for future in futures:
+            if future is not None:
+                _settle(future, exception=exc)
+
+    def _work(self, interval: float) -> None:
+        while not self._closed.wait(interval):
+            with self._lock:
+                # Decided under the lock so that a run tracked meanwhile either sees the worker or starts one.
+                if not any(not future.done() for future in self._futures.values()):
+                    self._futures.clear()
+                    self._worker = None
+                    return
+            try:
+                self.poll()
+            except Exception:
+                pass  # retried by the next sweep, or already delivered to the futures of the runs
+        with self._lock:
+            self._worker = None
+
+
+def _settle(
+    future: "concurrent.futures.Future[typing.Any]",
+    *,
+    result: typing.Any = None,
+    exception: typing.Optional[BaseException] = None,
+) -> None:
+    """Completes *future* unless it was cancelled meanwhile."""
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except concurrent.futures.InvalidStateError:
+        pass
+
+
+class AsyncRunTracker(_Sweeper):
+    """
+    The asyncio counterpart of RunTracker, for the resources of `AsyncExtend`: sweeps run on a task of the
+    event loop the runs were tracked on, and `track()` returns an `asyncio.Future`.
+
+    Takes the same arguments as RunTracker.
+    """
+
+    def __init__(
+        self,
+        runs: typing.Any,
+        *,
+        batch_id: typing.Optional[str] = None,
+        filters: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+        interval_ms: typing.Optional[int] = 2_000,
+        max_page_size: int = 100,
+        listing_lag_ms: int = DEFAULT_LISTING_LAG_MS,
+        fetch_full: bool = True,
+        max_sweep_failures: int = DEFAULT_MAX_SWEEP_FAILURES,
+    ) -> None:
+        super().__init__(
+            runs,
+            batch_id=batch_id,
+            filters=filters,
+            interval_ms=interval_ms,
+            max_page_size=max_page_size,
+            listing_lag_ms=listing_lag_ms,
+            fetch_full=fetch_full,
+            max_sweep_failures=max_sweep_failures,
+        )
+        self._futures: typing.Dict[str, "asyncio.Future[typing.Any]"] = {}
+        self._closed = False
+        self._worker: typing.Optional["asyncio.Task[None]"] = None
+
+    def track(self, run: typing.Any) -> "asyncio.Future[typing.Any]":
+        """Starts following a run, given as an id or a run object; tracking a run twice returns the same future."""
+        if self._closed:
+            raise RuntimeError("AsyncRunTracker is closed")
+        run_id, since = _run_id_and_since(run)
+        future = self._futures.get(run_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[run_id] = future
+            self._since[run_id] = since
+        if self._worker is None and self._interval is not None:
+            self._worker = asyncio.ensure_future(self._work(self._interval))
+        return future
+
+    async def as_completed(
+        self, runs: typing.Iterable[typing.Any], timeout: typing.Optional[float] = None
+    ) -> typing.AsyncIterator["asyncio.Future[typing.Any]"]:
+        """
+        Tracks *runs* and yields their futures as they complete; raises `asyncio.TimeoutError` if they
+        have not all completed within *timeout* seconds.
+        """
+        remaining = {self.track(run) for run in runs}
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while remaining:
+            wait = None if deadline is None else max(deadline - loop.time(), 0)
+            done, remaining = await asyncio.wait(remaining, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                raise asyncio.TimeoutError(f"{len(remaining)} runs did not complete within {timeout}s")
+            for future in done:
+                yield future
+
+    @property
+    def pending(self) -> int:
+        """The number of runs being followed."""
+        return sum(not future.done() for future in self._futures.values())
+
+    async def poll(self) -> int:
+        """
+        Runs one sweep now and returns the number of runs it resolved; raises the error of a failed sweep,
+        whether or not it failed the runs.
+        """
+        pending = {run_id: self._since[run_id] for run_id, future in self._futures.items() if not future.done()}
+        if not pending:
+            return 0
+        cutoff = self._cutoff(pending)
+        finished: typing.List[typing.Any] = []
+        seen_at: typing.Optional[float] = None
+        next_page_token: typing.Optional[str] = None
+        try:
+            while True:
+                page = await self._runs.list(**self._list_kwargs(next_page_token))
+                if next_page_token is None:
+                    seen_at = self._seen_at(page)
+                next_page_token = self._scan(page, pending, finished, cutoff)
+                if next_page_token is None:
+                    break
+        except Exception as exc:
+            if self._sweep_failed(exc):
+                self._fail([*pending, *(summary.id for summary in finished)], exc)
+            raise
+        self._sweep_failures = 0
+        for run_id in pending:
+            if run_id in self._since and seen_at is not None:
+                self._since[run_id] = seen_at
+        await asyncio.gather(*(self._resolve(summary) for summary in finished))
+        return len(finished)
+
+    async def aclose(self) -> None:
+        """Stops sweeping and cancels the futures of runs that have not completed."""
+        self._closed = True
+        worker, self._worker = self._worker, None
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._since.clear()
+        if worker is not None and worker is not asyncio.current_task():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self) -> "AsyncRunTracker":
+        return self
+
+    async def __aexit__(self, *exc_info: typing.Any) -> None:
+        await self.aclose()
+
+    async def _resolve(self, summary: typing.Any) -> None:
+        future = self._futures.pop(summary.id, None)
+        self._since.pop(summary.id, None)
+        if future is None or future.done():
+            return
+        try:
+            run = await self._runs.retrieve(summary.id, request_options=MODEL_RESPONSE) if self._fetch_full else summary
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            if not future.done():
+                future.set_result(run)
+
+    def _fail(self, run_ids: typing.List[str], exc: BaseException) -> None:
+        for run_id in run_ids:
+            future = self._futures.pop(run_id, None)
+            self._since.pop(run_id, None)
+            if future is not None and not future.done():
+                future.set_exception(exc)
+
+    async def _work(self, interval: float) -> None:
+        try:
+            while not self._closed:
+                await asyncio.sleep(interval)
+                if not any(not future.done() for future in self._futures.values()):
+                    self._futures.clear()
+                    return
+                try:
+                    await self.poll()
+                except Exception:
+                    pass  # retried by the next sweep, or already delivered to the futures of the runs
+        finally:
+            if self._worker is asyncio.current_task():
+                self._worker = None
@@ -0,0 +1,274 @@
+"""
+Spatial index over parse output blocks and OCR words.
+
+Answering "which blocks or words intersect this rectangle on page N" from a
+ParseRunOutput means scanning every chunk's blocks, or every OCR word, on
+every query. SpatialIndex buckets the bounding boxes of each page into a
+uniform grid (about one cell per entry, at most 64 x 64), so a query only
+looks at the cells it overlaps:
+
+    blocks = SpatialIndex.of_blocks(run.output)
+    blocks.query(3, (0.1, 0.2, 0.5, 0.3))     # blocks intersecting a rectangle on page 3
+    blocks.containing(3, 0.25, 0.22)          # blocks whose polygon contains a point
+    words = SpatialIndex.of_words(run.output.ocr)
+    words.nearest(3, 0.25, 0.22)              # the word closest to a point
+
+Coordinates are in whatever units the output uses; entries without a page
+number or with an incomplete bounding box are not indexed.
+"""
+
+import math
+import typing
+
+from ..types.block import Block
+from ..types.bounding_box import BoundingBox
+from ..types.parse_run_output import ParseRunOutput
+from ..types.parse_run_output_ocr import ParseRunOutputOcr
+from ..types.parse_run_output_ocr_words_item import ParseRunOutputOcrWordsItem
+
+T = typing.TypeVar("T")
+
+Box = typing.Tuple[float, float, float, float]
+"""A rectangle as (left, top, right, bottom)."""
+
+Point = typing.Tuple[float, float]
+Entry = typing.Tuple[float, Box, typing.Optional[typing.Sequence[Point]], T]
+"""An entry to index: (page number, bounding box, polygon or None, item)."""
+
+BlockLike = typing.Union[Block, typing.Mapping[str, typing.Any]]
+WordLike = typing.Union[ParseRunOutputOcrWordsItem, typing.Mapping[str, typing.Any]]
+
+_MAX_GRID_SIZE = 64
+
+
+def _box(value: typing.Union[Box, BoundingBox, typing.Mapping[str, typing.Any], None]) -> typing.Optional[Box]:
+    """A bounding box (model, JSON or tuple) as a tuple, or None if any edge is missing."""
+    if value is None:
+        return None
+    if isinstance(value, BoundingBox):
+        left, top, right, bottom = value.left, value.top, value.right, value.bottom
+    elif isinstance(value, typing.Mapping):
+        left, top, right, bottom = value.get("left"), value.get("top"), value.get("right"), value.get("bottom")
+    else:
+        left, top, right, bottom = value
+    if left is None or top is None or right is None or bottom is None:
+        return None
+    if left > right:
+        left, right = right, left
+    if top > bottom:
+        top, bottom = bottom, top
+    return (left, top, right, bottom)
+
+
+def _distance(box: Box, x: float, y: float) -> float:
+    left, top, right, bottom = box
+    return math.hypot(max(left - x, 0.0, x - right), max(top - y, 0.0, y - bottom))
+
+
+def _in_polygon(polygon: typing.Sequence[Point], x: float, y: float) -> bool:
+    inside = False
+    previous_x, previous_y = polygon[-1]
+    for point_x, point_y in polygon:
+        if (point_y > y) != (previous_y > y):
+            if x < (previous_x - point_x) * (y - point_y) / (previous_y - point_y) + point_x:
+                inside = not inside
+        previous_x, previous_y = point_x, point_y
+    return inside
+
+
+class _PageGrid:
+    """A uniform grid over one page's boxes; each cell lists the entries whose box overlaps it."""
+
+    __slots__ = ("left", "top", "cell_width", "cell_height", "size", "cells")
+
+    def __init__(self, entries: typing.Sequence[typing.Tuple[int, Box]]) -> None:
+        lefts, tops, rights, bottoms = zip(*(box for _, box in entries))
+        self.left = grid_left = min(lefts)
+        self.top = grid_top = min(tops)
+        self.size = size = max(1, min(_MAX_GRID_SIZE, math.isqrt(len(entries))))
+        self.cell_width = cell_width = (max(rights) - grid_left) / size or 1.0
+        self.cell_height = cell_height = (max(bottoms) - grid_top) / size or 1.0
+        self.cells: typing.List[typing.List[int]] = [[] for _ in range(size * size)]
+        cells, last = self.cells, size - 1
+        for entry_id, (left, top, right, bottom) in entries:
+            first_column = min(last, int((left - grid_left) / cell_width))
+            last_column = min(last, int((right - grid_left) / cell_width))
+            first_row = min(last, int((top - grid_top) / cell_height))
+            last_row = min(last, int((bottom - grid_top) / cell_height))
+            if first_column == last_column and first_row == last_row:
+                cells[first_row * size + first_column].append(entry_id)
+                continue
+            for row in range(first_row, last_row + 1):
+                for cell in range(row * size + first_column, row * size + last_column + 1):
+                    cells[cell].append(entry_id)
+
+    def _column(self, x: float) -> int:
+        return min(self.size - 1, max(0, int((x - self.left) / self.cell_width)))
+
+    def _row(self, y: float) -> int:
+        return min(self.size - 1, max(0, int((y - self.top) / self.cell_height)))
+
+    def _span(self, box: Box) -> typing.Tuple[int, int, int, int]:
+        return self._column(box[0]), self._column(box[2]), self._row(box[1]), self._row(box[3])
+
+    def candidates(self, box: Box) -> typing.Set[int]:
+        first_column, last_column, first_row, last_row = self._span(box)
+        size, cells = self.size, self.cells
+        found: typing.Set[int] = set()
+        for row in range(first_row, last_row + 1):
+            for cell in range(row * size + first_column, row * size + last_column + 1):
+                found.update(cells[cell])
+        return found
+
+    def ring(self, x: float, y: float, radius: int) -> typing.Iterator[int]:
+        """The entries in the cells at Chebyshev distance *radius* from the cell nearest (x, y)."""
+        column, row, size, cells = self._column(x), self._row(y), self.size, self.cells
+        for cell_row in range(max(0, row - radius), min(size - 1, row + radius) + 1):
+            edge_row = abs(cell_row - row) == radius
+            step = 1 if edge_row else 2 * radius
+            for cell_column in range(column - radius, column + radius + 1, step):
+                if 0 <= cell_column < size:
+                    yield from cells[cell_row * size + cell_column]
+
+
+class SpatialIndex(typing.Generic[T]):
+    """
+    A per-page grid index over bounding boxes, for rectangle, point and nearest-neighbour queries.
+
+    Build one with `SpatialIndex.of_blocks(...)` or `SpatialIndex.of_words(...)`, or from
+    `(page, (left, top, right, bottom), polygon or None, item)` entries. Queries return the items in the
+    order they were indexed.
+    """
+
+    def __init__(self, entries: typing.Iterable[Entry[T]]) -> None:
+        self._items: typing.List[T] = []
+        self._boxes: typing.List[Box] = []
+        self._polygons: typing.List[typing.Optional[typing.Sequence[Point]]] = []
+        pages: typing.Dict[float, typing.List[typing.Tuple[int, Box]]] = {}
+        for page, box, polygon, item in entries:
+            pages.setdefault(page, []).append((len(self._items), box))
+            self._items.append(item)
+            self._boxes.append(box)
+            self._polygons.append(polygon if polygon is not None and len(polygon) >= 3 else None)
+        self._grids = {page: _PageGrid(page_entries) for page, page_entries in pages.items()}
+
+    @classmethod
+    def of_blocks(
+        cls,
+        blocks: typing.Union[ParseRunOutput, typing.Mapping[str, typing.Any], typing.Iterable[BlockLike]],
+        *,
+        children: bool = True,
+    ) -> "SpatialIndex[typing.Any]":
+        """
+        Index blocks, as models or decoded JSON, by bounding box and polygon. A ParseRunOutput (or its
+        JSON) indexes the blocks of every chunk; child blocks are indexed too unless `children=False`.
+        """
+        if isinstance(blocks, ParseRunOutput):
+            blocks = [block for chunk in blocks.chunks for block in chunk.blocks]
+        elif isinstance(blocks, typing.Mapping):
+            blocks = [block for chunk in blocks.get("chunks") or () for block in chunk.get("blocks") or ()]
+        return cls(_block_entries(blocks, children))
+
+    @classmethod
+    def of_words(
+        cls, words: typing.Union[ParseRunOutputOcr, typing.Mapping[str, typing.Any], typing.Iterable[WordLike], None]
+    ) -> "SpatialIndex[typing.Any]":
+        """Index OCR words, as models or decoded JSON, by bounding box. Accepts a ParseRunOutputOcr (or its JSON)."""
+        if isinstance(words, ParseRunOutputOcr):
+            words = words.words or ()
+        elif isinstance(words, typing.Mapping):
+            words = words.get("words") or ()
+        return cls(_word_entries(words or ()))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def pages(self) -> typing.List[float]:
+        """The page numbers that have entries, in ascending order."""
+        return sorted(self._grids)
+
+    def query(
+        self, page: float, bbox: typing.Union[Box, BoundingBox, typing.Mapping[str, typing.Any]]
+    ) -> typing.List[T]:
+        """The items on *page* whose bounding box intersects *bbox* (edges touching count)."""
+        grid, box = self._grids.get(page), _box(bbox)
+        if grid is None or box is None:
+            return []
+        left, top, right, bottom = box
+        boxes = self._boxes
+        found = sorted(
+            entry_id
+            for entry_id in grid.candidates(box)
+            if boxes[entry_id][0] <= right
+            and boxes[entry_id][2] >= left
+            and boxes[entry_id][1] <= bottom
+            and boxes[entry_id][3] >= top
+        )
+        return [self._items[entry_id] for entry_id in found]
+
+    def containing(self, page: float, x: float, y: float) -> typing.List[T]:
+        """The items on *page* whose polygon (bounding box, if it has no polygon) contains the point (x, y)."""
+        grid = self._grids.get(page)
+        if grid is None:
+            return []
+        found = []
+        for entry_id in sorted(grid.candidates((x, y, x, y))):
+            left, top, right, bottom = self._boxes[entry_id]
+            if not (left <= x <= right and top <= y <= bottom):
+                continue
+            polygon = self._polygons[entry_id]
+            if polygon is None or _in_polygon(polygon, x, y):
+                found.append(self._items[entry_id])
+        return found
+
+    def nearest(self, page: float, x: float, y: float) -> typing.Optional[T]:
+        """
+        The item on *page* whose bounding box is closest to the point (x, y) (distance 0 inside it), the
+        first indexed one on ties, or None if the page has no entries.
+        """
+        grid = self._grids.get(page)
+        if grid is None:
+            return None
+        best_distance, best_id = math.inf, -1
+        cell_extent = min(grid.cell_width, grid.cell_height)
+        for radius in range(grid.size):
+            # Entries not seen yet lie wholly in cells `radius` or more rings out, at least
+            # `radius - 1` whole cells away from the point.
+            if best_distance < (radius - 1) * cell_extent:
+                break
+            for entry_id in grid.ring(x, y, radius):
+                distance = _distance(self._boxes[entry_id], x, y)
+                if distance < best_distance or (distance == best_distance and entry_id < best_id):
+                    best_distance, best_id = distance, entry_id
+        return self._items[best_id] if best_id >= 0 else None
+
+
+def _block_entries(blocks: typing.Iterable[BlockLike], children: bool) -> typing.Iterator[Entry[typing.Any]]:
+    for block in blocks:
+        if isinstance(block, Block):
+            page = block.metadata.page
+            box = _box(block.bounding_box)
+            if page is not None and box is not None:
+                yield page.number, box, [(point.x, point.y) for point in block.polygon], block
+            nested: typing.Iterable[BlockLike] = block.children or ()
+        else:
+            page_json = (block.get("metadata") or {}).get("page") or {}
+            box = _box(block.get("boundingBox"))
+            if page_json.get("number") is not None and box is not None:
+                polygon = [(point["x"], point["y"]) for point in block.get("polygon") or ()]
+                yield page_json["number"], box, polygon, block
+            nested = block.get("children") or ()
+        if children:
+            yield from _block_entries(nested, children)
+
+
+def _word_entries(words: typing.Iterable[WordLike]) -> typing.Iterator[Entry[typing.Any]]:
+    for word in words:
+        page: typing.Optional[float]
+        if isinstance(word, ParseRunOutputOcrWordsItem):
+            page, box = word.page_number, _box(word.bounding_box)
+        else:
+            page, box = word.get("pageNumber"), _box(word.get("boundingBox"))
+        if page is not None and box is not None:
+            yield page, box, None, word
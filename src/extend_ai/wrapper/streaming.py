@@ -0,0 +1,385 @@
+"""
+Streaming retrieval of parse run outputs.
+
+`parse_runs.retrieve` reads the whole response, decodes it and builds the
+ParseRun, so for a 1,000-page document the body, the decoded JSON and the
+model tree are all in memory at once. `parse_runs.stream_output` instead
+reads the response with `HttpClient.stream` and scans it as it arrives,
+yielding each Chunk (and, optionally, each OCR word) as soon as its JSON is
+complete. Memory stays bounded by the largest single chunk, whatever the size
+of the document.
+
+Example:
+    from extend_ai import Extend
+
+    client = Extend(token="...")
+
+    for chunk in client.parse_runs.stream_output("pr_xxx"):
+        index.add(chunk.content)
+"""
+
+import codecs
+import json
+import re
+import typing
+
+import httpx
+from ..core.api_error import ApiError
+from ..core.request_options import RequestOptions
+from ..core.unchecked_base_model import construct_type
+from ..errors.bad_request_error import BadRequestError
+from ..errors.forbidden_error import ForbiddenError
+from ..errors.internal_server_error import InternalServerError
+from ..errors.not_found_error import NotFoundError
+from ..errors.payment_required_error import PaymentRequiredError
+from ..errors.too_many_requests_error import TooManyRequestsError
+from ..errors.unauthorized_error import UnauthorizedError
+from ..errors.unprocessable_entity_error import UnprocessableEntityError
+from ..types.api_error import ApiError as types_api_error_ApiError
+from ..types.chunk import Chunk
+from ..types.parse_run_output_ocr_words_item import ParseRunOutputOcrWordsItem
+from .errors import ParseRunOutputUnavailableError
+
+__all__ = ["JsonStreamScanner", "ParseOutputItem"]
+
+JsonPath = typing.Tuple[str, ...]
+ParseOutputItem = typing.Union[Chunk, ParseRunOutputOcrWordsItem]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_KEY = re.compile(r'"((?:[^"\\]|\\.)*)"')
+# A string (group 1 is the closing quote, missing if the string runs past the end of the buffer) or a bracket.
+_SKIP_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*(?:(")|\\?\Z)|[\[\]{}]')
+_SCALAR_END = re.compile(r"[,\]}\s]")
+# A decoded number followed by one of these was cut short: "-25" or "-25." may continue as "-25.0".
+_NUMBER_CHARS = frozenset("-+.eE0123456789")
+_DECODER = json.JSONDecoder()
+
+_KEY_OR_END, _COLON, _VALUE, _VALUE_OR_END, _COMMA_OR_END = range(5)
+
+
+class _Frame:
+    __slots__ = ("is_object", "path", "items", "expect", "key")
+
+    def __init__(self, is_object: bool, path: JsonPath, items: bool) -> None:
+        self.is_object = is_object
+        self.path = path
+        # Each element of this array is a target.
+        self.items = items
+        self.expect = _KEY_OR_END if is_object else _VALUE_OR_END
+        self.key = ""
+
+
+class JsonStreamScanner:
+    """
+    Picks values out of a JSON document as its bytes arrive.
+
+    *targets* maps paths of object keys to "items", to get each element of the
+    array at that path, or "value", to get the value there. Only targets are
+    decoded: other values are skipped over without building them, and an
+    array of items is decoded one element at a time, so memory is bounded by
+    the largest target rather than the document.
+
+    `feed()` returns the (path, value) pairs completed by the bytes given, in
+    document order, and `close()` checks the document was complete. `done` is
+    set once the innermost object containing every target has ended, after
+    which the rest of the document can be left unread.
+
+    Example:
+        scanner = JsonStreamScanner({("output", "chunks"): "items"})
+        for data in response.iter_bytes():
+            for path, chunk in scanner.feed(data):
+                ...
+        scanner.close()
+    """
+
+    def __init__(self, targets: typing.Mapping[JsonPath, typing.Literal["items", "value"]]) -> None:
+        self._targets = dict(targets)
+        self._prefixes = {path[:end] for path in targets for end in range(len(path))}
+        paths = list(targets)
+        stop = paths[0][:-1] if paths else ()
+        for path in paths[1:]:
+            while path[: len(stop)] != stop:
+                stop = stop[:-1]
+        self._stop = stop
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._stack: typing.List[_Frame] = []
+        self._started = False
+        self._skip_depth: typing.Optional[int] = None
+        self._retry_at = 0
+        self._events: typing.List[typing.Tuple[JsonPath, typing.Any]] = []
+        self.found: typing.Set[JsonPath] = set()
+        self.done = False
+
+    def feed(self, data: bytes) -> typing.List[typing.Tuple[JsonPath, typing.Any]]:
+        if self.done:
+            return []
+        self._buf = self._buf[self._pos :] + self._text.decode(data)
+        self._pos = 0
+        return self._scan()
+
+    def close(self) -> typing.List[typing.Tuple[JsonPath, typing.Any]]:
+        if self.done:
+            return []
+        self._buf = self._buf[self._pos :] + self._text.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        events = self._scan()
+        if not self.done:
+            raise json.JSONDecodeError("Unexpected end of JSON document", self._buf, len(self._buf))
+        return events
+
+    def _scan(self) -> typing.List[typing.Tuple[JsonPath, typing.Any]]:
+        while not self.done and self._step():
+            pass
+        events, self._events = self._events, []
+        return events
+
+    def _step(self) -> bool:
+        """Consume one token or value. False when more input is needed."""
+        buf = self._buf
+        if self._skip_depth is not None:
+            return self._skip_container()
+        pos = self._pos = _WHITESPACE.match(buf, self._pos).end()  # type: ignore[union-attr]
+        if pos == len(buf):
+            return False
+
+        if not self._stack:
+            if self._started:
+                raise json.JSONDecodeError("Extra data", buf, pos)
+            self._started = True
+            return self._value((), items=False)
+
+        frame = self._stack[-1]
+        char = buf[pos]
+        expect = frame.expect
+        if expect in (_KEY_OR_END, _VALUE_OR_END, _COMMA_OR_END) and char == ("}" if frame.is_object else "]"):
+            self._pos = pos + 1
+            self._stack.pop()
+            if frame.path == self._stop:
+                self.done = True
+            self._value_done()
+            return True
+        if expect == _COMMA_OR_END:
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+            self._pos = pos + 1
+            frame.expect = _KEY_OR_END if frame.is_object else _VALUE
+            return True
+        if expect == _KEY_OR_END:
+            match = _KEY.match(buf, pos)
+            if match is None:
+                if char != '"':
+                    raise json.JSONDecodeError("Expecting property name enclosed in double quotes", buf, pos)
+                return self._need_more(pos)
+            key = match.group(1)
+            frame.key = json.loads(match.group()) if "\\" in key else key
+            frame.expect = _COLON
+            self._pos = match.end()
+            return True
+        if expect == _COLON:
+            if char != ":":
+                raise json.JSONDecodeError("Expecting ':' delimiter", buf, pos)
+            self._pos = pos + 1
+            frame.expect = _VALUE
+            return True
+        if frame.is_object:
+            return self._value(frame.path + (frame.key,), items=False)
+        return self._value(frame.path, items=frame.items)
+
+    def _value(self, path: JsonPath, *, items: bool) -> bool:
+        buf, pos = self._buf, self._pos
+        char = buf[pos]
+        target = self._targets.get(path)
+        if items or target == "value":
+            return self._decode(path)
+        if target == "items" and char == "[":
+            self.found.add(path)
+            self._stack.append(_Frame(False, path, items=True))
+            self._pos = pos + 1
+            return True
+        if path in self._prefixes and char == "{":
+            self._stack.append(_Frame(True, path, items=False))
+            self._pos = pos + 1
+            return True
+        return self._skip()
+
+    def _value_done(self) -> None:
+        if self._stack:
+            self._stack[-1].expect = _COMMA_OR_END
+        else:
+            self.done = True
+
+    def _need_more(self, pos: int) -> bool:
+        if self._eof:
+            raise json.JSONDecodeError("Unexpected end of JSON document", self._buf, pos)
+        return False
+
+    def _decode(self, path: JsonPath) -> bool:
+        buf, pos = self._buf, self._pos
+        available = len(buf) - pos
+        # Retrying only once the buffered text has doubled keeps a value that spans many
+        # reads from being decoded over and over.
+        if available < self._retry_at and not self._eof:
+            return False
+        try:
+            value, end = _DECODER.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            self._need_more(pos)
+            self._retry_at = available * 2
+            return False
+        if not self._eof and buf[pos] in _NUMBER_CHARS and (end == len(buf) or buf[end] in _NUMBER_CHARS):
+            # A number may continue in the next read; accept it only once a delimiter follows.
+            self._retry_at = available + 1
+            return False
+        self._retry_at = 0
+        self._pos = end
+        self.found.add(path)
+        self._events.append((path, value))
+        self._value_done()
+        return True
+
+    def _skip(self) -> bool:
+        buf, pos = self._buf, self._pos
+        char = buf[pos]
+        if char in "[{":
+            self._skip_depth = 0
+            return self._skip_container()
+        if char == '"':
+            match = _SKIP_TOKEN.match(buf, pos)
+            if match is None or match.group(1) is None:
+                return self._need_more(pos)
+            self._pos = match.end()
+        else:
+            match = _SCALAR_END.search(buf, pos)
+            if match is None:
+                if not self._eof:
+                    return False
+                self._pos = len(buf)
+            else:
+                self._pos = match.start()
+        self._value_done()
+        return True
+
+    def _skip_container(self) -> bool:
+        depth = typing.cast(int, self._skip_depth)
+        for match in _SKIP_TOKEN.finditer(self._buf, self._pos):
+            token = match.group()
+            if token[0] == '"':
+                if match.group(1) is None:
+                    self._skip_depth = depth
+                    return self._need_more(match.start())
+            elif token in "[{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    self._pos = match.end()
+                    self._skip_depth = None
+                    self._value_done()
+                    return True
+            self._pos = match.end()
+        self._skip_depth = depth
+        self._pos = len(self._buf)
+        return self._need_more(self._pos)
+
+
+_OUTPUT_URL: JsonPath = ("outputUrl",)
+_STATUS: JsonPath = ("status",)
+
+
+class ParseOutputScanner:
+    """Turns a parse run (or its output document) into Chunks and, optionally, OCR words."""
+
+    def __init__(self, prefix: JsonPath, *, ocr_words: bool) -> None:
+        self.chunks_path = prefix + ("chunks",)
+        self.words_path = prefix + ("ocr", "words")
+        targets: typing.Dict[JsonPath, typing.Literal["items", "value"]] = {self.chunks_path: "items"}
+        if ocr_words:
+            targets[self.words_path] = "items"
+        if prefix:
+            # Reading a parse run: these say why there is no inline output, if there isn't.
+            targets[_OUTPUT_URL] = "value"
+            targets[_STATUS] = "value"
+        self.scanner = JsonStreamScanner(targets)
+        self.run: typing.Dict[JsonPath, typing.Any] = {}
+
+    def feed(self, data: bytes) -> typing.List[ParseOutputItem]:
+        return self._items(self.scanner.feed(data))
+
+    def close(self) -> typing.List[ParseOutputItem]:
+        return self._items(self.scanner.close())
+
+    @property
+    def done(self) -> bool:
+        return self.scanner.done
+
+    @property
+    def found_output(self) -> bool:
+        return self.chunks_path in self.scanner.found
+
+    def _items(self, events: typing.List[typing.Tuple[JsonPath, typing.Any]]) -> typing.List[ParseOutputItem]:
+        items: typing.List[ParseOutputItem] = []
+        for path, value in events:
+            if path == self.chunks_path:
+                items.append(typing.cast(Chunk, construct_type(type_=Chunk, object_=value)))
+            elif path == self.words_path:
+                items.append(
+                    typing.cast(
+                        ParseRunOutputOcrWordsItem, construct_type(type_=ParseRunOutputOcrWordsItem, object_=value)
+                    )
+                )
+            else:
+                self.run[path] = value
+        return items
+
+    def output_url(self, run_id: str) -> str:
+        """The URL to download the output from when the run had none inline; raises if it has neither."""
+        output_url = self.run.get(_OUTPUT_URL)
+        if output_url is None:
+            raise ParseRunOutputUnavailableError(run_id, self.run.get(_STATUS))
+        return typing.cast(str, output_url)
+
+
+# Per status, the error `parse_runs.retrieve` raises and the type it constructs the body as.
+_ERRORS: typing.Dict[int, typing.Tuple[typing.Callable[..., ApiError], typing.Any]] = {
+    400: (BadRequestError, typing.Any),
+    401: (UnauthorizedError, typing.Any),
+    402: (PaymentRequiredError, types_api_error_ApiError),
+    403: (ForbiddenError, types_api_error_ApiError),
+    404: (NotFoundError, typing.Any),
+    422: (UnprocessableEntityError, types_api_error_ApiError),
+    429: (TooManyRequestsError, typing.Any),
+    500: (InternalServerError, typing.Any),
+}
+
+
+def raise_for_error_response(response: httpx.Response, *, typed: bool) -> None:
+    """Raise for a read, unsuccessful response as the generated `retrieve` does."""
+    if 200 <= response.status_code < 300:
+        return
+    headers = dict(response.headers)
+    try:
+        body = json.loads(response.content)
+    except ValueError:
+        raise ApiError(status_code=response.status_code, headers=headers, body=response.text)
+    error = _ERRORS.get(response.status_code) if typed else None
+    if error is not None:
+        error_type, body_type = error
+        raise error_type(headers=headers, body=construct_type(type_=body_type, object_=body))
+    raise ApiError(status_code=response.status_code, headers=headers, body=body)
+
+
+# Request options that still apply to a download from a presigned URL; headers and
+# query parameters meant for the API would be sent to the storage host, or break the signature.
+_DOWNLOAD_OPTIONS = ("timeout_in_seconds", "max_retries", "retry_policy")
+
+
+def download_options(request_options: typing.Optional[RequestOptions]) -> typing.Optional[RequestOptions]:
+    """The timeout and retry settings of `request_options`, for downloading an `outputUrl`."""
+    if request_options is None:
+        return None
+    options = {key: value for key, value in request_options.items() if key in _DOWNLOAD_OPTIONS}
+    return typing.cast(RequestOptions, options)
@@ -0,0 +1,190 @@
+"""
+Connection warm-up for Extend and AsyncExtend.
+
+A cold client pays for DNS, TCP and TLS on its first request. `warmup()` opens
+connections ahead of time by sending concurrent authenticated HEAD requests to
+the client's base URL; the connections stay in the pool for later requests.
+
+This file is protected by .fernignore and will not be overwritten during regeneration.
+
+Example:
+    client = Extend(token="...")
+    report = client.warmup(connections=8)
+    print(report.connect_p50, report.tls_p50)
+"""
+
+import asyncio
+import statistics
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import httpx
+from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+
+# Most connections one warm-up opens. Each needs its own request in flight (a thread for the sync client),
+# since requests sent after one finishes reuse its connection.
+MAX_WARMUP_CONNECTIONS = 32
+
+
+@dataclass(frozen=True)
+class ConnectionTiming:
+    """
+    Timings for one warm-up request, in seconds.
+
+    Attributes:
+        connect: DNS resolution plus TCP connect, or None if a pooled connection was reused.
+        tls: TLS handshake, or None if no handshake happened.
+        first_byte: From sending the request to receiving the response headers.
+        total: Wall time of the whole request.
+        status_code: Response status. Any status means the connection is open.
+        error: Description of the error if the request failed.
+    """
+
+    connect: typing.Optional[float]
+    tls: typing.Optional[float]
+    first_byte: typing.Optional[float]
+    total: float
+    status_code: typing.Optional[int] = None
+    error: typing.Optional[str] = None
+
+    @property
+    def reused(self) -> bool:
+        return self.error is None and self.connect is None
+
+
+@dataclass(frozen=True)
+class WarmupReport:
+    """
+    Result of `Extend.warmup()` / `AsyncExtend.warmup()`.
+
+    Attributes:
+        url: The URL that was warmed up.
+        elapsed: Wall time of the whole warm-up, in seconds.
+        connections: One entry per warm-up request.
+    """
+
+    url: str
+    elapsed: float
+    connections: typing.List[ConnectionTiming] = field(default_factory=list)
+
+    @property
+    def opened(self) -> int:
+        """
+        Number of new connections that were opened: one per request that succeeded without reusing a
+        pooled connection, so fewer than `len(connections)` when the pool already had some open.
+        """
+        return sum(1 for timing in self.connections if timing.error is None and timing.connect is not None)
+
+    @property
+    def errors(self) -> typing.List[str]:
+        return [timing.error for timing in self.connections if timing.error is not None]
+
+    @property
+    def connect_p50(self) -> typing.Optional[float]:
+        return _median([timing.connect for timing in self.connections])
+
+    @property
+    def tls_p50(self) -> typing.Optional[float]:
+        return _median([timing.tls for timing in self.connections])
+
+
+def _median(values: typing.List[typing.Optional[float]]) -> typing.Optional[float]:
+    present = [value for value in values if value is not None]
+    return statistics.median(present) if present else None
+
+
+class _Trace:
+    """Collects httpcore trace events (`connection.connect_tcp.started`, ...) with monotonic timestamps."""
+
+    def __init__(self) -> None:
+        self.events: typing.Dict[str, float] = {}
+
+    def __call__(self, event_name: str, info: typing.Dict[str, typing.Any]) -> None:
+        self.events.setdefault(event_name, time.monotonic())
+
+    async def async_call(self, event_name: str, info: typing.Dict[str, typing.Any]) -> None:
+        self(event_name, info)
+
+    def _span(self, prefix: str) -> typing.Optional[float]:
+        started = self.events.get(f"{prefix}.started")
+        completed = self.events.get(f"{prefix}.complete")
+        if started is None or completed is None:
+            return None
+        return completed - started
+
+    def _first_byte(self) -> typing.Optional[float]:
+        for protocol in ("http11", "http2"):
+            started = self.events.get(f"{protocol}.send_request_headers.started")
+            completed = self.events.get(f"{protocol}.receive_response_headers.complete")
+            if started is not None and completed is not None:
+                return completed - started
+        return None
+
+    def timing(
+        self,
+        *,
+        started: float,
+        response: typing.Optional[httpx.Response] = None,
+        error: typing.Optional[BaseException] = None,
+    ) -> ConnectionTiming:
+        return ConnectionTiming(
+            connect=self._span("connection.connect_tcp"),
+            tls=self._span("connection.start_tls"),
+            first_byte=self._first_byte(),
+            total=time.monotonic() - started,
+            status_code=response.status_code if response is not None else None,
+            error=f"{type(error).__name__}: {error}" if error is not None else None,
+        )
+
+
+def _validate(connections: int) -> None:
+    if connections < 1:
+        raise ValueError("connections must be at least 1")
+    if connections > MAX_WARMUP_CONNECTIONS:
+        raise ValueError(f"connections must be at most {MAX_WARMUP_CONNECTIONS}")
+
+
+def warmup(client_wrapper: SyncClientWrapper, connections: int, timeout: float) -> WarmupReport:
+    """Open `connections` pooled connections to the client's base URL. See `Extend.warmup`."""
+    _validate(connections)
+    url = client_wrapper.get_base_url()
+    httpx_client = client_wrapper.httpx_client.httpx_client
+    headers = client_wrapper.get_headers()
+
+    def one() -> ConnectionTiming:
+        trace, started = _Trace(), time.monotonic()
+        try:
+            response = httpx_client.request("HEAD", url, headers=headers, timeout=timeout, extensions={"trace": trace})
+        except httpx.HTTPError as exc:
+            return trace.timing(started=started, error=exc)
+        return trace.timing(started=started, response=response)
+
+    started = time.monotonic()
+    # Requests must be in flight at the same time, or the pool hands them all the same connection.
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        timings = list(executor.map(lambda _: one(), range(connections)))
+    return WarmupReport(url=url, elapsed=time.monotonic() - started, connections=timings)
+
+
+async def warmup_async(client_wrapper: AsyncClientWrapper, connections: int, timeout: float) -> WarmupReport:
+    """Open `connections` pooled connections to the client's base URL. See `AsyncExtend.warmup`."""
+    _validate(connections)
+    url = client_wrapper.get_base_url()
+    httpx_client = client_wrapper.httpx_client.httpx_client
+    headers = await client_wrapper.async_get_headers()
+
+    async def one() -> ConnectionTiming:
+        trace, started = _Trace(), time.monotonic()
+        try:
+            response = await httpx_client.request(
+                "HEAD", url, headers=headers, timeout=timeout, extensions={"trace": trace.async_call}
+            )
+        except httpx.HTTPError as exc:
+            return trace.timing(started=started, error=exc)
+        return trace.timing(started=started, response=response)
+
+    started = time.monotonic()
+    timings = await asyncio.gather(*(one() for _ in range(connections)))
+    return WarmupReport(url=url, elapsed=time.monotonic() - started, connections=list(timings))
@@ -33,6 +33,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 import httpx
 
+from ..core.json_codec import JsonCodec
 from .errors import SignedUrlNotAllowedError, WebhookParseError, WebhookPayloadFetchError, WebhookSignatureVerificationError
 
 if TYPE_CHECKING:
@@ -111,8 +112,15 @@ class Webhooks:
         if client.webhooks.verify(body, headers, secret):
             event = client.webhooks.parse(body)
             # handle event
+
+    Args:
+        json_codec: Codec used to decode webhook bodies and signed payloads.
+            Defaults to the standard library; `Extend(json_codec=...)` passes its own.
     """
 
+    def __init__(self, json_codec: Optional[JsonCodec] = None) -> None:
+        self._json_codec = json_codec
+
     def verify_and_parse(
         self,
         body: Union[str, bytes],
@@ -177,7 +185,7 @@ class Webhooks:
 
         # Parse the event
         try:
-            event_data = json.loads(body_str)
+            event_data = self._loads(body_str)
         except json.JSONDecodeError as e:
             raise WebhookParseError(f"Failed to parse webhook body as JSON: {e}")
 
@@ -246,7 +254,7 @@ class Webhooks:
         body_str = _normalize_body(body)
 
         try:
-            event_data = json.loads(body_str)
+            event_data = self._loads(body_str)
         except json.JSONDecodeError as e:
             raise WebhookParseError(f"Failed to parse webhook body as JSON: {e}")
 
@@ -292,7 +300,7 @@ class Webhooks:
                         f"Failed to fetch signed payload: {response.status_code} {response.reason_phrase}"
                     )
 
-                full_payload = response.json()
+                full_payload = self._decode_response(response)
 
                 full_event = {
                     "eventId": event.event_id,
@@ -329,7 +337,7 @@ class Webhooks:
                         f"Failed to fetch signed payload: {response.status_code} {response.reason_phrase}"
                     )
 
-                full_payload = response.json()
+                full_payload = self._decode_response(response)
 
                 full_event = {
                     "eventId": event.event_id,
@@ -371,6 +379,12 @@ class Webhooks:
             return _is_signed_data_url_payload(event.get("payload", {}))
         return False
 
+    def _loads(self, body: str) -> Any:
+        return json.loads(body) if self._json_codec is None else self._json_codec.loads(body)
+
+    def _decode_response(self, response: httpx.Response) -> Any:
+        return response.json() if self._json_codec is None else self._json_codec.loads(response.content)
+
     def _try_parse_webhook_event(self, event_data: Dict[str, Any]) -> Any:
         """Try to parse as typed WebhookEvent, fall back to raw dict for unknown event types."""
         try:
@@ -0,0 +1,77 @@
+"""
+Fixtures shared by the custom and wrapper tests.
+
+`sync_http_client` / `async_http_client` build a core HttpClient / AsyncHttpClient,
+and `sync_extend_client` / `async_extend_client` an Extend / AsyncExtend, for
+https://api.example.com whose requests are answered by a handler, through
+httpx.MockTransport. Other keyword arguments (retry_policy=, hooks=, token=, ...)
+go to the client. `no_backoff` makes retries immediate.
+"""
+
+import typing
+
+import httpx
+import pytest
+
+from extend_ai import AsyncExtend, Extend
+from extend_ai.core import http_client as http_client_module
+from extend_ai.core.http_client import AsyncHttpClient, HttpClient
+
+Handler = typing.Callable[[httpx.Request], typing.Any]
+
+BASE_URL = "https://api.example.com"
+
+
+@pytest.fixture
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retries are sent immediately, whatever the backoff or Retry-After."""
+    monkeypatch.setattr(http_client_module, "_backoff_timeout", lambda *args, **kwargs: 0.0)
+    monkeypatch.setattr(http_client_module, "_retry_timeout", lambda *args, **kwargs: 0.0)
+
+
+@pytest.fixture
+def sync_http_client() -> typing.Callable[..., HttpClient]:
+    def make(handler: Handler, **kwargs: typing.Any) -> HttpClient:
+        return HttpClient(
+            httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+            base_timeout=lambda: None,
+            base_headers=lambda: {},
+            base_url=lambda: BASE_URL,
+            **kwargs,
+        )
+
+    return make
+
+
+@pytest.fixture
+def async_http_client() -> typing.Callable[..., AsyncHttpClient]:
+    def make(handler: Handler, **kwargs: typing.Any) -> AsyncHttpClient:
+        return AsyncHttpClient(
+            httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            base_timeout=lambda: None,
+            base_headers=lambda: {},
+            base_url=lambda: BASE_URL,
+            **kwargs,
+        )
+
+    return make
+
+
+@pytest.fixture
+def sync_extend_client() -> typing.Callable[..., Extend]:
+    def make(handler: Handler, **kwargs: typing.Any) -> Extend:
+        kwargs.setdefault("token", "secret")
+        return Extend(base_url=BASE_URL, httpx_client=httpx.Client(transport=httpx.MockTransport(handler)), **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def async_extend_client() -> typing.Callable[..., AsyncExtend]:
+    def make(handler: Handler, **kwargs: typing.Any) -> AsyncExtend:
+        kwargs.setdefault("token", "secret")
+        return AsyncExtend(
+            base_url=BASE_URL, httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), **kwargs
+        )
+
+    return make
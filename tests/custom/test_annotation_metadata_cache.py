@@ -0,0 +1,134 @@
+"""
+Tests: convert_and_respect_annotation_metadata caches alias metadata per type.
+
+Type hints and alias maps used to be recomputed for every object converted,
+and alias-free payloads were rebuilt container by container. Both are now
+computed once per type, and subtrees with no aliases are returned as is.
+"""
+
+import sys
+import types
+import typing
+
+import typing_extensions
+
+from extend_ai.core import serialization
+from extend_ai.core.serialization import (
+    FieldMetadata,
+    convert_and_respect_annotation_metadata,
+    get_field_to_alias_mapping,
+)
+from extend_ai.extract_runs.requests import ExtractRunsCreateBatchRequestInputsItemParams
+from extend_ai.requests import EditConfigParams
+
+
+class _Plain(typing_extensions.TypedDict):
+    name: str
+    tags: typing.List[str]
+
+
+class _Aliased(typing_extensions.TypedDict):
+    page_count: typing_extensions.Annotated[int, FieldMetadata(alias="pageCount")]
+    plain: typing_extensions.NotRequired[_Plain]
+
+
+class _Tree(typing_extensions.TypedDict):
+    node_id: typing_extensions.Annotated[str, FieldMetadata(alias="nodeId")]
+    children: typing_extensions.NotRequired[typing.List["_Tree"]]
+
+
+class TestAliasFreeSubtrees:
+    def test_alias_free_payloads_are_returned_as_is(self) -> None:
+        inputs = [{"file": {"url": f"https://example.com/{index}.pdf"}} for index in range(3)]
+
+        converted = convert_and_respect_annotation_metadata(
+            object_=inputs,
+            annotation=typing.Sequence[ExtractRunsCreateBatchRequestInputsItemParams],
+            direction="write",
+        )
+
+        assert converted is inputs
+
+    def test_alias_free_fields_are_not_copied(self) -> None:
+        plain: _Plain = {"name": "doc", "tags": ["a"]}
+
+        converted = convert_and_respect_annotation_metadata(
+            object_={"page_count": 1, "plain": plain}, annotation=_Aliased, direction="write"
+        )
+
+        assert converted == {"pageCount": 1, "plain": plain}
+        assert converted["plain"] is plain
+
+    def test_unhashable_annotations_still_convert(self) -> None:
+        unhashable = typing_extensions.Annotated[_Aliased, {"examples": [1]}]
+
+        converted = convert_and_respect_annotation_metadata(
+            object_={"page_count": 1}, annotation=unhashable, direction="write"
+        )
+
+        assert converted == {"pageCount": 1}
+
+
+class TestAliasedTypes:
+    def test_nested_aliases_are_written(self) -> None:
+        converted = convert_and_respect_annotation_metadata(
+            object_={"advanced_options": {"flatten_pdf": True}, "instructions": "x"},
+            annotation=EditConfigParams,
+            direction="write",
+        )
+
+        assert converted == {"advancedOptions": {"flattenPdf": True}, "instructions": "x"}
+
+    def test_aliases_are_read_back_to_field_names(self) -> None:
+        converted = convert_and_respect_annotation_metadata(
+            object_={"pageCount": 1, "extra": 2}, annotation=_Aliased, direction="read"
+        )
+
+        assert converted == {"page_count": 1, "extra": 2}
+
+    def test_recursive_types(self) -> None:
+        tree = {"node_id": "a", "children": [{"node_id": "b", "children": [{"node_id": "c"}]}]}
+
+        converted = convert_and_respect_annotation_metadata(object_=tree, annotation=_Tree, direction="write")
+
+        assert converted == {"nodeId": "a", "children": [{"nodeId": "b", "children": [{"nodeId": "c"}]}]}
+
+
+class TestMetadataCache:
+    def test_type_hints_are_read_once_per_type(self) -> None:
+        serialization._get_mapping_fields.cache_clear()
+
+        for count in range(3):
+            convert_and_respect_annotation_metadata(
+                object_={"page_count": count}, annotation=_Aliased, direction="write"
+            )
+
+        info = serialization._get_mapping_fields.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_stubbed_annotations_are_dropped_once_defined(self) -> None:
+        module = types.ModuleType("_forward_refs")
+        sys.modules[module.__name__] = module
+        try:
+            exec(
+                "import typing_extensions\nclass Outer(typing_extensions.TypedDict):\n    inner: 'Inner'\n",
+                module.__dict__,
+            )
+            payload = {"inner": {"page_count": 1}}
+            write = {"object_": payload, "annotation": module.Outer, "direction": "write"}
+
+            # Before Inner exists its annotation is stubbed as Any and the payload passes through.
+            assert convert_and_respect_annotation_metadata(**write) == payload
+            assert convert_and_respect_annotation_metadata(**write) == payload
+
+            module.Inner = _Aliased  # type: ignore[attr-defined]
+            assert convert_and_respect_annotation_metadata(**write) == {"inner": {"pageCount": 1}}
+        finally:
+            del sys.modules[module.__name__]
+
+    def test_public_mappings_are_copies(self) -> None:
+        mapping = get_field_to_alias_mapping(_Aliased)
+        mapping["page_count"] = "changed"
+
+        assert get_field_to_alias_mapping(_Aliased) == {"page_count": "pageCount"}
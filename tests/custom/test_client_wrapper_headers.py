@@ -0,0 +1,116 @@
+"""
+Regression tests: static request headers are built once per client.
+
+`BaseClientWrapper.get_headers()` used to import and query `platform` and
+rebuild every header on each request. The static part is now cached and only
+Authorization is recomputed per request.
+"""
+
+import platform
+import typing
+
+import httpx
+import pytest
+
+from extend_ai.core import client_wrapper as client_wrapper_module
+from extend_ai.core import http_client as http_client_module
+from extend_ai.core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from extend_ai.core.http_client import _merge_headers
+
+
+def _sync_wrapper(**kwargs: typing.Any) -> SyncClientWrapper:
+    return SyncClientWrapper(base_url="https://api.example.com", httpx_client=httpx.Client(), **kwargs)
+
+
+class TestStaticHeaders:
+    def test_headers_match_previous_shape(self) -> None:
+        headers = _sync_wrapper(token="sk_test", headers={"X-Custom": "1"}).get_headers()
+
+        assert headers == {
+            "User-Agent": "extend_ai/1.17.0",
+            "X-Fern-Language": "Python",
+            "X-Fern-Runtime": f"python/{platform.python_version()}",
+            "X-Fern-Platform": f"{platform.system().lower()}/{platform.release()}",
+            "X-Fern-SDK-Name": "extend_ai",
+            "X-Fern-SDK-Version": "1.17.0",
+            "X-Custom": "1",
+            "x-extend-api-version": "2026-02-09",
+            "Authorization": "Bearer sk_test",
+        }
+
+    def test_custom_headers_cannot_override_auth_or_api_version(self) -> None:
+        headers = _sync_wrapper(
+            token="sk_test",
+            headers={"Authorization": "Bearer other", "x-extend-api-version": "old"},
+            extend_api_version="2026-02-09",
+        ).get_headers()
+
+        assert headers["Authorization"] == "Bearer sk_test"
+        assert headers["x-extend-api-version"] == "2026-02-09"
+
+    def test_platform_is_queried_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client_wrapper_module._platform_headers.cache_clear()
+        calls: typing.List[str] = []
+        real_python_version = platform.python_version
+        monkeypatch.setattr(platform, "python_version", lambda: calls.append("v") or real_python_version())
+
+        wrapper = _sync_wrapper(token="sk_test")
+        for _ in range(5):
+            wrapper.get_headers()
+        _sync_wrapper(token="sk_test").get_headers()
+
+        assert calls == ["v"]
+
+    def test_returned_headers_are_copies(self) -> None:
+        wrapper = _sync_wrapper(token="sk_test")
+        wrapper.get_headers()["X-Mutated"] = "1"
+
+        assert "X-Mutated" not in wrapper.get_headers()
+
+    def test_token_callable_is_called_per_request(self) -> None:
+        tokens = iter(["a", "b"])
+        wrapper = _sync_wrapper(token=lambda: next(tokens))
+
+        assert wrapper.get_headers()["Authorization"] == "Bearer a"
+        assert wrapper.get_headers()["Authorization"] == "Bearer b"
+
+    async def test_async_token_skips_sync_token(self) -> None:
+        def sync_token() -> str:
+            raise AssertionError("sync token should not be called when async_token is set")
+
+        async def async_token() -> str:
+            return "async"
+
+        wrapper = AsyncClientWrapper(
+            token=sync_token,
+            async_token=async_token,
+            base_url="https://api.example.com",
+            httpx_client=httpx.AsyncClient(),
+        )
+
+        headers = await wrapper.async_get_headers()
+        assert headers["Authorization"] == "Bearer async"
+        assert headers["X-Fern-SDK-Name"] == "extend_ai"
+
+
+class TestMergeHeaders:
+    def test_string_headers_skip_encoding(self) -> None:
+        base = {"A": "1"}
+        assert _merge_headers(base, {"B": "2"}, None) == {"A": "1", "B": "2"}
+
+    def test_later_sources_win_and_none_is_dropped(self) -> None:
+        assert _merge_headers({"A": "1", "B": "2"}, {"A": "3", "B": None}, {"C": 4}) == {"A": "3", "C": 4}
+
+    def test_generated_optional_header_shape_skips_encoding(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            raise AssertionError("jsonable_encoder should not run for string headers")
+
+        monkeypatch.setattr(http_client_module, "jsonable_encoder", fail)
+        base = _sync_wrapper(token="sk_test").get_headers()
+        # What the generated endpoints pass when extend_workspace_id is not given.
+        generated = {"x-extend-workspace-id": None}
+
+        merged = _merge_headers(base, generated, None)
+
+        assert merged == base
+        assert _merge_headers(base, {"x-extend-workspace-id": "ws_1"}, None)["x-extend-workspace-id"] == "ws_1"
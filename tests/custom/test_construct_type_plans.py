@@ -0,0 +1,140 @@
+"""
+Tests: construct_type compiles each annotation into a construction plan once.
+
+construct_type used to re-inspect the annotation for every value and re-read
+each model's type hints for every instance. Plans are now cached per
+(annotation, host) and per model; results are unchanged.
+"""
+
+import datetime as dt
+import typing
+
+import pydantic
+import typing_extensions
+
+from extend_ai.core import unchecked_base_model
+from extend_ai.core.unchecked_base_model import UncheckedBaseModel, construct_type
+from extend_ai.types import Block, ParseRun
+
+NOW = "2025-04-28T17:01:39.285Z"
+
+
+class _Node(UncheckedBaseModel):
+    name: str
+    tags: typing.List[str] = pydantic.Field(default_factory=list)
+    labels: typing.List[str] = []
+    created_at: typing.Optional[dt.datetime] = None
+    children: typing.Optional[typing.List["_Node"]] = None
+
+
+_Node.model_rebuild()
+
+
+class _Forward(UncheckedBaseModel):
+    later: typing.Optional["_Later"] = None
+
+
+class _Later(UncheckedBaseModel):
+    value: int
+
+
+def _block(index: int) -> typing.Dict[str, typing.Any]:
+    return {
+        "object": "block",
+        "id": f"block_{index}",
+        "type": "text",
+        "content": "Total",
+        "details": {"type": "text_details"},
+        "metadata": {"page": {"number": 1}},
+        "polygon": [{"x": 0.1, "y": 0.2}],
+        "boundingBox": {"left": 0.1, "top": 0.2, "right": 0.3, "bottom": 0.4},
+    }
+
+
+class TestConstructionPlans:
+    def test_plan_is_built_once_per_type(self) -> None:
+        unchecked_base_model._cached_construct_plan.cache_clear()
+
+        construct_type(type_=typing.List[Block], object_=[_block(0)])
+        misses = unchecked_base_model._cached_construct_plan.cache_info().misses
+        construct_type(type_=typing.List[Block], object_=[_block(1), _block(2)])
+
+        info = unchecked_base_model._cached_construct_plan.cache_info()
+        assert info.misses == misses
+        assert info.hits >= 1
+
+    def test_model_plan_follows_model_rebuild(self) -> None:
+        plan = unchecked_base_model._get_model_plan(_Forward)
+        assert unchecked_base_model._get_model_plan(_Forward) is plan
+
+        _Forward.model_rebuild()
+
+        assert unchecked_base_model._get_model_plan(_Forward) is not plan
+        forward = construct_type(type_=_Forward, object_={"later": {"value": "1"}})
+        assert isinstance(forward.later, _Later) and forward.later.value == 1
+
+    def test_union_member_order_is_respected(self) -> None:
+        # Union[str, int] == Union[int, str], but the first member wins.
+        assert construct_type(type_=typing.Union[int, str], object_="7") == 7
+        assert construct_type(type_=typing.Union[str, int], object_="7") == "7"
+
+    def test_unhashable_annotations_are_constructed_without_caching(self) -> None:
+        unhashable = typing_extensions.Annotated[typing.Union[int, str], {"examples": [1]}]
+
+        assert construct_type(type_=unhashable, object_="5") == 5
+
+    def test_unresolved_forward_refs_are_left_as_is(self) -> None:
+        type_ = typing.List[typing.ForwardRef("DoesNotExist")]
+
+        assert construct_type(type_=type_, object_=[{"a": 1}], host=Block) == [{"a": 1}]
+
+
+class TestConstructedModels:
+    def test_nested_models_and_values(self) -> None:
+        node = construct_type(
+            type_=_Node,
+            object_={
+                "name": "root",
+                "created_at": NOW,
+                "children": [{"name": "leaf", "tags": ["a"]}, None],
+                "extra": 1,
+            },
+        )
+
+        assert isinstance(node, _Node)
+        assert node.created_at == dt.datetime(2025, 4, 28, 17, 1, 39, 285000, tzinfo=dt.timezone.utc)
+        assert node.children is not None
+        assert isinstance(node.children[0], _Node) and node.children[0].tags == ["a"]
+        assert node.children[1] is None
+        assert node.model_extra == {"extra": 1}
+        # Non-None defaults count as set, as they always have.
+        assert node.model_fields_set == {"name", "labels", "created_at", "children", "extra"}
+
+    def test_mutable_defaults_are_not_shared(self) -> None:
+        first = construct_type(type_=_Node, object_={"name": "a"})
+        second = construct_type(type_=_Node, object_={"name": "b"})
+
+        assert first.labels == [] and second.labels == []
+        assert first.labels is not second.labels
+
+    def test_parse_run_with_aliases(self) -> None:
+        file = {"id": "file_1", "name": "a.pdf", "metadata": {}, "createdAt": NOW, "updatedAt": NOW}
+
+        run = construct_type(
+            type_=ParseRun,
+            object_={
+                "id": "pr_1",
+                "file": file,
+                "status": "PROCESSED",
+                "failureReason": None,
+                "outputUrl": "https://example.com/output.json",
+                "output": {"chunks": [{"object": "chunk", "type": "page", "content": "", "blocks": [_block(0)]}]},
+                "config": {},
+            },
+        )
+
+        assert isinstance(run, ParseRun)
+        assert run.output_url == "https://example.com/output.json"
+        assert "failure_reason" in run.model_fields_set
+        assert run.output is not None
+        assert isinstance(run.output.chunks[0].blocks[0], Block)
@@ -0,0 +1,142 @@
+"""
+Regression tests: HttpClient / AsyncHttpClient retry transport errors.
+
+Before this patch any httpx.TransportError (connect timeout, pool timeout,
+dropped connection) propagated immediately; only 408/409/429/5xx responses
+were retried. Connect-phase errors are now retried for every method, errors
+after the request may have been sent only for idempotent methods, and every
+retry is counted on the client's RetryStats.
+"""
+
+import typing
+
+import httpx
+import pytest
+
+from extend_ai.core.http_client import AsyncHttpClient, HttpClient
+from extend_ai.core.retries import is_retryable_transport_error, transport_error_kind
+
+pytestmark = pytest.mark.usefixtures("no_backoff")
+
+
+def _flaky_handler(
+    errors: typing.List[Exception], calls: typing.List[httpx.Request]
+) -> typing.Callable[[httpx.Request], httpx.Response]:
+    """Raise each error in turn, then succeed."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if errors:
+            raise errors.pop(0)
+        return httpx.Response(200, json={"ok": True})
+
+    return handler
+
+
+class TestTransportErrorClassification:
+    def test_connect_phase_errors_are_retryable_for_any_method(self) -> None:
+        for exc in (httpx.ConnectTimeout("t"), httpx.PoolTimeout("t"), httpx.ConnectError("e")):
+            assert is_retryable_transport_error(exc, "POST")
+            assert is_retryable_transport_error(exc, "GET")
+
+    def test_post_send_errors_are_retryable_only_for_idempotent_methods(self) -> None:
+        for exc in (httpx.ReadTimeout("t"), httpx.RemoteProtocolError("r"), httpx.ReadError("r")):
+            assert is_retryable_transport_error(exc, "get")
+            assert is_retryable_transport_error(exc, "DELETE")
+            assert not is_retryable_transport_error(exc, "POST")
+            assert not is_retryable_transport_error(exc, "PATCH")
+
+    def test_configuration_errors_are_never_retried(self) -> None:
+        assert not is_retryable_transport_error(httpx.UnsupportedProtocol("u"), "GET")
+        assert not is_retryable_transport_error(httpx.ProxyError("p"), "GET")
+
+    def test_kinds(self) -> None:
+        assert transport_error_kind(httpx.ConnectTimeout("t")) == "connect_timeout"
+        assert transport_error_kind(httpx.ReadTimeout("t")) == "read_timeout"
+        assert transport_error_kind(httpx.RemoteProtocolError("r")) == "remote_protocol_error"
+        assert transport_error_kind(httpx.UnsupportedProtocol("u")) == "UnsupportedProtocol"
+
+
+class TestSyncTransportRetries:
+    def test_retries_read_timeout_on_get(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        calls: typing.List[httpx.Request] = []
+        client = sync_http_client(_flaky_handler([httpx.ReadTimeout("t"), httpx.ReadTimeout("t")], calls))
+
+        response = client.request("parse_runs/pr_1", method="GET")
+
+        assert response.status_code == 200
+        assert len(calls) == 3
+        assert client.retry_stats.snapshot().transport_retries == {"read_timeout": 2}
+
+    def test_does_not_retry_read_timeout_on_post(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        calls: typing.List[httpx.Request] = []
+        client = sync_http_client(_flaky_handler([httpx.ReadTimeout("t")], calls))
+
+        with pytest.raises(httpx.ReadTimeout):
+            client.request("parse_runs", method="POST", json={"file": {"url": "x"}})
+
+        assert len(calls) == 1
+        snapshot = client.retry_stats.snapshot()
+        assert snapshot.transport_retries == {}
+        assert snapshot.transport_errors_raised == {"read_timeout": 1}
+
+    def test_retries_connect_error_on_post_and_resends_body(
+        self, sync_http_client: typing.Callable[..., HttpClient]
+    ) -> None:
+        calls: typing.List[httpx.Request] = []
+        client = sync_http_client(_flaky_handler([httpx.ConnectError("refused")], calls))
+
+        response = client.request("parse_runs", method="POST", json={"file": {"url": "x"}})
+
+        assert response.status_code == 200
+        assert len(calls) == 2
+        assert calls[0].content and calls[0].content == calls[1].content
+
+    def test_raises_after_max_retries(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        calls: typing.List[httpx.Request] = []
+        client = sync_http_client(_flaky_handler([httpx.ConnectTimeout("t")] * 5, calls))
+
+        with pytest.raises(httpx.ConnectTimeout):
+            client.request("files", method="GET", request_options={"max_retries": 1})
+
+        assert len(calls) == 2
+        snapshot = client.retry_stats.snapshot()
+        assert snapshot.transport_retries == {"connect_timeout": 1}
+        assert snapshot.transport_errors_raised == {"connect_timeout": 1}
+
+    def test_counts_status_retries(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        statuses = [503, 429, 200]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(statuses.pop(0), json={})
+
+        client = sync_http_client(handler)
+
+        assert client.request("files", method="GET").status_code == 200
+        assert client.retry_stats.snapshot().status_retries == {503: 1, 429: 1}
+
+
+class TestAsyncTransportRetries:
+    async def test_retries_remote_protocol_error_on_get(
+        self, async_http_client: typing.Callable[..., AsyncHttpClient]
+    ) -> None:
+        calls: typing.List[httpx.Request] = []
+        client = async_http_client(_flaky_handler([httpx.RemoteProtocolError("closed")], calls))
+
+        response = await client.request("parse_runs/pr_1", method="GET")
+
+        assert response.status_code == 200
+        assert len(calls) == 2
+        assert client.retry_stats.snapshot().transport_retries == {"remote_protocol_error": 1}
+
+    async def test_does_not_retry_write_error_on_post(
+        self, async_http_client: typing.Callable[..., AsyncHttpClient]
+    ) -> None:
+        calls: typing.List[httpx.Request] = []
+        client = async_http_client(_flaky_handler([httpx.WriteError("broken pipe")], calls))
+
+        with pytest.raises(httpx.WriteError):
+            await client.request("parse_runs", method="POST", json={})
+
+        assert len(calls) == 1
+        assert client.retry_stats.snapshot().transport_errors_raised == {"write_error": 1}
@@ -0,0 +1,161 @@
+"""
+Tests: the opt-in JSON codec encodes request bodies and decodes responses.
+
+With `Extend(json_codec=...)`, HttpClient encodes JSON bodies with the codec
+and `response.json()` in the generated endpoint code decodes with it. Input
+the fast codecs reject is handled by the standard library, so decoded values
+and errors are the same as without a codec.
+"""
+
+import importlib.util
+import json
+import typing
+
+import httpx
+import pytest
+
+from extend_ai import AsyncExtend, Extend, JsonCodec, RequestHooks
+from extend_ai.core.api_error import ApiError
+from extend_ai.core.json_codec import STDLIB_CODEC
+
+FILE_JSON = {"object": "file", "id": "file_123", "name": "invoice.pdf", "type": "PDF"}
+
+requires_orjson = pytest.mark.skipif(importlib.util.find_spec("orjson") is None, reason="orjson is not installed")
+
+
+pytestmark = pytest.mark.usefixtures("no_backoff")
+
+
+class _CountingCodec(JsonCodec):
+    def __init__(self) -> None:
+        self.decoded: typing.List[typing.Union[str, bytes]] = []
+        self.encoded: typing.List[typing.Any] = []
+        super().__init__("counting", loads=self._loads, dumps=self._dumps)
+
+    def _loads(self, data: typing.Union[str, bytes]) -> typing.Any:
+        self.decoded.append(data)
+        return STDLIB_CODEC.loads(data)
+
+    def _dumps(self, obj: typing.Any) -> bytes:
+        self.encoded.append(obj)
+        return STDLIB_CODEC.dumps(obj)
+
+
+class TestNamedCodecs:
+    @requires_orjson
+    def test_auto_prefers_orjson(self) -> None:
+        assert JsonCodec.named("auto").name == "orjson"
+
+    def test_json_is_the_standard_library(self) -> None:
+        assert JsonCodec.named("json") is STDLIB_CODEC
+
+    def test_unknown_names_are_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            JsonCodec.named("yaml")  # type: ignore[arg-type]
+
+    @pytest.mark.skipif(importlib.util.find_spec("msgspec") is not None, reason="msgspec is installed")
+    def test_missing_codec_raises_import_error(self) -> None:
+        with pytest.raises(ImportError, match="pip install msgspec"):
+            JsonCodec.named("msgspec")
+
+
+@requires_orjson
+class TestOrjsonCodec:
+    def test_decodes_like_the_standard_library(self) -> None:
+        codec = JsonCodec.named("orjson")
+        document = b'{"big": 123456789012345678901234567890, "nan": NaN, "text": "caf\\u00e9"}'
+
+        decoded = codec.loads(document)
+
+        assert decoded["big"] == 123456789012345678901234567890
+        assert decoded["nan"] != decoded["nan"]
+        assert decoded["text"] == "café"
+
+    def test_invalid_input_raises_json_decode_error(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            JsonCodec.named("orjson").loads(b"<html>Bad gateway</html>")
+
+    def test_encodes_like_httpx(self) -> None:
+        codec = JsonCodec.named("orjson")
+        body = {"name": "café", "count": 1, "ratio": 0.5, "tags": ["a"], "nested": {1: None}}
+
+        assert json.loads(codec.dumps(body)) == json.loads(STDLIB_CODEC.dumps(body))
+        assert codec.dumps({"big": 2**70}) == STDLIB_CODEC.dumps({"big": 2**70})
+
+
+class TestClientCodec:
+    def test_default_leaves_json_to_httpx(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        client = sync_extend_client(lambda request: httpx.Response(200, json=FILE_JSON))
+
+        assert client.json_codec is None
+        assert client.files.retrieve("file_123").id == "file_123"
+
+    def test_responses_are_decoded_with_the_codec(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        codec = _CountingCodec()
+        client = sync_extend_client(lambda request: httpx.Response(200, json=FILE_JSON), json_codec=codec)
+
+        file = client.files.retrieve("file_123")
+
+        assert file.id == "file_123"
+        assert len(codec.decoded) == 1
+
+    def test_request_bodies_are_encoded_once_with_the_codec(
+        self, sync_extend_client: typing.Callable[..., Extend]
+    ) -> None:
+        codec = _CountingCodec()
+        responses = [httpx.Response(503), httpx.Response(200, json=FILE_JSON)]
+        requests: typing.List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return responses.pop(0)
+
+        client = sync_extend_client(handler, json_codec=codec)
+
+        client._client_wrapper.httpx_client.request(
+            "files", method="POST", json={"name": "renamed.pdf"}, request_options={"max_retries": 1}
+        )
+
+        assert len(codec.encoded) == 1
+        assert [request.content for request in requests] == [b'{"name":"renamed.pdf"}'] * 2
+        assert requests[-1].headers["content-type"] == "application/json"
+
+    def test_error_bodies_still_fall_back_to_text(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        client = sync_extend_client(lambda request: httpx.Response(400, text="not json"), json_codec="json")
+
+        with pytest.raises(ApiError) as info:
+            client.files.retrieve("file_123")
+
+        assert info.value.body == "not json"
+
+    def test_codec_and_hooks_work_together(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        codec = _CountingCodec()
+        decoded: typing.List[typing.Any] = []
+        client = sync_extend_client(
+            lambda request: httpx.Response(200, json=FILE_JSON),
+            json_codec=codec,
+            hooks=RequestHooks(on_decode_complete=decoded.append),
+        )
+
+        client.files.retrieve("file_123")
+
+        assert len(codec.decoded) == 1
+        assert len(decoded) == 1
+
+    async def test_async_client_uses_the_codec(self, async_extend_client: typing.Callable[..., AsyncExtend]) -> None:
+        codec = _CountingCodec()
+        client = async_extend_client(lambda request: httpx.Response(200, json=FILE_JSON), json_codec=codec)
+
+        file = await client.files.retrieve("file_123")
+
+        assert file.id == "file_123"
+        assert client.json_codec is codec
+        assert len(codec.decoded) == 1
+
+    def test_webhooks_parse_with_the_codec(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        codec = _CountingCodec()
+        client = sync_extend_client(lambda request: httpx.Response(200), json_codec=codec)
+
+        client.webhooks.parse('{"eventId": "evt_1", "eventType": "unknown.event", "payload": {}}')
+
+        assert codec.decoded == ['{"eventId": "evt_1", "eventType": "unknown.event", "payload": {}}']
@@ -0,0 +1,68 @@
+"""
+Tests: jsonable_encoder returns JSON-native subtrees as is.
+
+jsonable_encoder used to rebuild every dict and list it was given. Payloads
+that are already plain JSON data are now returned unchanged, and containers
+are only copied where something is encoded or omitted; the encoded values are
+the same as before.
+"""
+
+import collections
+import datetime as dt
+import enum
+import typing
+
+from extend_ai.core.jsonable_encoder import jsonable_encoder
+
+NOW = dt.datetime(2025, 4, 28, 17, 1, 39, tzinfo=dt.timezone.utc)
+
+
+class _Color(str, enum.Enum):
+    RED = "red"
+
+
+class TestIdentityFastPath:
+    def test_json_native_payloads_are_returned_as_is(self) -> None:
+        body = {"inputs": [{"file": {"url": "https://example.com/a.pdf"}, "metadata": {"n": 1, "ok": True}}], "x": None}
+
+        assert jsonable_encoder(body) is body
+
+    def test_only_changed_containers_are_copied(self) -> None:
+        unchanged = {"url": "https://example.com/a.pdf"}
+        body = {"file": unchanged, "metadata": {"received_at": NOW}, "tags": ["a"]}
+
+        encoded = jsonable_encoder(body)
+
+        assert encoded is not body
+        assert encoded == {"file": unchanged, "metadata": {"received_at": "2025-04-28T17:01:39Z"}, "tags": ["a"]}
+        assert encoded["file"] is unchanged
+        assert encoded["tags"] is body["tags"]
+        assert list(encoded) == ["file", "metadata", "tags"]
+
+    def test_omitted_values_are_dropped(self) -> None:
+        body: typing.Dict[str, typing.Any] = {"a": 1, "b": ..., "c": [1, ..., 2]}
+
+        assert jsonable_encoder(body) == {"a": 1, "c": [1, 2]}
+        assert body == {"a": 1, "b": ..., "c": [1, ..., 2]}
+
+
+class TestEncodedTypes:
+    def test_subclasses_are_still_encoded(self) -> None:
+        ordered = collections.OrderedDict([("color", _Color.RED)])
+
+        encoded = jsonable_encoder(ordered)
+
+        assert type(encoded) is dict
+        assert encoded == {"color": "red"}
+        assert type(encoded["color"]) is str
+
+    def test_tuples_and_sets_become_lists(self) -> None:
+        assert jsonable_encoder({"a": (1, 2), "b": frozenset({3})}) == {"a": [1, 2], "b": [3]}
+
+    def test_custom_encoder_applies_to_json_native_values(self) -> None:
+        body = {"name": "doc", "pages": [1, 2]}
+
+        assert jsonable_encoder(body, custom_encoder={int: lambda value: value * 10}) == {
+            "name": "doc",
+            "pages": [10, 20],
+        }
@@ -0,0 +1,209 @@
+"""
+Tests: response_format="lazy" builds LazyModels whose nested objects and lists
+are constructed on first access.
+
+A LazyModel must read, compare, print, dump, copy and pickle exactly like the
+eagerly constructed model, and must never reach pydantic as an incomplete model.
+"""
+
+import copy
+import pickle
+import typing
+
+import httpx
+import pydantic
+import pytest
+
+from extend_ai import Extend
+from extend_ai.core.pydantic_utilities import IS_PYDANTIC_V2
+from extend_ai.core.unchecked_base_model import LazyModel, construct_lazily, construct_type, materialize
+from extend_ai.types import Chunk, ParseConfig, ParseRun, ParseRunOutput, WorkflowRun
+
+pytestmark = pytest.mark.skipif(not IS_PYDANTIC_V2, reason="lazy construction needs Pydantic v2")
+
+NOW = "2025-04-28T17:01:39.285Z"
+FILE_JSON = {"object": "file", "id": "file_123", "name": "invoice.pdf", "type": "PDF", "createdAt": NOW}
+CHUNK_JSON = {
+    "object": "chunk",
+    "type": "page",
+    "content": "Invoice",
+    "metadata": {"pageRange": {"start": 1, "end": 1}},
+    "blocks": [
+        {
+            "object": "block",
+            "id": "block_1",
+            "type": "text",
+            "content": "Invoice",
+            "details": {},
+            "metadata": {"page": {"number": 1, "width": 612, "height": 792}},
+            "polygon": [{"x": 0, "y": 0}],
+            "boundingBox": {"left": 0, "top": 0, "right": 1, "bottom": 1},
+        }
+    ],
+}
+PARSE_RUN_JSON: typing.Dict[str, typing.Any] = {
+    "object": "parse_run",
+    "id": "pr_123",
+    "file": FILE_JSON,
+    "status": "PROCESSED",
+    "config": {"target": "markdown", "chunkingStrategy": {"type": "page"}},
+    "metadata": {"customer": "acme"},
+    "output": {"chunks": [CHUNK_JSON]},
+    "usage": {"credits": 3},
+    "extraField": [1, 2],
+}
+
+
+def _lazy() -> typing.Any:
+    return construct_lazily(type_=ParseRun, object_=PARSE_RUN_JSON)
+
+
+def _eager() -> ParseRun:
+    return construct_type(type_=ParseRun, object_=PARSE_RUN_JSON)
+
+
+class TestConstruction:
+    def test_scalars_are_constructed_and_subtrees_deferred(self) -> None:
+        run = _lazy()
+
+        assert type(run) is LazyModel
+        assert run._model.__dict__["status"] == "PROCESSED"
+        assert "output" in run._deferred
+        assert "file" in run._deferred
+
+    def test_subtrees_are_constructed_on_access(self) -> None:
+        run = _lazy()
+
+        assert isinstance(run.output, ParseRunOutput)
+        assert isinstance(run.output.chunks[0], Chunk)
+        assert run.output.chunks[0].blocks[0].id == "block_1"
+        assert run.output is run.output
+
+    def test_model_fields_are_constructed_lazily_too(self) -> None:
+        config = _lazy().config
+
+        assert type(config) is LazyModel
+        assert "chunking_strategy" in config._deferred
+        assert config.chunking_strategy == _eager().config.chunking_strategy
+
+    def test_reads_like_the_eager_model(self) -> None:
+        run, eager = _lazy(), _eager()
+
+        assert run.file == eager.file
+        assert run.config == eager.config
+        assert run.metadata == eager.metadata
+        assert run.usage == eager.usage
+        assert run.model_extra == eager.model_extra
+        assert run.model_fields_set == eager.model_fields_set
+
+    def test_missing_attributes_still_raise(self) -> None:
+        with pytest.raises(AttributeError):
+            _lazy().not_a_field  # type: ignore[attr-defined]
+
+    def test_models_without_subtrees_are_plain(self) -> None:
+        run = construct_lazily(type_=ParseRun, object_={"object": "parse_run", "id": "pr_1", "status": "PENDING"})
+
+        assert type(run) is ParseRun
+
+    def test_other_types_are_constructed_eagerly(self) -> None:
+        chunks = construct_lazily(type_=typing.List[Chunk], object_=[CHUNK_JSON])
+
+        assert type(chunks[0]) is Chunk
+
+
+class TestWholeModelOperations:
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            lambda run: run.model_dump(),
+            lambda run: run.dict(),
+            lambda run: run.json(),
+            lambda run: run.model_dump_json(),
+            repr,
+            str,
+            lambda run: list(run),
+        ],
+    )
+    def test_matches_the_eager_model(self, operation: typing.Callable[[ParseRun], typing.Any]) -> None:
+        run = _lazy()
+        run.config  # a lazily constructed model inside
+
+        assert operation(run) == operation(_eager())
+        assert type(materialize(run)) is ParseRun
+        assert type(materialize(run).config) is ParseConfig
+
+    def test_equality(self) -> None:
+        assert _lazy() == _eager()
+        assert _eager() == _lazy()
+        assert _lazy() == _lazy()
+
+    def test_copy_and_pickle(self) -> None:
+        assert copy.copy(_lazy()) == _eager()
+        assert copy.deepcopy(_lazy()) == _eager()
+        assert pickle.loads(pickle.dumps(_lazy())) == _eager()
+
+    def test_materialize(self) -> None:
+        run = _lazy()
+        run.config
+
+        model = materialize(run)
+
+        assert type(model) is ParseRun
+        assert type(model.config) is ParseConfig
+        assert model.__dict__ == _eager().__dict__
+        assert materialize(run) is model
+        assert materialize(model) is model
+        assert run.output is model.output
+
+    def test_is_not_an_instance_of_the_model(self) -> None:
+        assert not isinstance(_lazy(), ParseRun)
+        assert vars(_lazy()) == vars(_eager())
+
+
+class TestNestedInOtherModels:
+    class Job(pydantic.BaseModel):
+        run: ParseRun
+
+    def test_materialized_model_dumps_like_the_eager_one(self) -> None:
+        lazy = _lazy()
+        lazy.status
+
+        assert self.Job(run=materialize(lazy)).model_dump() == self.Job(run=_eager()).model_dump()
+
+    def test_lazy_model_is_rejected_rather_than_dumped_incomplete(self) -> None:
+        with pytest.raises(pydantic.ValidationError):
+            self.Job(run=_lazy())
+
+    def test_type_adapter_dumps_the_complete_model(self) -> None:
+        adapter = pydantic.TypeAdapter(typing.List[ParseRun])
+        expected = adapter.dump_python([_eager()])
+
+        assert adapter.dump_python([materialize(_lazy())]) == expected
+        assert adapter.dump_python([_lazy()], warnings=False) == expected
+        assert pydantic.TypeAdapter(typing.List[ParseConfig]).dump_python([_lazy().config], warnings=False) == [
+            _eager().config.model_dump()
+        ]
+
+
+class TestResponseFormat:
+    def test_lazy_response_format(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        client = sync_extend_client(lambda request: httpx.Response(200, json=PARSE_RUN_JSON))
+
+        run = client.parse_runs.retrieve("pr_123", request_options={"response_format": "lazy"})
+
+        assert "output" in run._deferred
+        assert isinstance(materialize(run), ParseRun)
+        assert run == _eager()
+
+    def test_workflow_step_runs_are_deferred(self) -> None:
+        workflow_run_json = {
+            "object": "workflow_run",
+            "id": "workflow_run_1",
+            "status": "PROCESSED",
+            "stepRuns": [{"object": "workflow_step_run", "id": "step_run_1", "status": "PROCESSED"}],
+        }
+
+        run = construct_lazily(type_=WorkflowRun, object_=workflow_run_json)
+
+        assert "step_runs" in run._deferred
+        assert run.step_runs == construct_type(type_=WorkflowRun, object_=workflow_run_json).step_runs
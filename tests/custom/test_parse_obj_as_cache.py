@@ -0,0 +1,100 @@
+"""
+Tests: parse_obj_as caches TypeAdapters, and models cache their alias metadata.
+
+parse_obj_as used to build a new pydantic.TypeAdapter on every call, and every
+UniversalBaseModel rescanned its fields for aliases each time it was
+validated. Both are now computed once per type; behaviour is unchanged.
+"""
+
+import typing
+
+import pydantic
+import pytest
+import typing_extensions
+
+from extend_ai.core import pydantic_utilities
+from extend_ai.core.pydantic_utilities import IS_PYDANTIC_V2, UniversalBaseModel, parse_obj_as
+from extend_ai.types import ParseRun
+
+NOW = "2025-04-28T17:01:39.285Z"
+
+pytestmark = pytest.mark.skipif(not IS_PYDANTIC_V2, reason="TypeAdapter is pydantic v2 only")
+
+
+class _Aliased(UniversalBaseModel):
+    page_count: int = pydantic.Field(alias="pageCount")
+    name: str
+
+
+class _Ambiguous(UniversalBaseModel):
+    # "b" is both the alias of `a` and the name of another field.
+    a: int = pydantic.Field(alias="b")
+    b: int = pydantic.Field(alias="c")
+
+
+class TestTypeAdapterCache:
+    def test_adapter_is_built_once_per_type(self) -> None:
+        pydantic_utilities._cached_type_adapter.cache_clear()
+
+        parse_obj_as(typing.List[int], [1, 2])
+        parse_obj_as(typing.List[int], ["3"])
+        parse_obj_as(typing.Dict[str, int], {"a": 1})
+
+        info = pydantic_utilities._cached_type_adapter.cache_info()
+        assert info.misses == 2
+        assert info.hits == 1
+
+    def test_cache_is_bounded(self) -> None:
+        assert pydantic_utilities._cached_type_adapter.cache_info().maxsize == pydantic_utilities.PARSE_CACHE_SIZE
+
+    def test_union_member_order_gets_its_own_adapter(self) -> None:
+        # Union[int, str] == Union[str, int], but member order can decide which one wins.
+        first = pydantic_utilities._get_type_adapter(typing.Union[int, str])
+        second = pydantic_utilities._get_type_adapter(typing.Union[str, int])
+
+        assert first is not second
+        assert pydantic_utilities._get_type_adapter(typing.Union[int, str]) is first
+
+    def test_unhashable_types_are_parsed_without_caching(self) -> None:
+        unhashable = typing_extensions.Annotated[int, {"examples": [1]}]
+        with pytest.raises(TypeError):
+            hash(unhashable)
+
+        assert parse_obj_as(unhashable, "5") == 5
+
+    def test_large_models_still_validate(self) -> None:
+        file = {"id": "file_1", "name": "a.pdf", "metadata": {}, "createdAt": NOW, "updatedAt": NOW}
+
+        run = parse_obj_as(ParseRun, {"id": "pr_1", "file": file, "status": "PROCESSED", "config": {}})
+
+        assert run.id == "pr_1"
+        assert run.file.name == "a.pdf"
+
+
+class TestFieldAliasCache:
+    def test_aliases_are_computed_once_per_model(self) -> None:
+        pydantic_utilities._field_aliases.cache_clear()
+
+        for count in range(3):
+            _Aliased.model_validate({"pageCount": count, "name": "doc"})
+
+        info = pydantic_utilities._field_aliases.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_field_names_are_still_rewritten_to_aliases(self) -> None:
+        model = _Aliased.model_validate({"page_count": 3, "name": "doc"})
+
+        assert model.page_count == 3
+
+    def test_alias_keys_pass_through(self) -> None:
+        data = {"pageCount": 3, "name": "doc"}
+
+        assert _Aliased.model_validate(data).page_count == 3
+        assert data == {"pageCount": 3, "name": "doc"}
+
+    def test_ambiguous_keys_still_raise(self) -> None:
+        with pytest.raises(pydantic.ValidationError, match="Ambiguous input key 'b'"):
+            _Ambiguous.model_validate({"b": 1})
+
+        assert _Ambiguous.model_validate({"b": 1, "c": 2}).a == 1
@@ -0,0 +1,99 @@
+"""
+Tests: the convenience methods patched onto generated parse output types.
+
+`ParseRunOutputOcr.as_columns()` delegates to the wrapper's OcrColumns and
+`ParseRunOutput.index` to its BlockIndex, for models built eagerly and lazily
+alike. The index is cached per output without becoming part of the model.
+"""
+
+import gc
+import pickle
+
+import pytest
+
+from extend_ai import BlockIndex, OcrColumns
+from extend_ai.core.pydantic_utilities import IS_PYDANTIC_V2
+from extend_ai.core.unchecked_base_model import construct_lazily, construct_type
+from extend_ai.types import ParseRunOutput, ParseRunOutputOcr
+
+WORD_JSON = {
+    "content": "Invoice",
+    "boundingBox": {"left": 0.1, "top": 0.2, "right": 0.3, "bottom": 0.4},
+    "confidence": 0.9,
+    "pageNumber": 1,
+}
+BLOCK_JSON = {
+    "object": "block",
+    "id": "block_1",
+    "type": "table",
+    "content": "",
+    "details": {},
+    "metadata": {"page": {"number": 1, "width": 612, "height": 792}},
+    "polygon": [],
+    "boundingBox": {},
+}
+CHUNK_JSON = {"object": "chunk", "type": "page", "content": "", "metadata": {}, "blocks": [BLOCK_JSON]}
+OUTPUT_JSON = {
+    "chunks": [CHUNK_JSON],
+    "ocr": {"words": [WORD_JSON, {**WORD_JSON, "content": "Total", "pageNumber": 2}]},
+}
+
+
+class TestAsColumns:
+    def test_returns_the_words_as_columns(self) -> None:
+        ocr = construct_type(type_=ParseRunOutputOcr, object_=OUTPUT_JSON["ocr"])
+
+        columns = ocr.as_columns(numpy=False)
+
+        assert isinstance(columns, OcrColumns)
+        assert list(columns.content) == ["Invoice", "Total"]
+        assert list(columns.page_number) == [1.0, 2.0]
+
+    def test_no_words(self) -> None:
+        assert len(ParseRunOutputOcr().as_columns(numpy=False)) == 0
+
+    @pytest.mark.skipif(not IS_PYDANTIC_V2, reason="lazy construction needs Pydantic v2")
+    def test_lazily_constructed_output(self) -> None:
+        output = construct_lazily(type_=ParseRunOutput, object_=OUTPUT_JSON)
+
+        assert output.ocr is not None
+        assert list(output.ocr.as_columns(numpy=False).content) == ["Invoice", "Total"]
+
+
+class TestIndex:
+    def test_is_built_once_per_output(self) -> None:
+        output = construct_type(type_=ParseRunOutput, object_=OUTPUT_JSON)
+
+        assert isinstance(output.index, BlockIndex)
+        assert output.index is output.index
+        assert output.index is not construct_type(type_=ParseRunOutput, object_=OUTPUT_JSON).index
+        assert output.index.get("block_1") is output.chunks[0].blocks[0]
+
+    def test_is_not_part_of_the_model(self) -> None:
+        output = construct_type(type_=ParseRunOutput, object_=OUTPUT_JSON)
+        plain = construct_type(type_=ParseRunOutput, object_=OUTPUT_JSON)
+
+        output.index
+
+        assert output == plain
+        assert output.dict() == plain.dict()
+        assert repr(output) == repr(plain)
+        assert pickle.loads(pickle.dumps(output)) == plain
+
+    def test_is_dropped_with_the_output(self) -> None:
+        from extend_ai.wrapper import block_index
+
+        output = construct_type(type_=ParseRunOutput, object_=OUTPUT_JSON)
+        key = id(output)
+        output.index
+
+        del output
+        gc.collect()
+
+        assert key not in block_index._indexes
+
+    @pytest.mark.skipif(not IS_PYDANTIC_V2, reason="lazy construction needs Pydantic v2")
+    def test_lazily_constructed_output(self) -> None:
+        output = construct_lazily(type_=ParseRunOutput, object_=OUTPUT_JSON)
+
+        assert [block.id for block in output.index.of_type("table", page=1)] == ["block_1"]
@@ -0,0 +1,203 @@
+"""
+Regression tests: RateLimiter pacing in HttpClient / AsyncHttpClient.
+
+X-RateLimit headers used to be read only after a 429. A RateLimiter learns
+the quota from every response and paces later requests per workspace.
+"""
+
+import time
+import typing
+
+import httpx
+import pytest
+
+from extend_ai import AsyncExtend, Extend, RateLimiter
+from extend_ai.core import http_client as http_client_module
+from extend_ai.core import rate_limit as rate_limit_module
+from extend_ai.core.http_client import AsyncHttpClient, HttpClient
+
+
+def _quota_response(remaining: int, reset_in: float, limit: int = 100, status: int = 200) -> httpx.Response:
+    return httpx.Response(
+        status,
+        headers={
+            "x-ratelimit-limit": str(limit),
+            "x-ratelimit-remaining": str(remaining),
+            "x-ratelimit-reset": str(int(time.time() + reset_in)),
+        },
+    )
+
+
+class _FakeClock:
+    """Stands in for the `time` module in `extend_ai.core.rate_limit`."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+class TestRateLimiter:
+    def test_unknown_quota_does_not_wait(self) -> None:
+        limiter = RateLimiter()
+        assert limiter.reserve() == 0.0
+        assert limiter.state() is None
+
+    def test_paces_remaining_quota_over_window(self) -> None:
+        limiter = RateLimiter()
+        limiter.observe(_quota_response(remaining=10, reset_in=20))
+
+        delays = [limiter.reserve() for _ in range(3)]
+
+        assert delays[0] == 0.0
+        # ~20s left for 10 requests -> about 2s apart
+        assert 1.0 < delays[1] < 2.5
+        assert 2.5 < delays[2] < 5.0
+        state = limiter.state()
+        assert state is not None
+        assert state.remaining == 7
+        assert state.limit == 100
+
+    def test_responses_in_the_same_window_keep_local_reservations(self) -> None:
+        limiter = RateLimiter()
+        reset = str(int(time.time() + 20))
+
+        def response(remaining: int, reset: str = reset) -> httpx.Response:
+            return httpx.Response(200, headers={"x-ratelimit-remaining": str(remaining), "x-ratelimit-reset": reset})
+
+        limiter.observe(response(10))
+        for _ in range(3):
+            limiter.reserve()
+        # Answers to requests sent before the reservations report a stale count.
+        limiter.observe(response(9))
+        state = limiter.state()
+        assert state is not None and state.remaining == 7
+
+        limiter.observe(response(5))
+        state = limiter.state()
+        assert state is not None and state.remaining == 5
+
+        # A new window reports its own quota.
+        limiter.observe(response(50, reset=str(int(time.time() + 80))))
+        state = limiter.state()
+        assert state is not None and state.remaining == 50
+
+    def test_exhausted_quota_waits_for_reset(self) -> None:
+        limiter = RateLimiter()
+        limiter.observe(_quota_response(remaining=0, reset_in=5))
+
+        assert 3.0 < limiter.reserve() <= 5.0
+
+    def test_requests_held_for_reset_are_spaced_out(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        clock = _FakeClock()
+        monkeypatch.setattr(rate_limit_module, "time", clock)
+        limiter = RateLimiter()
+        limiter.observe(
+            httpx.Response(
+                200,
+                headers={"x-ratelimit-limit": "20", "x-ratelimit-remaining": "0", "x-ratelimit-reset": "1010"},
+            )
+        )
+
+        # 20 requests per 10 s window: the held requests go out 0.5 s apart from the reset.
+        assert [limiter.reserve() for _ in range(4)] == [10.0, 10.5, 11.0, 11.5]
+
+        # After the reset, and before a response reports the new quota, new requests queue behind them.
+        clock.now += 10.0
+        assert limiter.reserve() == 2.0
+        clock.now += 10.0
+        assert limiter.reserve() == 0.0
+
+    def test_held_requests_without_a_known_limit_go_one_per_window(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        clock = _FakeClock()
+        monkeypatch.setattr(rate_limit_module, "time", clock)
+        limiter = RateLimiter()
+        limiter.observe(httpx.Response(429, headers={"retry-after": "3"}))
+
+        assert [limiter.reserve() for _ in range(3)] == [3.0, 6.0, 9.0]
+
+    def test_pacing_delay_is_capped(self) -> None:
+        limiter = RateLimiter(max_delay=1.0)
+        limiter.observe(_quota_response(remaining=2, reset_in=30))
+
+        assert limiter.reserve() == 0.0
+        assert limiter.reserve() == 1.0
+
+    def test_exhausted_quota_wait_is_not_capped(self) -> None:
+        limiter = RateLimiter(max_delay=1.0)
+        limiter.observe(_quota_response(remaining=0, reset_in=30))
+
+        assert 28.0 < limiter.reserve() <= 30.0
+
+    def test_429_with_retry_after(self) -> None:
+        limiter = RateLimiter()
+        limiter.observe(httpx.Response(429, headers={"retry-after": "3"}))
+
+        assert 2.0 < limiter.reserve() <= 3.0
+
+    def test_workspaces_have_separate_buckets(self) -> None:
+        limiter = RateLimiter()
+        limiter.observe(_quota_response(remaining=0, reset_in=10), "ws_a")
+
+        assert limiter.reserve("ws_a") > 0
+        assert limiter.reserve("ws_b") == 0.0
+        assert limiter.reserve() == 0.0
+
+    def test_responses_without_headers_are_ignored(self) -> None:
+        limiter = RateLimiter()
+        limiter.observe(httpx.Response(200))
+        limiter.observe(httpx.Response(200, headers={"x-ratelimit-remaining": "oops"}))
+
+        assert limiter.state() is None
+
+
+class TestHttpClientRateLimiting:
+    def test_sync_client_sleeps_before_paced_request(
+        self, monkeypatch: pytest.MonkeyPatch, sync_http_client: typing.Callable[..., HttpClient]
+    ) -> None:
+        sleeps: typing.List[float] = []
+        monkeypatch.setattr(http_client_module.time, "sleep", sleeps.append)
+        seen_workspaces: typing.List[typing.Optional[str]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_workspaces.append(request.headers.get("x-extend-workspace-id"))
+            return _quota_response(remaining=0, reset_in=10)
+
+        client = sync_http_client(handler, rate_limiter=RateLimiter())
+
+        client.request("processor_runs", method="GET", headers={"x-extend-workspace-id": "ws_1"})
+        assert sleeps == []
+        client.request("processor_runs", method="GET", headers={"x-extend-workspace-id": "ws_1"})
+        assert len(sleeps) == 1 and sleeps[0] > 5
+        client.request("processor_runs", method="GET", headers={"x-extend-workspace-id": "ws_2"})
+        assert len(sleeps) == 1
+
+        assert seen_workspaces == ["ws_1", "ws_1", "ws_2"]
+
+    async def test_async_client_awaits_before_paced_request(
+        self, monkeypatch: pytest.MonkeyPatch, async_http_client: typing.Callable[..., AsyncHttpClient]
+    ) -> None:
+        sleeps: typing.List[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr(http_client_module.asyncio, "sleep", fake_sleep)
+        client = async_http_client(
+            lambda request: _quota_response(remaining=0, reset_in=10), rate_limiter=RateLimiter()
+        )
+
+        await client.request("files", method="GET")
+        await client.request("files", method="GET")
+
+        assert len(sleeps) == 1 and sleeps[0] > 5
+
+
+def test_extend_clients_accept_rate_limiter() -> None:
+    limiter = RateLimiter()
+    assert Extend(token="test", rate_limiter=limiter)._client_wrapper.httpx_client.rate_limiter is limiter
+    assert AsyncExtend(token="test", rate_limiter=limiter)._client_wrapper.httpx_client.rate_limiter is limiter
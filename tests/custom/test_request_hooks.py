@@ -0,0 +1,181 @@
+"""
+Tests: RequestHooks fire with per-phase timings and byte counts.
+
+HttpClient / AsyncHttpClient time body encoding and the network round trip,
+the response times `response.json()`, and HttpResponse reports when the
+generated endpoint code has built the model from it.
+"""
+
+import typing
+
+import httpx
+import pytest
+
+from extend_ai import AsyncExtend, Extend, RequestEvent, RequestHooks
+from extend_ai.core.http_client import AsyncHttpClient, HttpClient
+from extend_ai.core.instrumentation import operation_name
+from extend_ai.core.retries import RetryAttempt, RetryPolicy
+
+FILE_JSON = {"object": "file", "id": "file_123", "name": "invoice.pdf", "type": "PDF"}
+
+
+pytestmark = pytest.mark.usefixtures("no_backoff")
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.calls: typing.List[typing.Tuple[str, typing.Any]] = []
+
+    def hooks(self) -> RequestHooks:
+        return RequestHooks(
+            on_request_start=lambda event: self.calls.append(("start", event)),
+            on_response=lambda event: self.calls.append(("response", event)),
+            on_retry=lambda attempt: self.calls.append(("retry", attempt)),
+            on_decode_complete=lambda event: self.calls.append(("decode", event)),
+            on_model_constructed=lambda event: self.calls.append(("constructed", event)),
+            on_error=lambda event: self.calls.append(("error", event)),
+        )
+
+    def names(self) -> typing.List[str]:
+        return [name for name, _ in self.calls]
+
+    def last(self, name: str) -> typing.Any:
+        return [event for event_name, event in self.calls if event_name == name][-1]
+
+
+def _handler(responses: typing.List[httpx.Response]) -> typing.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    return handler
+
+
+class TestOperationName:
+    @pytest.mark.parametrize(
+        "method, path, expected",
+        [
+            ("GET", "files/file_123", "GET files/{id}"),
+            ("POST", "extract_runs", "POST extract_runs"),
+            ("POST", "extract_runs/batch", "POST extract_runs/batch"),
+            ("POST", "extract_runs/exr_123/cancel", "POST extract_runs/{id}/cancel"),
+            ("GET", "classifiers/cl_1/versions/clv_2", "GET classifiers/{id}/versions/{id}"),
+            ("GET", "classifiers/cl_1/versions/latest", "GET classifiers/{id}/versions/latest"),
+            ("POST", "parse", "POST parse"),
+            ("GET", None, "GET"),
+        ],
+    )
+    def test_names_the_path_template(self, method: str, path: typing.Optional[str], expected: str) -> None:
+        assert operation_name(method, path) == expected
+
+
+class TestSyncHooks:
+    def test_phases_fire_in_order_with_timings(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        recorder = _Recorder()
+        client = sync_extend_client(_handler([httpx.Response(200, json=FILE_JSON)]), hooks=recorder.hooks())
+
+        client.files.retrieve("file_123")
+
+        assert recorder.names() == ["start", "response", "decode", "constructed"]
+        event: RequestEvent = recorder.last("constructed")
+        assert event.operation == "GET files/{id}"
+        assert event.method == "GET"
+        assert event.path == "files/file_123"
+        assert event.url == "https://api.example.com/files/file_123"
+        assert event.attempt == 1
+        assert event.status_code == 200
+        assert event.request_bytes == 0
+        assert event.response_bytes == len(httpx.Response(200, json=FILE_JSON).content)
+        assert event.model == "File"
+        for phase in (event.encode, event.network, event.decode, event.construct):
+            assert phase is not None and phase >= 0
+        assert recorder.last("start").network is None
+        assert recorder.last("response").decode is None
+        assert recorder.last("decode").construct is None
+
+    def test_request_bytes_count_the_encoded_body(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        recorder = _Recorder()
+        client = sync_http_client(_handler([httpx.Response(200)]), hooks=recorder.hooks())
+
+        response = client.request("files", method="POST", json={"name": "invoice.pdf"})
+
+        assert recorder.last("start").request_bytes == len(response.request.content) > 0
+        assert recorder.names() == ["start", "response"]
+
+    def test_retries_fire_on_retry_and_restart_the_attempt(
+        self, sync_extend_client: typing.Callable[..., Extend]
+    ) -> None:
+        recorder = _Recorder()
+        client = sync_extend_client(
+            _handler([httpx.Response(503), httpx.Response(200, json=FILE_JSON)]), hooks=recorder.hooks()
+        )
+
+        client.files.retrieve("file_123")
+
+        assert recorder.names() == ["start", "response", "retry", "start", "response", "decode", "constructed"]
+        retry: RetryAttempt = recorder.last("retry")
+        assert retry.status_code == 503 and retry.will_retry
+        assert recorder.last("constructed").attempt == 2
+
+    def test_stream_fires_request_hooks(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        recorder = _Recorder()
+        client = sync_http_client(_handler([httpx.Response(200, content=b"data: {}\n\n")]), hooks=recorder.hooks())
+
+        with client.stream("events", method="GET") as response:
+            assert response.read() == b"data: {}\n\n"
+
+        assert recorder.names() == ["start", "response"]
+        assert recorder.last("response").status_code == 200
+
+    def test_transport_errors_fire_on_error(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        def timeout(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        recorder = _Recorder()
+        client = sync_http_client(timeout, hooks=recorder.hooks(), retry_policy=RetryPolicy(max_retries=1))
+
+        with pytest.raises(httpx.ReadTimeout):
+            client.request("files", method="GET")
+        with pytest.raises(httpx.ReadTimeout):
+            with client.stream("events", method="GET"):
+                pass
+
+        assert recorder.names() == ["start", "error", "retry", "start", "error"] * 2
+        error: RequestEvent = recorder.last("error")
+        assert error.error == "ReadTimeout" and error.status_code is None
+        assert error.attempt == 2 and error.network is not None
+
+    def test_hooks_are_off_by_default(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        client = sync_extend_client(_handler([httpx.Response(200, json=FILE_JSON)]))
+
+        response = client.files.with_raw_response.retrieve("file_123")
+
+        assert type(response._response) is httpx.Response
+
+
+class TestAsyncHooks:
+    async def test_phases_fire_in_order(self, async_extend_client: typing.Callable[..., AsyncExtend]) -> None:
+        recorder = _Recorder()
+        client = async_extend_client(_handler([httpx.Response(200, json=FILE_JSON)]), hooks=recorder.hooks())
+
+        await client.files.retrieve("file_123")
+
+        assert recorder.names() == ["start", "response", "decode", "constructed"]
+        assert recorder.last("constructed").model == "File"
+
+    async def test_transport_errors_fire_on_error(
+        self, async_http_client: typing.Callable[..., AsyncHttpClient]
+    ) -> None:
+        def refuse(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        recorder = _Recorder()
+        client = async_http_client(refuse, hooks=recorder.hooks(), retry_policy=RetryPolicy(max_retries=0))
+
+        with pytest.raises(httpx.ConnectError):
+            await client.request("files", method="GET")
+        with pytest.raises(httpx.ConnectError):
+            async with client.stream("events", method="GET"):
+                pass
+
+        assert recorder.names() == ["start", "error"] * 2
+        assert recorder.last("error").error == "ConnectError"
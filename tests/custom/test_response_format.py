@@ -0,0 +1,111 @@
+"""
+Tests: response_format="raw" / "bytes" return the response without a model.
+
+Successful responses are returned as decoded JSON or as the undecoded body,
+per client or per request; error responses still raise the typed errors, and
+the create_and_poll helpers still return models.
+"""
+
+import typing
+
+import httpx
+import pytest
+
+from extend_ai import AsyncExtend, Extend
+from extend_ai.errors import NotFoundError
+from extend_ai.types import File, ParseRun
+
+NOW = "2025-04-28T17:01:39.285Z"
+FILE_JSON = {"object": "file", "id": "file_123", "name": "invoice.pdf", "type": "PDF", "createdAt": NOW}
+PARSE_RUN_JSON = {
+    "object": "parse_run",
+    "id": "pr_123",
+    "file": FILE_JSON,
+    "status": "PROCESSED",
+    "config": {},
+    "output": {"chunks": []},
+}
+
+
+def _handler(responses: typing.List[httpx.Response]) -> typing.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    return handler
+
+
+class TestPerRequest:
+    def test_raw_returns_the_decoded_json(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        client = sync_extend_client(_handler([httpx.Response(200, json=FILE_JSON)]))
+
+        file = client.files.retrieve("file_123", request_options={"response_format": "raw"})
+
+        assert file == FILE_JSON
+
+    def test_bytes_returns_the_body_without_decoding(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        body = httpx.Response(200, json=FILE_JSON).content
+        client = sync_extend_client(_handler([httpx.Response(200, content=body)]))
+
+        file = client.files.retrieve("file_123", request_options={"response_format": "bytes"})
+
+        assert file == body
+        assert isinstance(file, bytes)
+
+    def test_model_is_the_default(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        client = sync_extend_client(_handler([httpx.Response(200, json=FILE_JSON)]))
+
+        assert isinstance(client.files.retrieve("file_123"), File)
+
+    def test_errors_are_still_typed(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        client = sync_extend_client(_handler([httpx.Response(404, json={"message": "not found"})]))
+
+        with pytest.raises(NotFoundError) as info:
+            client.files.retrieve("file_123", request_options={"response_format": "raw"})
+
+        assert info.value.body == {"message": "not found"}
+
+    def test_unknown_formats_are_rejected(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        client = sync_extend_client(_handler([httpx.Response(200, json=FILE_JSON)]))
+
+        with pytest.raises(ValueError, match="Unknown response_format"):
+            client.files.retrieve("file_123", request_options={"response_format": "xml"})  # type: ignore[typeddict-item]
+
+
+class TestPerClient:
+    def test_client_default_and_per_request_override(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        client = sync_extend_client(_handler([httpx.Response(200, json=FILE_JSON)]), response_format="raw")
+
+        assert client.files.retrieve("file_123") == FILE_JSON
+        assert isinstance(client.files.retrieve("file_123", request_options={"response_format": "model"}), File)
+
+    def test_works_with_a_json_codec(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        client = sync_extend_client(
+            _handler([httpx.Response(200, json=FILE_JSON)]), response_format="raw", json_codec="json"
+        )
+
+        assert client.files.retrieve("file_123") == FILE_JSON
+
+    def test_create_and_poll_still_returns_models(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        client = sync_extend_client(
+            _handler(
+                [
+                    httpx.Response(200, json={**PARSE_RUN_JSON, "status": "PROCESSING"}),
+                    httpx.Response(200, json=PARSE_RUN_JSON),
+                ]
+            ),
+            response_format="raw",
+        )
+
+        run = client.parse_runs.create_and_poll(file={"url": "https://example.com/a.pdf"})
+
+        assert isinstance(run, ParseRun)
+        assert run.status == "PROCESSED"
+
+    def test_unknown_client_formats_are_rejected(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        with pytest.raises(ValueError, match="Unknown response_format"):
+            sync_extend_client(_handler([httpx.Response(200)]), response_format="xml")
+
+    async def test_async_client(self, async_extend_client: typing.Callable[..., AsyncExtend]) -> None:
+        client = async_extend_client(lambda request: httpx.Response(200, json=FILE_JSON), response_format="raw")
+
+        assert await client.files.retrieve("file_123") == FILE_JSON
@@ -0,0 +1,148 @@
+"""
+Regression tests: RetryBudget in HttpClient / AsyncHttpClient.
+
+Without a budget every request retries independently, so a burst of 429s from
+a saturated API multiplies load by up to `1 + max_retries`. A shared budget
+caps retries at a fraction of successful requests.
+"""
+
+import threading
+import typing
+
+import httpx
+import pytest
+
+from extend_ai import AsyncExtend, Extend, RetryBudget, RetryPolicy
+from extend_ai.core.http_client import AsyncHttpClient, HttpClient
+
+NO_DELAY = RetryPolicy(initial_delay=0.0)
+
+
+def _always(status: int, calls: typing.List[httpx.Request]) -> typing.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(status)
+
+    return handler
+
+
+class TestRetryBudget:
+    def test_starts_full_and_denies_when_empty(self) -> None:
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+
+        assert budget.try_withdraw()
+        assert budget.try_withdraw()
+        assert not budget.try_withdraw()
+
+        snapshot = budget.snapshot()
+        assert (snapshot.granted, snapshot.denied, snapshot.tokens) == (2, 1, 0)
+
+    def test_successes_refill_up_to_capacity(self) -> None:
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+        budget.try_withdraw()
+        budget.try_withdraw()
+
+        budget.deposit()
+        assert not budget.try_withdraw()
+        budget.deposit()
+        assert budget.try_withdraw()
+
+        for _ in range(10):
+            budget.deposit()
+        assert budget.snapshot().tokens == 2
+        assert budget.snapshot().deposits == 12
+
+    def test_validates_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            RetryBudget(ratio=-1)
+        with pytest.raises(ValueError):
+            RetryBudget(max_tokens=0.5)
+
+    def test_thread_safe(self) -> None:
+        budget = RetryBudget(ratio=0, max_tokens=100)
+        granted: typing.List[bool] = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            for _ in range(50):
+                result = budget.try_withdraw()
+                with lock:
+                    granted.append(result)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert granted.count(True) == 100
+        assert budget.snapshot().denied == 300
+
+
+class TestHttpClientRetryBudget:
+    def test_budget_caps_retries_across_requests(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        calls: typing.List[httpx.Request] = []
+        budget = RetryBudget(ratio=0.1, max_tokens=3)
+        client = sync_http_client(_always(429, calls), retry_budget=budget, retry_policy=NO_DELAY)
+
+        for _ in range(5):
+            assert client.request("extract_runs", method="POST", json={}).status_code == 429
+
+        # 5 first attempts + the 3 retries the budget allowed
+        assert len(calls) == 8
+        assert budget.snapshot().granted == 3
+        assert budget.snapshot().denied == 4
+        assert client.retry_stats.snapshot().status_retries == {429: 3}
+
+    def test_successes_refill_budget(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        budget = RetryBudget(ratio=0.25, max_tokens=1)
+        budget.try_withdraw()
+        client = sync_http_client(_always(200, []), retry_budget=budget, retry_policy=NO_DELAY)
+
+        for _ in range(4):
+            client.request("files", method="GET")
+
+        assert budget.snapshot().tokens == 1
+        assert budget.snapshot().deposits == 4
+
+    def test_budget_denies_transport_retries(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        calls: typing.List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            raise httpx.ConnectError("refused")
+
+        budget = RetryBudget(max_tokens=1)
+        client = sync_http_client(handler, retry_budget=budget, retry_policy=NO_DELAY)
+
+        with pytest.raises(httpx.ConnectError):
+            client.request("files", method="GET")
+
+        assert len(calls) == 2
+        assert client.retry_stats.snapshot().transport_errors_raised == {"connect_error": 1}
+
+    async def test_async_client_shares_budget(
+        self,
+        sync_http_client: typing.Callable[..., HttpClient],
+        async_http_client: typing.Callable[..., AsyncHttpClient],
+    ) -> None:
+        budget = RetryBudget(max_tokens=1)
+        sync_client = sync_http_client(_always(503, []), retry_budget=budget, retry_policy=NO_DELAY)
+        async_calls: typing.List[httpx.Request] = []
+        async_client = async_http_client(_always(503, async_calls), retry_budget=budget, retry_policy=NO_DELAY)
+
+        sync_client.request("files", method="GET")
+        await async_client.request("files", method="GET")
+
+        assert len(async_calls) == 1
+        assert budget.snapshot().granted == 1
+
+
+def test_extend_clients_share_budget() -> None:
+    budget = RetryBudget()
+    client = Extend(token="test", retry_budget=budget)
+    async_client = AsyncExtend(token="test", retry_budget=budget)
+
+    assert client._client_wrapper.httpx_client.retry_budget is budget
+    assert async_client._client_wrapper.httpx_client.retry_budget is budget
+    assert Extend(token="test")._client_wrapper.httpx_client.retry_budget is None
@@ -0,0 +1,197 @@
+"""
+Regression tests: RetryPolicy in HttpClient / AsyncHttpClient.
+
+Retries used to be a recursive call inside `request()` configured only by
+`max_retries`, and `stream()` never retried. Both methods now run the same
+iterative loop driven by a RetryPolicy set on the client or per request.
+"""
+
+import typing
+
+import httpx
+import pytest
+
+from extend_ai import AsyncExtend, Extend, RetryAttempt, RetryPolicy
+from extend_ai.core.http_client import AsyncHttpClient, HttpClient
+
+NO_DELAY = RetryPolicy(initial_delay=0.0)
+
+
+def _status_handler(
+    statuses: typing.List[int], calls: typing.List[httpx.Request]
+) -> typing.Callable[[httpx.Request], httpx.Response]:
+    """Respond with each status in turn; the last one repeats."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        return httpx.Response(status, json={"status": status})
+
+    return handler
+
+
+class TestRetryPolicyRules:
+    def test_default_statuses(self) -> None:
+        policy = RetryPolicy()
+        for status in (408, 409, 429, 500, 503):
+            assert policy.should_retry_status("GET", status)
+        for status in (400, 401, 404, 422):
+            assert not policy.should_retry_status("GET", status)
+
+    def test_custom_statuses_replace_defaults(self) -> None:
+        policy = RetryPolicy(retry_statuses={503})
+        assert policy.should_retry_status("GET", 503)
+        assert not policy.should_retry_status("GET", 500)
+        assert not policy.should_retry_status("GET", 429)
+
+    def test_retry_methods_are_case_insensitive(self) -> None:
+        policy = RetryPolicy(retry_methods={"get"})
+        assert policy.should_retry_status("GET", 503)
+        assert not policy.should_retry_status("POST", 503)
+        assert not policy.should_retry_error("POST", httpx.ConnectError("refused"))
+
+
+class TestSyncRetryPolicy:
+    def test_loop_is_iterative(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        calls: typing.List[httpx.Request] = []
+        client = sync_http_client(
+            _status_handler([503], calls), retry_policy=RetryPolicy(max_retries=1500, initial_delay=0.0)
+        )
+
+        assert client.request("files", method="GET").status_code == 503
+        assert len(calls) == 1501
+
+    def test_method_rule(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        calls: typing.List[httpx.Request] = []
+        client = sync_http_client(
+            _status_handler([503, 200], calls), retry_policy=RetryPolicy(initial_delay=0.0, retry_methods={"GET"})
+        )
+
+        assert client.request("parse_runs", method="POST", json={}).status_code == 503
+        assert len(calls) == 1
+
+    def test_request_policy_overrides_client_policy(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        calls: typing.List[httpx.Request] = []
+        client = sync_http_client(
+            _status_handler([500, 200], calls), retry_policy=RetryPolicy(initial_delay=0.0, max_retries=0)
+        )
+
+        response = client.request("files", method="GET", request_options={"retry_policy": NO_DELAY})
+
+        assert response.status_code == 200
+        assert len(calls) == 2
+
+    def test_max_retries_request_option_overrides_policy(
+        self, sync_http_client: typing.Callable[..., HttpClient]
+    ) -> None:
+        calls: typing.List[httpx.Request] = []
+        client = sync_http_client(_status_handler([500], calls), retry_policy=NO_DELAY)
+
+        client.request("files", method="GET", request_options={"retry_policy": NO_DELAY, "max_retries": 4})
+
+        assert len(calls) == 5
+
+    def test_max_elapsed_stops_retrying(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        calls: typing.List[httpx.Request] = []
+        policy = RetryPolicy(initial_delay=10.0, jitter=0.0, max_elapsed=5.0)
+        client = sync_http_client(_status_handler([503, 200], calls), retry_policy=policy)
+
+        assert client.request("files", method="GET").status_code == 503
+        assert len(calls) == 1
+
+    def test_on_attempt_hook(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        attempts: typing.List[RetryAttempt] = []
+        policy = RetryPolicy(initial_delay=0.0, on_attempt=attempts.append)
+        client = sync_http_client(_status_handler([429, 200], []), retry_policy=policy)
+
+        client.request("files", method="GET")
+
+        assert [(a.attempt, a.status_code, a.will_retry) for a in attempts] == [(1, 429, True), (2, 200, False)]
+        assert attempts[0].method == "GET"
+        assert attempts[0].url == "https://api.example.com/files"
+        assert attempts[0].error is None
+
+    def test_on_attempt_hook_sees_transport_errors(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        attempts: typing.List[RetryAttempt] = []
+        errors: typing.List[Exception] = [httpx.ConnectError("refused")]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if errors:
+                raise errors.pop(0)
+            return httpx.Response(200)
+
+        client = sync_http_client(handler, retry_policy=RetryPolicy(initial_delay=0.0, on_attempt=attempts.append))
+        client.request("files", method="GET")
+
+        assert isinstance(attempts[0].error, httpx.ConnectError)
+        assert attempts[0].status_code is None
+        assert attempts[0].will_retry
+
+    def test_stream_retries_and_closes_retried_response(
+        self, sync_http_client: typing.Callable[..., HttpClient]
+    ) -> None:
+        calls: typing.List[httpx.Request] = []
+        client = sync_http_client(_status_handler([502, 200], calls), retry_policy=NO_DELAY)
+
+        with client.stream("files/file_1/content", method="GET") as response:
+            assert response.status_code == 200
+            assert response.read() == b'{"status":200}'
+
+        assert len(calls) == 2
+        assert client.retry_stats.snapshot().status_retries == {502: 1}
+
+    def test_stream_returns_final_failure(self, sync_http_client: typing.Callable[..., HttpClient]) -> None:
+        client = sync_http_client(
+            _status_handler([503], []), retry_policy=RetryPolicy(initial_delay=0.0, max_retries=1)
+        )
+
+        with client.stream("files/file_1/content", method="GET") as response:
+            assert response.status_code == 503
+
+
+class TestAsyncRetryPolicy:
+    async def test_request_uses_policy(self, async_http_client: typing.Callable[..., AsyncHttpClient]) -> None:
+        calls: typing.List[httpx.Request] = []
+        client = async_http_client(
+            _status_handler([500, 500, 500, 200], calls), retry_policy=RetryPolicy(initial_delay=0.0, max_retries=3)
+        )
+
+        assert (await client.request("files", method="GET")).status_code == 200
+        assert len(calls) == 4
+
+    async def test_stream_retries(self, async_http_client: typing.Callable[..., AsyncHttpClient]) -> None:
+        calls: typing.List[httpx.Request] = []
+        client = async_http_client(_status_handler([429, 200], calls), retry_policy=NO_DELAY)
+
+        async with client.stream("files/file_1/content", method="GET") as response:
+            assert response.status_code == 200
+            assert await response.aread() == b'{"status":200}'
+
+        assert len(calls) == 2
+
+
+class TestClientRetryPolicy:
+    def test_extend_sets_client_policy(self) -> None:
+        policy = RetryPolicy(max_retries=5)
+        client = Extend(token="test", retry_policy=policy)
+        assert client._client_wrapper.httpx_client.retry_policy is policy
+
+    def test_async_extend_sets_client_policy(self) -> None:
+        policy = RetryPolicy(max_retries=5)
+        client = AsyncExtend(token="test", retry_policy=policy)
+        assert client._client_wrapper.httpx_client.retry_policy is policy
+
+    def test_default_policy(self) -> None:
+        client = Extend(token="test")
+        assert client._client_wrapper.httpx_client.retry_policy == RetryPolicy()
+
+
+@pytest.mark.parametrize("status", [400, 404])
+def test_non_retryable_status_returns_immediately(
+    status: int, sync_http_client: typing.Callable[..., HttpClient]
+) -> None:
+    calls: typing.List[httpx.Request] = []
+    client = sync_http_client(_status_handler([status], calls), retry_policy=NO_DELAY)
+
+    assert client.request("files", method="GET").status_code == status
+    assert len(calls) == 1
@@ -0,0 +1,183 @@
+"""
+Regression tests: TokenProvider caching, single-flight refresh and 401 handling.
+
+Token callables used to be invoked on every request. A TokenProvider caches
+the token for its lifetime, shares one fetch between concurrent callers, and
+lets HttpClient refresh the token and resend once after a 401.
+"""
+
+import asyncio
+import threading
+import time
+import typing
+
+import httpx
+import pytest
+
+from extend_ai import AsyncExtend, Extend, TokenProvider
+
+
+class _CountingFetch:
+    def __init__(self, delay: float = 0.0, lifetime: typing.Optional[float] = None) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.lifetime = lifetime
+        self._lock = threading.Lock()
+
+    def __call__(self) -> typing.Union[str, typing.Tuple[str, float]]:
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls += 1
+            token = f"token-{self.calls}"
+        return (token, self.lifetime) if self.lifetime is not None else token
+
+
+class TestTokenProvider:
+    def test_caches_until_ttl(self) -> None:
+        fetch = _CountingFetch()
+        provider = TokenProvider(fetch, ttl=60)
+
+        assert [provider.get_token() for _ in range(5)] == ["token-1"] * 5
+        assert fetch.calls == 1
+
+    def test_source_lifetime_overrides_ttl(self) -> None:
+        fetch = _CountingFetch(lifetime=0.05)
+        provider = TokenProvider(fetch, ttl=3600, refresh_margin=0)
+
+        assert provider.get_token() == "token-1"
+        time.sleep(0.06)
+        assert provider.get_token() == "token-2"
+
+    def test_proactive_refresh_before_expiry(self) -> None:
+        fetch = _CountingFetch(lifetime=0.2)
+        provider = TokenProvider(fetch, refresh_margin=0.15)
+
+        assert provider.get_token() == "token-1"
+        time.sleep(0.12)  # past the refresh point, before expiry
+        assert provider.get_token() == "token-2"
+
+    def test_threads_share_one_fetch(self) -> None:
+        fetch = _CountingFetch(delay=0.05)
+        provider = TokenProvider(fetch)
+        results: typing.List[str] = []
+
+        threads = [threading.Thread(target=lambda: results.append(provider.get_token())) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert fetch.calls == 1
+        assert results == ["token-1"] * 10
+
+    def test_invalidate_only_affects_matching_token(self) -> None:
+        fetch = _CountingFetch()
+        provider = TokenProvider(fetch)
+        provider.get_token()
+
+        provider.invalidate("some-other-token")
+        assert provider.get_token() == "token-1"
+
+        provider.invalidate("token-1")
+        provider.invalidate("token-1")
+        assert provider.get_token() == "token-2"
+        assert fetch.calls == 2
+
+    def test_requires_a_fetch_function(self) -> None:
+        with pytest.raises(ValueError):
+            TokenProvider()
+
+    async def test_tasks_share_one_async_fetch(self) -> None:
+        calls = 0
+
+        async def async_fetch() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return f"async-{calls}"
+
+        provider = TokenProvider(async_fetch=async_fetch)
+        results = await asyncio.gather(*(provider.async_get_token() for _ in range(10)))
+
+        assert calls == 1
+        assert results == ["async-1"] * 10
+
+    async def test_async_uses_sync_fetch_in_worker_thread(self) -> None:
+        fetch = _CountingFetch(delay=0.02)
+        provider = TokenProvider(fetch)
+
+        results = await asyncio.gather(*(provider.async_get_token() for _ in range(5)))
+
+        assert results == ["token-1"] * 5
+        assert fetch.calls == 1
+
+    async def test_async_proactive_refresh_returns_current_token(self) -> None:
+        fetch = _CountingFetch(lifetime=0.2)
+        provider = TokenProvider(fetch, refresh_margin=0.15)
+        assert await provider.async_get_token() == "token-1"
+
+        await asyncio.sleep(0.12)
+        assert await provider.async_get_token() == "token-1"
+        await asyncio.sleep(0.05)
+        assert await provider.async_get_token() == "token-2"
+
+
+def _unauthorized_once(seen: typing.List[str]) -> typing.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(401 if len(seen) == 1 else 200, json={})
+
+    return handler
+
+
+class TestUnauthorizedRefresh:
+    def test_sync_client_refreshes_and_resends_once(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        seen: typing.List[str] = []
+        wrapper = sync_extend_client(_unauthorized_once(seen), token=TokenProvider(_CountingFetch()))._client_wrapper
+
+        response = wrapper.httpx_client.request("files", method="GET")
+
+        assert response.status_code == 200
+        assert seen == ["Bearer token-1", "Bearer token-2"]
+        assert wrapper.httpx_client.retry_stats.snapshot().status_retries == {}
+
+    def test_second_401_is_returned(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        seen: typing.List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(401, json={})
+
+        wrapper = sync_extend_client(handler, token=TokenProvider(_CountingFetch()))._client_wrapper
+
+        assert wrapper.httpx_client.request("files", method="GET").status_code == 401
+        assert len(seen) == 2
+
+    def test_static_token_401_is_not_resent(self, sync_extend_client: typing.Callable[..., Extend]) -> None:
+        seen: typing.List[str] = []
+        wrapper = sync_extend_client(_unauthorized_once(seen), token="sk_test")._client_wrapper
+
+        assert wrapper.httpx_client.request("files", method="GET").status_code == 401
+        assert len(seen) == 1
+
+    async def test_async_client_refreshes_and_resends_once(
+        self, async_extend_client: typing.Callable[..., AsyncExtend]
+    ) -> None:
+        seen: typing.List[str] = []
+        wrapper = async_extend_client(_unauthorized_once(seen), token=TokenProvider(_CountingFetch()))._client_wrapper
+
+        response = await wrapper.httpx_client.request("files", method="GET")
+
+        assert response.status_code == 200
+        assert seen == ["Bearer token-1", "Bearer token-2"]
+
+
+def test_extend_accepts_token_provider() -> None:
+    fetch = _CountingFetch()
+    provider = TokenProvider(fetch)
+    client = Extend(token=provider)
+    AsyncExtend(token=provider)
+
+    assert client._client_wrapper.get_headers()["Authorization"] == "Bearer token-1"
+    assert client._client_wrapper.get_headers()["Authorization"] == "Bearer token-1"
+    assert fetch.calls == 1
@@ -0,0 +1,117 @@
+"""Tests for the block tree and type indexes on ParseRunOutput."""
+
+from extend_ai import BlockIndex
+from extend_ai.core.unchecked_base_model import construct_type
+from extend_ai.types import ParseRunOutput
+
+
+def _block(block_id, block_type, page, **extra):
+    return {
+        "object": "block",
+        "id": block_id,
+        "type": block_type,
+        "content": block_id,
+        "details": {"type": "text_details"},
+        "metadata": {"page": {"number": page, "width": 612, "height": 792}} if page else {},
+        "polygon": [],
+        "boundingBox": {"left": 0, "top": 0, "right": 1, "bottom": 1},
+        **extra,
+    }
+
+
+def _chunk(page, blocks):
+    return {
+        "object": "chunk",
+        "type": "page",
+        "content": "",
+        "metadata": {"pageRange": {"start": page, "end": page}},
+        "blocks": blocks,
+    }
+
+
+OUTPUT = {
+    "chunks": [
+        _chunk(
+            1,
+            [
+                _block("heading", "section_heading", 1),
+                _block("paragraph", "text", 1, parentBlockId="heading"),
+                _block(
+                    "table",
+                    "table",
+                    1,
+                    parentBlockId="heading",
+                    children=[
+                        _block("cell_1", "table_cell", 1, parentBlockId="table"),
+                        _block("cell_2", "table_cell", 1, children=[_block("nested", "text", 1)]),
+                    ],
+                ),
+            ],
+        ),
+        _chunk(2, [_block("table_2", "table", 2), _block("footer", "footer", 2), _block("sheet", "text", None)]),
+        _chunk(3, [_block("footer", "footer", 3)]),
+    ]
+}
+READING_ORDER = ["heading", "paragraph", "table", "cell_1", "cell_2", "nested", "table_2", "footer", "sheet", "footer"]
+
+
+def _index():
+    return construct_type(type_=ParseRunOutput, object_=OUTPUT).index
+
+
+def _ids(blocks):
+    return [block.id for block in blocks]
+
+
+class TestBlockIndex:
+    def test_reading_order(self):
+        index = _index()
+
+        assert _ids(index) == READING_ORDER
+        assert len(index) == len(READING_ORDER)
+
+    def test_block_by_id(self):
+        index = _index()
+
+        assert index["cell_2"].type == "table_cell"
+        assert index.get("missing") is None
+        assert "nested" in index
+        assert index.get("footer") is next(block for block in index if block.id == "footer")
+
+    def test_children_by_parent_id_and_nesting(self):
+        index = _index()
+
+        assert _ids(index.children("heading")) == ["paragraph", "table"]
+        assert _ids(index.children(index["table"])) == ["cell_1", "cell_2"]
+        assert _ids(index.children("cell_2")) == ["nested"]
+        assert index.children("paragraph") == ()
+
+    def test_parent_and_descendants(self):
+        index = _index()
+
+        assert index.parent("nested").id == "cell_2"
+        assert index.parent("table").id == "heading"
+        assert index.parent("heading") is None
+        assert _ids(index.descendants("heading")) == ["paragraph", "table", "cell_1", "cell_2", "nested"]
+
+    def test_by_type_and_page(self):
+        index = _index()
+
+        assert _ids(index.of_type("table")) == ["table", "table_2"]
+        assert _ids(index.of_type("table", page=2)) == ["table_2"]
+        assert _ids(index.of_type("table", "footer")) == ["table", "table_2", "footer", "footer"]
+        assert _ids(index.on_page(1)) == READING_ORDER[:6]
+        assert index.on_page(9) == ()
+        assert index.pages == [1, 2, 3]
+        assert index.types[:3] == ["section_heading", "text", "table"]
+
+    def test_chunk_of_block(self):
+        index = _index()
+
+        assert index.chunk("table_2").metadata.page_range.start == 2
+        assert index.chunk("missing") is None
+
+    def test_built_directly_from_chunks(self):
+        output = construct_type(type_=ParseRunOutput, object_=OUTPUT)
+
+        assert _ids(BlockIndex(output.chunks)) == READING_ORDER
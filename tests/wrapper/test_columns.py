@@ -0,0 +1,166 @@
+"""Tests for the columnar views of OCR words and blocks."""
+
+import importlib.util
+import math
+
+import pytest
+
+from extend_ai import BlockColumns, OcrColumns
+from extend_ai.core.unchecked_base_model import construct_type
+from extend_ai.types import ParseRunOutput
+
+WORDS = [
+    {
+        "content": word,
+        "boundingBox": {"left": index * 0.1, "top": page * 0.01, "right": index * 0.1 + 0.05, "bottom": 0.5},
+        "confidence": confidence,
+        "pageNumber": page,
+    }
+    for index, (word, confidence, page) in enumerate(
+        [("Invoice", 0.99, 1), ("#", 0.4, 1), ("ünïcode", 0.8, 2), ("", 0.3, 2), ("Total", 0.95, 3)]
+    )
+]
+WORDS[3]["boundingBox"] = {"left": 0.2}
+
+
+def _block(block_id, block_type, page, points):
+    return {
+        "object": "block",
+        "id": block_id,
+        "type": block_type,
+        "content": f"{block_type} {block_id}",
+        "details": {"type": "text_details"},
+        "metadata": {"page": {"number": page, "width": 612, "height": 792}},
+        "polygon": [{"x": x, "y": y} for x, y in points],
+        "boundingBox": {"left": 0.1, "top": 0.2, "right": 0.3, "bottom": 0.4},
+    }
+
+
+OUTPUT = {
+    "chunks": [
+        {
+            "object": "chunk",
+            "type": "page",
+            "content": "",
+            "metadata": {"pageRange": {"start": page, "end": page}},
+            "blocks": blocks,
+        }
+        for page, blocks in [
+            (1, [_block("b1", "heading", 1, [(0, 0), (1, 0), (1, 1)]), _block("b2", "table", 1, [])]),
+            (2, [_block("b3", "text", 2, [(0.5, 0.5), (0.6, 0.6)])]),
+        ]
+    ],
+    "ocr": {"words": WORDS},
+}
+
+BACKENDS = [False] + ([True] if importlib.util.find_spec("numpy") else [])
+
+
+def _output():
+    return construct_type(type_=ParseRunOutput, object_=OUTPUT)
+
+
+def _floats(column):
+    return [float(value) for value in column]
+
+
+@pytest.mark.parametrize("numpy", BACKENDS)
+class TestOcrColumns:
+    def test_columns_match_the_words(self, numpy):
+        columns = _output().ocr.as_columns(numpy=numpy)
+
+        assert len(columns) == len(WORDS)
+        assert list(columns.content) == [word["content"] for word in WORDS]
+        assert columns.content.text == "Invoice#ünïcodeTotal"
+        assert _floats(columns.confidence) == [word["confidence"] for word in WORDS]
+        assert _floats(columns.page_number) == [1, 1, 2, 2, 3]
+        assert _floats(columns.left) == [0.0, 0.1, 0.2, 0.2, 0.4]
+        assert math.isnan(columns.top[3])
+        assert columns.numpy is numpy
+
+    def test_rows_round_trip(self, numpy):
+        output = _output()
+        columns = output.ocr.as_columns(numpy=numpy)
+
+        assert [columns[index] for index in range(len(columns))] == output.ocr.words
+        assert columns[-1].content == "Total"
+
+    def test_models_and_json_give_the_same_columns(self, numpy):
+        from_models = OcrColumns.from_words(_output().ocr.words, numpy=numpy)
+        from_json = OcrColumns.from_ocr(OUTPUT["ocr"], numpy=numpy)
+
+        assert list(from_models.content) == list(from_json.content)
+        assert _floats(from_models.left) == _floats(from_json.left)
+        assert math.isnan(from_models.right[3]) and math.isnan(from_json.right[3])
+
+    def test_low_confidence(self, numpy):
+        shaky = _output().ocr.as_columns(numpy=numpy).low_confidence(0.5)
+
+        assert list(shaky.content) == ["#", ""]
+        assert _floats(shaky.confidence) == [0.4, 0.3]
+
+    def test_on_page(self, numpy):
+        page = _output().ocr.as_columns(numpy=numpy).on_page(2)
+
+        assert list(page.content) == ["ünïcode", ""]
+        assert _floats(page.page_number) == [2, 2]
+
+    def test_filter_and_take(self, numpy):
+        columns = _output().ocr.as_columns(numpy=numpy)
+
+        assert list(columns.filter([True, False, False, False, True]).content) == ["Invoice", "Total"]
+        assert list(columns.take([4, 0]).content) == ["Total", "Invoice"]
+        assert len(columns.filter([False] * len(columns))) == 0
+
+    def test_missing_ocr_output_gives_empty_columns(self, numpy):
+        assert len(OcrColumns.from_ocr(None, numpy=numpy)) == 0
+        assert len(OcrColumns.from_ocr({"words": None}, numpy=numpy)) == 0
+
+
+@pytest.mark.parametrize("numpy", BACKENDS)
+class TestBlockColumns:
+    def test_columns_match_the_blocks(self, numpy):
+        columns = BlockColumns.from_output(_output(), numpy=numpy)
+
+        assert list(columns.id) == ["b1", "b2", "b3"]
+        assert columns.type == ["heading", "table", "text"]
+        assert columns.content[1] == "table b2"
+        assert _floats(columns.page_number) == [1, 1, 2]
+        assert _floats(columns.bottom) == [0.4] * 3
+        assert columns.polygon[0] == [(0, 0), (1, 0), (1, 1)]
+        assert columns.polygon[1] == []
+
+    def test_models_and_json_give_the_same_columns(self, numpy):
+        from_models = BlockColumns.from_output(_output(), numpy=numpy)
+        from_json = BlockColumns.from_output(OUTPUT, numpy=numpy)
+
+        assert list(from_models.id) == list(from_json.id)
+        assert [from_models.polygon[index] for index in range(3)] == [from_json.polygon[index] for index in range(3)]
+
+    def test_on_page_and_of_type(self, numpy):
+        columns = BlockColumns.from_output(_output(), numpy=numpy)
+
+        assert list(columns.on_page(1).id) == ["b1", "b2"]
+        assert list(columns.of_type("text", "heading").id) == ["b1", "b3"]
+
+    def test_take_keeps_polygons(self, numpy):
+        taken = BlockColumns.from_output(_output(), numpy=numpy).take([2, 0])
+
+        assert list(taken.id) == ["b3", "b1"]
+        assert taken.polygon[0] == [(0.5, 0.5), (0.6, 0.6)]
+        assert taken.polygon[1] == [(0, 0), (1, 0), (1, 1)]
+
+
+@pytest.mark.skipif(importlib.util.find_spec("numpy") is None, reason="needs NumPy")
+def test_numpy_masks():
+    columns = _output().ocr.as_columns(numpy=True)
+
+    wide = columns.filter((columns.right - columns.left) > 0.04)
+
+    assert list(wide.content) == ["Invoice", "#", "ünïcode", "Total"]
+
+
+@pytest.mark.skipif(importlib.util.find_spec("numpy") is not None, reason="NumPy is installed")
+def test_numpy_true_requires_numpy():
+    with pytest.raises(ImportError, match="NumPy"):
+        _output().ocr.as_columns(numpy=True)
@@ -0,0 +1,224 @@
+"""Tests for map() and as_completed() on the run resources."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from extend_ai import AsyncExtend, Extend, PollingOptions, RunResult
+from extend_ai.wrapper.fan_out import fan_out, fan_out_async
+
+RUN_RESOURCES = ["classify_runs", "edit_runs", "extract_runs", "parse_runs", "split_runs", "workflow_runs"]
+
+
+class FakeCreateAndPoll:
+    """Stands in for `create_and_poll`: sleeps `delay` seconds per input, fails inputs with `fail=True`."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+
+    def __call__(self, name, delay=0.0, fail=False, polling_options=None):
+        with self.lock:
+            self.calls.append((name, polling_options))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(delay)
+            if fail:
+                raise RuntimeError(f"{name} failed")
+            return f"run_{name}"
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class AsyncFakeCreateAndPoll(FakeCreateAndPoll):
+    async def __call__(self, name, delay=0.0, fail=False, polling_options=None):
+        self.calls.append((name, polling_options))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+            if fail:
+                raise RuntimeError(f"{name} failed")
+            return f"run_{name}"
+        finally:
+            self.in_flight -= 1
+
+
+class TestFanOut:
+    def test_ordered_yields_in_input_order(self):
+        fake = FakeCreateAndPoll()
+        inputs = [{"name": "a", "delay": 0.05}, {"name": "b"}, {"name": "c", "delay": 0.02}]
+
+        results = list(fan_out(fake, inputs, concurrency=3, polling_options=None, ordered=True))
+
+        assert [result.index for result in results] == [0, 1, 2]
+        assert [result.run for result in results] == ["run_a", "run_b", "run_c"]
+        assert results[0].input == inputs[0]
+
+    def test_unordered_yields_in_completion_order(self):
+        fake = FakeCreateAndPoll()
+        inputs = [{"name": "slow", "delay": 0.2}, {"name": "fast"}]
+
+        results = list(fan_out(fake, inputs, concurrency=2, polling_options=None, ordered=False))
+
+        assert [result.run for result in results] == ["run_fast", "run_slow"]
+
+    def test_captures_errors_per_input(self):
+        fake = FakeCreateAndPoll()
+        inputs = [{"name": "a"}, {"name": "b", "fail": True}, {"name": "c"}]
+
+        results = list(fan_out(fake, inputs, concurrency=2, polling_options=None, ordered=True))
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert isinstance(results[1].error, RuntimeError)
+        assert results[1].run is None
+        assert results[2].result() == "run_c"
+        with pytest.raises(RuntimeError, match="b failed"):
+            results[1].result()
+
+    def test_bounds_runs_in_flight(self):
+        fake = FakeCreateAndPoll()
+        inputs = [{"name": str(n), "delay": 0.01} for n in range(20)]
+
+        results = list(fan_out(fake, inputs, concurrency=4, polling_options=None, ordered=False))
+
+        assert len(results) == 20
+        assert fake.max_in_flight <= 4
+
+    def test_reads_inputs_only_as_slots_free_up(self):
+        fake = FakeCreateAndPoll()
+        read = []
+
+        def inputs():
+            for n in range(100):
+                read.append(n)
+                yield {"name": str(n)}
+
+        results = fan_out(fake, inputs(), concurrency=3, polling_options=None, ordered=True)
+        assert read == []  # nothing is read until iteration starts
+
+        next(results)
+        assert 3 <= len(read) <= 6  # 3 running, and at most 3 finished results held back for ordering
+        seen = len(read)
+        results.close()
+        assert len(read) == seen
+
+    def test_a_slow_run_does_not_stall_the_other_slots(self):
+        released = threading.Event()
+
+        def create_and_poll(name, polling_options=None):
+            if name == "head":
+                assert released.wait(timeout=5)
+            elif name == "3":
+                released.set()
+            return f"run_{name}"
+
+        inputs = [{"name": "head"}] + [{"name": str(n)} for n in range(1, 6)]
+
+        results = list(fan_out(create_and_poll, inputs, concurrency=2, polling_options=None, ordered=True))
+
+        assert [result.error for result in results] == [None] * 6
+        assert [result.run for result in results] == ["run_head", "run_1", "run_2", "run_3", "run_4", "run_5"]
+
+    def test_polling_options_apply_unless_the_input_sets_its_own(self):
+        fake = FakeCreateAndPoll()
+        shared = PollingOptions(max_wait_ms=1000)
+        own = PollingOptions(max_wait_ms=5)
+        inputs = [{"name": "a"}, {"name": "b", "polling_options": own}]
+
+        list(fan_out(fake, inputs, concurrency=1, polling_options=shared, ordered=True))
+
+        assert fake.calls == [("a", shared), ("b", own)]
+
+    def test_rejects_concurrency_below_one(self):
+        with pytest.raises(ValueError, match="concurrency"):
+            fan_out(FakeCreateAndPoll(), [], concurrency=0, polling_options=None, ordered=True)
+
+
+class TestFanOutAsync:
+    async def test_ordered_and_unordered(self):
+        inputs = [{"name": "slow", "delay": 0.05}, {"name": "fast"}]
+
+        ordered = [r.run async for r in fan_out_async(AsyncFakeCreateAndPoll(), inputs, **_options(ordered=True))]
+        unordered = [r.run async for r in fan_out_async(AsyncFakeCreateAndPoll(), inputs, **_options(ordered=False))]
+
+        assert ordered == ["run_slow", "run_fast"]
+        assert unordered == ["run_fast", "run_slow"]
+
+    async def test_accepts_async_iterables_with_backpressure(self):
+        fake = AsyncFakeCreateAndPoll()
+        read = []
+
+        async def inputs():
+            for n in range(50):
+                read.append(n)
+                yield {"name": str(n), "delay": 0.001, "fail": n == 7}
+
+        results = [result async for result in fan_out_async(fake, inputs(), **_options(concurrency=5))]
+
+        assert [result.index for result in results] == list(range(50))
+        assert [result.ok for result in results].count(False) == 1
+        assert isinstance(results[7].error, RuntimeError)
+        assert fake.max_in_flight <= 5
+        assert len(read) == 50
+
+    async def test_a_slow_run_does_not_stall_the_other_slots(self):
+        released = asyncio.Event()
+
+        async def create_and_poll(name, polling_options=None):
+            if name == "head":
+                await asyncio.wait_for(released.wait(), timeout=5)
+            elif name == "3":
+                released.set()
+            return f"run_{name}"
+
+        inputs = [{"name": "head"}] + [{"name": str(n)} for n in range(1, 6)]
+
+        results = [result async for result in fan_out_async(create_and_poll, inputs, **_options(concurrency=2))]
+
+        assert [result.error for result in results] == [None] * 6
+        assert [result.run for result in results] == ["run_head", "run_1", "run_2", "run_3", "run_4", "run_5"]
+
+    async def test_rejects_concurrency_below_one(self):
+        with pytest.raises(ValueError, match="concurrency"):
+            fan_out_async(AsyncFakeCreateAndPoll(), [], concurrency=0, polling_options=None, ordered=True)
+
+
+def _options(concurrency=2, ordered=True):
+    return {"concurrency": concurrency, "polling_options": None, "ordered": ordered}
+
+
+class TestRunResources:
+    @pytest.mark.parametrize("resource", RUN_RESOURCES)
+    def test_every_run_resource_has_map_and_as_completed(self, resource):
+        for client in (Extend(token="secret"), AsyncExtend(token="secret")):
+            runs = getattr(client, resource)
+            assert callable(runs.map)
+            assert callable(runs.as_completed)
+
+    def test_map_runs_create_and_poll(self, monkeypatch):
+        runs = Extend(token="secret").split_runs
+        monkeypatch.setattr(runs, "create_and_poll", lambda **kwargs: kwargs["file"]["id"])
+
+        results = list(runs.map([{"file": {"id": "file_1"}}, {"file": {"id": "file_2"}}], concurrency=2))
+
+        assert all(isinstance(result, RunResult) for result in results)
+        assert [result.run for result in results] == ["file_1", "file_2"]
+
+    async def test_async_as_completed_runs_create_and_poll(self, monkeypatch):
+        runs = AsyncExtend(token="secret").extract_runs
+
+        async def create_and_poll(**kwargs):
+            return kwargs["file"]["id"]
+
+        monkeypatch.setattr(runs, "create_and_poll", create_and_poll)
+
+        results = [result async for result in runs.as_completed([{"file": {"id": "file_1"}}])]
+
+        assert [result.run for result in results] == ["file_1"]
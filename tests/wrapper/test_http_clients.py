@@ -0,0 +1,97 @@
+"""Tests for connection-pool options on Extend/AsyncExtend and the httpx client factories."""
+
+import importlib.util
+
+import httpx
+import pytest
+
+from extend_ai import AsyncExtend, Extend, create_async_httpx_client, create_httpx_client
+
+
+def _pool(client):
+    """The httpcore connection pool behind an httpx client."""
+    return client._transport._pool
+
+
+class TestFactories:
+    """create_httpx_client / create_async_httpx_client apply the SDK's pool defaults."""
+
+    def test_defaults(self):
+        client = create_httpx_client()
+
+        pool = _pool(client)
+        assert pool._max_connections == 200
+        assert pool._max_keepalive_connections == 100
+        assert pool._keepalive_expiry == 30.0
+        assert client.timeout.read == 300.0
+        assert client.follow_redirects is True
+
+    def test_overrides(self):
+        client = create_async_httpx_client(
+            timeout=10, follow_redirects=False, max_connections=50, max_keepalive_connections=5, keepalive_expiry=1
+        )
+
+        pool = _pool(client)
+        assert pool._max_connections == 50
+        assert pool._max_keepalive_connections == 5
+        assert pool._keepalive_expiry == 1
+        assert client.timeout.read == 10
+        assert client.follow_redirects is False
+
+    @pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 is installed")
+    def test_http2_without_h2_raises_helpful_error(self):
+        with pytest.raises(ImportError, match="httpx\\[http2\\]"):
+            create_httpx_client(http2=True)
+
+
+@pytest.mark.parametrize("client_cls", [Extend, AsyncExtend])
+class TestClientPoolOptions:
+    """Pool options are passed through when the SDK builds the httpx client."""
+
+    def test_default_client_uses_sdk_pool(self, client_cls):
+        client = client_cls(token="test")
+
+        httpx_client = client._client_wrapper.httpx_client.httpx_client
+        assert _pool(httpx_client)._max_keepalive_connections == 100
+        assert client._client_wrapper.get_timeout() == 300
+
+    def test_pool_options_and_timeout(self, client_cls):
+        client = client_cls(token="test", timeout=12, max_connections=400, keepalive_expiry=60)
+
+        httpx_client = client._client_wrapper.httpx_client.httpx_client
+        assert _pool(httpx_client)._max_connections == 400
+        assert _pool(httpx_client)._keepalive_expiry == 60
+        assert httpx_client.timeout.read == 12
+        assert client._client_wrapper.get_timeout() == 12
+
+    def test_pool_options_rejected_with_custom_client(self, client_cls):
+        custom = httpx.Client() if client_cls is Extend else httpx.AsyncClient()
+
+        with pytest.raises(ValueError, match="max_connections"):
+            client_cls(token="test", httpx_client=custom, max_connections=10)
+
+    @pytest.mark.parametrize("option", ["max_connections", "max_keepalive_connections", "keepalive_expiry"])
+    def test_zero_pool_options_rejected_with_custom_client(self, client_cls, option):
+        custom = httpx.Client() if client_cls is Extend else httpx.AsyncClient()
+
+        with pytest.raises(ValueError, match=option):
+            client_cls(token="test", httpx_client=custom, **{option: 0})
+
+    def test_http2_rejected_with_custom_client(self, client_cls):
+        custom = httpx.Client() if client_cls is Extend else httpx.AsyncClient()
+
+        with pytest.raises(ValueError, match="http2"):
+            client_cls(token="test", httpx_client=custom, http2=True)
+
+
+def test_clients_can_share_one_pool():
+    """Several Extend instances built on one httpx client reuse its connections."""
+    shared = create_httpx_client(max_connections=10)
+
+    first = Extend(token="workspace-a", httpx_client=shared)
+    second = Extend(token="workspace-b", httpx_client=shared)
+
+    assert first._client_wrapper.httpx_client.httpx_client is shared
+    assert second._client_wrapper.httpx_client.httpx_client is shared
+    assert first._client_wrapper.get_headers()["Authorization"] == "Bearer workspace-a"
+    assert second._client_wrapper.get_headers()["Authorization"] == "Bearer workspace-b"
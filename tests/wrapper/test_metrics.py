@@ -0,0 +1,166 @@
+"""Tests for MetricsRegistry and the client `metrics=` option."""
+
+import httpx
+import pytest
+
+from extend_ai import AsyncExtend, Extend, MetricsRegistry, RequestHooks
+from extend_ai.core import http_client as http_client_module
+from extend_ai.core.api_error import ApiError
+from extend_ai.wrapper.metrics import LatencyHistogram, render_prometheus
+
+FILE_JSON = {"object": "file", "id": "file_123", "name": "invoice.pdf", "type": "PDF"}
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    monkeypatch.setattr(http_client_module, "_retry_timeout", lambda *args, **kwargs: 0.0)
+
+
+def _transport(*statuses):
+    """Answer with each status in turn, repeating the last one."""
+    remaining = list(statuses)
+
+    def handler(request):
+        status = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        return httpx.Response(status, json=FILE_JSON)
+
+    return httpx.MockTransport(handler)
+
+
+class TestLatencyHistogram:
+    """Percentiles stay within the histogram's relative error."""
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000)
+
+        summary = histogram.summary()
+
+        assert summary.count == 1000
+        assert summary.min == 0.001 and summary.max == 1.0
+        assert summary.p50 == pytest.approx(0.5, rel=0.035)
+        assert summary.p95 == pytest.approx(0.95, rel=0.035)
+        assert summary.p99 == pytest.approx(0.99, rel=0.035)
+        assert summary.mean == pytest.approx(0.5005)
+
+    def test_empty(self):
+        summary = LatencyHistogram().summary()
+
+        assert summary.count == 0
+        assert summary.p50 is None and summary.mean is None
+
+
+class TestClientMetrics:
+    """Extend(metrics=...) records per-operation metrics from the request hooks."""
+
+    def test_disabled_by_default(self):
+        client = Extend(token="secret", httpx_client=httpx.Client(transport=_transport(200)))
+
+        assert client.metrics is None
+
+    def test_records_per_operation(self):
+        client = Extend(token="secret", httpx_client=httpx.Client(transport=_transport(200)), metrics=True)
+
+        client.files.retrieve("file_123")
+        client.files.retrieve("file_456")
+        client.files.list()
+
+        operations = client.metrics.snapshot().operations
+        assert set(operations) == {"GET files/{id}", "GET files"}
+        retrieve = operations["GET files/{id}"]
+        assert retrieve.requests == 2
+        assert retrieve.retries == 0
+        assert retrieve.status_codes == {200: 2}
+        assert retrieve.bytes_received == 2 * len(httpx.Response(200, json=FILE_JSON).content)
+        assert retrieve.latency.count == 2
+        assert retrieve.latency.p99 is not None
+
+    def test_counts_retries_and_statuses(self):
+        client = Extend(token="secret", httpx_client=httpx.Client(transport=_transport(503, 200)), metrics=True)
+
+        client.files.retrieve("file_123")
+
+        retrieve = client.metrics.snapshot().operations["GET files/{id}"]
+        assert retrieve.requests == 2
+        assert retrieve.retries == 1
+        assert retrieve.status_codes == {503: 1, 200: 1}
+
+    def test_counts_transport_errors_with_their_latency(self, monkeypatch):
+        monkeypatch.setattr(http_client_module, "_backoff_timeout", lambda *args, **kwargs: 0.0)
+
+        def timeout(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        client = Extend(token="secret", httpx_client=httpx.Client(transport=httpx.MockTransport(timeout)), metrics=True)
+
+        with pytest.raises(httpx.ReadTimeout):
+            client.files.retrieve("file_123")
+
+        retrieve = client.metrics.snapshot().operations["GET files/{id}"]
+        assert retrieve.requests == 3
+        assert retrieve.retries == 2
+        assert retrieve.status_codes == {}
+        assert retrieve.errors == {"ReadTimeout": 3}
+        assert retrieve.latency.count == 3
+        assert 'extend_requests_total{operation="GET files/{id}",status="error"} 3' in client.metrics.to_prometheus()
+
+    async def test_shared_registry_aggregates_sync_and_async_clients(self):
+        metrics = MetricsRegistry()
+        client = Extend(token="secret", httpx_client=httpx.Client(transport=_transport(200)), metrics=metrics)
+        async_client = AsyncExtend(
+            token="secret", httpx_client=httpx.AsyncClient(transport=_transport(200)), metrics=metrics
+        )
+
+        client.files.retrieve("file_123")
+        await async_client.files.retrieve("file_123")
+
+        assert client.metrics is async_client.metrics is metrics
+        assert metrics.snapshot().operations["GET files/{id}"].requests == 2
+
+    def test_user_hooks_still_fire(self):
+        seen = []
+        client = Extend(
+            token="secret",
+            httpx_client=httpx.Client(transport=_transport(200)),
+            hooks=RequestHooks(on_response=lambda event: seen.append(event.operation)),
+            metrics=True,
+        )
+
+        client.files.retrieve("file_123")
+
+        assert seen == ["GET files/{id}"]
+        assert client.metrics.snapshot().operations["GET files/{id}"].requests == 1
+
+    def test_reset(self):
+        client = Extend(token="secret", httpx_client=httpx.Client(transport=_transport(200)), metrics=True)
+        client.files.retrieve("file_123")
+
+        client.metrics.reset()
+
+        assert client.metrics.snapshot().operations == {}
+
+
+class TestPrometheus:
+    """The text exporter follows the Prometheus exposition format."""
+
+    def test_render(self):
+        client = Extend(token="secret", httpx_client=httpx.Client(transport=_transport(404)), metrics=True)
+        with pytest.raises(ApiError):
+            client.files.retrieve("file_123")
+
+        text = client.metrics.to_prometheus()
+
+        assert "# TYPE extend_requests_total counter" in text
+        assert 'extend_requests_total{operation="GET files/{id}",status="404"} 1' in text
+        assert 'extend_retries_total{operation="GET files/{id}"} 0' in text
+        assert "# TYPE extend_request_duration_seconds summary" in text
+        assert 'extend_request_duration_seconds{operation="GET files/{id}",quantile="0.99"}' in text
+        assert 'extend_request_duration_seconds_count{operation="GET files/{id}"} 1' in text
+        assert text.endswith("\n")
+
+    def test_prefix_and_empty_registry(self):
+        text = render_prometheus(MetricsRegistry().snapshot(), prefix="myapp_extend")
+
+        assert "# TYPE myapp_extend_requests_total counter" in text
+        assert "operation=" not in text
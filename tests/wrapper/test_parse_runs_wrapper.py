@@ -108,3 +108,25 @@ class TestParseRunsClientCreateAndPoll:
                     jitter_fraction=0,
                 ),
             )
+
+    def test_status_only_polls_without_output_then_fetches_once(self):
+        """Should check status with response_type="url" and raw JSON, then retrieve the full run once."""
+        from extend_ai.parse_runs.types.parse_runs_retrieve_request_response_type import (
+            ParseRunsRetrieveRequestResponseType,
+        )
+        from extend_ai.wrapper.polling import MODEL_RESPONSE, STATUS_RESPONSE
+
+        full_run = create_mock_retrieve_response("PROCESSED")
+        self.wrapper.create.return_value = create_mock_create_response("PROCESSING")
+        self.wrapper.retrieve.side_effect = [{"status": "PROCESSING"}, {"status": "PROCESSED"}, full_run]
+
+        result = self.wrapper.create_and_poll(
+            file=MagicMock(),
+            polling_options=PollingOptions(status_only=True, fast_poll_interval_ms=1, jitter_fraction=0),
+        )
+
+        assert result is full_run
+        checks = self.wrapper.retrieve.call_args_list[:2]
+        assert all(call.kwargs["response_type"] == ParseRunsRetrieveRequestResponseType.URL for call in checks)
+        assert all(call.kwargs["request_options"] == STATUS_RESPONSE for call in checks)
+        assert self.wrapper.retrieve.call_args_list[2].kwargs == {"request_options": MODEL_RESPONSE}
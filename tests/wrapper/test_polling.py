@@ -5,11 +5,19 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from extend_ai.core.unchecked_base_model import construct_type
+from extend_ai.types import ExtractRun, ParseRun, WorkflowRun
 from extend_ai.wrapper.polling import (
+    MODEL_RESPONSE,
+    STATUS_RESPONSE,
+    AdaptivePolling,
     calculate_backoff_delay,
     calculate_hybrid_delay,
+    poll_run_until_done,
+    poll_run_until_done_async,
     poll_until_done,
     poll_until_done_async,
+    polling_key,
     HybridDelayOptions,
     PollingOptions,
     PollingTimeoutError,
@@ -546,6 +554,324 @@ class TestPollUntilDoneAsync:
         assert result["done"] is True
 
 
+# ============================================================================
+# poll_run_until_done tests
+# ============================================================================
+
+FAST = dict(fast_poll_interval_ms=1, jitter_fraction=0, max_wait_ms=5000)
+
+
+def _is_terminal_status(status):
+    return status not in ("PROCESSING", "PENDING", "CANCELLING")
+
+
+def _run_json(status):
+    return {"object": "extract_run", "id": "exr_1", "status": status, "output": {"value": {"total": 1}}}
+
+
+class TestPollRunUntilDone:
+    """Tests for poll_run_until_done function."""
+
+    def test_polls_with_models_by_default(self):
+        """Should retrieve the full run on every poll unless status_only is set."""
+        runs = [MagicMock(status="PROCESSING"), MagicMock(status="PROCESSED")]
+        retrieve = MagicMock(side_effect=runs)
+
+        result = poll_run_until_done(retrieve, ExtractRun, _is_terminal_status, PollingOptions(**FAST))
+
+        assert result is runs[1]
+        assert [call.args for call in retrieve.call_args_list] == [(MODEL_RESPONSE,), (MODEL_RESPONSE,)]
+
+    def test_status_only_builds_the_run_from_the_last_poll(self):
+        """Should poll raw JSON and build the run once, without another request."""
+        retrieve = MagicMock(side_effect=[_run_json("PENDING"), _run_json("PROCESSING"), _run_json("PROCESSED")])
+
+        result = poll_run_until_done(
+            retrieve, ExtractRun, _is_terminal_status, PollingOptions(status_only=True, **FAST)
+        )
+
+        assert isinstance(result, ExtractRun)
+        assert result.status == "PROCESSED"
+        assert result.output.value == {"total": 1}
+        assert [call.args for call in retrieve.call_args_list] == [(STATUS_RESPONSE,)] * 3
+
+    def test_status_only_fetches_once_when_status_checks_leave_the_run_out(self):
+        """Should poll check_status, then retrieve the full run exactly once."""
+        run = MagicMock(status="PROCESSED")
+        retrieve = MagicMock(return_value=run)
+        check_status = MagicMock(side_effect=[{"status": "PROCESSING"}, {"status": "FAILED"}])
+
+        result = poll_run_until_done(
+            retrieve,
+            ExtractRun,
+            _is_terminal_status,
+            PollingOptions(status_only=True, **FAST),
+            check_status=check_status,
+        )
+
+        assert result is run
+        assert check_status.call_count == 2
+        retrieve.assert_called_once_with(MODEL_RESPONSE)
+
+    def test_status_only_times_out(self):
+        """Should raise PollingTimeoutError without fetching the run."""
+        retrieve = MagicMock(return_value=_run_json("PROCESSING"))
+
+        with pytest.raises(PollingTimeoutError):
+            poll_run_until_done(
+                retrieve,
+                ExtractRun,
+                _is_terminal_status,
+                PollingOptions(status_only=True, fast_poll_interval_ms=1, max_wait_ms=20),
+            )
+        assert all(call.args == (STATUS_RESPONSE,) for call in retrieve.call_args_list)
+
+
+class TestPollRunUntilDoneAsync:
+    """Tests for poll_run_until_done_async function."""
+
+    async def test_status_only(self):
+        """Should poll raw JSON and build the run once."""
+        bodies = iter([_run_json("PROCESSING"), _run_json("PROCESSED")])
+        calls = []
+
+        async def retrieve(request_options):
+            calls.append(request_options)
+            return next(bodies)
+
+        result = await poll_run_until_done_async(
+            retrieve, ExtractRun, _is_terminal_status, PollingOptions(status_only=True, **FAST)
+        )
+
+        assert result.status == "PROCESSED"
+        assert calls == [STATUS_RESPONSE, STATUS_RESPONSE]
+
+    async def test_status_only_with_check_status(self):
+        """Should fetch the full run once after check_status reports completion."""
+        calls = []
+
+        async def retrieve(request_options):
+            calls.append(request_options)
+            return "full run"
+
+        async def check_status():
+            return {"status": "PROCESSED"}
+
+        result = await poll_run_until_done_async(
+            retrieve,
+            ExtractRun,
+            _is_terminal_status,
+            PollingOptions(status_only=True, **FAST),
+            check_status=check_status,
+        )
+
+        assert result == "full run"
+        assert calls == [MODEL_RESPONSE]
+
+
+class FakeClock:
+    """Stands in for the `time` module: sleeping advances `now` instead of waiting."""
+
+    def __init__(self):
+        self.now = 1_000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds * 1000)
+        self.now += seconds
+
+
+def _poll_run_finishing_at(clock, finish_ms, options, key):
+    """Polls a run that finishes `finish_ms` after polling starts; returns the times it was polled at."""
+    start = clock.now
+    polled_at = []
+
+    def retrieve():
+        polled_at.append(round((clock.now - start) * 1000))
+        return (clock.now - start) * 1000 >= finish_ms
+
+    with patch("extend_ai.wrapper.polling.time", clock):
+        poll_until_done(retrieve, lambda done: done, options, key=key)
+    return polled_at
+
+
+class TestAdaptivePolling:
+    """Tests for AdaptivePolling."""
+
+    def test_schedule_is_empty_until_enough_samples(self):
+        """Should leave runs on the fixed schedule until a key has min_samples processing times."""
+        adaptive = AdaptivePolling(min_samples=3)
+        adaptive.observe("extract_run:ex_1", 40_000)
+        adaptive.observe("extract_run:ex_1", 50_000)
+
+        assert adaptive.schedule("extract_run:ex_1", max_delay_ms=30_000) == []
+        assert adaptive.schedule("extract_run:ex_2", max_delay_ms=30_000) == []
+
+    def test_schedule_polls_at_evenly_spaced_quantiles(self):
+        """Should poll at the 1/n, 2/n, ... quantiles of the window, up to its slowest run."""
+        adaptive = AdaptivePolling(polls_per_run=4)
+        for seconds in range(1, 9):
+            adaptive.observe("parse_run", seconds * 1000)
+
+        assert adaptive.schedule("parse_run", max_delay_ms=30_000) == [2000, 4000, 6000, 8000]
+
+    def test_schedule_respects_min_interval_and_max_delay(self):
+        """Should drop polls closer than min_interval_ms and fill gaps longer than max_delay_ms."""
+        adaptive = AdaptivePolling(polls_per_run=4, min_interval_ms=500)
+        for duration in (1000, 1100, 1200, 1300, 1400, 1500, 1600, 9000):
+            adaptive.observe("split_run:spl_1", duration)
+
+        assert adaptive.schedule("split_run:spl_1", max_delay_ms=3000) == [1100, 4100, 7100, 9000]
+
+    def test_window_forgets_old_samples(self):
+        """Should only keep the last `window` processing times of a key."""
+        adaptive = AdaptivePolling(window=3)
+        for duration in (100_000, 1_000, 1_000, 1_000):
+            adaptive.observe("parse_run", duration)
+
+        assert adaptive.snapshot()["parse_run"].p90_ms == 1_000
+
+    def test_learns_from_runs_polled_on_the_fixed_schedule(self):
+        """Should record processing time, wasted polls and detection lag of runs polled without a schedule."""
+        clock = FakeClock()
+        adaptive = AdaptivePolling()
+        options = PollingOptions(adaptive=adaptive, jitter_fraction=0)
+
+        polled_at = _poll_run_finishing_at(clock, 2500, options, key="parse_run")
+
+        assert polled_at == [0, 1000, 2000, 3000]
+        stats = adaptive.snapshot()["parse_run"]
+        assert stats.runs == 1
+        assert stats.polls == 4
+        assert stats.wasted_polls == 3
+        assert stats.mean_detection_lag_ms == 500
+        assert stats.p50_ms == 2500
+
+    def test_polls_around_the_predicted_completion(self):
+        """Should wait for the first quantile before polling, then poll at the next ones."""
+        clock = FakeClock()
+        adaptive = AdaptivePolling(polls_per_run=5)
+        for duration in (40_000, 42_000, 45_000, 47_000, 50_000):
+            adaptive.observe("extract_run:ex_1", duration)
+        options = PollingOptions(adaptive=adaptive, jitter_fraction=0)
+
+        polled_at = _poll_run_finishing_at(clock, 44_000, options, key="extract_run:ex_1")
+
+        assert polled_at == [40_000, 42_000, 45_000]
+        assert adaptive.snapshot()["extract_run:ex_1"].wasted_polls == 2
+
+    def test_a_run_finished_at_the_first_poll_records_an_upper_bound(self):
+        """Should keep the first poll's time, not half of it, when no poll saw the run processing."""
+        clock = FakeClock()
+        adaptive = AdaptivePolling(polls_per_run=5)
+        for duration in (40_000, 42_000, 45_000, 47_000, 50_000):
+            adaptive.observe("extract_run:ex_1", duration)
+        options = PollingOptions(adaptive=adaptive, jitter_fraction=0)
+
+        polled_at = _poll_run_finishing_at(clock, 30_000, options, key="extract_run:ex_1")
+
+        assert polled_at == [40_000]
+        assert adaptive.snapshot()["extract_run:ex_1"].wasted_polls == 0
+        # The new sample is 40 s, so the earliest poll of the next run does not move earlier.
+        assert adaptive.schedule("extract_run:ex_1", max_delay_ms=30_000)[0] == 40_000
+
+    def test_falls_back_to_the_fixed_schedule_after_the_slowest_run(self):
+        """Should poll a run that outlasts every observed one on the fixed schedule."""
+        clock = FakeClock()
+        adaptive = AdaptivePolling(polls_per_run=1)
+        for _ in range(5):
+            adaptive.observe("parse_run", 1000)
+        options = PollingOptions(adaptive=adaptive, jitter_fraction=0)
+
+        polled_at = _poll_run_finishing_at(clock, 3000, options, key="parse_run")
+
+        assert polled_at == [1000, 2000, 3000]
+
+    def test_without_a_key_uses_the_fixed_schedule(self):
+        """Should neither schedule nor record polls that have no key."""
+        clock = FakeClock()
+        adaptive = AdaptivePolling()
+        options = PollingOptions(adaptive=adaptive, jitter_fraction=0)
+
+        polled_at = _poll_run_finishing_at(clock, 1500, options, key=None)
+
+        assert polled_at == [0, 1000, 2000]
+        assert adaptive.snapshot() == {}
+
+    def test_first_delay_respects_max_wait(self):
+        """Should not wait past max_wait_ms for the first adaptive poll."""
+        clock = FakeClock()
+        adaptive = AdaptivePolling(min_samples=1)
+        adaptive.observe("parse_run", 60_000)
+        options = PollingOptions(adaptive=adaptive, max_wait_ms=5_000)
+
+        with pytest.raises(PollingTimeoutError):
+            _poll_run_finishing_at(clock, 60_000, options, key="parse_run")
+        assert clock.sleeps == [5_000]
+
+    async def test_async_records_polls(self):
+        """Should schedule and record polls made by poll_until_done_async."""
+        adaptive = AdaptivePolling(min_samples=1)
+        adaptive.observe("parse_run", 10)
+        results = iter([False, True])
+
+        async def retrieve():
+            return next(results)
+
+        await poll_until_done_async(
+            retrieve, lambda done: done, PollingOptions(adaptive=adaptive, fast_poll_interval_ms=1), key="parse_run"
+        )
+
+        assert adaptive.snapshot()["parse_run"].polls == 2
+
+    def test_poll_run_until_done_passes_the_key(self):
+        """Should group a run's timings under the key create_and_poll passes."""
+        adaptive = AdaptivePolling()
+        retrieve = MagicMock(return_value=MagicMock(status="PROCESSED"))
+
+        poll_run_until_done(
+            retrieve, ExtractRun, _is_terminal_status, PollingOptions(adaptive=adaptive), key="extract_run:ex_1"
+        )
+
+        assert adaptive.snapshot()["extract_run:ex_1"].runs == 1
+
+    def test_rejects_empty_windows(self):
+        """Should reject a window, min_samples or polls_per_run below 1."""
+        with pytest.raises(ValueError):
+            AdaptivePolling(window=0)
+
+
+def _summary(kind, processor_id):
+    created = "2025-01-01T00:00:00Z"
+    return {"object": kind, "id": processor_id, "name": "Invoices", "createdAt": created, "updatedAt": created}
+
+
+class TestPollingKey:
+    """Tests for polling_key function."""
+
+    def test_keys_runs_by_processor(self):
+        """Should key runs by object type and processor id, or object type alone."""
+        extract_run = construct_type(
+            type_=ExtractRun,
+            object_={"object": "extract_run", "id": "exr_1", "extractor": _summary("extractor", "ex_1")},
+        )
+        workflow_run = construct_type(
+            type_=WorkflowRun,
+            object_={"object": "workflow_run", "id": "wr_1", "workflow": _summary("workflow", "workflow_1")},
+        )
+        parse_run = construct_type(type_=ParseRun, object_={"object": "parse_run", "id": "pr_1"})
+        inline_run = construct_type(type_=ExtractRun, object_={"object": "extract_run", "id": "exr_2"})
+
+        assert polling_key(extract_run) == "extract_run:ex_1"
+        assert polling_key(workflow_run) == "workflow_run:workflow_1"
+        assert polling_key(parse_run) == "parse_run"
+        assert polling_key(inline_run) == "extract_run"
+        assert polling_key(MagicMock()) is None
+
+
 # ============================================================================
 # PollingTimeoutError tests
 # ============================================================================
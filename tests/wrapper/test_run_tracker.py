@@ -0,0 +1,288 @@
+"""Tests for RunTracker and AsyncRunTracker."""
+
+import asyncio
+import concurrent.futures
+import datetime as dt
+import json
+import threading
+
+import httpx
+import pytest
+
+from extend_ai import AsyncRunTracker, Extend, RetryPolicy, RunTracker
+from extend_ai.core.unchecked_base_model import construct_type
+from extend_ai.errors import ForbiddenError, InternalServerError
+from extend_ai.types import ExtractRun, ExtractRunSummary
+
+EPOCH = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def _time(seconds):
+    return (EPOCH + dt.timedelta(seconds=seconds)).isoformat().replace("+00:00", "Z")
+
+
+class FakeApi:
+    """Serves `/extract_runs` sorted by updatedAt, newest first, and `/extract_runs/{id}`."""
+
+    def __init__(self, history=0):
+        # Finished runs from before the test, all older than the runs it creates.
+        self.runs = {f"exr_old_{n}": ("PROCESSED", n) for n in range(history)}
+        self.now = history + 1000
+        self.requests = []
+        self.lock = threading.Lock()
+        self.fail_list = False
+
+    def create(self, run_id):
+        self.runs[run_id] = ("PROCESSING", self.now)
+        return construct_type(type_=ExtractRun, object_=self._summary(run_id))
+
+    def finish(self, run_id, status="PROCESSED"):
+        self.now += 1
+        self.runs[run_id] = (status, self.now)
+
+    def _summary(self, run_id):
+        status, updated = self.runs[run_id]
+        return {"object": "extract_run", "id": run_id, "status": status, "updatedAt": _time(updated)}
+
+    def handle(self, request):
+        with self.lock:
+            self.requests.append(request)
+            path = request.url.path
+            if path == "/extract_runs":
+                if self.fail_list:
+                    status = 500 if self.fail_list is True else self.fail_list
+                    return httpx.Response(status, json={"message": "boom"})
+                params = request.url.params
+                ordered = sorted(self.runs, key=lambda run_id: self.runs[run_id][1], reverse=True)
+                start = int(params.get("nextPageToken", 0))
+                size = int(params["maxPageSize"])
+                page = ordered[start : start + size]
+                body = {"object": "list", "data": [self._summary(run_id) for run_id in page]}
+                if start + size < len(ordered):
+                    body["nextPageToken"] = str(start + size)
+                return httpx.Response(200, content=json.dumps(body).encode())
+            run_id = path.rsplit("/", 1)[1]
+            return httpx.Response(200, json={**self._summary(run_id), "output": {"value": {"total": 1}}})
+
+    def lists(self):
+        return [request for request in self.requests if request.url.path == "/extract_runs"]
+
+    def retrieves(self):
+        return [request.url.path for request in self.requests if request.url.path != "/extract_runs"]
+
+
+class TestRunTracker:
+    def test_fetches_each_run_once_when_the_listing_shows_it_finished(self, sync_extend_client):
+        api = FakeApi()
+        tracker = RunTracker(
+            sync_extend_client(api.handle).extract_runs, batch_id="batch_1", max_page_size=10, interval_ms=None
+        )
+        futures = [tracker.track(api.create(f"exr_{n}")) for n in range(3)]
+        api.finish("exr_1")
+        api.finish("exr_2", "FAILED")
+
+        assert tracker.poll() == 2
+        assert tracker.poll() == 0
+
+        assert not futures[0].done()
+        assert isinstance(futures[1].result(), ExtractRun)
+        assert futures[1].result().output.value == {"total": 1}
+        assert futures[2].result().status == "FAILED"
+        assert tracker.pending == 1
+        assert sorted(api.retrieves()) == ["/extract_runs/exr_1", "/extract_runs/exr_2"]
+        params = api.lists()[0].url.params
+        assert params["batchId"] == "batch_1"
+        assert params["sortBy"] == "updatedAt"
+        assert params["sortDir"] == "desc"
+        tracker.close()
+
+    def test_stops_paging_at_runs_older_than_the_tracked_ones(self, sync_extend_client):
+        api = FakeApi(history=500)
+        tracker = RunTracker(sync_extend_client(api.handle).extract_runs, max_page_size=10, interval_ms=None)
+        futures = [tracker.track(api.create(f"exr_{n}")) for n in range(5)]
+        api.finish("exr_3")
+
+        tracker.poll()
+
+        assert futures[3].done()
+        assert len(api.lists()) == 1  # 505 runs, but only the newest page is read
+        tracker.close()
+
+    def test_runs_tracked_by_id_read_the_listing_once(self, sync_extend_client):
+        api = FakeApi(history=50)
+        tracker = RunTracker(
+            sync_extend_client(api.handle).extract_runs, max_page_size=10, listing_lag_ms=0, interval_ms=None
+        )
+        api.create("exr_1")
+        future = tracker.track("exr_1")
+
+        tracker.poll()
+        first_sweep = len(api.lists())
+        tracker.poll()
+
+        assert first_sweep == 6
+        assert len(api.lists()) == first_sweep + 1
+        api.finish("exr_1")
+        tracker.poll()
+        assert future.result().id == "exr_1"
+
+    def test_finds_runs_that_finished_before_they_were_tracked(self, sync_extend_client):
+        api = FakeApi(history=30)
+        tracker = RunTracker(sync_extend_client(api.handle).extract_runs, max_page_size=10, interval_ms=None)
+
+        future = tracker.track("exr_old_3")
+        tracker.poll()
+
+        assert future.result().id == "exr_old_3"
+
+    def test_resolves_to_the_summary_without_fetching(self, sync_extend_client):
+        api = FakeApi()
+        tracker = RunTracker(sync_extend_client(api.handle).extract_runs, fetch_full=False, interval_ms=None)
+        future = tracker.track(api.create("exr_1"))
+        api.finish("exr_1")
+
+        tracker.poll()
+
+        assert isinstance(future.result(), ExtractRunSummary)
+        assert api.retrieves() == []
+
+    def test_tracking_a_run_twice_returns_the_same_future(self, sync_extend_client):
+        api = FakeApi()
+        tracker = RunTracker(sync_extend_client(api.handle).extract_runs)
+
+        assert tracker.track("exr_1") is tracker.track(api.create("exr_1"))
+        assert tracker.pending == 1
+        tracker.close()
+
+    def test_as_completed_sweeps_in_the_background(self, sync_extend_client):
+        api = FakeApi()
+        tracker = RunTracker(sync_extend_client(api.handle).extract_runs, interval_ms=10)
+        runs = [api.create(f"exr_{n}") for n in range(3)]
+        for run in runs:
+            api.finish(run.id)
+
+        with tracker:
+            done = [future.result().id for future in tracker.as_completed(runs, timeout=5)]
+
+        assert sorted(done) == ["exr_0", "exr_1", "exr_2"]
+
+    def test_as_completed_times_out(self, sync_extend_client):
+        api = FakeApi()
+        with RunTracker(sync_extend_client(api.handle).extract_runs, interval_ms=10) as tracker:
+            with pytest.raises(concurrent.futures.TimeoutError):
+                list(tracker.as_completed([api.create("exr_1")], timeout=0.05))
+
+    def test_failed_sweeps_keep_runs_pending_until_the_limit(self, sync_extend_client):
+        api = FakeApi()
+        tracker = RunTracker(
+            sync_extend_client(api.handle, retry_policy=RetryPolicy(max_retries=0)).extract_runs,
+            interval_ms=None,
+            max_sweep_failures=2,
+        )
+        future = tracker.track(api.create("exr_1"))
+        api.fail_list = True
+
+        with pytest.raises(InternalServerError):
+            tracker.poll()
+        assert not future.done()
+        assert tracker.pending == 1
+
+        with pytest.raises(InternalServerError):
+            tracker.poll()
+        assert isinstance(future.exception(), InternalServerError)
+        assert tracker.pending == 0
+
+    def test_a_successful_sweep_resets_the_failure_count(self, sync_extend_client):
+        api = FakeApi()
+        tracker = RunTracker(
+            sync_extend_client(api.handle, retry_policy=RetryPolicy(max_retries=0)).extract_runs,
+            interval_ms=None,
+            max_sweep_failures=2,
+        )
+        future = tracker.track(api.create("exr_1"))
+
+        for _ in range(3):
+            api.fail_list = True
+            with pytest.raises(InternalServerError):
+                tracker.poll()
+            api.fail_list = False
+            assert tracker.poll() == 0
+        api.finish("exr_1")
+
+        assert tracker.poll() == 1
+        assert future.result().status == "PROCESSED"
+
+    def test_non_retryable_sweep_errors_fail_the_runs_at_once(self, sync_extend_client):
+        api = FakeApi()
+        api.fail_list = 403
+        tracker = RunTracker(
+            sync_extend_client(api.handle, retry_policy=RetryPolicy(max_retries=0)).extract_runs, interval_ms=None
+        )
+        future = tracker.track(api.create("exr_1"))
+
+        with pytest.raises(ForbiddenError):
+            tracker.poll()
+
+        assert isinstance(future.exception(), ForbiddenError)
+
+    def test_close_cancels_pending_runs(self, sync_extend_client):
+        api = FakeApi()
+        tracker = RunTracker(sync_extend_client(api.handle).extract_runs, interval_ms=10_000)
+        future = tracker.track(api.create("exr_1"))
+
+        tracker.close()
+
+        assert future.cancelled()
+        with pytest.raises(RuntimeError):
+            tracker.track("exr_2")
+
+    def test_parse_runs_need_a_batch_id(self):
+        client = Extend(token="secret")
+
+        with pytest.raises(ValueError, match="batch_id"):
+            RunTracker(client.parse_runs)
+        RunTracker(client.parse_runs, batch_id="batch_1")
+        with pytest.raises(TypeError):
+            RunTracker(client.edit_runs)
+
+
+class TestAsyncRunTracker:
+    async def test_as_completed(self, async_extend_client):
+        api = FakeApi(history=40)
+        tracker = AsyncRunTracker(async_extend_client(api.handle).extract_runs, interval_ms=10, max_page_size=10)
+        runs = [api.create(f"exr_{n}") for n in range(3)]
+        for run in runs:
+            api.finish(run.id)
+
+        async with tracker:
+            done = [future.result().id async for future in tracker.as_completed(runs, timeout=5)]
+
+        assert sorted(done) == ["exr_0", "exr_1", "exr_2"]
+        assert len(api.lists()) == 1
+        assert len(api.retrieves()) == 3
+
+    async def test_poll_and_timeout(self, async_extend_client):
+        api = FakeApi()
+        tracker = AsyncRunTracker(async_extend_client(api.handle).extract_runs, interval_ms=10)
+        future = tracker.track(api.create("exr_1"))
+
+        assert await tracker.poll() == 0
+        with pytest.raises(asyncio.TimeoutError):
+            [f async for f in tracker.as_completed(["exr_1"], timeout=0.05)]
+        api.finish("exr_1")
+        assert (await future).status == "PROCESSED"
+        await tracker.aclose()
+
+    async def test_failed_sweeps_keep_runs_pending_until_the_limit(self, async_extend_client):
+        api = FakeApi()
+        client = async_extend_client(api.handle, retry_policy=RetryPolicy(max_retries=0))
+        tracker = AsyncRunTracker(client.extract_runs, interval_ms=None, max_sweep_failures=2)
+        future = tracker.track(api.create("exr_1"))
+        api.fail_list = True
+
+        with pytest.raises(InternalServerError):
+            await tracker.poll()
+        assert not future.done()
+        with pytest.raises(InternalServerError):
+            await tracker.poll()
+        assert isinstance(future.exception(), InternalServerError)
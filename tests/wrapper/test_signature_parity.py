@@ -4,6 +4,7 @@ Guards against wrapper code drifting from the Fern-generated SDK.
 The wrapper layer re-declares parts of the generated API surface:
 
 - `create_and_poll()` mirrors each generated `create()` signature
+- `ParseRunsClient.stream_output()` mirrors the generated `retrieve()` signature
 - `TypedExtractConfigParams` / `TypedExtractorParams` mirror the generated
   request TypedDicts (with `schema` retyped to a pydantic model class)
 - `TypedExtractRun` mirrors the fields of the generated `ExtractRun`
@@ -71,6 +72,19 @@ def test_create_and_poll_accepts_all_create_params(wrapper_client):
     )
 
 
+@pytest.mark.parametrize(
+    "wrapper_client", [parse_runs.ParseRunsClient, parse_runs.AsyncParseRunsClient], ids=lambda cls: cls.__name__
+)
+def test_stream_output_accepts_all_retrieve_params(wrapper_client):
+    """stream_output() requests the same endpoint as retrieve() and must take the same parameters."""
+    generated_client = wrapper_client.__mro__[1]
+    missing = _param_names(generated_client.retrieve) - _param_names(wrapper_client.stream_output)
+    assert not missing, (
+        f"{wrapper_client.__name__}.stream_output() is missing parameters that "
+        f"{generated_client.__name__}.retrieve() accepts: {sorted(missing)}."
+    )
+
+
 SYNC_RUN_CLIENTS = [cls for cls in RUN_CLIENTS if not cls.__name__.startswith("Async")]
 ASYNC_RUN_CLIENTS = [cls for cls in RUN_CLIENTS if cls.__name__.startswith("Async")]
 
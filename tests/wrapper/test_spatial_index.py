@@ -0,0 +1,160 @@
+"""Tests for the spatial index over parse output blocks and OCR words."""
+
+import math
+import random
+
+import pytest
+
+from extend_ai import SpatialIndex
+from extend_ai.core.unchecked_base_model import construct_type
+from extend_ai.types import BoundingBox, ParseRunOutput
+
+
+def _block(block_id, page, box, polygon=None, children=None):
+    left, top, right, bottom = box
+    block = {
+        "object": "block",
+        "id": block_id,
+        "type": "text",
+        "content": block_id,
+        "details": {"type": "text_details"},
+        "metadata": {"page": {"number": page, "width": 1, "height": 1}},
+        "polygon": [
+            {"x": x, "y": y} for x, y in polygon or [(left, top), (right, top), (right, bottom), (left, bottom)]
+        ],
+        "boundingBox": {"left": left, "top": top, "right": right, "bottom": bottom},
+    }
+    if children is not None:
+        block["children"] = children
+    return block
+
+
+TRIANGLE = [(0.5, 0.5), (0.9, 0.5), (0.5, 0.9)]
+OUTPUT = {
+    "chunks": [
+        {
+            "object": "chunk",
+            "type": "page",
+            "content": "",
+            "metadata": {"pageRange": {"start": 1, "end": 2}},
+            "blocks": [
+                _block("header", 1, (0.0, 0.0, 1.0, 0.1)),
+                _block(
+                    "table",
+                    1,
+                    (0.1, 0.2, 0.9, 0.4),
+                    children=[_block("cell_1", 1, (0.1, 0.2, 0.5, 0.4)), _block("cell_2", 1, (0.5, 0.2, 0.9, 0.4))],
+                ),
+                _block("triangle", 1, (0.5, 0.5, 0.9, 0.9), polygon=TRIANGLE),
+                _block("page_2", 2, (0.1, 0.1, 0.2, 0.2)),
+                {**_block("no_page", 1, (0.0, 0.0, 1.0, 1.0)), "metadata": {}},
+            ],
+        }
+    ],
+    "ocr": {
+        "words": [
+            {
+                "content": f"w{index}",
+                "boundingBox": {"left": x, "top": y, "right": x + 0.05, "bottom": y + 0.02},
+                "confidence": 0.9,
+                "pageNumber": 1,
+            }
+            for index, (x, y) in enumerate([(0.1, 0.1), (0.6, 0.1), (0.1, 0.6), (0.6, 0.6)])
+        ]
+    },
+}
+
+
+def _ids(blocks):
+    return [block.id if hasattr(block, "id") else block["id"] for block in blocks]
+
+
+@pytest.fixture(params=["models", "json"])
+def blocks(request):
+    if request.param == "json":
+        return SpatialIndex.of_blocks(OUTPUT)
+    return SpatialIndex.of_blocks(construct_type(type_=ParseRunOutput, object_=OUTPUT))
+
+
+class TestBlocks:
+    def test_indexes_blocks_with_a_page_and_their_children(self, blocks):
+        assert len(blocks) == 6
+        assert blocks.pages == [1, 2]
+
+    def test_query(self, blocks):
+        assert _ids(blocks.query(1, (0.4, 0.25, 0.6, 0.3))) == ["table", "cell_1", "cell_2"]
+        assert _ids(blocks.query(1, BoundingBox(left=0.0, top=0.0, right=0.05, bottom=0.05))) == ["header"]
+        assert _ids(blocks.query(2, (0.0, 0.0, 1.0, 1.0))) == ["page_2"]
+        assert blocks.query(3, (0.0, 0.0, 1.0, 1.0)) == []
+
+    def test_edges_touching_intersect(self, blocks):
+        assert _ids(blocks.query(1, (0.9, 0.4, 1.0, 0.45))) == ["table", "cell_2"]
+
+    def test_containing_uses_polygons(self, blocks):
+        assert _ids(blocks.containing(1, 0.6, 0.6)) == ["triangle"]
+        assert blocks.containing(1, 0.85, 0.85) == []
+        assert _ids(blocks.containing(1, 0.3, 0.3)) == ["table", "cell_1"]
+
+    def test_nearest(self, blocks):
+        assert _ids([blocks.nearest(1, 0.3, 0.3)]) == ["table"]
+        assert _ids([blocks.nearest(1, 0.95, 0.45)]) == ["table"]
+        assert _ids([blocks.nearest(2, 5.0, 5.0)]) == ["page_2"]
+        assert blocks.nearest(3, 0.5, 0.5) is None
+
+    def test_without_children(self):
+        index = SpatialIndex.of_blocks(OUTPUT, children=False)
+
+        assert _ids(index.query(1, (0.4, 0.25, 0.6, 0.3))) == ["table"]
+
+
+class TestWords:
+    def test_words_from_models_and_json(self):
+        from_json = SpatialIndex.of_words(OUTPUT["ocr"])
+        from_models = SpatialIndex.of_words(construct_type(type_=ParseRunOutput, object_=OUTPUT).ocr)
+
+        assert [word["content"] for word in from_json.query(1, (0.5, 0.5, 1.0, 1.0))] == ["w3"]
+        assert from_models.nearest(1, 0.62, 0.12).content == "w1"
+        assert len(SpatialIndex.of_words(None)) == 0
+
+
+def _random_entries(rng, count):
+    entries = []
+    for item in range(count):
+        left, top = rng.uniform(0, 100), rng.uniform(0, 100)
+        box = (left, top, left + rng.expovariate(0.2), top + rng.expovariate(0.5))
+        entries.append((rng.choice([1, 2]), box, None, item))
+    return entries
+
+
+def _brute_distance(box, x, y):
+    return math.hypot(max(box[0] - x, 0, x - box[2]), max(box[1] - y, 0, y - box[3]))
+
+
+class TestAgainstLinearScan:
+    @pytest.mark.parametrize("count", [1, 7, 500])
+    def test_random_queries(self, count):
+        rng = random.Random(count)
+        entries = _random_entries(rng, count)
+        index = SpatialIndex(entries)
+
+        for _ in range(200):
+            page = rng.choice([1, 2])
+            left, top = rng.uniform(-10, 110), rng.uniform(-10, 110)
+            rectangle = (left, top, left + rng.uniform(0, 30), top + rng.uniform(0, 30))
+            x, y = rng.uniform(-20, 120), rng.uniform(-20, 120)
+            on_page = [entry for entry in entries if entry[0] == page]
+
+            assert index.query(page, rectangle) == [
+                item
+                for _, box, _, item in on_page
+                if box[0] <= rectangle[2]
+                and box[2] >= rectangle[0]
+                and box[1] <= rectangle[3]
+                and box[3] >= rectangle[1]
+            ]
+            assert index.containing(page, x, y) == [
+                item for _, box, _, item in on_page if box[0] <= x <= box[2] and box[1] <= y <= box[3]
+            ]
+            if on_page:
+                expected = min(on_page, key=lambda entry: (_brute_distance(entry[1], x, y), entry[3]))[3]
+                assert index.nearest(page, x, y) == expected
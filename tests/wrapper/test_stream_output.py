@@ -0,0 +1,237 @@
+"""Tests for ParseRunsClient.stream_output and the JSON stream scanner."""
+
+import json
+import random
+
+import httpx
+import pytest
+
+from extend_ai import ParseRunOutputUnavailableError, RetryPolicy
+from extend_ai.core.api_error import ApiError
+from extend_ai.errors import NotFoundError, UnprocessableEntityError
+from extend_ai.types import ApiError as ApiErrorBody
+from extend_ai.types import Chunk, ParseRunOutputOcrWordsItem
+from extend_ai.wrapper.streaming import JsonStreamScanner
+
+CHUNKS = [
+    {
+        "object": "chunk",
+        "type": "page",
+        "content": f'Page {page} "quoted" \\ ünïcode ]}}',
+        "metadata": {"pageRange": {"start": page, "end": page}},
+        "blocks": [],
+    }
+    for page in range(1, 6)
+]
+WORDS = [
+    {
+        "content": "Invoice",
+        "boundingBox": {"left": 0, "top": 0, "right": 1, "bottom": 1},
+        "confidence": 0.9,
+        "pageNumber": 1,
+    }
+]
+OUTPUT = {"chunks": CHUNKS, "ocr": {"words": WORDS}}
+PARSE_RUN = {
+    "object": "parse_run",
+    "id": "pr_123",
+    "file": {"object": "file", "id": "file_123", "name": "a.pdf", "type": "PDF"},
+    "status": "PROCESSED",
+    "output": OUTPUT,
+    "config": {"target": "markdown", "blockOptions": {"tables": {"enabled": True}}},
+}
+OUTPUT_URL = "https://storage.example.com/outputs/pr_123.json?signature=abc"
+RUN_URL = "https://api.example.com/parse_runs/pr_123"
+
+
+def _pieces(document, size):
+    return [document[index : index + size] for index in range(0, len(document), size)]
+
+
+def _handler(routes, requests=None, pieces=True):
+    """Serves JSON bodies by URL (without the query string), in small pieces unless *pieces* is False."""
+
+    def handle(request):
+        if requests is not None:
+            requests.append(request)
+        status, body = routes[str(request.url.copy_with(query=None))]
+        content = json.dumps(body).encode()
+        return httpx.Response(status, content=iter(_pieces(content, 7)) if pieces else content)
+
+    return handle
+
+
+def _scan(document, targets, size):
+    scanner = JsonStreamScanner(targets)
+    events = []
+    for piece in _pieces(document, size):
+        events += scanner.feed(piece)
+        if scanner.done:
+            break
+    return events + scanner.close(), scanner
+
+
+class TestJsonStreamScanner:
+    @pytest.mark.parametrize("size", [1, 3, 64, 1 << 20])
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_yields_targets_in_document_order(self, size, indent):
+        document = json.dumps({"skipped": [{"a": "]}"}, 1.5e3, None], **PARSE_RUN}, indent=indent).encode()
+
+        events, _ = _scan(
+            document,
+            {("output", "chunks"): "items", ("output", "ocr", "words"): "items", ("status",): "value"},
+            size,
+        )
+
+        assert events == (
+            [(("status",), "PROCESSED")]
+            + [(("output", "chunks"), chunk) for chunk in CHUNKS]
+            + [(("output", "ocr", "words"), word) for word in WORDS]
+        )
+
+    def test_random_documents_split_anywhere(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            items = [{'k"ey': rng.choice(["x", "\\", "é", "]", 1, -2.5, True, None, [], {}])} for _ in range(10)]
+            document = json.dumps({"before": {"items": "no"}, "items": items, "after": [1, 2]}).encode()
+
+            events, _ = _scan(document, {("items",): "items", ("after",): "value"}, rng.randint(1, 20))
+
+            assert [value for path, value in events if path == ("items",)] == items
+            assert events[-1] == (("after",), [1, 2])
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 5])
+    def test_numbers_split_inside_their_fraction_or_exponent(self, size):
+        numbers = [-25000000000.0, 1.5e-07, 2e21, -0.5, 7]
+        document = json.dumps({"output": {"chunks": numbers}}).encode()
+
+        events, _ = _scan(document, {("output", "chunks"): "items"}, size)
+
+        assert [value for _, value in events] == numbers
+
+    def test_stops_after_the_object_containing_the_targets(self):
+        document = json.dumps({"output": {"chunks": [1, 2]}, "rest": "x" * 1000}).encode()
+        scanner = JsonStreamScanner({("output", "chunks"): "items"})
+
+        events = scanner.feed(document[:40])
+
+        assert events == [(("output", "chunks"), 1), (("output", "chunks"), 2)]
+        assert scanner.done
+
+    @pytest.mark.parametrize(
+        "document", [b'{"output": {"chunks": [1, 2', b'{"output" 1}', b'{"output": {"chunks": [{"a": "b']
+    )
+    def test_invalid_or_truncated_documents_raise(self, document):
+        scanner = JsonStreamScanner({("output", "chunks"): "items"})
+
+        with pytest.raises(json.JSONDecodeError):
+            scanner.feed(document)
+            scanner.close()
+
+
+class TestStreamOutput:
+    def test_yields_chunks_from_the_inline_output(self, sync_extend_client):
+        client = sync_extend_client(_handler({RUN_URL: (200, PARSE_RUN)}))
+
+        chunks = list(client.parse_runs.stream_output("pr_123"))
+
+        assert all(isinstance(chunk, Chunk) for chunk in chunks)
+        assert chunks == client.parse_runs.retrieve("pr_123").output.chunks
+
+    def test_yields_ocr_words_when_asked(self, sync_extend_client):
+        client = sync_extend_client(_handler({RUN_URL: (200, PARSE_RUN)}))
+
+        items = list(client.parse_runs.stream_output("pr_123", ocr_words=True))
+
+        assert [type(item) for item in items] == [Chunk] * len(CHUNKS) + [ParseRunOutputOcrWordsItem]
+        assert items[-1].bounding_box.right == 1
+
+    def test_follows_the_output_url(self, sync_extend_client):
+        requests = []
+        run = {**PARSE_RUN, "output": None, "outputUrl": OUTPUT_URL}
+        client = sync_extend_client(_handler({RUN_URL: (200, run), OUTPUT_URL.split("?")[0]: (200, OUTPUT)}, requests))
+
+        chunks = list(client.parse_runs.stream_output("pr_123", response_type="url"))
+
+        assert [chunk.content for chunk in chunks] == [chunk["content"] for chunk in CHUNKS]
+        assert requests[0].url.params["responseType"] == "url"
+        assert str(requests[1].url) == OUTPUT_URL
+        assert "authorization" not in requests[1].headers
+
+    def test_output_url_download_is_retried_with_the_request_timeout(self, sync_extend_client):
+        requests = []
+        run = {**PARSE_RUN, "output": None, "outputUrl": OUTPUT_URL}
+        serve = _handler({RUN_URL: (200, run), OUTPUT_URL.split("?")[0]: (200, OUTPUT)})
+
+        def handler(request):
+            requests.append(request)
+            if request.url.host == "storage.example.com" and len(requests) == 2:
+                return httpx.Response(503)
+            return serve(request)
+
+        client = sync_extend_client(handler, retry_policy=RetryPolicy(initial_delay=0.0, max_delay=0.0, jitter=0.0))
+
+        chunks = list(
+            client.parse_runs.stream_output(
+                "pr_123",
+                extend_workspace_id="ws_123",
+                request_options={"timeout_in_seconds": 7, "additional_headers": {"x-trace": "1"}},
+            )
+        )
+
+        assert len(chunks) == len(CHUNKS)
+        assert [str(request.url) for request in requests[1:]] == [OUTPUT_URL, OUTPUT_URL]
+        for download in requests[1:]:
+            assert download.extensions["timeout"]["read"] == 7
+            assert not {"authorization", "x-extend-workspace-id", "x-trace"} & set(download.headers)
+
+    def test_raises_when_the_run_has_no_output(self, sync_extend_client):
+        run = {**PARSE_RUN, "status": "PROCESSING", "output": None}
+        client = sync_extend_client(_handler({RUN_URL: (200, run)}))
+
+        with pytest.raises(ParseRunOutputUnavailableError) as info:
+            list(client.parse_runs.stream_output("pr_123"))
+
+        assert info.value.status == "PROCESSING"
+
+    def test_raises_typed_errors(self, sync_extend_client):
+        client = sync_extend_client(_handler({RUN_URL: (404, {"message": "Parse run not found"})}))
+
+        with pytest.raises(NotFoundError) as info:
+            list(client.parse_runs.stream_output("pr_123"))
+
+        assert info.value.body == {"message": "Parse run not found"}
+
+    @pytest.mark.parametrize("status", [400, 401, 402, 403, 404, 422, 429, 500])
+    def test_raises_the_same_errors_as_retrieve(self, status, sync_extend_client):
+        body = {"code": "INVALID", "message": "Nope", "requestId": "req_1", "retryable": False}
+        client = sync_extend_client(_handler({RUN_URL: (status, body)}), retry_policy=RetryPolicy(max_retries=0))
+
+        with pytest.raises(ApiError) as retrieved:
+            client.parse_runs.retrieve("pr_123")
+        with pytest.raises(ApiError) as streamed:
+            list(client.parse_runs.stream_output("pr_123"))
+
+        assert type(streamed.value) is type(retrieved.value)
+        assert type(streamed.value.body) is type(retrieved.value.body)
+        assert streamed.value.body == retrieved.value.body
+        assert streamed.value.status_code == status
+
+    def test_422_body_is_an_api_error(self, sync_extend_client):
+        body = {"code": "INVALID", "message": "Nope", "requestId": "req_1", "retryable": False}
+        client = sync_extend_client(_handler({RUN_URL: (422, body)}))
+
+        with pytest.raises(UnprocessableEntityError) as info:
+            list(client.parse_runs.stream_output("pr_123"))
+
+        assert isinstance(info.value.body, ApiErrorBody)
+        assert info.value.body.message == "Nope"
+
+    async def test_async_client(self, async_extend_client):
+        run = {**PARSE_RUN, "output": None, "outputUrl": OUTPUT_URL}
+        handler = _handler({RUN_URL: (200, run), OUTPUT_URL.split("?")[0]: (200, OUTPUT)}, pieces=False)
+        client = async_extend_client(handler)
+
+        items = [item async for item in client.parse_runs.stream_output("pr_123", ocr_words=True)]
+
+        assert len(items) == len(CHUNKS) + len(WORDS)
@@ -0,0 +1,181 @@
+"""Tests for Extend.warmup / AsyncExtend.warmup."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from extend_ai import AsyncExtend, Extend
+from extend_ai.wrapper.warmup import MAX_WARMUP_CONNECTIONS
+
+TRACE_EVENTS = [
+    "connection.connect_tcp.started",
+    "connection.connect_tcp.complete",
+    "connection.start_tls.started",
+    "connection.start_tls.complete",
+    "http11.send_request_headers.started",
+    "http11.receive_response_headers.complete",
+]
+
+
+def _handler(requests, status=200):
+    """Records requests and replays the httpcore trace events a new TLS connection emits."""
+
+    def handle(request):
+        requests.append(request)
+        for event in TRACE_EVENTS:
+            request.extensions["trace"](event, {})
+        return httpx.Response(status)
+
+    return handle
+
+
+def _async_handler(requests, status=200):
+    async def handle(request):
+        requests.append(request)
+        for event in TRACE_EVENTS:
+            await request.extensions["trace"](event, {})
+        return httpx.Response(status)
+
+    return handle
+
+
+class TestWarmup:
+    """Extend.warmup sends concurrent authenticated HEAD requests and reports handshake timings."""
+
+    def test_sends_authenticated_head_requests(self):
+        requests = []
+        client = Extend(
+            token="secret",
+            base_url="https://api.example.com",
+            httpx_client=httpx.Client(transport=httpx.MockTransport(_handler(requests))),
+        )
+
+        report = client.warmup(connections=3)
+
+        assert len(requests) == 3
+        assert all(request.method == "HEAD" for request in requests)
+        assert all(str(request.url) == "https://api.example.com" for request in requests)
+        assert all(request.headers["authorization"] == "Bearer secret" for request in requests)
+        assert report.url == "https://api.example.com"
+        assert report.opened == 3
+        assert report.errors == []
+
+    def test_reports_handshake_timings(self):
+        client = Extend(token="secret", httpx_client=httpx.Client(transport=httpx.MockTransport(_handler([]))))
+
+        report = client.warmup()
+
+        (timing,) = report.connections
+        assert timing.connect is not None and timing.connect >= 0
+        assert timing.tls is not None and timing.tls >= 0
+        assert timing.first_byte is not None and timing.first_byte >= 0
+        assert timing.total >= timing.connect
+        assert timing.status_code == 200
+        assert not timing.reused
+        assert report.connect_p50 == timing.connect
+
+    def test_error_status_still_counts_as_warm(self):
+        """A 404 or 405 for HEAD / still leaves an open connection."""
+        client = Extend(token="secret", httpx_client=httpx.Client(transport=httpx.MockTransport(_handler([], 405))))
+
+        report = client.warmup(connections=2)
+
+        assert report.opened == 2
+        assert [timing.status_code for timing in report.connections] == [405, 405]
+
+    def test_transport_errors_are_recorded_not_raised(self):
+        def fail(request):
+            raise httpx.ConnectError("connection refused")
+
+        client = Extend(token="secret", httpx_client=httpx.Client(transport=httpx.MockTransport(fail)))
+
+        report = client.warmup(connections=2)
+
+        assert report.opened == 0
+        assert report.errors == ["ConnectError: connection refused"] * 2
+        assert report.connect_p50 is None
+
+    def test_rejects_non_positive_connections(self):
+        client = Extend(token="secret", httpx_client=httpx.Client(transport=httpx.MockTransport(_handler([]))))
+
+        with pytest.raises(ValueError, match="at least 1"):
+            client.warmup(connections=0)
+
+    def test_rejects_more_connections_than_it_can_open_at_once(self):
+        client = Extend(token="secret", httpx_client=httpx.Client(transport=httpx.MockTransport(_handler([]))))
+
+        with pytest.raises(ValueError, match=f"at most {MAX_WARMUP_CONNECTIONS}"):
+            client.warmup(connections=MAX_WARMUP_CONNECTIONS + 1)
+
+    def test_opens_real_pooled_connections(self):
+        """Against a local server the connections are opened concurrently and reused afterwards."""
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_HEAD(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            client = Extend(token="secret", base_url=f"http://127.0.0.1:{server.server_address[1]}")
+
+            first = client.warmup(connections=2)
+            second = client.warmup(connections=1)
+
+            assert first.errors == []
+            assert all(timing.connect is not None for timing in first.connections)
+            assert first.tls_p50 is None
+            assert second.connections[0].reused
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestAsyncWarmup:
+    """AsyncExtend.warmup mirrors the sync behaviour."""
+
+    async def test_sends_concurrent_head_requests(self):
+        requests = []
+        client = AsyncExtend(
+            token="secret",
+            base_url="https://api.example.com",
+            httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_async_handler(requests))),
+        )
+
+        report = await client.warmup(connections=4)
+
+        assert len(requests) == 4
+        assert all(request.method == "HEAD" for request in requests)
+        assert all(request.headers["authorization"] == "Bearer secret" for request in requests)
+        assert report.opened == 4
+        assert report.tls_p50 is not None
+
+    async def test_transport_errors_are_recorded_not_raised(self):
+        async def fail(request):
+            raise httpx.ConnectTimeout("timed out")
+
+        client = AsyncExtend(token="secret", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(fail)))
+
+        report = await client.warmup(connections=2)
+
+        assert report.errors == ["ConnectTimeout: timed out"] * 2
+
+    async def test_rejects_more_connections_than_it_can_open_at_once(self):
+        requests = []
+        client = AsyncExtend(
+            token="secret", httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_async_handler(requests)))
+        )
+
+        with pytest.raises(ValueError, match=f"at most {MAX_WARMUP_CONNECTIONS}"):
+            await client.warmup(connections=MAX_WARMUP_CONNECTIONS + 1)
+        assert requests == []